@@ -0,0 +1,204 @@
+"""
+ANSI/VT100 이스케이프 시퀀스 파서 (스트리밍)
+- 수신 텍스트를 (텍스트, 스타일 id) 구간 목록으로 변환 (QtWidgets 미사용, 헤드리스 공용)
+- SGR(ESC [ ... m)만 해석해 현재 스타일을 갱신하고, 그 밖의 CSI/OSC/단일 ESC 시퀀스는 제거
+- 청크 끝에서 잘린 시퀀스는 다음 청크와 이어서 해석, 스타일은 줄/청크를 넘어 유지
+- 스타일은 (전경, 배경, 굵게, 흐리게, 기울임, 밑줄, 반전, 취소선) 튜플을 정수 id로 고정 배정
+  → 표시 측은 id별 서식을 한 번만 만들어 재사용 (기본 스타일 id = 0)
+- ESC가 없는 청크는 정규식 검사 없이 그대로 한 구간으로 반환
+"""
+
+import os
+import re
+
+ENV_ANSI_KEEP_RAW = "ANSI_KEEP_RAW"
+
+DEFAULT_STYLE_ID = 0
+MAX_PENDING_SEQUENCE = 256    # 종료되지 않은 시퀀스 최대 길이 (초과 시 버림)
+
+# 색상 값: None(기본), 0~255(팔레트 인덱스), (r, g, b)
+# 스타일 튜플 인덱스
+FG, BG, BOLD, DIM, ITALIC, UNDERLINE, INVERSE, STRIKE = range(8)
+DEFAULT_STYLE = (None, None, False, False, False, False, False, False)
+
+# CSI: ESC [ 매개변수 중간문자 종료문자 / OSC: ESC ] ... BEL 또는 ESC \ / 그 밖의 ESC 시퀀스
+# (줄바꿈을 포함하는 시퀀스는 인정하지 않음 → 줄 분리 결과가 원본과 항상 같음)
+_SEQUENCE_RE = re.compile(
+    r"\x1b(?:\[([0-?]*)[ -/]*([@-~])|\][^\x07\x1b\n]*(?:\x07|\x1b\\)|[ -/]*[0-Z\\^-~])"
+)
+# 청크 끝의 미완성 시퀀스
+_PARTIAL_RE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b\n]*\x1b?|[ -/]*)\Z")
+
+
+def keep_raw_from_env() -> bool:
+    """ANSI_KEEP_RAW=1이면 로그/통계/자동 명령에 원본 시퀀스를 그대로 전달"""
+    return os.environ.get(ENV_ANSI_KEEP_RAW, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def strip_ansi(text: str) -> str:
+    """모든 이스케이프 시퀀스 제거 (상태 없음)"""
+    if "\x1b" not in text:
+        return text
+    return _SEQUENCE_RE.sub("", text)
+
+
+class StyleTable:
+    """스타일 튜플 ↔ id 고정 배정표 (여러 파서가 공유 가능)"""
+
+    def __init__(self):
+        self._ids: dict[tuple, int] = {DEFAULT_STYLE: DEFAULT_STYLE_ID}
+        self._styles: list[tuple] = [DEFAULT_STYLE]
+
+    def intern(self, style: tuple) -> int:
+        style_id = self._ids.get(style)
+        if style_id is None:
+            style_id = len(self._styles)
+            self._ids[style] = style_id
+            self._styles.append(style)
+        return style_id
+
+    def style(self, style_id: int) -> tuple:
+        return self._styles[style_id]
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+
+class AnsiParser:
+    """SGR 상태를 유지하는 스트리밍 파서"""
+
+    def __init__(self, table: StyleTable | None = None):
+        self.table = table if table is not None else StyleTable()
+        self._pending = ""
+        self._style = DEFAULT_STYLE
+        self._style_id = DEFAULT_STYLE_ID
+        # SGR 매개변수 문자열 → 적용 결과 캐시 ((이전 스타일, 매개변수) → 스타일 id)
+        self._transitions: dict[tuple[int, str], int] = {}
+
+    @property
+    def style_id(self) -> int:
+        return self._style_id
+
+    def reset(self) -> None:
+        self._pending = ""
+        self._style = DEFAULT_STYLE
+        self._style_id = DEFAULT_STYLE_ID
+
+    def feed(self, text: str) -> list[tuple[str, int]]:
+        """텍스트 → [(시퀀스를 제거한 텍스트, 스타일 id), ...] (빈 텍스트 구간은 생략)"""
+        if self._pending:
+            text = self._pending + text
+            self._pending = ""
+        if "\x1b" not in text:
+            return [(text, self._style_id)] if text else []
+
+        runs = []
+        position = 0
+        for match in _SEQUENCE_RE.finditer(text):
+            if match.start() > position:
+                runs.append((text[position:match.start()], self._style_id))
+            position = match.end()
+            if match.group(2) == "m":
+                self._apply_sgr(match.group(1))
+
+        tail = text[position:]
+        escape = tail.find("\x1b")
+        if escape >= 0:
+            # 끝에서 잘린 시퀀스는 다음 청크로 넘기고, 해석할 수 없는 ESC 문자는 버림
+            partial = _PARTIAL_RE.match(tail, escape)
+            if partial is not None:
+                if len(tail) - escape <= MAX_PENDING_SEQUENCE:
+                    self._pending = tail[escape:]
+                tail = tail[:escape]
+            tail = tail.replace("\x1b", "")
+        if tail:
+            runs.append((tail, self._style_id))
+        return [
+            (run_text.replace("\x1b", ""), style_id) if "\x1b" in run_text else (run_text, style_id)
+            for run_text, style_id in runs
+        ]
+
+    def _apply_sgr(self, params: str) -> None:
+        key = (self._style_id, params)
+        style_id = self._transitions.get(key)
+        if style_id is None:
+            style_id = self.table.intern(_apply_sgr_params(self._style, params))
+            self._transitions[key] = style_id
+        self._style_id = style_id
+        self._style = self.table.style(style_id)
+
+
+def _apply_sgr_params(style: tuple, params: str) -> tuple:
+    """SGR 매개변수 적용 결과 스타일 (지원하지 않는 코드는 무시)"""
+    values = []
+    for part in params.replace(":", ";").split(";"):
+        try:
+            values.append(int(part) if part else 0)
+        except ValueError:
+            return style   # 비공개 매개변수(?, > 등)는 SGR이 아님
+    if not values:
+        values = [0]
+
+    fields = list(style)
+    index = 0
+    while index < len(values):
+        code = values[index]
+        index += 1
+        if code == 0:
+            fields = list(DEFAULT_STYLE)
+        elif code == 1:
+            fields[BOLD] = True
+        elif code == 2:
+            fields[DIM] = True
+        elif code == 3:
+            fields[ITALIC] = True
+        elif code == 4:
+            fields[UNDERLINE] = True
+        elif code == 7:
+            fields[INVERSE] = True
+        elif code == 9:
+            fields[STRIKE] = True
+        elif code == 22:
+            fields[BOLD] = fields[DIM] = False
+        elif code == 23:
+            fields[ITALIC] = False
+        elif code == 24:
+            fields[UNDERLINE] = False
+        elif code == 27:
+            fields[INVERSE] = False
+        elif code == 29:
+            fields[STRIKE] = False
+        elif 30 <= code <= 37:
+            fields[FG] = code - 30
+        elif 40 <= code <= 47:
+            fields[BG] = code - 40
+        elif 90 <= code <= 97:
+            fields[FG] = code - 90 + 8
+        elif 100 <= code <= 107:
+            fields[BG] = code - 100 + 8
+        elif code == 39:
+            fields[FG] = None
+        elif code == 49:
+            fields[BG] = None
+        elif code in (38, 48):
+            target = FG if code == 38 else BG
+            mode = values[index] if index < len(values) else None
+            if mode == 5 and index + 1 < len(values):
+                fields[target] = max(0, min(255, values[index + 1]))
+                index += 2
+            elif mode == 2 and index + 3 < len(values):
+                fields[target] = tuple(max(0, min(255, value)) for value in values[index + 1:index + 4])
+                index += 4
+            else:
+                break
+    return tuple(fields)
+
+
+def palette_rgb(index: int) -> tuple[int, int, int]:
+    """xterm 256색 팔레트 16~255번 RGB (0~15번은 표시 측 테마 색 사용)"""
+    if index >= 232:
+        level = 8 + (index - 232) * 10
+        return (level, level, level)
+    index -= 16
+    steps = (0, 95, 135, 175, 215, 255)
+    return (steps[index // 36], steps[(index // 6) % 6], steps[index % 6])
@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+종단 간(E2E) 처리량 벤치마크
+- pty 쌍을 열고 앱(오프스크린 GUI 또는 헤드리스 파이프라인)을 slave 측에 연결
+- master 측 생성기 스레드가 트래픽 패턴(라인 길이, 버스트, 키워드 밀도, 잘못된 UTF-8)을 송신
+- 라인 앞에 "<순번> <송신 시각 ns>"를 실어 보내고, 수신 청크 처리가 끝난 시점과의 차이로 종단 간 지연 측정
+- 결과: 지속 처리량(lines/s), 지연 백분위, 이벤트 루프 정지 시간, RSS 증가량 → JSON
+
+사용 예:
+    python bench/bench_e2e.py --mode gui --pattern short --pattern burst -o bench_gui.json
+    python bench/bench_e2e.py --mode headless --rate 20000 --duration 10 --compare bench_gui.json
+
+앱과 생성기가 같은 프로세스에서 동작하므로 두 시각은 같은 monotonic 시계를 사용한다.
+설정/로그는 임시 작업 디렉토리(.env, QSettings 포함)에만 기록되어 사용자 환경을 건드리지 않는다.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tty
+
+from common import (
+    REPO_ROOT, load_results, percent_change, rss_kb, run_metadata, write_results,
+)
+
+from latency_histogram import LatencyHistogram
+
+PATTERNS = {
+    "short": {"line_length": 40},
+    "long": {"line_length": 1000},
+    "burst": {"line_length": 80, "burst_lines": 5000, "burst_gap_ms": 200},
+    "keywords": {"line_length": 80, "keyword_density": 0.5},
+    "invalid_utf8": {"line_length": 80, "invalid_utf8_ratio": 0.1},
+}
+PATTERN_DEFAULTS = {
+    "line_length": 80,
+    "rate": 0,              # lines/s, 0 = 최대 속도 (in-flight 창 안에서)
+    "max_in_flight": 512,   # 송신했지만 아직 처리되지 않은 라인 상한 (앱 이벤트 큐가 무한히 쌓이지 않도록)
+    "burst_lines": 0,       # 0 = 연속 송신
+    "burst_gap_ms": 0,
+    "keyword_density": 0.0,
+    "invalid_utf8_ratio": 0.0,
+}
+DEFAULT_KEYWORDS = ["ERROR", "WARNING", "CRITICAL"]
+INVALID_UTF8 = b"\xc3\x28\xff\xfe\x80"
+
+WRITE_CHUNK_BYTES = 64 * 1024
+LOOP_PROBE_INTERVAL_MS = 10
+STALL_THRESHOLD_MS = 50   # 사용자가 체감하는 UI 멈춤 기준
+DRAIN_TIMEOUT_S = 10.0
+WAKE_INTERVAL_MS = 20     # 대기 중 이벤트가 없어도 조건/마감 시각을 확인하는 간격
+IN_FLIGHT_POLL_S = 0.001
+
+
+class TrafficGenerator(threading.Thread):
+    """pty master에 패턴대로 라인을 송신하는 생성기"""
+
+    def __init__(self, fd: int, config: dict, duration_s: float, keywords: list[str], seed: int = 1,
+                 processed=None):
+        """processed: 앱이 처리 완료한 라인 수를 반환하는 함수 (in-flight 창 계산용)"""
+        super().__init__(name="TrafficGenerator", daemon=True)
+        self._fd = fd
+        self._config = config
+        self._processed = processed
+        self._duration_s = duration_s
+        self._keywords = [keyword.encode("utf-8") for keyword in keywords] or [b"KEYWORD"]
+        self._random = random.Random(seed)
+        self._stop_event = threading.Event()
+        alphabet = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 =:-_.,"
+        self._filler = bytes(self._random.choice(alphabet) for _ in range(8192))
+        self.sent_lines = 0
+        self.sent_bytes = 0
+        self.started_ns = 0
+        self.finished_ns = 0
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _build_line(self, seq: int) -> bytes:
+        header = b"%d %d " % (seq, time.monotonic_ns())
+        length = max(len(header) + 1, self._config["line_length"])
+        body_length = length - len(header)
+        offset = (seq * 131) % (len(self._filler) - body_length)
+        body = self._filler[offset:offset + body_length]
+        if self._config["keyword_density"] and self._random.random() < self._config["keyword_density"]:
+            keyword = self._keywords[seq % len(self._keywords)]
+            body = body[:max(0, body_length - len(keyword) - 1)] + b" " + keyword
+        if self._config["invalid_utf8_ratio"] and self._random.random() < self._config["invalid_utf8_ratio"]:
+            middle = len(body) // 2
+            body = body[:middle] + INVALID_UTF8 + body[middle + len(INVALID_UTF8):]
+        return header + body[:body_length] + b"\n"
+
+    def _write(self, data: bytearray) -> None:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)  # pty 버퍼가 가득 차면 블로킹 (앱 쪽 백프레셔)
+            view = view[written:]
+
+    def _wait_for_window(self, seq: int, batch_lines: int, deadline: float) -> bool:
+        """처리 대기 라인 + 다음 배치가 창을 넘지 않을 때까지 대기. 중지/마감 시 False"""
+        window = self._config["max_in_flight"]
+        if not window or self._processed is None:
+            return True
+        while seq + batch_lines - self._processed() > window:
+            if time.monotonic() >= deadline or self._stop_event.wait(IN_FLIGHT_POLL_S):
+                return False
+        return True
+
+    def run(self):
+        rate = self._config["rate"]
+        burst_lines = self._config["burst_lines"]
+        burst_gap_s = self._config["burst_gap_ms"] / 1000.0
+        lines_per_batch = max(1, rate // 100) if rate else 512
+        if self._config["max_in_flight"]:
+            lines_per_batch = min(lines_per_batch, self._config["max_in_flight"])
+        self.started_ns = time.monotonic_ns()
+        deadline = time.monotonic() + self._duration_s
+        start = time.monotonic()
+        seq = 0
+        batch = bytearray()
+        try:
+            while not self._stop_event.is_set() and time.monotonic() < deadline:
+                if not self._wait_for_window(seq, lines_per_batch, deadline):
+                    break
+                for _ in range(lines_per_batch):
+                    batch += self._build_line(seq)
+                    seq += 1
+                    if burst_lines and seq % burst_lines == 0:
+                        break
+                    if len(batch) >= WRITE_CHUNK_BYTES:
+                        break
+                self._write(batch)
+                self.sent_bytes += len(batch)
+                self.sent_lines = seq
+                batch.clear()
+                if burst_lines and seq % burst_lines == 0:
+                    self._stop_event.wait(burst_gap_s)
+                elif rate:
+                    ahead_s = start + seq / rate - time.monotonic()
+                    if ahead_s > 0:
+                        self._stop_event.wait(ahead_s)
+        except OSError:
+            pass  # 앱이 먼저 연결을 끊은 경우
+        self.finished_ns = time.monotonic_ns()
+
+
+class LatencyProbe:
+    """파이프라인이 처리한 라인의 헤더를 읽어 종단 간 지연 기록"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.received_lines = 0
+        self.out_of_order = 0
+        self.first_done_ns = 0
+        self.last_done_ns = 0
+        self._last_seq = -1
+        self._pending: list[int] = []
+
+    def on_line(self, line: str) -> None:
+        seq_text, _sep, rest = line.partition(" ")
+        sent_text = rest.partition(" ")[0]
+        if not (seq_text.isdigit() and sent_text.isdigit()):
+            return
+        seq = int(seq_text)
+        if seq <= self._last_seq:
+            self.out_of_order += 1
+        self._last_seq = seq
+        self._pending.append(int(sent_text))
+
+    def on_chunk_done(self) -> None:
+        """수신 청크 1개 처리(표시/카운터/자동 명령/로그) 완료 시점"""
+        if not self._pending:
+            return
+        done_ns = time.monotonic_ns()
+        for sent_ns in self._pending:
+            self.histogram.record(done_ns - sent_ns)
+        self.received_lines += len(self._pending)
+        self._pending.clear()
+        if not self.first_done_ns:
+            self.first_done_ns = done_ns
+        self.last_done_ns = done_ns
+
+
+class EventLoopMonitor:
+    """주기 타이머의 실제 간격으로 이벤트 루프 정지 시간 측정"""
+
+    def __init__(self, interval_ms: int = LOOP_PROBE_INTERVAL_MS):
+        from PyQt6.QtCore import Qt, QTimer
+        self._interval_ms = interval_ms
+        self._gaps = LatencyHistogram()
+        self._stall_count = 0
+        self._stall_total_ns = 0
+        self._last_ns = 0
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self):
+        self._last_ns = time.monotonic_ns()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _on_tick(self):
+        now = time.monotonic_ns()
+        gap = now - self._last_ns
+        self._last_ns = now
+        self._gaps.record(gap)
+        if gap >= STALL_THRESHOLD_MS * 1_000_000:
+            self._stall_count += 1
+            self._stall_total_ns += gap - self._interval_ms * 1_000_000
+
+    def summary(self) -> dict:
+        return {
+            "probe_interval_ms": self._interval_ms,
+            "max_gap_ms": round(self._gaps.max / 1e6, 3),
+            "p99_gap_ms": round(self._gaps.percentile(99) / 1e6, 3),
+            "stall_threshold_ms": STALL_THRESHOLD_MS,
+            "stall_count": self._stall_count,
+            "stall_total_ms": round(self._stall_total_ns / 1e6, 3),
+        }
+
+
+# === 벤치마크 대상 (GUI / 헤드리스) ===
+
+def _instrument(pipeline, probe: LatencyProbe) -> None:
+    """파이프라인 객체(MainWindow / HeadlessCapture)에 측정 훅 설치 (연결 전에 호출)"""
+    original_write_line = pipeline._log.write_line
+    original_on_data = pipeline._on_data_received
+
+    def write_line(line, timestamp=None):
+        probe.on_line(line)
+        original_write_line(line, timestamp)
+
+    def on_data_received(data, rx_ns=None):
+        original_on_data(data, rx_ns)
+        probe.on_chunk_done()
+
+    pipeline._log.write_line = write_line
+    pipeline._on_data_received = on_data_received
+
+
+class GuiTarget:
+    """오프스크린 MainWindow (표시/검색/카운터/자동 명령/로그 전체 경로)"""
+
+    def __init__(self, keywords: list[str], max_lines: int | None):
+        from PyQt6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication([sys.argv[0]])
+        from main_window import MainWindow
+        self.window = MainWindow()
+        self.window.show()
+        self.pipeline = self.window
+        self._keywords = keywords[:self.window._sidebar.MAX_LOG_COUNTERS]
+        self._max_lines = max_lines
+
+    def connect(self, port: str) -> bool:
+        settings = {
+            "port": port, "baudrate": 115200, "databits": 8, "parity": "N", "stopbits": 1,
+        }
+        if self._max_lines:
+            settings["max_lines"] = self._max_lines
+        if not self.window._on_connect(settings, silent=True):
+            return False
+        sidebar = self.window._sidebar
+        for index, keyword in enumerate(self._keywords):
+            counter = sidebar._log_counters[index]
+            if not counter["is_running"]:
+                counter["input"].setText(keyword)
+                sidebar._start_log_counter(index)
+        return True
+
+    def disconnect(self):
+        self.window._on_disconnect(manual=True)
+
+    def close(self):
+        self.window.close()
+
+
+class HeadlessTarget:
+    """헤드리스 파이프라인 (QtWidgets 없음)"""
+
+    def __init__(self, keywords: list[str], log_dir: str):
+        from PyQt6.QtCore import QCoreApplication
+        self.app = QCoreApplication.instance() or QCoreApplication([sys.argv[0]])
+        os.environ["AUTO_LOAD_STRING_STATS"] = ";".join(keywords)
+        from headless import HeadlessCapture
+        self.pipeline = HeadlessCapture("", 115200, log_dir, stats_interval_s=3600)
+
+    def connect(self, port: str) -> bool:
+        self.pipeline._port = port
+        self.pipeline.connect_port()
+        return self.pipeline._serial.is_connected()
+
+    def disconnect(self):
+        self.pipeline._reconnect_timer.stop()
+        self.pipeline._serial.disconnect()
+
+    def close(self):
+        self.pipeline.stop()
+
+
+# === 실행 ===
+
+def _wait_until(app, predicate, timeout_s: float, on_tick=None) -> bool:
+    """이벤트를 배치 단위로 처리하며 조건 대기
+
+    processEvents(WaitForMoreEvents)는 호출 시점에 쌓인 이벤트만 처리하고 돌아오므로
+    이벤트가 계속 들어와도 배치 사이마다 마감 시각을 확인해 timeout_s가 지나면 반드시 반환
+    (이벤트가 없을 때는 깨우기 타이머까지 블로킹, 바쁜 대기 없음)
+    """
+    from PyQt6.QtCore import QEventLoop, QTimer
+    deadline = time.monotonic() + timeout_s
+    wake_timer = QTimer()
+    wake_timer.setInterval(WAKE_INTERVAL_MS)
+    wake_timer.start()
+    try:
+        while True:
+            if on_tick is not None:
+                on_tick()
+            if predicate():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
+    finally:
+        wake_timer.stop()
+
+
+def run_pattern(target, name: str, config: dict, duration_s: float, keywords: list[str]) -> dict:
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    slave_path = os.ttyname(slave)
+    probe = LatencyProbe()
+    _instrument(target.pipeline, probe)
+    try:
+        if not target.connect(slave_path):
+            raise RuntimeError(f"pty 연결 실패: {slave_path}")
+
+        monitor = EventLoopMonitor()
+        generator = TrafficGenerator(
+            master, config, duration_s, keywords, processed=lambda: probe.received_lines
+        )
+        rss_start = rss_kb()
+        rss_peak = {"value": rss_start}
+
+        def sample_rss():
+            rss_peak["value"] = max(rss_peak["value"], rss_kb())
+
+        monitor.start()
+        generator.start()
+        _wait_until(target.app, lambda: not generator.is_alive(), duration_s + DRAIN_TIMEOUT_S,
+                    on_tick=sample_rss)
+        generator.stop()
+        generator.join(1.0)
+        drained = _wait_until(
+            target.app, lambda: probe.received_lines >= generator.sent_lines, DRAIN_TIMEOUT_S,
+            on_tick=sample_rss,
+        )
+        monitor.stop()
+        rss_end = rss_kb()
+        target.disconnect()
+    finally:
+        # 측정 훅 제거 (다음 패턴은 새 프로브 사용)
+        for attribute in ("_on_data_received",):
+            target.pipeline.__dict__.pop(attribute, None)
+        target.pipeline._log.__dict__.pop("write_line", None)
+        os.close(master)
+        os.close(slave)
+
+    elapsed_s = max(1e-9, (probe.last_done_ns - generator.started_ns) / 1e9) if probe.last_done_ns else 0.0
+    send_s = max(1e-9, (generator.finished_ns - generator.started_ns) / 1e9)
+    histogram = probe.histogram
+    return {
+        "pattern": name,
+        "config": config,
+        "duration_s": duration_s,
+        "sent_lines": generator.sent_lines,
+        "sent_bytes": generator.sent_bytes,
+        "received_lines": probe.received_lines,
+        "lost_lines": max(0, generator.sent_lines - probe.received_lines),
+        "out_of_order_lines": probe.out_of_order,
+        "drained": drained,
+        "elapsed_s": round(elapsed_s, 3),
+        "achieved_send_lines_per_s": round(generator.sent_lines / send_s, 1),
+        "sustained_lines_per_s": round(probe.received_lines / elapsed_s, 1) if elapsed_s else 0.0,
+        "sustained_bytes_per_s": round(generator.sent_bytes / elapsed_s, 1) if elapsed_s else 0.0,
+        "latency_ms": {
+            "p50": round(histogram.percentile(50) / 1e6, 3),
+            "p90": round(histogram.percentile(90) / 1e6, 3),
+            "p99": round(histogram.percentile(99) / 1e6, 3),
+            "p999": round(histogram.percentile(99.9) / 1e6, 3),
+            "max": round(histogram.max / 1e6, 3),
+            "mean": round(histogram.mean / 1e6, 3),
+        },
+        "event_loop": monitor.summary(),
+        "rss_kb": {
+            "start": rss_start,
+            "end": rss_end,
+            "peak": rss_peak["value"],
+            "growth": rss_end - rss_start,
+        },
+    }
+
+
+def build_pattern_configs(args) -> list[tuple[str, dict]]:
+    overrides = {
+        key: getattr(args, key)
+        for key in PATTERN_DEFAULTS
+        if getattr(args, key) is not None
+    }
+    configs = []
+    for name in args.pattern or ["short"]:
+        config = dict(PATTERN_DEFAULTS)
+        config.update(PATTERNS[name])
+        config.update(overrides)
+        configs.append((name, config))
+    return configs
+
+
+def print_result(result: dict) -> None:
+    latency = result["latency_ms"]
+    loop = result["event_loop"]
+    print(
+        f"[{result['pattern']}] {result['sustained_lines_per_s']:.0f} lines/s "
+        f"({result['received_lines']}/{result['sent_lines']} lines, lost={result['lost_lines']}) "
+        f"latency p50={latency['p50']}ms p99={latency['p99']}ms max={latency['max']}ms "
+        f"at {result['achieved_send_lines_per_s']:.0f} lines/s sent "
+        f"(rate={result['config']['rate'] or 'max'}, window={result['config']['max_in_flight'] or 'off'}"
+        f"{'' if result['drained'] else ', not drained'}) "
+        f"loop max_gap={loop['max_gap_ms']}ms stalls={loop['stall_count']} "
+        f"rss +{result['rss_kb']['growth']} kB",
+        flush=True,
+    )
+
+
+def print_comparison(baseline: dict, current: dict) -> None:
+    previous = {result["pattern"]: result for result in baseline.get("results", [])}
+    print(f"\ncompare: {baseline.get('metadata', {}).get('version', '?')} "
+          f"({baseline.get('metadata', {}).get('git_revision', '?')}) -> "
+          f"{current['metadata']['version']} ({current['metadata']['git_revision']})")
+    for result in current["results"]:
+        old = previous.get(result["pattern"])
+        if old is None:
+            continue
+        print(
+            f"  [{result['pattern']}] lines/s "
+            f"{percent_change(old['sustained_lines_per_s'], result['sustained_lines_per_s'])}, "
+            f"p99 {percent_change(old['latency_ms']['p99'], result['latency_ms']['p99'])}, "
+            f"max_gap {percent_change(old['event_loop']['max_gap_ms'], result['event_loop']['max_gap_ms'])}, "
+            f"rss_growth {old['rss_kb']['growth']} -> {result['rss_kb']['growth']} kB"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="LnxTerm end-to-end throughput benchmark")
+    parser.add_argument("--mode", choices=("gui", "headless"), default="gui")
+    parser.add_argument("--pattern", action="append", choices=sorted(PATTERNS),
+                        help="트래픽 패턴 (반복 지정 가능, 기본: short)")
+    parser.add_argument("--duration", type=float, default=5.0, help="패턴별 송신 시간(초)")
+    parser.add_argument("--rate", type=int, default=None, help="송신 속도 lines/s (0 = 최대)")
+    parser.add_argument("--max-in-flight", dest="max_in_flight", type=int, default=None,
+                        help="처리 대기 라인 상한 (0 = 제한 없음, 기본 512)")
+    parser.add_argument("--line-length", dest="line_length", type=int, default=None)
+    parser.add_argument("--burst-lines", dest="burst_lines", type=int, default=None)
+    parser.add_argument("--burst-gap-ms", dest="burst_gap_ms", type=int, default=None)
+    parser.add_argument("--keyword-density", dest="keyword_density", type=float, default=None)
+    parser.add_argument("--invalid-utf8-ratio", dest="invalid_utf8_ratio", type=float, default=None)
+    parser.add_argument("--keywords", default=";".join(DEFAULT_KEYWORDS),
+                        help="문자열 통계 키워드 (';' 구분)")
+    parser.add_argument("--max-lines", type=int, default=None, help="GUI 터미널 최대 라인 수")
+    parser.add_argument("-o", "--output", default="", help="결과 JSON 경로")
+    parser.add_argument("--compare", default="", help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    keywords = [keyword.strip() for keyword in args.keywords.split(";") if keyword.strip()]
+    configs = build_pattern_configs(args)
+
+    with tempfile.TemporaryDirectory(prefix="lnxterm_bench_") as workdir:
+        # 앱 설정 격리: 작업 디렉토리 .env가 우선 사용되고 QSettings는 임시 경로에 기록
+        log_dir = os.path.join(workdir, "logs")
+        with open(os.path.join(workdir, ".env"), "w", encoding="utf-8") as fp:
+            fp.write(f"LOG_DIR={log_dir}\nAUTO_LOAD_MODE=IGNORE\nRECONNECT_INTERVAL_MS=1000\n")
+        os.environ["XDG_CONFIG_HOME"] = os.path.join(workdir, "config")
+        os.environ.pop("STREAM_SERVER", None)
+        if args.mode == "gui":
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        os.chdir(workdir)
+        from dotenv import load_dotenv
+        load_dotenv(os.path.join(workdir, ".env"), override=True)
+
+        if args.mode == "gui":
+            target = GuiTarget(keywords, args.max_lines)
+        else:
+            target = HeadlessTarget(keywords, log_dir)
+
+        results = []
+        try:
+            for name, config in configs:
+                result = run_pattern(target, name, config, args.duration, keywords)
+                print_result(result)
+                results.append(result)
+        finally:
+            target.close()
+            os.chdir(REPO_ROOT)
+
+    payload = {
+        "metadata": run_metadata(benchmark="e2e", mode=args.mode, duration_s=args.duration),
+        "results": results,
+    }
+    if args.output:
+        write_results(args.output, payload)
+        print(f"saved: {args.output}")
+    if args.compare:
+        print_comparison(load_results(args.compare), payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+라인 처리 핫패스 마이크로벤치마크
+- 단계별로 격리하여 ns/line 측정 (오프스크린 Qt, 반복 측정 후 최소/중앙값)
+    terminal_append_data     TerminalWidget.append_data (호출당 라인 수별)
+    terminal_append_ansi     TerminalWidget.append_data (ANSI 색상 없음 / 라인마다 SGR 색상)
+    counters                 SidebarWidget.process_log_line_for_counters (키워드 1~100개)
+    automation               SidebarWidget.process_log_line_for_automation (자동 명령 1~200개)
+    log_write_line           LogManager.write_line
+    counter_rate_csv         SidebarWidget._write_counter_rates (카운터 10개 x 60분 분당 히트 수 행, ns/행)
+    search_find_all          SearchWidget._find_all (N줄 문서)
+- 결과를 JSON으로 저장하고 --compare로 이전 결과와 비교
+
+사용 예:
+    python bench/bench_micro.py -o micro_base.json
+    python bench/bench_micro.py --only counters --only automation --compare micro_base.json
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from common import load_results, percent_change, run_metadata, write_results
+
+DEFAULT_LINES = 20_000
+DEFAULT_REPEAT = 5
+MATCH_RATIO = 0.01   # 키워드/트리거가 포함된 라인 비율
+
+APPEND_BATCH_SIZES = (1, 10, 100, 1000)
+COUNTER_KEYWORD_COUNTS = (1, 10, 50, 100)
+AUTOMATION_TASK_COUNTS = (1, 10, 100, 200)
+SEARCH_DOCUMENT_LINES = (1_000, 10_000, 100_000)
+
+
+def make_lines(count: int, keyword: str = "", match_ratio: float = MATCH_RATIO) -> list[str]:
+    """일반 로그 형태의 라인 생성 (match_ratio 비율로 keyword 포함)"""
+    every = int(1 / match_ratio) if keyword and match_ratio > 0 else 0
+    lines = []
+    for index in range(count):
+        line = f"[{index:08d}] sensor=0x{index * 2654435761 & 0xFFFF:04x} temp=23.{index % 10} status=ok"
+        if every and index % every == 0:
+            line += f" {keyword}"
+        lines.append(line)
+    return lines
+
+
+def measure(run, units: int, repeat: int) -> dict:
+    """run()을 repeat회 실행하여 단위(라인)당 ns 계산 (GC는 측정 중 비활성)"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - started
+        finally:
+            gc.enable()
+        samples.append(elapsed / units)
+    return {
+        "units": units,
+        "repeat": repeat,
+        "ns_per_line_best": round(min(samples), 1),
+        "ns_per_line_median": round(statistics.median(samples), 1),
+    }
+
+
+# === 벤치마크 케이스 ===
+
+def bench_terminal_append_data(args, workdir: str) -> list[dict]:
+    from terminal_widget import TerminalWidget
+    results = []
+    lines = make_lines(args.lines)
+    for batch_size in APPEND_BATCH_SIZES:
+        chunks = [
+            "\n".join(lines[index:index + batch_size]) + "\n"
+            for index in range(0, len(lines), batch_size)
+        ]
+        terminal = TerminalWidget(max_lines=args.lines)
+
+        def run():
+            for chunk in chunks:
+                terminal.append_data(chunk, direction="rx")
+
+        result = measure(run, len(lines), args.repeat)
+        result.update(case="terminal_append_data", param=f"batch={batch_size}")
+        results.append(result)
+        terminal.deleteLater()
+    return results
+
+
+def bench_terminal_append_ansi(args, workdir: str) -> list[dict]:
+    from terminal_widget import TerminalWidget
+    results = []
+    plain = make_lines(args.lines)
+    colors = ("\x1b[32m", "\x1b[1;33m", "\x1b[31m", "\x1b[38;5;208m")
+    variants = {
+        "plain": plain,
+        "colored": [
+            f"{colors[index % len(colors)]}{line[:10]}\x1b[0m{line[10:]}"
+            for index, line in enumerate(plain)
+        ],
+    }
+    for name, lines in variants.items():
+        chunks = [
+            "\n".join(lines[index:index + 100]) + "\n"
+            for index in range(0, len(lines), 100)
+        ]
+        terminal = TerminalWidget(max_lines=args.lines)
+
+        def run():
+            for chunk in chunks:
+                terminal.append_data(chunk, direction="rx")
+
+        result = measure(run, len(lines), args.repeat)
+        result.update(case="terminal_append_ansi", param=name)
+        results.append(result)
+        terminal.deleteLater()
+    return results
+
+
+def _make_sidebar(workdir: str):
+    from sidebar_widget import SidebarWidget
+    sidebar = SidebarWidget()
+    sidebar._is_connected = True
+    sidebar._stats_csv_path = os.path.join(workdir, "lnxterm_stats_bench.csv")
+    sidebar._is_logging = True
+    return sidebar
+
+
+def _make_running_counter(keyword: str) -> dict:
+    """SidebarWidget 카운터 항목과 같은 구성 (MAX_LOG_COUNTERS를 넘는 키워드 수 측정용)"""
+    from PyQt6.QtWidgets import QLabel, QLineEdit, QPushButton
+    from rate_buckets import RateBuckets
+    from sparkline import SparklineWidget
+    return {
+        "input": QLineEdit(keyword),
+        "count_label": QLabel(),
+        "started_label": QLabel(),
+        "last_detected_label": QLabel(),
+        "status_label": QLabel(),
+        "toggle_btn": QPushButton(),
+        "reset_btn": QPushButton(),
+        "sparkline": SparklineWidget(),
+        "rates": RateBuckets(),
+        "count": 0,
+        "started_at": datetime.now(),
+        "last_detected_at": None,
+        "is_running": True,
+        "is_stopped": False,
+    }
+
+
+def bench_counters(args, workdir: str) -> list[dict]:
+    results = []
+    lines = make_lines(args.lines, keyword="KW0")
+    timestamp = "[2024-01-01 00:00:00.000]"
+    for keyword_count in COUNTER_KEYWORD_COUNTS:
+        sidebar = _make_sidebar(workdir)
+        sidebar._log_counters = [_make_running_counter(f"KW{index}") for index in range(keyword_count)]
+
+        def run():
+            for line in lines:
+                sidebar.process_log_line_for_counters(line, timestamp)
+
+        result = measure(run, len(lines), args.repeat)
+        result.update(case="counters", param=f"keywords={keyword_count}")
+        results.append(result)
+        sidebar.deleteLater()
+    return results
+
+
+def bench_automation(args, workdir: str) -> list[dict]:
+    results = []
+    lines = make_lines(args.lines, keyword="TRIGGER0")
+    for task_count in AUTOMATION_TASK_COUNTS:
+        sidebar = _make_sidebar(workdir)
+        tasks = []
+        for index in range(task_count):
+            # 사후 명령 없음: 매칭/상태 갱신 비용만 측정 (송신 예약 제외)
+            task = sidebar._build_automation_task(
+                {"name": f"task{index}", "trigger": f"TRIGGER{index}", "post_cmd": "", "enabled": True}
+            )
+            tasks.append(task)
+        sidebar._automation_tasks = tasks
+        sidebar._refresh_automation_list()
+        rx_ns = time.monotonic_ns()
+
+        def run():
+            for line in lines:
+                sidebar.process_log_line_for_automation(line, rx_ns)
+
+        result = measure(run, len(lines), args.repeat)
+        result.update(case="automation", param=f"tasks={task_count}")
+        results.append(result)
+        sidebar.deleteLater()
+    return results
+
+
+def bench_log_write_line(args, workdir: str) -> list[dict]:
+    from log_manager import LogManager
+    lines = make_lines(args.lines)
+    log = LogManager()
+    log.start_logging(os.path.join(workdir, "lnxterm_bench.log"), LogManager.MODE_OVERWRITE)
+    timestamp = log.get_timestamp()
+
+    def run():
+        for line in lines:
+            log.write_line(line, timestamp)
+
+    result = measure(run, len(lines), args.repeat)
+    result.update(case="log_write_line", param="")
+    log.stop_logging()
+    return [result]
+
+
+def bench_counter_rate_csv(args, workdir: str) -> list[dict]:
+    from rate_buckets import minute_start
+    sidebar = _make_sidebar(workdir)
+    minutes = 60
+    end = minute_start(time.time())
+    start = end - minutes * 60
+    sidebar._log_counters = [_make_running_counter(f"KW{index}") for index in range(10)]
+    for counter in sidebar._log_counters:
+        counter["rates"].start(start)
+        for second in range(start, end):
+            counter["rates"].record(second)
+
+    def run():
+        sidebar._stats_csv_written_until = start
+        sidebar._write_counter_rates(end)
+
+    result = measure(run, minutes * len(sidebar._log_counters), args.repeat)
+    result.update(case="counter_rate_csv", param=f"counters=10,minutes={minutes}")
+    sidebar.deleteLater()
+    return [result]
+
+
+def bench_search_find_all(args, workdir: str) -> list[dict]:
+    from terminal_widget import TerminalWidget
+    from search_widget import SearchWidget
+    results = []
+    for document_lines in SEARCH_DOCUMENT_LINES:
+        terminal = TerminalWidget(max_lines=document_lines)
+        terminal.setPlainText("\n".join(make_lines(document_lines, keyword="NEEDLE")))
+        search = SearchWidget(terminal)
+
+        def run():
+            search._find_all("NEEDLE")
+
+        result = measure(run, document_lines, args.repeat)
+        result.update(case="search_find_all", param=f"lines={document_lines}",
+                      matches=len(search._matches))
+        results.append(result)
+        search.deleteLater()
+        terminal.deleteLater()
+    return results
+
+
+CASES = {
+    "terminal_append_data": bench_terminal_append_data,
+    "terminal_append_ansi": bench_terminal_append_ansi,
+    "counters": bench_counters,
+    "automation": bench_automation,
+    "log_write_line": bench_log_write_line,
+    "counter_rate_csv": bench_counter_rate_csv,
+    "search_find_all": bench_search_find_all,
+}
+
+
+def _result_key(result: dict) -> str:
+    return f"{result['case']}[{result['param']}]" if result["param"] else result["case"]
+
+
+def print_result(result: dict) -> None:
+    print(
+        f"{_result_key(result):<40} {result['ns_per_line_best']:>12.1f} ns/line "
+        f"(median {result['ns_per_line_median']:.1f}, n={result['units']}x{result['repeat']})",
+        flush=True,
+    )
+
+
+def print_comparison(baseline: dict, current: dict) -> None:
+    previous = {_result_key(result): result for result in baseline.get("results", [])}
+    print(f"\ncompare: {baseline.get('metadata', {}).get('git_revision', '?')} -> "
+          f"{current['metadata']['git_revision']} (best ns/line, 음수 = 개선)")
+    for result in current["results"]:
+        key = _result_key(result)
+        old = previous.get(key)
+        if old is None:
+            continue
+        print(f"  {key:<40} {old['ns_per_line_best']:>12.1f} -> {result['ns_per_line_best']:>12.1f} "
+              f"({percent_change(old['ns_per_line_best'], result['ns_per_line_best'])})")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="LnxTerm per-line hot path microbenchmarks")
+    parser.add_argument("--only", action="append", choices=sorted(CASES),
+                        help="실행할 케이스 (반복 지정 가능, 기본: 전체)")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="반복당 라인 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="반복 횟수")
+    parser.add_argument("-o", "--output", default="", help="결과 JSON 경로")
+    parser.add_argument("--compare", default="", help="비교할 이전 결과 JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="lnxterm_micro_") as workdir:
+        os.environ["XDG_CONFIG_HOME"] = os.path.join(workdir, "config")
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication([sys.argv[0]])
+
+        results = []
+        for name in args.only or list(CASES):
+            for result in CASES[name](args, workdir):
+                print_result(result)
+                results.append(result)
+            app.processEvents()
+
+    payload = {
+        "metadata": run_metadata(
+            benchmark="micro",
+            qt_platform=os.environ.get("QT_QPA_PLATFORM", ""),
+            lines=args.lines,
+            repeat=args.repeat,
+        ),
+        "results": results,
+    }
+    if args.output:
+        write_results(args.output, payload)
+        print(f"saved: {args.output}")
+    if args.compare:
+        print_comparison(load_results(args.compare), payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+벤치마크 공용 도우미
+- 저장소 루트를 모듈 경로에 추가 (bench/ 하위에서 직접 실행)
+- RSS 측정(/proc/self/status), 실행 환경 메타데이터, 결과 JSON 저장/불러오기
+"""
+
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def rss_kb(field: str = "VmRSS") -> int:
+    """현재 프로세스 메모리(kB). field: VmRSS(현재) / VmHWM(최대)"""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as fp:
+            for line in fp:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def app_version() -> str:
+    """main_window.APP_VERSION 값 (QtWidgets 로딩 없이 소스에서 읽음)"""
+    try:
+        with open(os.path.join(REPO_ROOT, "main_window.py"), "r", encoding="utf-8") as fp:
+            match = re.search(r'APP_VERSION\s*=\s*"([^"]+)"', fp.read())
+    except OSError:
+        return ""
+    return match.group(1) if match else ""
+
+
+def git_revision() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=2,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip()
+
+
+def run_metadata(**extra) -> dict:
+    """결과 비교용 실행 환경 정보"""
+    metadata = {
+        "version": app_version(),
+        "git_revision": git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    metadata.update(extra)
+    return metadata
+
+
+def write_results(path: str, payload: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(payload, fp, ensure_ascii=False, indent=2)
+        fp.write("\n")
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def percent_change(baseline: float, current: float) -> str:
+    if not baseline:
+        return "n/a"
+    return f"{(current - baseline) / baseline * 100:+.1f}%"
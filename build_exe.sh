@@ -1,5 +1,12 @@
 #!/bin/bash
 # LnxTerm 단독 실행 파일 빌드 스크립트
+# 사용법: ./build_exe.sh            단일 실행 파일 (dist/lnxterm)
+#         ./build_exe.sh --onedir   폴더 배포 (dist/lnxterm/lnxterm, 실행 시 압축 해제 없음 → 시작 빠름)
+
+BUILD_MODE="--onefile"
+if [ "$1" == "--onedir" ]; then
+    BUILD_MODE="--onedir"
+fi
 
 # 가상환경 활성화
 source .venv/bin/activate
@@ -8,12 +15,17 @@ source .venv/bin/activate
 rm -rf build dist lnxterm.spec
 
 # PyInstaller를 사용하여 단독 실행 파일 생성
-# --onefile: 모든 파일을 하나로 묶음
+# --onefile: 모든 파일을 하나로 묶음 (실행할 때마다 임시 폴더에 압축 해제)
+# --onedir: 실행 파일 + 라이브러리 폴더 (압축 해제 단계 없음)
 # --windowed: GUI 앱으로 실행 (터미널 창 열리지 않음)
 # --name lnxterm: 실행 파일 이름 지정
 # --clean: 캐시 삭제 후 빌드
-pyinstaller --onefile --windowed --name lnxterm --clean main.py
+pyinstaller $BUILD_MODE --windowed --name lnxterm --clean main.py
 
 echo "------------------------------------------------"
-echo "빌드가 완료되었습니다. 실행 파일 위치: dist/lnxterm"
+if [ "$BUILD_MODE" == "--onedir" ]; then
+    echo "빌드가 완료되었습니다. 실행 파일 위치: dist/lnxterm/lnxterm"
+else
+    echo "빌드가 완료되었습니다. 실행 파일 위치: dist/lnxterm"
+fi
 echo "------------------------------------------------"
@@ -0,0 +1,86 @@
+"""
+수신 원본 바이트 링 버퍼
+- 고정 크기 bytearray에 수신 청크를 그대로 복사 (디코딩 이전, 오래된 바이트부터 덮어씀)
+- 위치는 연결 이후 누적 절대 오프셋으로 표시 → 덮어써도 보기 측 오프셋이 밀리지 않음
+- 읽기는 memoryview 슬라이스(경계를 넘으면 최대 2개)로 복사 1회
+"""
+
+import os
+
+ENV_HEX_VIEW_BUFFER_BYTES = "HEX_VIEW_BUFFER_BYTES"
+DEFAULT_CAPACITY = 16 * 1024 * 1024
+MIN_CAPACITY = 64 * 1024
+
+
+def capacity_from_env() -> int:
+    """HEX_VIEW_BUFFER_BYTES (기본 16MiB, 최소 64KiB)"""
+    try:
+        value = int(os.environ.get(ENV_HEX_VIEW_BUFFER_BYTES, "").strip() or DEFAULT_CAPACITY)
+    except ValueError:
+        return DEFAULT_CAPACITY
+    return max(MIN_CAPACITY, value)
+
+
+class ByteRing:
+    """절대 오프셋 기반 바이트 링 버퍼 (버퍼는 첫 append 때 할당)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = max(1, int(capacity))
+        self._buffer: bytearray | None = None
+        self._view: memoryview | None = None
+        self._end = 0     # 지금까지 기록한 총 바이트 수 (= 다음 바이트의 절대 오프셋)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def start_offset(self) -> int:
+        """읽을 수 있는 가장 오래된 바이트의 절대 오프셋"""
+        return max(0, self._end - self._capacity)
+
+    @property
+    def end_offset(self) -> int:
+        return self._end
+
+    def __len__(self) -> int:
+        return self._end - self.start_offset
+
+    def clear(self) -> None:
+        """내용 비우기 (오프셋도 0부터 다시 시작)"""
+        self._end = 0
+
+    def append(self, data: bytes) -> None:
+        size = len(data)
+        if not size:
+            return
+        if self._buffer is None:
+            self._buffer = bytearray(self._capacity)
+            self._view = memoryview(self._buffer)
+        capacity = self._capacity
+        source = memoryview(data)
+        if size > capacity:
+            # 용량보다 큰 청크는 마지막 capacity 바이트만 유지
+            self._end += size - capacity
+            source = source[size - capacity:]
+            size = capacity
+        position = self._end % capacity
+        first = min(size, capacity - position)
+        self._view[position:position + first] = source[:first]
+        if first < size:
+            self._view[:size - first] = source[first:]
+        self._end += size
+
+    def read(self, offset: int, length: int) -> bytes:
+        """[offset, offset+length) 중 버퍼에 남아 있는 구간 (앞쪽이 덮어써졌으면 잘린 결과)"""
+        start = max(offset, self.start_offset)
+        end = min(offset + length, self._end)
+        if end <= start:
+            return b""
+        capacity = self._capacity
+        position = start % capacity
+        size = end - start
+        if position + size <= capacity:
+            return self._view[position:position + size].tobytes()
+        first = capacity - position
+        return b"".join((self._view[position:], self._view[:size - first]))
@@ -0,0 +1,216 @@
+"""
+명령 입력 히스토리 저장소
+- .env와 같은 디렉토리의 lnxterm_history.jsonl에 한 줄씩 추가 기록 (append-only, [시각, 명령, 횟수])
+- 메모리에는 명령별 (사용 횟수, 마지막 사용 순번)만 유지 → 중복 제거, 최근 사용 순서 O(1) 갱신
+- 파일은 첫 사용 시 또는 preload()로 백그라운드 스레드에서 읽음 (시작 시간에 영향 없음)
+- 중복 줄이 많이 쌓이면 불러올 때 명령당 한 줄로 압축해 원자적으로 교체
+- 역방향 검색(Ctrl+R)은 최근 사용 순으로 이은 문자열에서 부분 문자열을 찾고
+  사용 빈도/최근성(frecency) 점수로 정렬
+"""
+
+import json
+import os
+import threading
+import time
+
+HISTORY_FILENAME = "lnxterm_history.jsonl"
+
+
+def _search_text(command: str) -> str:
+    return command.lower().replace("\n", " ")
+
+
+def history_path_for(env_path: str) -> str:
+    """.env와 같은 디렉토리의 히스토리 파일 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(env_path)), HISTORY_FILENAME)
+
+
+class CommandHistory:
+    """중복 제거 + 파일 유지 명령 히스토리 (path가 None이면 메모리 전용)"""
+
+    MAX_ENTRIES = 50000          # 유지할 서로 다른 명령 수 (초과 시 오래 안 쓴 것부터 제거)
+    COMPACT_MIN_LINES = 1000     # 파일 줄 수가 이 값 이상이고
+    COMPACT_FACTOR = 2           # 명령 수의 이 배수를 넘으면 불러올 때 압축
+    FRECENCY_HALF_LIFE = 200     # 최근성 가중치가 절반이 되는 사용 횟수 간격
+    MAX_SEARCH_CANDIDATES = 500  # 검색 시 점수를 매길 최근 일치 항목 수
+
+    def __init__(self, path: str | None = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._loaded = path is None
+        self._load_thread: threading.Thread | None = None
+        # 명령 → [사용 횟수, 마지막 사용 순번, 검색용 소문자], dict 순서 = 오래된 사용 → 최근 사용
+        self._entries: dict[str, list] = {}
+        self._by_lowered: dict[str, str] = {}    # 검색용 소문자 → 명령 (검색 결과 역참조)
+        self._seq = 0
+        self._recent: list[str] | None = None
+        self._blob: str | None = None
+
+    @property
+    def path(self) -> str | None:
+        return self._path
+
+    # === 불러오기 ===
+
+    def preload(self) -> None:
+        """백그라운드 스레드에서 파일 불러오기 시작"""
+        with self._lock:
+            if self._loaded or self._load_thread is not None:
+                return
+            self._load_thread = threading.Thread(
+                target=self._ensure_loaded, name="CommandHistoryLoader", daemon=True
+            )
+            self._load_thread.start()
+
+    def _ensure_loaded(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            # 불러오기 전에 add()된 명령도 파일에 이미 기록되어 있으므로 함께 집계됨
+            self._entries, line_count = self._read_file()
+            self._by_lowered = {stats[2]: command for command, stats in self._entries.items()}
+            self._seq = max((stats[1] for stats in self._entries.values()), default=0)
+            self._trim()
+            if (
+                line_count >= self.COMPACT_MIN_LINES
+                and line_count > len(self._entries) * self.COMPACT_FACTOR
+            ):
+                self._compact()
+            self._loaded = True
+            self._invalidate()
+
+    def _read_file(self) -> tuple[dict[str, list], int]:
+        entries: dict[str, list] = {}
+        line_count = 0
+        seq = 0
+        try:
+            with open(self._path, encoding="utf-8") as fp:
+                for line in fp:
+                    line_count += 1
+                    try:
+                        record = json.loads(line)
+                        command = record[1]
+                        count = int(record[2]) if len(record) > 2 else 1
+                    except (ValueError, TypeError, IndexError, KeyError):
+                        continue
+                    if not isinstance(command, str) or not command:
+                        continue
+                    seq += 1
+                    stats = entries.pop(command, None)
+                    if stats is None:
+                        stats = [0, 0, _search_text(command)]
+                    stats[0] += max(1, count)
+                    stats[1] = seq
+                    entries[command] = stats
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error reading {self._path}: {e}")
+        return entries, line_count
+
+    def _compact(self) -> None:
+        """명령당 한 줄로 다시 기록 (임시 파일 + os.replace)"""
+        tmp_path = f"{self._path}.tmp{os.getpid()}"
+        now = int(time.time())
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                for command, (count, _seq, _lowered) in self._entries.items():
+                    fp.write(json.dumps([now, command, count], ensure_ascii=False) + "\n")
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            print(f"Error compacting {self._path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # === 갱신 ===
+
+    def add(self, command: str) -> None:
+        """명령 사용 기록 (파일에는 즉시 한 줄 추가)"""
+        if not command:
+            return
+        # 불러오기 스레드와 파일 기록 순서가 섞이지 않도록 잠금 안에서 기록
+        with self._lock:
+            if self._path is not None:
+                try:
+                    with open(self._path, "a", encoding="utf-8") as fp:
+                        fp.write(json.dumps([int(time.time()), command], ensure_ascii=False) + "\n")
+                except OSError as e:
+                    print(f"Error writing {self._path}: {e}")
+            if not self._loaded:
+                return
+            self._touch(command)
+            self._trim()
+            self._invalidate()
+
+    def _touch(self, command: str) -> None:
+        self._seq += 1
+        stats = self._entries.pop(command, None)
+        if stats is None:
+            stats = [0, 0, _search_text(command)]
+        stats[0] += 1
+        stats[1] = self._seq
+        self._entries[command] = stats
+        self._by_lowered[stats[2]] = command
+
+    def _trim(self) -> None:
+        while len(self._entries) > self.MAX_ENTRIES:
+            command = next(iter(self._entries))
+            lowered = self._entries.pop(command)[2]
+            if self._by_lowered.get(lowered) == command:
+                del self._by_lowered[lowered]
+
+    def _invalidate(self) -> None:
+        self._recent = None
+        self._blob = None
+
+    # === 조회 ===
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
+
+    def recent(self) -> list[str]:
+        """최근 사용 순 명령 목록 (최신이 앞)"""
+        self._ensure_loaded()
+        if self._recent is None:
+            self._recent = list(reversed(self._entries))
+        return self._recent
+
+    def frecency(self, command: str) -> float:
+        stats = self._entries.get(command)
+        if stats is None:
+            return 0.0
+        count, seq, _lowered = stats
+        return count * 0.5 ** ((self._seq - seq) / self.FRECENCY_HALF_LIFE)
+
+    def search(self, query: str) -> list[str]:
+        """query를 포함하는 명령 목록 (대소문자 무시, frecency 높은 순)"""
+        self._ensure_loaded()
+        if not query:
+            return []
+        blob = self._ensure_blob()
+        needle = query.lower()
+        matches = []
+        position = blob.find(needle)
+        while position >= 0 and len(matches) < self.MAX_SEARCH_CANDIDATES:
+            line_start = blob.rfind("\n", 0, position) + 1
+            line_end = blob.find("\n", position)
+            if line_end < 0:
+                line_end = len(blob)
+            command = self._by_lowered.get(blob[line_start:line_end])
+            if command is not None:
+                matches.append(command)
+            # 같은 명령의 나머지 일치는 건너뛰고 다음 줄부터 검색
+            position = blob.find(needle, line_end + 1)
+        matches.sort(key=self.frecency, reverse=True)
+        return matches
+
+    def _ensure_blob(self) -> str:
+        """최근 사용 순 명령(소문자)을 줄 단위로 이은 문자열 (변경 후 첫 검색 시 재생성)"""
+        if self._blob is None:
+            self._blob = "\n".join(self._entries[command][2] for command in self.recent())
+        return self._blob
@@ -0,0 +1,398 @@
+"""
+명령 팔레트 모듈 (Ctrl+P)
+- 매크로 / 입력 히스토리 / 자동 명령 이름을 하나의 색인에서 퍼지 검색
+- 색인은 소스별 diff로만 갱신 (바뀐 항목만 트라이에 추가/제거)
+- 순위 단계: 완전 일치 → 질의로 시작 → 단어 접두사 일치 → 부분열 일치, 같은 단계 안에서는 부분열 점수
+- 완전 일치: 텍스트/설명(소문자, 공백 정규화) → id 사전에서 바로 조회
+- 질의로 시작: 정렬한 검색 문자열 목록에서 bisect로 범위 조회
+- 단어 접두사: 트라이에서 질의 단어별 후보 집합 교집합
+- 앞 단계 후보가 부족하면 부분열(subsequence) 매칭으로 보충.
+  정적 순위 순서로 모든 항목을 한 줄씩 이은 문자열을 정규식으로 스캔해
+  앞에서부터 필요한 개수만 취함 (파이썬 루프 없이 C에서 스캔)
+- 점수 계산은 단계별로 정적 순위(소스 → 순서 → 길이)로 추린 상위 후보에만 수행
+"""
+
+import bisect
+import heapq
+import re
+import time
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (
+    QDialog, QLabel, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout,
+)
+
+from i18n import normalize_language, tr
+from styles import COLORS
+
+SOURCE_HISTORY = "history"
+SOURCE_MACRO = "macro"
+SOURCE_TASK = "task"
+SOURCES = (SOURCE_HISTORY, SOURCE_MACRO, SOURCE_TASK)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def exact_key(text: str) -> str:
+    """완전 일치 비교용 키 (소문자, 연속 공백 하나로)"""
+    return " ".join(text.lower().split())
+
+
+def subsequence_score(query: str, text: str) -> int | None:
+    """query 글자가 text에 순서대로 모두 있으면 점수, 아니면 None
+
+    연속 일치 / 단어 시작 일치에 가산, 건너뛴 글자 수만큼 감점
+    """
+    score = 0
+    position = 0
+    previous = -2
+    for char in query:
+        found = text.find(char, position)
+        if found < 0:
+            return None
+        if found == previous + 1:
+            score += 8
+        if found == 0 or not text[found - 1].isalnum():
+            score += 6
+        score -= min(found - position, 10)
+        previous = found
+        position = found + 1
+    return score
+
+
+class PaletteIndex:
+    """팔레트 검색 색인 (Qt 비의존)
+
+    항목은 (source, key)로 식별하며 text(전송/실행 대상)와 detail(설명)을 함께 검색
+    """
+
+    MAX_PREFIX_DEPTH = 24      # 트라이에 넣는 단어 접두사 최대 길이
+    SCORE_POOL_FACTOR = 2      # 단계별 점수 계산 후보 수 = limit * 이 값 (정적 순위 상위)
+
+    # 순위 단계 (클수록 앞)
+    TIER_EXACT = 3      # 텍스트 또는 설명이 질의와 같음
+    TIER_START = 2      # 검색 문자열이 질의로 시작
+    TIER_PREFIX = 1     # 질의 단어가 모두 항목 단어의 접두사
+    TIER_FUZZY = 0      # 부분열 일치
+
+    def __init__(self):
+        self._next_id = 0
+        self._ids: dict[tuple[str, str], int] = {}
+        self._entries: dict[int, tuple[str, str, str, str, str]] = {}  # id → (source, key, text, detail, 검색 문자열)
+        self._rank: dict[int, tuple] = {}      # 질의가 없거나 동점일 때 정렬 키
+        self._exact: dict[str, set[int]] = {}  # exact_key(텍스트/설명) → id 집합
+        self._trie: dict = {}                  # 글자 → [하위 노드, id 집합]
+        self._blob: tuple[str, list[int], list[int]] | None = None   # (문자열, 줄 시작 위치, id)
+        self._sorted: tuple[list[str], list[int]] | None = None      # (정렬한 검색 문자열, id)
+        self._default_order: list[int] | None = None    # 정적 순위로 정렬한 전체 id
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # === 갱신 ===
+
+    def add(self, source: str, key: str, text: str, detail: str = "", order: int = 0) -> None:
+        ident = self._ids.get((source, key))
+        if ident is not None:
+            entry = self._entries[ident]
+            if entry[2] == text and entry[3] == detail:
+                rank = self._make_rank(source, text, order)
+                if self._rank[ident] != rank:
+                    self._rank[ident] = rank
+                    self._default_order = None
+                return
+            self.remove(source, key)
+        ident = self._next_id
+        self._next_id += 1
+        haystack = (f"{text} {detail}" if detail else text).lower().replace("\n", " ")
+        self._ids[(source, key)] = ident
+        self._entries[ident] = (source, key, text, detail, haystack)
+        self._rank[ident] = self._make_rank(source, text, order)
+        for key_text in (text, detail):
+            if key_text:
+                self._exact.setdefault(exact_key(key_text), set()).add(ident)
+        for token in set(tokenize(haystack)):
+            self._trie_update(token, ident, add=True)
+        self._default_order = None
+
+    def remove(self, source: str, key: str) -> None:
+        ident = self._ids.pop((source, key), None)
+        if ident is None:
+            return
+        _source, _key, text, detail, haystack = self._entries.pop(ident)
+        del self._rank[ident]
+        for key_text in (text, detail):
+            ids = self._exact.get(exact_key(key_text)) if key_text else None
+            if ids is not None:
+                ids.discard(ident)
+                if not ids:
+                    del self._exact[exact_key(key_text)]
+        for token in set(tokenize(haystack)):
+            self._trie_update(token, ident, add=False)
+        self._default_order = None
+
+    def replace_source(self, source: str, items) -> None:
+        """소스 전체를 items [(key, text, detail), ...]로 맞춤 (바뀐 항목만 갱신)"""
+        wanted = {}
+        for order, (key, text, detail) in enumerate(items):
+            wanted.setdefault(key, (text, detail, order))
+        for existing_source, key in list(self._ids):
+            if existing_source == source and key not in wanted:
+                self.remove(source, key)
+        for key, (text, detail, order) in wanted.items():
+            self.add(source, key, text, detail, order)
+
+    def _make_rank(self, source: str, text: str, order: int) -> tuple:
+        return (SOURCES.index(source), order, len(text))
+
+    def _trie_update(self, token: str, ident: int, add: bool) -> None:
+        node = self._trie
+        for char in token[:self.MAX_PREFIX_DEPTH]:
+            child = node.get(char)
+            if child is None:
+                if not add:
+                    return
+                child = node[char] = [{}, set()]
+            if add:
+                child[1].add(ident)
+            else:
+                child[1].discard(ident)
+            node = child[0]
+
+    def _prefix_ids(self, token: str) -> set[int]:
+        node = self._trie
+        ids: set[int] = set()
+        for char in token[:self.MAX_PREFIX_DEPTH]:
+            child = node.get(char)
+            if child is None:
+                return set()
+            node, ids = child
+        return ids
+
+    # === 검색 ===
+
+    def search(self, query: str, limit: int = 50) -> list[tuple[str, str, str, str]]:
+        """[(source, key, text, detail), ...] 점수 높은 순"""
+        lowered = query.strip().lower()
+        if not lowered:
+            self._ensure_blob()    # 빈 질의(창 열기) 시점에 미리 준비해 첫 입력 지연 방지
+            return [self._entries[ident][:4] for ident in self._ordered_ids()[:limit]]
+
+        compact = "".join(lowered.split())
+        tokens = tokenize(lowered)
+        prefix_ids: set[int] = set()
+        if tokens:
+            sets = sorted((self._prefix_ids(token) for token in tokens), key=len)
+            prefix_ids = set(sets[0]).intersection(*sets[1:])
+
+        # 단계별 상위 후보를 모은 뒤 (단계, 부분열 점수, 정적 순위)로 정렬
+        pool = limit * self.SCORE_POOL_FACTOR
+        exact_ids = self._exact.get(exact_key(lowered), set())
+        candidates = set(self._top_by_rank(exact_ids, pool))
+        candidates.update(self._start_matches(lowered, pool))
+        candidates.update(self._top_by_rank(prefix_ids, pool))
+        if len(candidates) < limit:
+            candidates.update(self._fuzzy_matches(compact, candidates, pool))
+
+        scored = []
+        for ident in candidates:
+            haystack = self._entries[ident][4]
+            if ident in exact_ids:
+                tier = self.TIER_EXACT
+            elif haystack.startswith(lowered):
+                tier = self.TIER_START
+            elif ident in prefix_ids:
+                tier = self.TIER_PREFIX
+            else:
+                tier = self.TIER_FUZZY
+            score = subsequence_score(compact, haystack) or 0
+            scored.append((-tier, -score, self._rank[ident], ident))
+        scored.sort()
+        return [self._entries[ident][:4] for *_, ident in scored[:limit]]
+
+    def _ordered_ids(self) -> list[int]:
+        if self._default_order is None:
+            self._default_order = sorted(self._entries, key=self._rank.__getitem__)
+            self._blob = None
+            self._sorted = None
+        return self._default_order
+
+    def _top_by_rank(self, ids, count: int) -> list[int]:
+        """ids 중 정적 순위 상위 count개"""
+        if len(ids) <= count:
+            return list(ids)
+        ordered = self._ordered_ids()
+        if len(ids) * 8 < len(ordered):
+            return heapq.nsmallest(count, ids, key=self._rank.__getitem__)
+        # 후보가 전체의 1/8 이상이면 정렬된 전체 목록을 앞에서부터 훑는 편이 빠름
+        if not isinstance(ids, (set, frozenset, dict)):
+            ids = set(ids)
+        top = []
+        for ident in ordered:
+            if ident in ids:
+                top.append(ident)
+                if len(top) >= count:
+                    break
+        return top
+
+    def _start_matches(self, lowered: str, count: int) -> list[int]:
+        """검색 문자열이 lowered로 시작하는 id 중 정적 순위 상위 count개"""
+        ordered = self._ordered_ids()
+        if self._sorted is None:
+            pairs = sorted((entry[4], ident) for ident, entry in self._entries.items())
+            self._sorted = ([haystack for haystack, _ in pairs], [ident for _, ident in pairs])
+        haystacks, ids = self._sorted
+        low = bisect.bisect_left(haystacks, lowered)
+        high = bisect.bisect_left(haystacks, lowered + "\U0010ffff", low)
+        if (high - low) * 8 < len(ordered):
+            return self._top_by_rank(ids[low:high], count)
+        # 범위가 넓으면 정적 순위 순서로 훑으며 직접 확인 (앞쪽에서 금방 count개가 참)
+        top = []
+        for ident in ordered:
+            if self._entries[ident][4].startswith(lowered):
+                top.append(ident)
+                if len(top) >= count:
+                    break
+        return top
+
+    def _fuzzy_matches(self, compact: str, exclude: set[int], count: int) -> list[int]:
+        """부분열 매칭 id 중 정적 순위 상위 count개 (exclude 제외)"""
+        # 각 글자 사이는 다음 글자를 제외한 문자 클래스 → 첫 출현 위치로만 진행 (역추적 최소화)
+        # 매칭 후 줄 끝까지 소비해 한 항목당 한 번만 매칭
+        pattern = re.escape(compact[0]) + "".join(
+            f"[^\\n{re.escape(char)}]*{re.escape(char)}" for char in compact[1:]
+        ) + "[^\\n]*"
+        blob, starts, ids = self._ensure_blob()
+        matches = []
+        for found in re.finditer(pattern, blob):
+            ident = ids[bisect.bisect_right(starts, found.start()) - 1]
+            if ident in exclude:
+                continue
+            matches.append(ident)
+            if len(matches) >= count:
+                break
+        return matches
+
+    def _ensure_blob(self) -> tuple[str, list[int], list[int]]:
+        """정적 순위 순서로 검색 문자열을 줄 단위로 이은 문자열 (색인 변경 후 첫 검색 시 재생성)"""
+        ids = self._ordered_ids()
+        if self._blob is None:
+            starts = []
+            position = 0
+            for ident in ids:
+                starts.append(position)
+                position += len(self._entries[ident][4]) + 1
+            blob = "\n".join(self._entries[ident][4] for ident in ids)
+            self._blob = (blob, starts, ids)
+        return self._blob
+
+
+class CommandPalette(QDialog):
+    """Ctrl+P 명령 팔레트 창 (Enter: 선택 항목 전송/실행, Esc: 닫기)"""
+
+    entry_activated = pyqtSignal(str, str, str)   # (source, key, text)
+
+    MAX_RESULTS = 50
+
+    def __init__(self, index: PaletteIndex, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._index = index
+        self._setup_ui()
+        self._apply_language()
+
+    def _setup_ui(self):
+        self.resize(640, 420)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+            }}
+            QLabel {{
+                color: {COLORS['text_secondary']};
+            }}
+            QLineEdit, QListWidget {{
+                background-color: {COLORS['bg_input']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border']};
+            }}
+        """)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(6)
+
+        self._query_edit = QLineEdit()
+        self._query_edit.textChanged.connect(self._refresh_results)
+        self._query_edit.returnPressed.connect(self._activate_current)
+        self._query_edit.installEventFilter(self)
+        layout.addWidget(self._query_edit)
+
+        self._result_list = QListWidget()
+        self._result_list.itemActivated.connect(lambda _item: self._activate_current())
+        layout.addWidget(self._result_list, 1)
+
+        self._status_label = QLabel()
+        layout.addWidget(self._status_label)
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self._apply_language()
+
+    def _apply_language(self):
+        self.setWindowTitle(tr(self._language, "palette.title"))
+        self._query_edit.setPlaceholderText(tr(self._language, "palette.placeholder"))
+        self._refresh_results()
+
+    def open_palette(self):
+        """질의를 비우고 표시 (색인은 호출 측에서 미리 동기화)"""
+        self._query_edit.clear()
+        self._refresh_results()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        self._query_edit.setFocus()
+
+    def eventFilter(self, obj, event):
+        # 입력창에서 위/아래 키로 결과 목록 이동
+        if obj is self._query_edit and event.type() == event.Type.KeyPress:
+            if event.key() in (Qt.Key.Key_Up, Qt.Key.Key_Down):
+                step = -1 if event.key() == Qt.Key.Key_Up else 1
+                row = self._result_list.currentRow() + step
+                if 0 <= row < self._result_list.count():
+                    self._result_list.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
+
+    def _refresh_results(self):
+        started = time.perf_counter()
+        results = self._index.search(self._query_edit.text(), self.MAX_RESULTS)
+        elapsed_us = (time.perf_counter() - started) * 1_000_000
+
+        self._result_list.clear()
+        for source, key, text, detail in results:
+            label = f"[{tr(self._language, f'palette.source.{source}')}] {text}"
+            if detail:
+                label += f"  — {detail}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, (source, key, text))
+            self._result_list.addItem(item)
+        if results:
+            self._result_list.setCurrentRow(0)
+        self._status_label.setText(
+            tr(
+                self._language, "palette.status",
+                shown=len(results), total=len(self._index), elapsed_us=f"{elapsed_us:.0f}",
+            )
+        )
+
+    def _activate_current(self):
+        item = self._result_list.currentItem()
+        if item is None:
+            return
+        source, key, text = item.data(Qt.ItemDataRole.UserRole)
+        self.hide()
+        self.entry_activated.emit(source, key, text)
@@ -0,0 +1,220 @@
+"""
+설정 저장소 모듈
+- 문자열 통계 키워드 / 자동 명령 / 매크로 / 하이라이트 규칙 / 플롯 추출기를 .env 대신 전용 JSON 파일(lnxterm_config.json)에 저장
+- 변경 시에는 더티 표시만 하고 디바운스 타이머 만료 시 한 번만 스냅샷 → 백그라운드 스레드가 기록
+- 기록은 임시 파일 + fsync + os.replace로 원자적으로 교체 (중간에 종료되어도 이전 파일 유지)
+- 기존 .env의 AUTO_LOAD_STRING_STATS / AUTO_LOAD_AUTO_COMMANDS / AUTO_LOAD_MACRO_COMMANDS 값이
+  있으면 우선 적용 후 다음 저장 시 JSON으로 옮기고 .env 값은 비움
+"""
+
+import json
+import os
+import threading
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+import env_config
+from styles import DEFAULT_HIGHLIGHT_RULES
+from plot_data import DEFAULT_PLOT_EXTRACTORS
+
+CONFIG_FILENAME = "lnxterm_config.json"
+CONFIG_VERSION = 1
+
+SECTION_STRING_STATS = "string_stats"
+SECTION_AUTO_COMMANDS = "auto_commands"
+SECTION_MACRO_COMMANDS = "macro_commands"
+SECTION_HIGHLIGHT_RULES = "highlight_rules"
+SECTION_PLOT_EXTRACTORS = "plot_extractors"
+SECTIONS = (
+    SECTION_STRING_STATS, SECTION_AUTO_COMMANDS, SECTION_MACRO_COMMANDS, SECTION_HIGHLIGHT_RULES,
+    SECTION_PLOT_EXTRACTORS,
+)
+
+# 파일에 섹션이 없을 때의 기본값 (없으면 빈 목록)
+SECTION_DEFAULTS = {
+    SECTION_HIGHLIGHT_RULES: DEFAULT_HIGHLIGHT_RULES,
+    SECTION_PLOT_EXTRACTORS: DEFAULT_PLOT_EXTRACTORS,
+}
+
+# 섹션별 이전 .env 키
+LEGACY_ENV_KEYS = {
+    SECTION_STRING_STATS: env_config.ENV_AUTO_LOAD_STRING_STATS,
+    SECTION_AUTO_COMMANDS: env_config.ENV_AUTO_LOAD_AUTO_COMMANDS,
+    SECTION_MACRO_COMMANDS: env_config.ENV_AUTO_LOAD_MACRO_COMMANDS,
+}
+
+
+def config_path_for(env_path: str) -> str:
+    """.env와 같은 디렉토리의 설정 파일 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(env_path)), CONFIG_FILENAME)
+
+
+def read_config(path: str) -> dict:
+    """설정 파일 읽기 (없거나 손상된 경우 빈 dict)"""
+    try:
+        with open(path, encoding="utf-8") as fp:
+            data = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error reading {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_config_atomic(path: str, data: dict) -> None:
+    """임시 파일에 기록 후 rename으로 교체 (OSError 전달)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False, indent=2)
+            fp.write("\n")
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _legacy_sections() -> dict:
+    """현재 환경변수(.env 로드 후)의 이전 형식 값"""
+    return {
+        SECTION_STRING_STATS: env_config.load_string_stats(),
+        SECTION_AUTO_COMMANDS: env_config.load_auto_commands(),
+        SECTION_MACRO_COMMANDS: env_config.load_macro_commands(),
+    }
+
+
+def load_sections(env_path: str) -> dict:
+    """섹션별 목록 반환 (.env에 값이 있는 섹션은 .env 우선, 나머지는 JSON 파일)"""
+    data = read_config(config_path_for(env_path))
+    sections = {}
+    for key in SECTIONS:
+        value = data.get(key, SECTION_DEFAULTS.get(key, []))
+        sections[key] = value if isinstance(value, list) else []
+    for key, value in _legacy_sections().items():
+        if value:
+            sections[key] = value
+    return sections
+
+
+class ConfigStore(QObject):
+    """디바운스 + 백그라운드 원자적 기록 설정 저장소
+
+    snapshot_provider: 저장 시점에 SECTIONS 키를 가진 dict를 반환하는 함수
+    """
+
+    DEBOUNCE_MS = 500
+
+    save_failed = pyqtSignal(str, str)    # (경로, 오류)
+
+    def __init__(self, env_path: str, parent=None):
+        super().__init__(parent)
+        self._env_path = env_path
+        self._path = config_path_for(env_path)
+        self._sections = load_sections(env_path)
+        self._legacy_keys = [
+            LEGACY_ENV_KEYS[key] for key, value in _legacy_sections().items() if value
+        ]
+        self._snapshot_provider = None
+        # 마지막으로 기록한 스냅샷 (파일이 없거나 .env에서 옮길 값이 있으면 첫 저장은 항상 기록)
+        # 기록 실패 시 기록 스레드가 None으로 되돌리므로 _cond 안에서 접근
+        self._saved: dict | None = (
+            None if self._legacy_keys or not os.path.isfile(self._path) else self.sections()
+        )
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._commit)
+
+        # 기록 스레드 상태 (_cond 보호)
+        self._cond = threading.Condition()
+        self._pending: dict | None = None
+        self._writing = False
+        self._last_error = ""
+        self._thread: threading.Thread | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def sections(self) -> dict:
+        """불러온 섹션별 목록 (복사본)"""
+        return {key: list(value) for key, value in self._sections.items()}
+
+    def set_snapshot_provider(self, provider) -> None:
+        self._snapshot_provider = provider
+
+    def mark_dirty(self) -> None:
+        """변경 알림 (타이머 재시작만 수행, 스냅샷/기록은 디바운스 만료 시)"""
+        self._debounce_timer.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 변경을 즉시 기록하고 완료까지 대기 (종료/수동 저장용)"""
+        self._debounce_timer.stop()
+        self._commit()
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._pending is None and not self._writing, timeout
+            ):
+                return False
+            return not self._last_error
+
+    def _commit(self) -> None:
+        if self._snapshot_provider is None:
+            return
+        provided = self._snapshot_provider()
+        snapshot = {key: provided.get(key, []) for key in SECTIONS}
+        with self._cond:
+            if snapshot == self._saved:
+                return
+            self._saved = snapshot
+            self._sections = snapshot
+            self._pending = {"version": CONFIG_VERSION, **snapshot}
+            self._cond.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_writer, name="ConfigStoreWriter", daemon=True
+                )
+                self._thread.start()
+
+    # === 기록 스레드 ===
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None)
+                payload = self._pending
+                self._pending = None
+                self._writing = True
+            error = ""
+            try:
+                write_config_atomic(self._path, payload)
+                self._clear_legacy_env()
+            except OSError as e:
+                error = str(e)
+            with self._cond:
+                if error:
+                    self._saved = None    # 다음 저장 시 재시도
+                self._writing = False
+                self._last_error = error
+                self._cond.notify_all()
+            if error:
+                self.save_failed.emit(self._path, error)
+
+    def _clear_legacy_env(self) -> None:
+        """JSON으로 옮긴 이전 .env 값 비우기 (최초 저장 1회)"""
+        if not self._legacy_keys:
+            return
+        from dotenv import set_key
+        for key in self._legacy_keys:
+            set_key(self._env_path, key, "")
+            os.environ[key] = ""
+        self._legacy_keys = []
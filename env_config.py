@@ -0,0 +1,141 @@
+"""
+환경 설정(.env) 모듈
+- .env 경로 결정, 최초 실행 기본값 생성
+- 자동 재연결 주기, 문자열 통계/자동 명령/매크로 설정 파싱
+- GUI와 헤드리스 모드 공용 (QtWidgets 미사용)
+"""
+
+import json
+import os
+import sys
+
+ENV_RECONNECT_INTERVAL_MS = "RECONNECT_INTERVAL_MS"
+ENV_RECONNECT_INTERVAL_SEC = "RECONNECT_INTERVAL_SEC"
+ENV_AUTO_LOAD_STRING_STATS = "AUTO_LOAD_STRING_STATS"
+ENV_AUTO_LOAD_AUTO_COMMANDS = "AUTO_LOAD_AUTO_COMMANDS"
+ENV_AUTO_LOAD_MACRO_COMMANDS = "AUTO_LOAD_MACRO_COMMANDS"
+DEFAULT_RECONNECT_INTERVAL_MS = 1000
+
+
+def resolve_env_path() -> str:
+    """실행 환경에 맞는 .env 경로 결정."""
+    candidate_paths: list[str] = []
+    if getattr(sys, "frozen", False):
+        candidate_paths.append(
+            os.path.join(os.path.dirname(os.path.abspath(sys.executable)), ".env")
+        )
+    candidate_paths.append(os.path.join(os.getcwd(), ".env"))
+    candidate_paths.append(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+    )
+
+    unique_candidates = []
+    for path in candidate_paths:
+        normalized = os.path.abspath(path)
+        if normalized not in unique_candidates:
+            unique_candidates.append(normalized)
+
+    for path in unique_candidates:
+        if os.path.isfile(path):
+            return path
+
+    # 기존 파일이 없으면 실행 파일 폴더(배포 환경) 또는 소스 폴더(개발 환경)에 생성
+    if getattr(sys, "frozen", False):
+        return os.path.join(
+            os.path.dirname(os.path.abspath(sys.executable)), ".env"
+        )
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+
+def ensure_env_file_defaults(env_path: str) -> None:
+    """최초 실행 시 .env를 자동 생성하고 기본값을 채운다."""
+    env_exists = os.path.isfile(env_path)
+    env_dir = os.path.dirname(env_path)
+    if env_dir:
+        os.makedirs(env_dir, exist_ok=True)
+    if not env_exists:
+        from dotenv import set_key
+        with open(env_path, "a", encoding="utf-8"):
+            pass
+        defaults = {
+            ENV_RECONNECT_INTERVAL_MS: str(DEFAULT_RECONNECT_INTERVAL_MS),
+            ENV_AUTO_LOAD_STRING_STATS: "",
+            ENV_AUTO_LOAD_AUTO_COMMANDS: "",
+            ENV_AUTO_LOAD_MACRO_COMMANDS: "",
+        }
+        for key, value in defaults.items():
+            set_key(env_path, key, value)
+            os.environ[key] = value
+
+
+def parse_positive_milliseconds(raw_value: str) -> int | None:
+    """양의 밀리초 문자열을 int로 변환. 실패 시 None."""
+    if not raw_value:
+        return None
+    try:
+        value = int(float(raw_value))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def parse_positive_seconds_to_ms(raw_value: str) -> int | None:
+    """양의 초 문자열을 ms(int)로 변환. 실패 시 None."""
+    if not raw_value:
+        return None
+    try:
+        value = float(raw_value)
+    except ValueError:
+        return None
+    if value <= 0:
+        return None
+    return int(value * 1000)
+
+
+def resolve_reconnect_interval_ms() -> int:
+    """환경변수에서 자동 재연결 주기를 읽어 ms 단위로 반환."""
+    raw_ms = os.environ.get(ENV_RECONNECT_INTERVAL_MS, "").strip()
+    parsed_ms = parse_positive_milliseconds(raw_ms)
+    if parsed_ms is not None:
+        return parsed_ms
+
+    raw_sec = os.environ.get(ENV_RECONNECT_INTERVAL_SEC, "").strip()
+    parsed_sec_ms = parse_positive_seconds_to_ms(raw_sec)
+    if parsed_sec_ms is not None:
+        return parsed_sec_ms
+
+    return DEFAULT_RECONNECT_INTERVAL_MS
+
+
+def resolve_log_dir() -> str:
+    """LOG_DIR 환경변수를 절대 경로로 반환 (미설정 시 빈 문자열)"""
+    raw = os.environ.get("LOG_DIR", "").strip()
+    return os.path.abspath(os.path.expanduser(raw)) if raw else ""
+
+
+def load_string_stats() -> list[str]:
+    """AUTO_LOAD_STRING_STATS (';' 구분) 파싱"""
+    raw_stats = os.environ.get(ENV_AUTO_LOAD_STRING_STATS, "").strip()
+    return [s.strip() for s in raw_stats.split(";") if s.strip()] if raw_stats else []
+
+
+def _load_json_list(key: str) -> list:
+    raw = os.environ.get(key, "").strip()
+    if not raw:
+        return []
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        print(f"Error parsing {key}: {raw}")
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def load_auto_commands() -> list:
+    """AUTO_LOAD_AUTO_COMMANDS (JSON 목록) 파싱"""
+    return _load_json_list(ENV_AUTO_LOAD_AUTO_COMMANDS)
+
+
+def load_macro_commands() -> list:
+    """AUTO_LOAD_MACRO_COMMANDS (JSON 목록) 파싱"""
+    return _load_json_list(ENV_AUTO_LOAD_MACRO_COMMANDS)
@@ -0,0 +1,177 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QSpinBox,
+    QComboBox, QCheckBox, QFormLayout, QGroupBox, QLabel, QFileDialog
+)
+
+from file_sender import FileSenderThread
+from styles import COLORS
+from i18n import normalize_language, tr
+
+
+class FileSendDialog(QDialog):
+    """파일 송신 설정 창 (파일 선택, 페이싱 방식, 에코 요약)"""
+
+    def __init__(self, parent=None, options: dict = None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self.setMinimumWidth(520)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+            }}
+            QLabel, QCheckBox {{
+                color: {COLORS['text_primary']};
+            }}
+            QLineEdit, QSpinBox, QComboBox {{
+                background-color: {COLORS['bg_input']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 4px;
+                padding: 4px;
+            }}
+            QGroupBox {{
+                border: 1px solid {COLORS['border']};
+                border-radius: 6px;
+                margin-top: 20px;
+                font-weight: bold;
+                color: {COLORS['text_secondary']};
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 5px;
+            }}
+        """)
+        self._options = options or {}
+        self._setup_ui()
+        self._load_options()
+        self._apply_language()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        layout.setContentsMargins(15, 15, 15, 15)
+
+        # 1. 파일 선택
+        file_row = QHBoxLayout()
+        self._path_input = QLineEdit()
+        file_row.addWidget(self._path_input, 1)
+        self._browse_btn = QPushButton()
+        self._browse_btn.clicked.connect(self._browse_file)
+        file_row.addWidget(self._browse_btn)
+        layout.addLayout(file_row)
+
+        # 2. 페이싱 설정
+        self._pacing_group = QGroupBox()
+        form = QFormLayout(self._pacing_group)
+        form.setContentsMargins(10, 5, 10, 10)
+        form.setSpacing(8)
+
+        self._mode_combo = QComboBox()
+        self._mode_combo.addItem("", FileSenderThread.MODE_LINE_DELAY)
+        self._mode_combo.addItem("", FileSenderThread.MODE_BYTE_RATE)
+        self._mode_combo.addItem("", FileSenderThread.MODE_PROMPT)
+        self._mode_combo.currentIndexChanged.connect(self._update_mode_fields)
+        self._mode_label = QLabel()
+        form.addRow(self._mode_label, self._mode_combo)
+
+        self._line_delay_input = QSpinBox()
+        self._line_delay_input.setRange(0, 60_000)
+        self._line_delay_input.setSuffix(" ms")
+        self._line_delay_label = QLabel()
+        form.addRow(self._line_delay_label, self._line_delay_input)
+
+        self._byte_rate_input = QSpinBox()
+        self._byte_rate_input.setRange(1, 10_000_000)
+        self._byte_rate_input.setSuffix(" B/s")
+        self._byte_rate_label = QLabel()
+        form.addRow(self._byte_rate_label, self._byte_rate_input)
+
+        self._prompt_input = QLineEdit()
+        self._prompt_label = QLabel()
+        form.addRow(self._prompt_label, self._prompt_input)
+
+        self._prompt_timeout_input = QSpinBox()
+        self._prompt_timeout_input.setRange(100, 600_000)
+        self._prompt_timeout_input.setSuffix(" ms")
+        self._prompt_timeout_label = QLabel()
+        form.addRow(self._prompt_timeout_label, self._prompt_timeout_input)
+
+        layout.addWidget(self._pacing_group)
+
+        # 3. 에코 요약
+        self._collapse_checkbox = QCheckBox()
+        layout.addWidget(self._collapse_checkbox)
+
+        # 4. 버튼
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self._cancel_btn = QPushButton()
+        self._cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self._cancel_btn)
+        self._ok_btn = QPushButton()
+        self._ok_btn.clicked.connect(self._on_accept)
+        btn_layout.addWidget(self._ok_btn)
+        layout.addLayout(btn_layout)
+
+    def _apply_language(self):
+        self.setWindowTitle(tr(self._language, "file_send.title"))
+        self._path_input.setPlaceholderText(tr(self._language, "file_send.placeholder.path"))
+        self._browse_btn.setText(tr(self._language, "file_send.button.browse"))
+        self._pacing_group.setTitle(tr(self._language, "file_send.group.pacing"))
+        self._mode_label.setText(tr(self._language, "file_send.label.mode"))
+        self._mode_combo.setItemText(0, tr(self._language, "file_send.mode.line_delay"))
+        self._mode_combo.setItemText(1, tr(self._language, "file_send.mode.byte_rate"))
+        self._mode_combo.setItemText(2, tr(self._language, "file_send.mode.prompt"))
+        self._line_delay_label.setText(tr(self._language, "file_send.label.line_delay"))
+        self._byte_rate_label.setText(tr(self._language, "file_send.label.byte_rate"))
+        self._prompt_label.setText(tr(self._language, "file_send.label.prompt"))
+        self._prompt_timeout_label.setText(tr(self._language, "file_send.label.prompt_timeout"))
+        self._collapse_checkbox.setText(tr(self._language, "file_send.checkbox.collapse_echo"))
+        self._cancel_btn.setText(tr(self._language, "automation.button.cancel"))
+        self._ok_btn.setText(tr(self._language, "file_send.button.send"))
+
+    def _load_options(self):
+        index = self._mode_combo.findData(
+            self._options.get("mode", FileSenderThread.MODE_LINE_DELAY)
+        )
+        self._mode_combo.setCurrentIndex(max(0, index))
+        self._path_input.setText(self._options.get("path", ""))
+        self._line_delay_input.setValue(int(self._options.get("line_delay_ms", 10)))
+        self._byte_rate_input.setValue(int(self._options.get("bytes_per_sec", 11520)))
+        self._prompt_input.setText(self._options.get("prompt", ""))
+        self._prompt_timeout_input.setValue(int(self._options.get("prompt_timeout_ms", 5000)))
+        self._collapse_checkbox.setChecked(bool(self._options.get("collapse_echo", True)))
+        self._update_mode_fields()
+
+    def _update_mode_fields(self):
+        mode = self._mode_combo.currentData()
+        self._line_delay_input.setEnabled(mode == FileSenderThread.MODE_LINE_DELAY)
+        self._byte_rate_input.setEnabled(mode == FileSenderThread.MODE_BYTE_RATE)
+        self._prompt_input.setEnabled(mode == FileSenderThread.MODE_PROMPT)
+        self._prompt_timeout_input.setEnabled(mode == FileSenderThread.MODE_PROMPT)
+
+    def _browse_file(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, tr(self._language, "file_send.title"), self._path_input.text()
+        )
+        if path:
+            self._path_input.setText(path)
+
+    def _on_accept(self):
+        if not self._path_input.text().strip():
+            self._path_input.setFocus()
+            return
+        self.accept()
+
+    def get_data(self) -> dict:
+        return {
+            "path": self._path_input.text().strip(),
+            "mode": self._mode_combo.currentData(),
+            "line_delay_ms": self._line_delay_input.value(),
+            "bytes_per_sec": self._byte_rate_input.value(),
+            "prompt": self._prompt_input.text(),
+            "prompt_timeout_ms": self._prompt_timeout_input.value(),
+            "collapse_echo": self._collapse_checkbox.isChecked(),
+        }
@@ -0,0 +1,168 @@
+"""
+파일 송신 모듈
+- 파일을 디스크에서 청크 단위로 읽어 스트리밍 송신 (전체 파일을 메모리에 올리지 않음)
+- 페이싱: 바이트 속도 / 라인 간 지연 / 프롬프트 대기
+- 프롬프트는 줄바꿈 없이 오는 경우가 많아(`=> `, `# `) 완성 라인이 아닌 수신 텍스트 끝부분과 비교
+- 진행률(전송량, 처리량, 남은 시간) 시그널 제공
+"""
+
+import os
+import threading
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class FileSenderThread(QThread):
+    """파일 스트리밍 송신 스레드"""
+
+    progress = pyqtSignal(int, int, float, float)   # (송신 바이트, 전체 바이트, bytes/s, ETA 초)
+    line_sent = pyqtSignal(str)                      # 송신 라인 (에코용, 라인 모드)
+    finished_sending = pyqtSignal(bool, int, int, float, str)  # (성공, 바이트, 라인, 경과초, 오류)
+
+    MODE_LINE_DELAY = "line_delay"
+    MODE_BYTE_RATE = "byte_rate"
+    MODE_PROMPT = "prompt"
+
+    CHUNK_SIZE = 4096
+    PROGRESS_INTERVAL_S = 0.1
+
+    def __init__(self, write_func, options: dict, parent=None):
+        super().__init__(parent)
+        self._write = write_func
+        self._path = options["path"]
+        self._mode = options.get("mode", self.MODE_LINE_DELAY)
+        self._line_delay_s = max(0, int(options.get("line_delay_ms", 0))) / 1000.0
+        self._bytes_per_sec = max(1, int(options.get("bytes_per_sec", 11520)))
+        self._prompt = str(options.get("prompt", ""))
+        self._prompt_timeout_s = max(1, int(options.get("prompt_timeout_ms", 5000))) / 1000.0
+        self._emit_lines = not options.get("collapse_echo", False)
+
+        self._cancel_event = threading.Event()
+        self._prompt_event = threading.Event()
+        self._rx_tail = ""                       # 마지막 라인 송신 이후 수신 텍스트 끝부분
+        self._rx_tail_lock = threading.Lock()
+        self._total_bytes = 0
+        self._sent_bytes = 0
+        self._sent_lines = 0
+        self._started_at = 0.0
+        self._last_progress_at = 0.0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def cancel(self):
+        """송신 중단 요청"""
+        self._cancel_event.set()
+        self._prompt_event.set()
+
+    def notify_rx_text(self, text: str):
+        """수신 청크 텍스트 전달 (프롬프트 대기 모드에서 프롬프트 감지)
+
+        청크 경계에 걸친 프롬프트도 찾도록 직전 수신 끝부분(프롬프트 길이 - 1)과 이어서 비교
+        """
+        if self._mode != self.MODE_PROMPT or not self._prompt:
+            return
+        with self._rx_tail_lock:
+            tail = self._rx_tail + text
+            if self._prompt in tail:
+                self._rx_tail = ""
+                self._prompt_event.set()
+            else:
+                self._rx_tail = tail[-(len(self._prompt) - 1):] if len(self._prompt) > 1 else ""
+
+    def run(self):
+        self._started_at = time.monotonic()
+        error = ""
+        try:
+            self._total_bytes = os.path.getsize(self._path)
+            with open(self._path, "rb", buffering=0) as fp:
+                if self._mode == self.MODE_BYTE_RATE:
+                    self._send_by_rate(fp)
+                else:
+                    self._send_by_lines(fp)
+        except Exception as e:
+            error = str(e)
+
+        self._emit_progress(force=True)
+        elapsed = time.monotonic() - self._started_at
+        cancelled = self._cancel_event.is_set()
+        ok = not error and not cancelled
+        self.finished_sending.emit(ok, self._sent_bytes, self._sent_lines, elapsed, error)
+
+    def _iter_chunks(self, fp, size: int):
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        while not self._cancel_event.is_set():
+            count = fp.readinto(buffer)
+            if not count:
+                break
+            yield view[:count]
+
+    def _send_by_rate(self, fp):
+        """바이트 속도 기준 송신 (토큰 버킷 방식, 약 20회/초 분할 송신)"""
+        chunk_size = max(1, min(self.CHUNK_SIZE, self._bytes_per_sec // 20))
+        for chunk in self._iter_chunks(fp, chunk_size):
+            data = bytes(chunk)
+            self._write_bytes(data)
+            self._sent_lines += data.count(b"\n")
+            target = self._started_at + self._sent_bytes / self._bytes_per_sec
+            wait_s = target - time.monotonic()
+            if wait_s > 0 and self._cancel_event.wait(wait_s):
+                break
+
+    def _send_by_lines(self, fp):
+        """라인 단위 송신 (라인 간 지연 또는 프롬프트 대기)"""
+        pending = b""
+        first = True
+        for chunk in self._iter_chunks(fp, self.CHUNK_SIZE):
+            pending += chunk.tobytes()
+            while b"\n" in pending:
+                line, pending = pending.split(b"\n", 1)
+                if not self._send_line(line + b"\n", first):
+                    return
+                first = False
+        if pending and not self._cancel_event.is_set():
+            self._send_line(pending, first)
+
+    def _send_line(self, line: bytes, first: bool) -> bool:
+        if not first and not self._wait_before_next_line():
+            return False
+        with self._rx_tail_lock:
+            self._rx_tail = ""
+            self._prompt_event.clear()
+        self._write_bytes(line)
+        self._sent_lines += 1
+        if self._emit_lines:
+            self.line_sent.emit(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+        return True
+
+    def _wait_before_next_line(self) -> bool:
+        """다음 라인 송신 전 대기. 취소/타임아웃 시 False"""
+        if self._mode == self.MODE_PROMPT and self._prompt:
+            if not self._prompt_event.wait(self._prompt_timeout_s):
+                raise TimeoutError(f"프롬프트 대기 시간 초과: {self._prompt}")
+            return not self._cancel_event.is_set()
+        if self._line_delay_s > 0:
+            return not self._cancel_event.wait(self._line_delay_s)
+        return not self._cancel_event.is_set()
+
+    def _write_bytes(self, data: bytes):
+        sent = self._write(data)
+        self._sent_bytes += sent if sent is not None else len(data)
+        self._emit_progress()
+
+    def _emit_progress(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._last_progress_at < self.PROGRESS_INTERVAL_S:
+            return
+        self._last_progress_at = now
+        elapsed = max(1e-6, now - self._started_at)
+        rate = self._sent_bytes / elapsed
+        remaining = max(0, self._total_bytes - self._sent_bytes)
+        eta = remaining / rate if rate > 0 else -1.0
+        self.progress.emit(self._sent_bytes, self._total_bytes, rate, eta)
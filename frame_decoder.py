@@ -0,0 +1,465 @@
+"""
+바이너리 프레임 디코더 (텍스트 로그와 섞인 UART 스트림용, QtWidgets 미사용)
+- 수신 바이트를 텍스트 구간과 프레임으로 분리: 텍스트는 그대로 기존 라인 파이프라인에 전달
+- COBS: 0x00 ... 0x00 사이를 COBS 디코딩 (텍스트에는 NUL이 없으므로 앞 구분자로 프레임 시작 판단)
+- SLIP: 0xC0(END) ... 0xC0 사이를 SLIP 디코딩 (0xC0은 UTF-8 텍스트에 나타나지 않음)
+- 길이 지정: 동기 바이트(sync) + 길이 필드(1/2/4바이트) + 데이터 + 체크섬
+- 체크섬(none/sum8/crc16/crc32)은 프레임 데이터 끝에 붙은 값과 비교, 수신 청크마다 누적 계산
+  (COBS/SLIP은 끝의 체크섬 바이트를 알 수 없으므로 체크섬 크기만큼 늦춰 누적)
+- 바이트 처리는 bytearray/memoryview 구간 복사 단위 (바이트별 파이썬 반복 없음)
+- 새 형식은 register_decoder(이름, 생성 함수)로 추가
+"""
+
+import binascii
+import os
+
+from xmodem import crc16_update
+
+ENV_FRAME_CHECKSUM = "FRAME_CHECKSUM"
+ENV_FRAME_LENGTH_PREFIX = "FRAME_LENGTH_PREFIX"
+
+DECODER_COBS = "cobs"
+DECODER_SLIP = "slip"
+DECODER_LENGTH = "length"
+
+CHECKSUM_NONE = "none"
+CHECKSUM_SUM8 = "sum8"
+CHECKSUM_CRC16 = "crc16"    # CRC-16/XMODEM, 빅엔디언 2바이트
+CHECKSUM_CRC32 = "crc32"    # CRC-32(zlib), 리틀엔디언 4바이트
+CHECKSUM_SIZES = {CHECKSUM_NONE: 0, CHECKSUM_SUM8: 1, CHECKSUM_CRC16: 2, CHECKSUM_CRC32: 4}
+
+MAX_FRAME_BYTES = 64 * 1024
+SUMMARY_BYTES = 32
+
+COBS_DELIMITER = 0x00
+SLIP_END = 0xC0
+SLIP_ESC = 0xDB
+SLIP_ESC_END = 0xDC
+SLIP_ESC_ESC = 0xDD
+
+
+class Frame:
+    """디코딩된 프레임
+
+    checksum_ok: True/False (체크섬 없음이면 None)
+    error: 형식 오류 설명 (정상이면 빈 문자열)
+    """
+
+    __slots__ = ("protocol", "payload", "checksum_ok", "error")
+
+    def __init__(self, protocol: str, payload: bytes, checksum_ok: bool | None = None, error: str = ""):
+        self.protocol = protocol
+        self.payload = payload
+        self.checksum_ok = checksum_ok
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and self.checksum_ok is not False
+
+    def status(self) -> str:
+        if self.error:
+            return self.error
+        if self.checksum_ok is None:
+            return "-"
+        return "ok" if self.checksum_ok else "bad checksum"
+
+    def summary(self, limit: int = SUMMARY_BYTES) -> str:
+        """로그 한 줄 요약: 'slip 12B ok: 01 02 ...'"""
+        data = self.payload[:limit].hex(" ")
+        if len(self.payload) > limit:
+            data += " ..."
+        return f"{self.protocol} {len(self.payload)}B {self.status()}: {data}"
+
+
+class _Checksum:
+    """누적 체크섬 (끝에 붙는 값의 바이트 순서 포함)"""
+
+    def __init__(self, kind: str):
+        if kind not in CHECKSUM_SIZES:
+            raise ValueError(f"unknown checksum: {kind}")
+        self.kind = kind
+        self.size = CHECKSUM_SIZES[kind]
+        self.value = 0
+
+    def reset(self) -> None:
+        self.value = 0
+
+    def update(self, data) -> None:
+        if self.kind == CHECKSUM_CRC16:
+            self.value = crc16_update(self.value, data)
+        elif self.kind == CHECKSUM_CRC32:
+            self.value = binascii.crc32(data, self.value)
+        elif self.kind == CHECKSUM_SUM8:
+            self.value = (self.value + sum(data)) & 0xFF
+
+    def matches(self, trailer) -> bool | None:
+        if not self.size:
+            return None
+        if self.kind == CHECKSUM_CRC32:
+            return int.from_bytes(trailer, "little") == self.value
+        return int.from_bytes(trailer, "big") == self.value
+
+
+class FrameDecoder:
+    """디코더 공통 인터페이스: feed(bytes/bytearray) → [bytes(텍스트) 또는 Frame, ...] (수신 순서 유지)"""
+
+    name = ""
+
+    def feed(self, data) -> list:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    def split(self, data) -> tuple[bytes, list[Frame]]:
+        """(이어 붙인 텍스트 바이트, 프레임 목록) — 텍스트 파이프라인에 그대로 넘기는 용도"""
+        text_parts = []
+        frames = []
+        for item in self.feed(data):
+            if isinstance(item, Frame):
+                frames.append(item)
+            else:
+                text_parts.append(item)
+        if len(text_parts) == 1:
+            return text_parts[0], frames
+        return b"".join(text_parts), frames
+
+
+class _DelimitedDecoder(FrameDecoder):
+    """구분 바이트로 감싼 프레임 (COBS/SLIP 공통): 텍스트 → 구분자 → 프레임 → 구분자 → 텍스트"""
+
+    delimiter = 0
+
+    def __init__(self, checksum: str = CHECKSUM_NONE):
+        self._checksum = _Checksum(checksum)
+        self._payload = bytearray()
+        self._checked = 0          # 체크섬에 반영한 payload 길이
+        self._in_frame = False
+        self._overflow = False
+        self._reset_state()
+
+    def reset(self) -> None:
+        self._in_frame = False
+        self._start_frame()
+
+    def _start_frame(self) -> None:
+        self._payload.clear()
+        self._checked = 0
+        self._overflow = False
+        self._checksum.reset()
+        self._reset_state()
+
+    def feed(self, data) -> list:
+        items = []
+        view = memoryview(data)
+        position = 0
+        size = len(data)
+        while position < size:
+            boundary = data.find(self.delimiter, position)
+            end = size if boundary < 0 else boundary
+            if self._in_frame:
+                if end > position:
+                    self._decode_segment(data, view, position, end)
+                    self._update_checksum()
+                if boundary < 0:
+                    break
+                if self._payload or self._state_pending():
+                    items.append(self._finish_frame())
+                    self._in_frame = False
+                # 빈 프레임(구분자 연속)은 다음 프레임 시작으로 처리
+            else:
+                if end > position:
+                    items.append(view[position:end].tobytes())
+                if boundary < 0:
+                    break
+                self._in_frame = True
+                self._start_frame()
+            position = boundary + 1
+        return items
+
+    def _update_checksum(self) -> None:
+        if len(self._payload) > MAX_FRAME_BYTES:
+            self._overflow = True
+            del self._payload[MAX_FRAME_BYTES:]
+        # 끝 size 바이트는 체크섬 값일 수 있으므로 그 앞까지만 누적
+        ready = len(self._payload) - self._checksum.size
+        if ready > self._checked:
+            self._checksum.update(memoryview(self._payload)[self._checked:ready])
+            self._checked = ready
+
+    def _finish_frame(self) -> Frame:
+        error = self._state_error()
+        if self._overflow:
+            error = "too long"
+        size = self._checksum.size
+        checksum_ok = None
+        if size and not error:
+            if len(self._payload) < size:
+                error = "too short"
+            else:
+                checksum_ok = self._checksum.matches(self._payload[-size:])
+        payload = bytes(self._payload[:len(self._payload) - size] if size and not error else self._payload)
+        frame = Frame(self.name, payload, checksum_ok, error)
+        self._start_frame()
+        return frame
+
+    # === 형식별 ===
+
+    def _reset_state(self) -> None:
+        pass
+
+    def _state_pending(self) -> bool:
+        return False
+
+    def _state_error(self) -> str:
+        return ""
+
+    def _decode_segment(self, data, view: memoryview, start: int, end: int) -> None:
+        """data[start:end] (구분자 없음) 디코딩 결과를 self._payload에 추가"""
+        raise NotImplementedError
+
+
+class CobsDecoder(_DelimitedDecoder):
+    """COBS (0x00 구분)"""
+
+    name = DECODER_COBS
+    delimiter = COBS_DELIMITER
+
+    def _reset_state(self) -> None:
+        self._remaining = 0         # 현재 블록에 남은 데이터 바이트 수
+        self._zero_pending = False  # 다음 블록이 시작되면 0x00 추가
+        self._started = False
+
+    def _state_pending(self) -> bool:
+        return self._started
+
+    def _state_error(self) -> str:
+        return "cobs truncated" if self._remaining else ""
+
+    def _decode_segment(self, data, view: memoryview, start: int, end: int) -> None:
+        payload = self._payload
+        index = start
+        while index < end:
+            if self._remaining == 0:
+                code = data[index]
+                index += 1
+                if self._zero_pending:
+                    payload.append(0)
+                self._remaining = code - 1
+                self._zero_pending = code != 0xFF
+                self._started = True
+                continue
+            take = min(self._remaining, end - index)
+            payload += view[index:index + take]
+            index += take
+            self._remaining -= take
+
+
+class SlipDecoder(_DelimitedDecoder):
+    """SLIP (RFC 1055, 0xC0 구분)"""
+
+    name = DECODER_SLIP
+    delimiter = SLIP_END
+
+    def _reset_state(self) -> None:
+        self._escape = False
+        self._bad_escape = False
+
+    def _state_pending(self) -> bool:
+        return self._escape
+
+    def _state_error(self) -> str:
+        if self._bad_escape or self._escape:
+            return "slip escape"
+        return ""
+
+    def _decode_segment(self, data, view: memoryview, start: int, end: int) -> None:
+        payload = self._payload
+        index = start
+        while index < end:
+            if self._escape:
+                value = data[index]
+                index += 1
+                self._escape = False
+                if value == SLIP_ESC_END:
+                    payload.append(SLIP_END)
+                elif value == SLIP_ESC_ESC:
+                    payload.append(SLIP_ESC)
+                else:
+                    self._bad_escape = True
+                    payload.append(value)
+                continue
+            escape = data.find(SLIP_ESC, index, end)
+            payload += view[index:end if escape < 0 else escape]
+            if escape < 0:
+                break
+            self._escape = True
+            index = escape + 1
+
+
+class LengthPrefixDecoder(FrameDecoder):
+    """동기 바이트 + 길이 필드 + 데이터 + 체크섬
+
+    length_adjust: 길이 필드 값에 더할 값 (예: 길이 필드가 체크섬까지 포함하면 -체크섬 크기)
+    """
+
+    name = DECODER_LENGTH
+
+    def __init__(
+        self, sync: bytes = b"\xaa\x55", length_size: int = 2, byteorder: str = "big",
+        checksum: str = CHECKSUM_CRC16, length_adjust: int = 0,
+    ):
+        if not sync:
+            raise ValueError("sync bytes required")
+        if length_size not in (1, 2, 4):
+            raise ValueError(f"unsupported length size: {length_size}")
+        if byteorder not in ("big", "little"):
+            raise ValueError(f"unsupported byte order: {byteorder}")
+        self._sync = bytes(sync)
+        self._length_size = length_size
+        self._byteorder = byteorder
+        self._length_adjust = length_adjust
+        self._checksum = _Checksum(checksum)
+        self._buffer = bytearray()     # 헤더/체크섬 수집 또는 데이터
+        self.reset()
+
+    def reset(self) -> None:
+        self._state = "text"
+        self._text_hold = b""          # 다음 청크와 이어서 sync일 수 있는 텍스트 끝부분
+        self._needed = 0
+        self._buffer.clear()
+        self._payload = b""
+        self._checksum.reset()
+
+    def feed(self, data) -> list:
+        items = []
+        if self._text_hold:
+            data = self._text_hold + bytes(data)
+            self._text_hold = b""
+        view = memoryview(data)
+        position = 0
+        size = len(data)
+        while position < size:
+            if self._state == "text":
+                sync = data.find(self._sync, position)
+                if sync < 0:
+                    # 끝이 sync 앞부분과 같으면 보류
+                    hold = self._partial_sync_length(data, size)
+                    if size - hold > position:
+                        items.append(view[position:size - hold].tobytes())
+                    if hold:
+                        self._text_hold = view[size - hold:].tobytes()
+                    break
+                if sync > position:
+                    items.append(view[position:sync].tobytes())
+                position = sync + len(self._sync)
+                self._state = "length"
+                self._needed = self._length_size
+                self._buffer.clear()
+                continue
+
+            take = min(self._needed, size - position)
+            chunk = view[position:position + take]
+            position += take
+            self._needed -= take
+            if self._state == "payload":
+                self._checksum.update(chunk)
+            self._buffer += chunk
+            if self._needed:
+                continue
+            if self._state == "length":
+                length = int.from_bytes(self._buffer, self._byteorder) + self._length_adjust
+                self._buffer.clear()
+                if length < 0 or length > MAX_FRAME_BYTES:
+                    items.append(Frame(self.name, b"", None, "bad length"))
+                    self._state = "text"
+                    continue
+                self._checksum.reset()
+                self._state = "payload"
+                self._needed = length
+                if length:
+                    continue
+            if self._state == "payload":
+                self._payload = bytes(self._buffer)
+                self._buffer.clear()
+                self._state = "checksum"
+                self._needed = self._checksum.size
+                if self._needed:
+                    continue
+            items.append(Frame(
+                self.name, self._payload, self._checksum.matches(self._buffer), ""
+            ))
+            self._buffer.clear()
+            self._payload = b""
+            self._state = "text"
+        return items
+
+    def _partial_sync_length(self, data, size: int) -> int:
+        for hold in range(min(len(self._sync) - 1, size), 0, -1):
+            if data[size - hold:size] == self._sync[:hold]:
+                return hold
+        return 0
+
+
+# === 생성 ===
+
+def checksum_from_env() -> str:
+    """FRAME_CHECKSUM (COBS/SLIP 프레임 끝 체크섬, 기본 none)"""
+    value = os.environ.get(ENV_FRAME_CHECKSUM, "").strip().lower() or CHECKSUM_NONE
+    return value if value in CHECKSUM_SIZES else CHECKSUM_NONE
+
+
+def parse_length_prefix_spec(spec: str) -> dict:
+    """'sync=AA55,len=2,order=big,checksum=crc16,adjust=0' → LengthPrefixDecoder 인자 (ValueError 전달)"""
+    options = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        key, _sep, value = part.partition("=")
+        key = key.strip().lower()
+        value = value.strip()
+        if key == "sync":
+            options["sync"] = bytes.fromhex(value)
+        elif key == "len":
+            options["length_size"] = int(value)
+        elif key == "order":
+            options["byteorder"] = value.lower()
+        elif key == "checksum":
+            options["checksum"] = value.lower()
+        elif key == "adjust":
+            options["length_adjust"] = int(value)
+        else:
+            raise ValueError(f"unknown option: {key}")
+    return options
+
+
+def _create_length_decoder() -> LengthPrefixDecoder:
+    spec = os.environ.get(ENV_FRAME_LENGTH_PREFIX, "").strip()
+    try:
+        return LengthPrefixDecoder(**parse_length_prefix_spec(spec))
+    except (TypeError, ValueError) as e:
+        print(f"Invalid {ENV_FRAME_LENGTH_PREFIX}={spec!r}: {e}")
+        return LengthPrefixDecoder()
+
+
+_FACTORIES = {
+    DECODER_COBS: lambda: CobsDecoder(checksum_from_env()),
+    DECODER_SLIP: lambda: SlipDecoder(checksum_from_env()),
+    DECODER_LENGTH: _create_length_decoder,
+}
+
+
+def register_decoder(name: str, factory) -> None:
+    """디코더 형식 추가 (factory: 인자 없이 FrameDecoder를 반환하는 함수)"""
+    _FACTORIES[name] = factory
+
+
+def decoder_names() -> list[str]:
+    return list(_FACTORIES)
+
+
+def create_decoder(name: str) -> FrameDecoder | None:
+    """형식 이름 → 디코더 (빈 문자열/알 수 없는 이름이면 None = 디코딩 안 함)"""
+    factory = _FACTORIES.get((name or "").strip().lower())
+    return factory() if factory is not None else None
@@ -0,0 +1,142 @@
+"""
+디코딩된 바이너리 프레임 표 (프레임 탭)
+- 열: 수신 시각 / 포트 / 형식 / 길이 / 상태(체크섬) / 데이터(16진수 요약)
+- 수신 청크 단위로 행을 한 번에 추가 (beginInsertRows 1회), 최대 행 수를 넘으면 오래된 행부터 제거
+- 체크섬 오류/형식 오류 행은 빨간색 표시, 맨 아래를 보고 있으면 새 행을 따라감
+"""
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+from i18n import normalize_language, tr
+from styles import COLORS
+
+MAX_FRAME_ROWS = 100_000
+PAYLOAD_PREVIEW_BYTES = 64
+
+
+def decoder_label(language: str, name: str) -> str:
+    """디코더 메뉴/목록 표시 이름 (번역이 없는 추가 형식은 이름을 대문자로)"""
+    key = f"frame.decoder.{name or 'off'}"
+    label = tr(language, key)
+    return name.upper() if label == key else label
+
+
+class FrameTableModel(QAbstractTableModel):
+    """프레임 행 모델 (행: (시각, 포트, 형식, 길이, 상태, 데이터, 정상 여부))"""
+
+    COLUMN_COUNT = 6
+    HEADER_KEYS = (
+        "frame.table.time", "frame.table.source", "frame.table.protocol",
+        "frame.table.length", "frame.table.status", "frame.table.payload",
+    )
+
+    def __init__(self, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+        self._language = normalize_language(language)
+        self._error_color = QColor(COLORS["error"])
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return tr(self._language, self.HEADER_KEYS[section])
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and not row[6]:
+            return self._error_color
+        return None
+
+    def append_frames(self, timestamp: str, source: str, frames: list) -> None:
+        """Frame 목록을 한 번에 추가 (최대 행 수 초과분은 앞에서 제거)"""
+        if not frames:
+            return
+        excess = len(self._rows) + len(frames) - MAX_FRAME_ROWS
+        if excess > 0:
+            excess = min(excess, len(self._rows))
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._rows[:excess]
+            self.endRemoveRows()
+        frames = frames[-MAX_FRAME_ROWS:]
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(frames) - 1)
+        for frame in frames:
+            payload = frame.payload
+            preview = payload[:PAYLOAD_PREVIEW_BYTES].hex(" ")
+            if len(payload) > PAYLOAD_PREVIEW_BYTES:
+                preview += " ..."
+            self._rows.append((
+                timestamp, source, frame.protocol, str(len(payload)), frame.status(), preview, frame.ok,
+            ))
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+
+class FrameTableView(QTableView):
+    """프레임 표 (읽기 전용, 맨 아래를 보고 있으면 자동 스크롤)"""
+
+    def __init__(self, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._model = FrameTableModel(self, language=language)
+        self.setModel(self._model)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setWordWrap(False)
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setDefaultSectionSize(22)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate((190, 120, 70, 60, 100)):
+            self.setColumnWidth(column, width)
+        font = QFont("JetBrains Mono", 10)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        self.setStyleSheet(f"""
+            QTableView {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+                gridline-color: {COLORS['border']};
+                border: none;
+            }}
+            QHeaderView::section {{
+                background-color: {COLORS['bg_sidebar']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border']};
+                padding: 4px;
+            }}
+        """)
+
+    def set_language(self, language: str):
+        self._model.set_language(language)
+
+    def append_frames(self, timestamp: str, source: str, frames: list) -> None:
+        scrollbar = self.verticalScrollBar()
+        follow = scrollbar.value() >= scrollbar.maximum()
+        self._model.append_frames(timestamp, source, frames)
+        if follow:
+            self.scrollToBottom()
+
+    def clear(self) -> None:
+        self._model.clear()
@@ -0,0 +1,353 @@
+"""
+헤드리스 캡처 모드
+- 디스플레이 없이 로그 수집, 문자열 통계, 자동 명령 실행 (QCoreApplication 이벤트 루프)
+- SerialManager / LogManager / line_pipeline / env_config 를 GUI와 공유 (QtWidgets 미사용)
+- 주기적으로 처리량/카운터 통계를 stdout에 출력
+"""
+
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+from dotenv import load_dotenv
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, QSettings
+
+import ansi_parser
+import env_config
+import config_store
+import line_pipeline
+from latency_histogram import TaskLatencyStats
+from rate_buckets import RateBuckets, minute_start
+from log_manager import LogManager, raw_sidecar_from_env
+import frame_decoder
+from serial_manager import SerialManager, SerialWriterThread
+from stream_server import StreamServer
+from i18n import normalize_language, tr
+
+ENV_HEADLESS_PORT = "HEADLESS_PORT"
+ENV_HEADLESS_BAUDRATE = "HEADLESS_BAUDRATE"
+ENV_HEADLESS_STATS_INTERVAL_SEC = "HEADLESS_STATS_INTERVAL_SEC"
+ENV_HEADLESS_CASE_SENSITIVE = "HEADLESS_CASE_SENSITIVE"
+DEFAULT_STATS_INTERVAL_SEC = 10
+
+
+class HeadlessCapture(QObject):
+    """GUI 없이 포트 1개를 캡처하는 파이프라인 (자동 재연결 포함)"""
+
+    def __init__(self, port: str, baudrate: int, log_dir: str, stats_interval_s: float,
+                 case_sensitive: bool = False, frame_decoder_name: str = "", parent=None):
+        super().__init__(parent)
+        self._port = port
+        self._baudrate = baudrate
+        self._log_dir = log_dir
+        self._case_sensitive = case_sensitive
+        self._serial = SerialManager()
+        self._log = LogManager()
+        self._log.raw_sidecar = raw_sidecar_from_env()
+        self._frame_decoder = frame_decoder.create_decoder(frame_decoder_name)
+        self._framer = line_pipeline.LineFramer(ansi=True, keep_raw=ansi_parser.keep_raw_from_env())
+        self._stats_csv_path = ""
+        self._stats_csv_written_until = 0   # 통계 CSV에 기록한 마지막 분 경계 (epoch 초)
+        # 통계 CSV 형식은 GUI와 동일 (언어 설정 공유)
+        self._language = normalize_language(
+            QSettings("LnxTerm", "LnxTerm").value("language", "en", type=str)
+        )
+
+        # 문자열 통계 / 자동 명령 (GUI 설정 저장소 공유)
+        sections = config_store.load_sections(env_config.resolve_env_path())
+        self._counters = [
+            {"keyword": str(keyword), "match": self._normalize(str(keyword)), "count": 0,
+             "rates": RateBuckets()}
+            for keyword in sections[config_store.SECTION_STRING_STATS]
+        ]
+        self._tasks = []
+        for task_data in sections[config_store.SECTION_AUTO_COMMANDS]:
+            if not isinstance(task_data, dict) or not task_data.get("enabled"):
+                continue
+            trigger = str(task_data.get("trigger", ""))
+            self._tasks.append({
+                "name": str(task_data.get("name", "")),
+                "trigger": trigger,
+                "match": self._normalize(trigger),
+                "pre_cmd": str(task_data.get("pre_cmd", "")),
+                "post_cmd": str(task_data.get("post_cmd", "")),
+                "delay": max(0, int(task_data.get("delay", 0) or 0)),
+                "cmd_interval": max(0, int(task_data.get("cmd_interval", 0) or 0)),
+                "trigger_count": 0,
+                "_latency": TaskLatencyStats(),
+            })
+
+        # 처리량 통계
+        self._totals = {"rx_bytes": 0, "rx_lines": 0, "tx_bytes": 0, "tx_lines": 0}
+        self._last_totals = dict(self._totals)
+        self._last_stats_at = time.monotonic()
+
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.setInterval(env_config.resolve_reconnect_interval_ms())
+        self._reconnect_timer.timeout.connect(self.connect_port)
+
+        # RX 스트림 팬아웃 서버 (STREAM_SERVER 설정 시)
+        self._stream_server = StreamServer.from_env(tx_callback=self._serial.queue_write)
+
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(max(1, int(stats_interval_s * 1000)))
+        self._stats_timer.timeout.connect(self._print_stats)
+
+    def _normalize(self, text: str) -> str:
+        return text if self._case_sensitive else text.lower()
+
+    @staticmethod
+    def _print(message: str):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{now}] {message}", flush=True)
+
+    # === 연결 ===
+
+    def start(self):
+        self._print(
+            f"headless capture: port={self._port} baud={self._baudrate} "
+            f"counters={len(self._counters)} auto_commands={len(self._tasks)}"
+        )
+        if self._stream_server is not None:
+            try:
+                self._stream_server.start()
+                self._print(f"stream server: {self._stream_server.address}")
+            except (OSError, ValueError) as e:
+                self._print(f"stream server failed: {self._stream_server.address} ({e})")
+                self._stream_server = None
+        self._stats_timer.start()
+        self.connect_port()
+
+    def connect_port(self):
+        try:
+            self._serial.connect(port=self._port, baudrate=self._baudrate)
+            reader = self._serial.start_reading()
+            reader.data_received.connect(self._on_data_received)
+            reader.error_occurred.connect(self._on_serial_error)
+            reader.start()
+            writer = self._serial.start_writing()
+            writer.line_written.connect(self._on_line_written)
+            writer.error_occurred.connect(self._on_serial_error)
+            writer.start()
+        except Exception as e:
+            self._serial.disconnect()
+            self._print(f"connect failed: {e} (retry in {self._reconnect_timer.interval()} ms)")
+            self._reconnect_timer.start()
+            return
+
+        self._print(f"connected: {self._port} @ {self._baudrate} bps")
+        if self._serial.peer_path:
+            self._print(f"pty peer: {self._serial.peer_path}")
+        self._start_logging()
+        for task in self._tasks:
+            self._run_command_set(task, task["pre_cmd"])
+
+    def _start_logging(self):
+        if self._log.is_logging or not self._log_dir:
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self._log_dir, f"lnxterm_{timestamp}.log")
+        self._log.start_logging(path)
+        self._stats_csv_path = line_pipeline.build_stats_csv_path(path)
+        self._stats_csv_written_until = int(time.time())
+        for counter in self._counters:
+            counter["rates"].start(time.time())
+        self._print(f"logging: {path}")
+        if self._log.raw_file_path:
+            self._print(f"raw log: {self._log.raw_file_path}")
+
+    def _on_serial_error(self, error_msg: str):
+        self._print(f"error: {error_msg}")
+        self._serial.disconnect()
+        self._reconnect_timer.start()
+
+    def stop(self):
+        self._stats_timer.stop()
+        self._reconnect_timer.stop()
+        self._serial.disconnect()
+        if self._stream_server is not None:
+            self._stream_server.stop()
+        pending = self._framer.flush()
+        if pending:
+            self._process_line(pending, self._log.get_timestamp(), time.monotonic_ns())
+        self._print_stats()
+        for task in self._tasks:
+            for line in task["_latency"].summary_lines():
+                self._print(f"latency[{task['name']}] {line}")
+        self._write_counter_rates(int(time.time()) + 1)
+        if self._log.is_logging:
+            self._log.stop_logging()
+
+    # === 수신 파이프라인 ===
+
+    def _on_data_received(self, data: bytes, rx_ns: int = None):
+        if rx_ns is None:
+            rx_ns = time.monotonic_ns()
+        self._totals["rx_bytes"] += len(data)
+        if self._stream_server is not None:
+            self._stream_server.publish(data)
+        self._log.write_raw(data)
+        if self._frame_decoder is not None:
+            data, frames = self._frame_decoder.split(data)
+            if frames:
+                timestamp = self._log.get_timestamp()
+                for frame in frames:
+                    self._log.write_line(f"[FRAME] {frame.summary()}", timestamp)
+        lines = self._framer.feed(data.decode("utf-8", errors="replace"))
+        if not lines:
+            return
+        timestamp = self._log.get_timestamp()
+        for line in lines:
+            self._process_line(line, timestamp, rx_ns)
+
+    def _process_line(self, line: str, timestamp: str, rx_ns: int):
+        self._totals["rx_lines"] += 1
+        self._log.write_line(line, timestamp)
+        compare_line = self._normalize(line)
+
+        for counter in self._counters:
+            if counter["match"] and counter["match"] in compare_line:
+                counter["count"] += 1
+                counter["rates"].record(time.time())
+
+        for task in self._tasks:
+            if task["match"] and task["match"] in compare_line:
+                task["trigger_count"] += 1
+                trace = {"rx_ns": rx_ns, "match_ns": time.monotonic_ns(), "task": task}
+                self._run_command_set(task, task["post_cmd"], task["delay"], trace)
+
+    # === 자동 명령 송신 ===
+
+    def _run_command_set(self, task: dict, command_text: str, delay_ms: int = 0,
+                         trace: dict = None):
+        """명령 세트를 송신 큐에 예약 (지연/sleep()/명령 간격은 송신 스레드가 처리)"""
+        writer = self._serial.writer
+        if writer is None:
+            return
+        sequence = line_pipeline.build_command_sequence(command_text, task["cmd_interval"])
+        if not sequence:
+            return
+        # 한 배치로 추가: 라인별 지연은 직전 라인 송신 후부터 누적 (trace send_ns는 송신 스레드가 기록)
+        delays = [delay_before for delay_before, _command in sequence]
+        delays[0] = min(line_pipeline.MAX_SLEEP_DELAY_MS, delays[0] + delay_ms)
+        writer.enqueue_lines(
+            [command for _delay, command in sequence],
+            priority=SerialWriterThread.PRIORITY_HIGH,
+            trace=trace,
+            delays_ms=delays,
+        )
+
+    def _on_line_written(self, item: dict):
+        self._totals["tx_bytes"] += item.get("sent") or 0
+        self._totals["tx_lines"] += 1
+        # 스트림 서버 클라이언트 입력은 여러 줄일 수 있음
+        for line in item["text"].splitlines() or [""]:
+            self._log.write_line(f"[TX] {line}")
+        trace = item.get("trace")
+        if trace is not None and trace.get("task") is not None:
+            trace["task"]["_latency"].record_trace(trace)
+
+    # === 통계 출력 ===
+
+    def _write_counter_rates(self, end: int):
+        """통계 CSV에 [마지막 기록 시점, end) 구간 분당 히트 수 추가 (GUI와 같은 형식)"""
+        start = self._stats_csv_written_until
+        if not self._stats_csv_path or end <= start:
+            return
+        self._stats_csv_written_until = end
+        line_pipeline.append_counter_stats_rows(
+            self._stats_csv_path,
+            [
+                tr(self._language, "sidebar.csv.header.keyword"),
+                tr(self._language, "sidebar.csv.header.minute"),
+                tr(self._language, "sidebar.csv.header.hits"),
+                tr(self._language, "sidebar.csv.header.case"),
+            ],
+            line_pipeline.counter_rate_rows(
+                [(counter["keyword"], counter["rates"]) for counter in self._counters],
+                start,
+                end,
+                tr(self._language, "sidebar.csv.case_yes")
+                if self._case_sensitive
+                else tr(self._language, "sidebar.csv.case_no"),
+            ),
+        )
+
+    def _print_stats(self):
+        wall_now = time.time()
+        self._write_counter_rates(minute_start(wall_now))
+        now = time.monotonic()
+        elapsed = max(1e-6, now - self._last_stats_at)
+        delta = {key: self._totals[key] - self._last_totals[key] for key in self._totals}
+        self._last_totals = dict(self._totals)
+        self._last_stats_at = now
+
+        state = "up" if self._serial.is_connected() else "down"
+        message = (
+            f"{self._port} [{state}] "
+            f"rx {self._totals['rx_bytes']} B ({delta['rx_bytes'] / elapsed:.0f} B/s), "
+            f"{self._totals['rx_lines']} lines ({delta['rx_lines'] / elapsed:.1f} lines/s) | "
+            f"tx {self._totals['tx_bytes']} B, {self._totals['tx_lines']} lines"
+        )
+        if self._counters:
+            message += " | " + ", ".join(
+                f"{counter['keyword']}={counter['count']} "
+                f"({counter['rates'].count_between(int(wall_now) - 59, int(wall_now) + 1)}/min)"
+                for counter in self._counters
+            )
+        if self._tasks:
+            message += " | " + ", ".join(
+                f"{task['name']}:{task['trigger_count']}" for task in self._tasks
+            )
+        if self._stream_server is not None:
+            stream_stats = self._stream_server.stats
+            message += (
+                f" | stream clients={self._stream_server.client_count} "
+                f"dropped={stream_stats['dropped_bytes']} B"
+            )
+        self._print(message)
+
+
+def run_headless(args) -> int:
+    """헤드리스 모드 진입점 (args: main.py argparse 결과)"""
+    env_path = env_config.resolve_env_path()
+    env_config.ensure_env_file_defaults(env_path)
+    load_dotenv(env_path, override=True)
+
+    port = args.port or os.environ.get(ENV_HEADLESS_PORT, "").strip()
+    if not port:
+        print(f"--port 또는 {ENV_HEADLESS_PORT} 설정이 필요합니다.", file=sys.stderr)
+        return 2
+    baudrate = args.baud or int(
+        os.environ.get(ENV_HEADLESS_BAUDRATE, "") or SerialManager.DEFAULT_BAUDRATE
+    )
+    stats_interval = args.stats_interval or float(
+        os.environ.get(ENV_HEADLESS_STATS_INTERVAL_SEC, "") or DEFAULT_STATS_INTERVAL_SEC
+    )
+    case_sensitive = os.environ.get(ENV_HEADLESS_CASE_SENSITIVE, "").strip().lower() in (
+        "1", "true", "yes", "y"
+    )
+    log_dir = env_config.resolve_log_dir()
+    if not log_dir:
+        print("LOG_DIR 미설정: 로그 파일 없이 실행합니다.", file=sys.stderr)
+
+    app = QCoreApplication(sys.argv)
+    app.setApplicationName("LnxTerm")
+    capture = HeadlessCapture(
+        port, baudrate, log_dir, stats_interval, case_sensitive,
+        frame_decoder_name=getattr(args, "frame_decoder", ""),
+    )
+
+    # SIGINT/SIGTERM: 이벤트 루프 종료 (파이썬 시그널 처리를 위해 주기적으로 깨움)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    wake_timer = QTimer()
+    wake_timer.timeout.connect(lambda: None)
+    wake_timer.start(200)
+
+    capture.start()
+    exit_code = app.exec()
+    capture.stop()
+    return exit_code
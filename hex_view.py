@@ -0,0 +1,148 @@
+"""
+Hex 덤프 보기 (오프셋 / 16진수 / ASCII)
+- 수신 원본 바이트 링 버퍼(ByteRing)를 직접 그림 → 디코딩 과정에서 깨진 바이너리도 원본 그대로 표시
+- 화면에 보이는 행만 그리는 가상 스크롤: 보이는 범위를 한 번에 읽고 행마다 bytes.hex()/translate()로
+  변환 (바이트 단위 파이썬 문자열 조립 없음) → 버퍼가 수 MB여도 스크롤 비용 일정
+- 보이는 동안에만 주기적으로 링 버퍼 끝 위치를 확인해 갱신 (수신 경로에서는 신호를 보내지 않음)
+- 스크롤이 맨 아래면 새 데이터를 따라감
+"""
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtWidgets import QAbstractScrollArea
+
+from byte_ring import ByteRing
+from styles import COLORS
+
+BYTES_PER_ROW = 16
+# 출력 가능한 ASCII(0x20~0x7E) 외의 바이트는 '.'로 표시
+_ASCII_TABLE = bytes(value if 0x20 <= value < 0x7F else 0x2E for value in range(256))
+
+
+class HexView(QAbstractScrollArea):
+    """ByteRing 내용을 16바이트 행으로 표시하는 가상 스크롤 뷰"""
+
+    REFRESH_INTERVAL_MS = 100
+    MARGIN = 8
+
+    def __init__(self, ring: ByteRing, parent=None):
+        super().__init__(parent)
+        self._ring = ring
+        self._top_row = 0              # 화면 맨 위 행 (절대 오프셋 // BYTES_PER_ROW)
+        self._follow = True
+        self._seen_end = -1
+
+        font = QFont("JetBrains Mono", 11)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        metrics = QFontMetrics(font)
+        self._line_height = metrics.lineSpacing()
+        self._ascent = metrics.ascent()
+        char_width = metrics.horizontalAdvance("0")
+        self._hex_x = self.MARGIN + char_width * 10           # "0000abcd" + 공백 2
+        self._ascii_x = self._hex_x + char_width * (BYTES_PER_ROW * 3 + 1)
+
+        self._offset_color = QColor(COLORS["terminal_yellow"])
+        self._hex_color = QColor(COLORS["text_primary"])
+        self._ascii_color = QColor(COLORS["terminal_green"])
+        self._background = QColor(COLORS["bg_dark"])
+        self.setStyleSheet(f"QAbstractScrollArea {{ background-color: {COLORS['bg_dark']}; border: none; }}")
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll_value_changed)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def set_ring(self, ring: ByteRing) -> None:
+        self._ring = ring
+        self._seen_end = -1
+        self._follow = True
+        self.refresh()
+
+    # === 스크롤 범위 ===
+
+    def _visible_rows(self) -> int:
+        return max(1, self.viewport().height() // self._line_height)
+
+    def _row_range(self) -> tuple[int, int]:
+        """(첫 행, 끝 행 + 1) 절대 행 번호"""
+        first = self._ring.start_offset // BYTES_PER_ROW
+        end = (self._ring.end_offset + BYTES_PER_ROW - 1) // BYTES_PER_ROW
+        return first, end
+
+    def refresh(self) -> None:
+        """링 버퍼 끝이 바뀌었으면 스크롤 범위 갱신 후 다시 그림"""
+        end_offset = self._ring.end_offset
+        if end_offset == self._seen_end:
+            return
+        self._seen_end = end_offset
+        self._update_scroll_range()
+        self.viewport().update()
+
+    def _update_scroll_range(self) -> None:
+        first, end = self._row_range()
+        max_top = max(first, end - self._visible_rows())
+        if self._follow or self._top_row > max_top:
+            self._top_row = max_top
+        self._top_row = max(self._top_row, first)
+        scrollbar = self.verticalScrollBar()
+        scrollbar.blockSignals(True)
+        scrollbar.setRange(0, max_top - first)
+        scrollbar.setPageStep(self._visible_rows())
+        scrollbar.setSingleStep(1)
+        scrollbar.setValue(self._top_row - first)
+        scrollbar.blockSignals(False)
+
+    def _on_scroll_value_changed(self, value: int) -> None:
+        first, _end = self._row_range()
+        self._top_row = first + value
+        self._follow = value >= self.verticalScrollBar().maximum()
+        self.viewport().update()
+
+    # === Qt 이벤트 ===
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._seen_end = -1
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scroll_range()
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), self._background)
+        painter.setFont(self.font())
+
+        ring = self._ring
+        row_count = self._visible_rows() + 1
+        base = self._top_row * BYTES_PER_ROW
+        # 맨 앞 행은 덮어써진 앞부분이 빠질 수 있음 → 빈칸으로 채워 열 위치 유지
+        read_start = max(base, ring.start_offset)
+        data = ring.read(read_start, base + row_count * BYTES_PER_ROW - read_start)
+        lead = read_start - base
+        data_end = lead + len(data)
+
+        y = self._ascent
+        for row in range(row_count):
+            row_start = row * BYTES_PER_ROW
+            if row_start >= data_end:
+                break
+            chunk_start = max(row_start, lead)
+            chunk = data[chunk_start - lead:row_start + BYTES_PER_ROW - lead]
+            pad = chunk_start - row_start
+            painter.setPen(self._offset_color)
+            painter.drawText(self.MARGIN, y, f"{base + row_start:08x}")
+            painter.setPen(self._hex_color)
+            painter.drawText(self._hex_x, y, "   " * pad + chunk.hex(" "))
+            painter.setPen(self._ascii_color)
+            painter.drawText(self._ascii_x, y, " " * pad + chunk.translate(_ASCII_TABLE).decode("ascii"))
+            y += self._line_height
+        painter.end()
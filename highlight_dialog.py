@@ -0,0 +1,203 @@
+"""
+하이라이트 규칙 편집 창
+- 패턴 / 정규식 / 대소문자 무시 / 색상 / 줄 전체 배경 열로 규칙 편집 (위에 있는 규칙이 우선)
+- 색상 셀 더블 클릭 시 색상 선택, 확인 시 정규식 오류가 있으면 해당 행을 알리고 창 유지
+"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QColorDialog,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from highlight_rules import MAX_RULES, normalize_rule, rule_error
+from i18n import normalize_language, tr
+from styles import COLORS, DEFAULT_HIGHLIGHT_RULES
+
+
+class HighlightRulesDialog(QDialog):
+    """하이라이트 규칙 편집 (모달, rules()로 결과 조회)"""
+
+    COLUMN_PATTERN = 0
+    COLUMN_REGEX = 1
+    COLUMN_IGNORE_CASE = 2
+    COLUMN_COLOR = 3
+    COLUMN_LINE = 4
+    COLUMN_COUNT = 5
+    CHECK_COLUMNS = {COLUMN_REGEX: "regex", COLUMN_IGNORE_CASE: "ignore_case", COLUMN_LINE: "line"}
+
+    def __init__(self, rules: list[dict], parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._setup_ui()
+        self._set_rules(rules)
+
+    def _setup_ui(self):
+        self.setWindowTitle(tr(self._language, "highlight.dialog.title"))
+        self.resize(640, 420)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+            }}
+            QLabel {{
+                color: {COLORS['text_secondary']};
+            }}
+            QTableWidget {{
+                background-color: {COLORS['bg_input']};
+                color: {COLORS['text_primary']};
+                gridline-color: {COLORS['border']};
+            }}
+            QHeaderView::section {{
+                background-color: {COLORS['bg_sidebar']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border']};
+                padding: 4px;
+            }}
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        hint = QLabel(tr(self._language, "highlight.dialog.hint"))
+        hint.setWordWrap(True)
+        layout.addWidget(hint)
+
+        self._table = QTableWidget(0, self.COLUMN_COUNT)
+        self._table.setHorizontalHeaderLabels([
+            tr(self._language, "highlight.table.pattern"),
+            tr(self._language, "highlight.table.regex"),
+            tr(self._language, "highlight.table.ignore_case"),
+            tr(self._language, "highlight.table.color"),
+            tr(self._language, "highlight.table.line"),
+        ])
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._table.verticalHeader().setDefaultSectionSize(26)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(self.COLUMN_PATTERN, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, self.COLUMN_COUNT):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        self._table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        layout.addWidget(self._table, 1)
+
+        buttons = QHBoxLayout()
+        add_btn = QPushButton(tr(self._language, "highlight.button.add"))
+        add_btn.clicked.connect(self._add_row)
+        buttons.addWidget(add_btn)
+        remove_btn = QPushButton(tr(self._language, "highlight.button.remove"))
+        remove_btn.clicked.connect(self._remove_selected_rows)
+        buttons.addWidget(remove_btn)
+        defaults_btn = QPushButton(tr(self._language, "highlight.button.defaults"))
+        defaults_btn.clicked.connect(lambda: self._set_rules(DEFAULT_HIGHLIGHT_RULES))
+        buttons.addWidget(defaults_btn)
+        buttons.addStretch(1)
+        ok_btn = QPushButton(tr(self._language, "highlight.button.ok"))
+        ok_btn.setDefault(True)
+        ok_btn.clicked.connect(self.accept)
+        buttons.addWidget(ok_btn)
+        cancel_btn = QPushButton(tr(self._language, "highlight.button.cancel"))
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+    # === 행 편집 ===
+
+    def _set_rules(self, rules: list[dict]):
+        self._table.setRowCount(0)
+        for rule in rules:
+            normalized = normalize_rule(rule)
+            if normalized is not None:
+                self._append_rule(normalized)
+
+    def _append_rule(self, rule: dict) -> int:
+        row = self._table.rowCount()
+        self._table.insertRow(row)
+        self._table.setItem(row, self.COLUMN_PATTERN, QTableWidgetItem(rule["pattern"]))
+        for column, key in self.CHECK_COLUMNS.items():
+            item = QTableWidgetItem()
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if rule[key] else Qt.CheckState.Unchecked)
+            self._table.setItem(row, column, item)
+        color_item = QTableWidgetItem()
+        color_item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
+        color_item.setToolTip(tr(self._language, "highlight.tooltip.color"))
+        self._table.setItem(row, self.COLUMN_COLOR, color_item)
+        self._set_color(row, rule["color"])
+        return row
+
+    def _set_color(self, row: int, color: str):
+        item = self._table.item(row, self.COLUMN_COLOR)
+        item.setText(color)
+        item.setBackground(QColor(color))
+        item.setForeground(QColor(COLORS["bg_dark"]))
+
+    def _add_row(self):
+        if self._table.rowCount() >= MAX_RULES:
+            QMessageBox.warning(
+                self,
+                tr(self._language, "highlight.dialog.title"),
+                tr(self._language, "highlight.dialog.max", max_count=MAX_RULES),
+            )
+            return
+        row = self._append_rule({
+            "pattern": "", "regex": False, "ignore_case": False,
+            "color": COLORS["warning"], "line": False,
+        })
+        self._table.setCurrentCell(row, self.COLUMN_PATTERN)
+        self._table.editItem(self._table.item(row, self.COLUMN_PATTERN))
+
+    def _remove_selected_rows(self):
+        rows = sorted({index.row() for index in self._table.selectedIndexes()}, reverse=True)
+        for row in rows:
+            self._table.removeRow(row)
+
+    def _on_cell_double_clicked(self, row: int, column: int):
+        if column != self.COLUMN_COLOR:
+            return
+        current = QColor(self._table.item(row, column).text())
+        color = QColorDialog.getColor(current, self, tr(self._language, "highlight.table.color"))
+        if color.isValid():
+            self._set_color(row, color.name().upper())
+
+    # === 결과 ===
+
+    def rules(self) -> list[dict]:
+        """표의 규칙 목록 (패턴이 빈 행 제외)"""
+        rules = []
+        for row in range(self._table.rowCount()):
+            data = {"pattern": self._table.item(row, self.COLUMN_PATTERN).text()}
+            for column, key in self.CHECK_COLUMNS.items():
+                data[key] = self._table.item(row, column).checkState() == Qt.CheckState.Checked
+            data["color"] = self._table.item(row, self.COLUMN_COLOR).text()
+            rule = normalize_rule(data)
+            if rule is not None:
+                rules.append(rule)
+        return rules
+
+    def accept(self):
+        for row in range(self._table.rowCount()):
+            pattern = self._table.item(row, self.COLUMN_PATTERN).text()
+            regex = self._table.item(row, self.COLUMN_REGEX).checkState() == Qt.CheckState.Checked
+            if not pattern or not regex:
+                continue
+            error = rule_error({"pattern": pattern, "regex": True, "ignore_case": False})
+            if error:
+                self._table.setCurrentCell(row, self.COLUMN_PATTERN)
+                QMessageBox.warning(
+                    self,
+                    tr(self._language, "highlight.dialog.title"),
+                    tr(self._language, "highlight.dialog.invalid", row=row + 1, error=error),
+                )
+                return
+        super().accept()
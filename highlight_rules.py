@@ -0,0 +1,198 @@
+"""
+사용자 하이라이트 규칙
+- 규칙(문자열 또는 정규식 → 색상)을 이름 있는 그룹으로 묶은 하나의 정규식으로 컴파일 → 줄당 finditer 1회
+- 줄 추가 시에는 서식을 넣지 않고, 화면에 보이는 블록에만 QTextLayout 추가 서식으로 적용 (지연 적용)
+- 블록 userState에 적용한 규칙 버전을 기록 → 규칙이 바뀌기 전까지 같은 줄은 다시 계산하지 않음
+- 규칙 형식: {"pattern": str, "regex": bool, "ignore_case": bool, "color": "#RRGGBB", "line": bool}
+  (line=True이면 일치한 줄 전체에 배경색 추가)
+"""
+
+import re
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QTextCharFormat, QTextLayout
+
+from styles import COLORS
+
+MAX_RULES = 100
+LINE_BACKGROUND_ALPHA = 48
+
+
+def normalize_rule(data) -> dict | None:
+    """저장/입력 값 → 규칙 dict (패턴이 비었거나 형식이 다르면 None)"""
+    if not isinstance(data, dict):
+        return None
+    pattern = str(data.get("pattern", ""))
+    if not pattern:
+        return None
+    color = QColor(str(data.get("color", "")))
+    if not color.isValid():
+        color = QColor(COLORS["warning"])
+    return {
+        "pattern": pattern,
+        "regex": bool(data.get("regex", False)),
+        "ignore_case": bool(data.get("ignore_case", False)),
+        "color": color.name().upper(),
+        "line": bool(data.get("line", False)),
+    }
+
+
+def _rule_source(rule: dict) -> str:
+    source = rule["pattern"] if rule["regex"] else re.escape(rule["pattern"])
+    return f"(?i:{source})" if rule["ignore_case"] else f"(?:{source})"
+
+
+def rule_error(rule: dict) -> str:
+    """규칙 하나의 정규식 오류 메시지 (정상이면 빈 문자열)"""
+    try:
+        re.compile(_rule_source(rule))
+    except re.error as e:
+        return str(e)
+    return ""
+
+
+def compile_rules(rules: list[dict]) -> re.Pattern | None:
+    """규칙 목록 → 결합 정규식 (그룹 이름 _hN = 규칙 인덱스, 앞선 규칙이 같은 위치에서 우선)
+
+    오류가 있는 규칙은 제외
+    """
+    sources = [
+        f"(?P<_h{index}>{_rule_source(rule)})"
+        for index, rule in enumerate(rules)
+        if not rule_error(rule)
+    ]
+    if not sources:
+        return None
+    try:
+        return re.compile("|".join(sources))
+    except re.error:
+        # 규칙끼리 충돌(예: 같은 그룹 이름, 번호 역참조) → 호출 측에서 규칙별 정규식으로 검사
+        return None
+
+
+class HighlightRuleSet(QObject):
+    """터미널 위젯들이 공유하는 규칙 세트 (변경 시 version 증가 + changed 발생)"""
+
+    changed = pyqtSignal()
+
+    def __init__(self, rules: list | None = None, parent=None):
+        super().__init__(parent)
+        self._rules: list[dict] = []
+        self._pattern: re.Pattern | None = None
+        self._fallback: list[tuple[int, re.Pattern]] = []
+        self._span_formats: list[QTextCharFormat] = []
+        self._line_formats: list[QTextCharFormat | None] = []
+        self.version = 0
+        self.set_rules(rules or [])
+
+    def rules(self) -> list[dict]:
+        return [dict(rule) for rule in self._rules]
+
+    def set_rules(self, rules: list) -> None:
+        normalized = [rule for rule in map(normalize_rule, rules) if rule is not None][:MAX_RULES]
+        if normalized == self._rules and self.version:
+            return
+        self._rules = normalized
+        self._pattern = compile_rules(normalized)
+        self._fallback = []
+        if self._pattern is None:
+            self._fallback = [
+                (index, re.compile(_rule_source(rule)))
+                for index, rule in enumerate(normalized)
+                if not rule_error(rule)
+            ]
+        self._span_formats = []
+        self._line_formats = []
+        for rule in normalized:
+            color = QColor(rule["color"])
+            span_format = QTextCharFormat()
+            span_format.setForeground(color)
+            span_format.setFontWeight(QFont.Weight.Bold)
+            self._span_formats.append(span_format)
+            line_format = None
+            if rule["line"]:
+                background = QColor(color)
+                background.setAlpha(LINE_BACKGROUND_ALPHA)
+                line_format = QTextCharFormat()
+                line_format.setBackground(background)
+            self._line_formats.append(line_format)
+        self.version += 1
+        self.changed.emit()
+
+    def _matches(self, text: str):
+        """(규칙 인덱스, 시작, 끝) 순회"""
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                if match.end() > match.start():
+                    yield int(match.lastgroup[2:]), match.start(), match.end()
+            return
+        for index, pattern in self._fallback:
+            for match in pattern.finditer(text):
+                if match.end() > match.start():
+                    yield index, match.start(), match.end()
+
+    def format_ranges(self, text: str) -> list[QTextLayout.FormatRange]:
+        """줄 텍스트 → 레이아웃 추가 서식 목록 (줄 배경이 먼저, 일치 구간이 그 위)"""
+        if not self._rules or not text:
+            return []
+        line_range = None
+        spans = []
+        for index, start, end in self._matches(text):
+            if line_range is None and self._line_formats[index] is not None:
+                line_range = QTextLayout.FormatRange()
+                line_range.start = 0
+                line_range.length = len(text)
+                line_range.format = self._line_formats[index]
+            span = QTextLayout.FormatRange()
+            span.start = start
+            span.length = end - start
+            span.format = self._span_formats[index]
+            spans.append(span)
+        return [line_range] + spans if line_range is not None else spans
+
+
+class ViewportHighlighter(QObject):
+    """QPlainTextEdit의 보이는 블록에만 규칙 서식을 적용
+
+    QSyntaxHighlighter는 문서 변경마다 바뀐 블록 전체를 다시 칠하므로 대량 수신 시 삽입 비용이
+    늘어남 → 대신 화면 갱신 요청(updateRequest)을 모아 다음 이벤트 루프에서 보이는 블록만 처리
+    """
+
+    def __init__(self, editor, rule_set: HighlightRuleSet):
+        super().__init__(editor)
+        self._editor = editor
+        self._rule_set = rule_set
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.refresh_visible)
+        editor.updateRequest.connect(self._schedule)
+        rule_set.changed.connect(self._schedule)
+
+    def _schedule(self, *_args) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def refresh_visible(self) -> int:
+        """보이는 블록 중 현재 규칙 버전으로 칠하지 않은 블록 처리 (처리한 블록 수 반환)"""
+        editor = self._editor
+        document = editor.document()
+        version = self._rule_set.version
+        bottom = editor.viewport().height()
+        offset = editor.contentOffset()
+        block = editor.firstVisibleBlock()
+        painted = 0
+        while block.isValid():
+            if editor.blockBoundingGeometry(block).translated(offset).top() > bottom:
+                break
+            if block.userState() != version:
+                # userState 갱신을 먼저 해 markContentsDirty가 다시 요청한 갱신에서 건너뛰게 함
+                block.setUserState(version)
+                layout = block.layout()
+                ranges = self._rule_set.format_ranges(block.text())
+                if ranges or layout.formats():
+                    layout.setFormats(ranges)
+                    document.markContentsDirty(block.position(), block.length())
+                painted += 1
+            block = block.next()
+        return painted
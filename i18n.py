@@ -64,7 +64,11 @@ TRANSLATIONS = {
         "msg.error_prefix": "오류: {error}\n",
         "msg.port_not_connected": "포트가 연결되지 않았습니다.\n",
         "msg.send_error": "전송 오류: {error}\n",
-        "msg.send_error_delayed": "전송 오류 (지연 전송): {error}\n",
+        "msg.tx_queue_full": "송신 큐가 가득 차 {count}줄 전송을 거부했습니다.\n",
+        "msg.tx_queue_cleared": "송신 대기열 취소: {count}줄\n",
+        "action.cancel_tx": "송신 대기열 취소",
+        "status.tx_queue": "TXQ: {count}",
+        "status.tx_progress": "TX {done}/{total}",
         "msg.log_start": "로그 기록 시작: {path}\n",
         "dialog.log_error.title": "로그 오류",
         "dialog.log_error.body": "로그 파일을 열 수 없습니다:\n{error}",
@@ -83,13 +87,11 @@ TRANSLATIONS = {
             "<li>터미널 출력 검색</li>"
             "</ul>"
         ),
-        "msg.env_updated": "환경 변수(.env)가 업데이트되었습니다.\n",
+        "msg.env_updated": "환경 설정(.env, lnxterm_config.json)이 업데이트되었습니다.\n",
         "dialog.done.title": "완료",
-        "dialog.done.body": "환경 변수(.env)가 성공적으로 업데이트되었습니다.",
-        "dialog.update_unavailable.title": "업데이트 불가",
-        "dialog.update_unavailable.body": "AUTO_LOAD_MODE가 '{mode}'로 설정되어 있어 환경 변수를 업데이트할 수 없습니다.",
+        "dialog.done.body": "환경 설정(.env, lnxterm_config.json)이 성공적으로 업데이트되었습니다.",
         "dialog.failed.title": "실패",
-        "dialog.failed.body": "환경 변수 업데이트에 실패했습니다. (알 수 없는 오류)",
+        "dialog.failed.body": "설정 파일 저장에 실패했습니다.\n{path}\n(오류 내용은 터미널 메시지 참고)",
         "search.placeholder": "검색...",
         "search.tooltip.prev": "이전 결과 (Shift+F3)",
         "search.tooltip.next": "다음 결과 (F3)",
@@ -119,6 +121,7 @@ TRANSLATIONS = {
         "sidebar.tooltip.copy_log_path": "로그 파일 경로 복사",
         "sidebar.tooltip.copy_stats_path": "통계 파일 경로 복사",
         "sidebar.tooltip.reset_counter": "통계 초기화",
+        "sidebar.tooltip.sparkline": "최근 60초 초당 검출 수",
         "sidebar.tooltip.reset_all": "문자열 통계 전체 항목 초기화",
         "sidebar.conn.expanded": "연결 설정 ▼",
         "sidebar.conn.collapsed": "연결 설정 ▲",
@@ -163,12 +166,162 @@ TRANSLATIONS = {
         "macro.dialog.max.title": "등록 제한",
         "macro.dialog.max.body": "명령어는 최대 {max_count}개까지 등록할 수 있습니다.",
         "sidebar.csv.header.keyword": "문자열",
-        "sidebar.csv.header.timestamp": "집계 시점",
-        "sidebar.csv.header.count": "누적 카운트",
+        "sidebar.csv.header.minute": "분",
+        "sidebar.csv.header.hits": "분당 검출 수",
         "sidebar.csv.header.case": "대소문자 구분",
-        "sidebar.csv.header.log": "로그",
         "sidebar.csv.case_yes": "예",
         "sidebar.csv.case_no": "아니오",
+        "action.export_latency": "자동 명령 지연 통계 내보내기...",
+        "dialog.export_latency.title": "지연 통계 CSV 저장",
+        "msg.latency_exported": "지연 통계 저장: {path}\n",
+        "msg.latency_export_failed": "지연 통계 저장 실패: {path}\n",
+        "sidebar.auto.latency_header": "트리거→송신 지연 (p50 / p99 / max)",
+        "sidebar.latency_csv.header.task": "자동 명령",
+        "sidebar.latency_csv.header.stage": "구간",
+        "sidebar.latency_csv.header.bucket_low": "버킷 하한(us)",
+        "sidebar.latency_csv.header.bucket_high": "버킷 상한(us)",
+        "sidebar.latency_csv.header.count": "횟수",
+        "sidebar.latency_csv.header.cumulative": "누적 비율(%)",
+        "action.send_file": "파일 전송...",
+        "status.file_send": "📤 {percent}% {rate}/s ETA {eta}s",
+        "msg.file_send_start": "파일 전송 시작: {path}\n",
+        "msg.file_send_done": "파일 전송 완료: {path} ({lines}줄, {size}, {elapsed}초, {rate}/s)\n",
+        "msg.file_send_failed": "파일 전송 실패: {path} ({error})\n",
+        "msg.file_send_canceled": "파일 전송 취소: {path} ({size} 전송됨)\n",
+        "msg.file_send_busy": "이미 파일 전송이 진행 중입니다.\n",
+        "msg.file_not_found": "파일을 찾을 수 없음",
+        "file_send.title": "파일 전송",
+        "file_send.placeholder.path": "전송할 파일 경로",
+        "file_send.button.browse": "찾아보기...",
+        "file_send.button.send": "전송",
+        "file_send.group.pacing": "전송 속도 조절",
+        "file_send.label.mode": "방식:",
+        "file_send.mode.line_delay": "라인 간 지연",
+        "file_send.mode.byte_rate": "바이트 속도",
+        "file_send.mode.prompt": "프롬프트 대기",
+        "file_send.label.line_delay": "라인 간 지연:",
+        "file_send.label.byte_rate": "바이트 속도:",
+        "file_send.label.prompt": "프롬프트 문자열:",
+        "file_send.label.prompt_timeout": "프롬프트 대기 시간:",
+        "file_send.checkbox.collapse_echo": "송신 에코를 요약 1줄로 표시",
+        "action.modem_send": "XMODEM/YMODEM 송신...",
+        "action.modem_receive": "XMODEM/YMODEM 수신...",
+        "dialog.modem.title": "XMODEM/YMODEM 전송",
+        "dialog.modem.protocol": "프로토콜:",
+        "status.modem": "📦 {percent}% {size} ({rate}/s)",
+        "msg.modem_send_start": "XMODEM/YMODEM 송신 대기 중 (수신 측 시작 요청 대기): {path}\n",
+        "msg.modem_receive_start": "XMODEM/YMODEM 수신 시작: {path}\n",
+        "msg.modem_done": "XMODEM/YMODEM 전송 완료: {path} ({size}, {elapsed}초, {rate}/s)\n",
+        "msg.modem_failed": "XMODEM/YMODEM 전송 실패: {path} ({error})\n",
+        "action.new_session": "새 포트 세션",
+        "session.tab.main": "메인",
+        "session.tab.new": "새 세션",
+        "session.tab.timeline": "통합 타임라인",
+        "session.button.connect": "연결",
+        "session.button.disconnect": "연결 해제",
+        "session.placeholder.command": "이 포트로 보낼 명령 입력...",
+        "msg.stream_server_started": "RX 스트림 서버 시작: {address}\n",
+        "msg.stream_server_failed": "RX 스트림 서버 시작 실패: {address} ({error})\n",
+        "action.raw_capture": "Raw 캡처 기록",
+        "action.replay_raw": "Raw 캡처 재생...",
+        "dialog.replay.title": "Raw 캡처 재생",
+        "dialog.replay.speed": "재생 속도:",
+        "status.replay": "⏵ 재생 {chunks}청크 {size}",
+        "msg.raw_capture_started": "Raw 캡처 시작: {path}\n",
+        "msg.raw_capture_stopped": "Raw 캡처 종료: {path} ({chunks}청크, {size})\n",
+        "msg.raw_capture_failed": "Raw 캡처 시작 실패: {error}\n",
+        "msg.replay_requires_disconnect": "재생하려면 먼저 포트 연결을 해제하세요.\n",
+        "msg.replay_start": "Raw 캡처 재생 시작 ({speed}): {path}\n",
+        "msg.replay_done": "Raw 캡처 재생 완료: {chunks}청크, {size}, {elapsed}초 ({rate}/s)\n",
+        "msg.replay_canceled": "Raw 캡처 재생 중단: {chunks}청크, {size}, {elapsed}초\n",
+        "msg.replay_failed": "Raw 캡처 재생 실패: {error}\n",
+        "msg.pty_peer_path": "가상 pty 상대편 경로: {path}\n",
+        "action.metrics": "파이프라인 지표",
+        "metrics.title": "파이프라인 지표",
+        "metrics.row.rx_rate": "수신 속도",
+        "metrics.row.queue": "시그널 큐 (청크)",
+        "metrics.row.tx_pending": "송신 대기 라인",
+        "metrics.row.automation_timers": "자동 명령 대기 타이머",
+        "metrics.row.render": "표시 (청크당)",
+        "metrics.row.match": "통계/트리거 매칭 (라인당)",
+        "metrics.row.log": "로그 기록+flush (라인당)",
+        "metrics.chunk_sizes": "수신 청크 크기 분포",
+        "metrics.value.rx_rate": "{bytes}/s, {lines} 라인/s",
+        "metrics.value.queue": "현재 {depth}, 최대 {max}",
+        "metrics.value.stage": "{rate}/s  p50 {p50}µs  p99 {p99}µs  최대 {max}µs",
+        "metrics.button.reset": "초기화",
+        "metrics.button.close": "닫기",
+        "action.stall_report": "GUI 멈춤 보고서 저장...",
+        "dialog.stall_report.title": "GUI 멈춤 보고서 저장",
+        "msg.stall_report_saved": "[GUI 멈춤 보고서 저장] {path} (접힌 스택: {folded}, 멈춤 {stalls}회, 샘플 {samples}개)\n",
+        "msg.stall_report_failed": "[GUI 멈춤 보고서 저장 실패] {path}: {error}\n",
+        "msg.stall_detector_disabled": "[GUI 멈춤 감지 비활성] STALL_THRESHOLD_MS=0\n",
+        "action.profile_start": "프로파일링 시작",
+        "action.profile_stop": "프로파일링 중지 및 저장",
+        "msg.profile_started": "[프로파일링 시작] 중지하면 LOG_DIR에 .pstats와 요약 저장\n",
+        "msg.profile_saved": "[프로파일 저장] {path} (요약: {summary}, {seconds}초, 호출 {calls}회)\n",
+        "msg.profile_save_failed": "[프로파일 저장 실패] {path}: {error}\n",
+        "about.startup": (
+            "<p><b>시작 시간</b> (파이썬 진입 기준)<br>"
+            "창 생성 {window_init} ms, 첫 화면 {first_paint} ms, 초기화 완료 {ready} ms<br>"
+            "프로세스 시작 → 파이썬 진입 {pre_python} ms</p>"
+        ),
+        "msg.config_save_failed": "[설정 저장 실패] {path}: {error}\n",
+        "action.command_palette": "명령 팔레트...",
+        "palette.title": "명령 팔레트",
+        "palette.placeholder": "매크로 / 입력 기록 / 자동 명령 검색 (Enter: 전송)",
+        "palette.status": "{shown} / {total}개, 검색 {elapsed_us} µs",
+        "palette.source.history": "기록",
+        "palette.source.macro": "매크로",
+        "palette.source.task": "자동",
+        "history.search.prompt": "(역방향 검색) '{query}':",
+        "history.search.failed": "(역방향 검색 실패) '{query}':",
+        "action.highlight_rules": "하이라이트 규칙...",
+        "highlight.dialog.title": "하이라이트 규칙",
+        "highlight.dialog.hint": "일치하는 문자열을 색상으로 강조합니다 (화면에 보이는 줄에만 적용, 위에 있는 규칙이 우선). 색상 칸을 더블 클릭하면 색을 바꿀 수 있습니다.",
+        "highlight.dialog.max": "규칙은 최대 {max_count}개까지 등록할 수 있습니다.",
+        "highlight.dialog.invalid": "{row}번 규칙의 정규식이 올바르지 않습니다: {error}",
+        "highlight.table.pattern": "패턴",
+        "highlight.table.regex": "정규식",
+        "highlight.table.ignore_case": "대소문자 무시",
+        "highlight.table.color": "색상",
+        "highlight.table.line": "줄 전체",
+        "highlight.tooltip.color": "더블 클릭하여 색상 선택",
+        "highlight.button.add": "추가",
+        "highlight.button.remove": "삭제",
+        "highlight.button.defaults": "기본값",
+        "highlight.button.ok": "확인",
+        "highlight.button.cancel": "취소",
+        "action.hex_view": "Hex 보기",
+        "session.tab.hex": "HEX (수신 원본)",
+        "msg.log_raw_sidecar": "Raw 바이트 로그: {path}\n",
+        "menu.frame_decoder": "프레임 디코더",
+        "frame.decoder.off": "끄기 (텍스트만)",
+        "frame.decoder.length": "길이 지정 (FRAME_LENGTH_PREFIX)",
+        "frame.table.time": "시각",
+        "frame.table.source": "포트",
+        "frame.table.protocol": "형식",
+        "frame.table.length": "길이",
+        "frame.table.status": "상태",
+        "frame.table.payload": "데이터",
+        "session.tab.frames": "프레임",
+        "session.label.frame_decoder": "프레임:",
+        "msg.frame_decoder": "프레임 디코더: {name}\n",
+        "action.plot": "플롯",
+        "plot.title": "수치 플롯",
+        "plot.window": "시간 범위:",
+        "plot.window.seconds": "{count}초",
+        "plot.window.minutes": "{count}분",
+        "plot.window.hours": "{count}시간",
+        "plot.window.all": "전체",
+        "plot.pause": "일시정지",
+        "plot.extractors": "추출기 (한 줄에 하나, 이름 있는 그룹 = 시계열 이름 예: temp=(?P<temp>-?\\d+(?:\\.\\d+)?)):",
+        "plot.button.apply": "적용",
+        "plot.button.clear": "지우기",
+        "plot.button.close": "닫기",
+        "plot.empty": "표시할 샘플이 없습니다",
+        "plot.status": "시계열 {series}개 · 샘플 {samples}개",
+        "plot.status.error": "추출기 오류: {pattern} ({error})",
     },
     "en": {
         "app.title": "LnxTerm - Serial Terminal",
@@ -219,7 +372,11 @@ TRANSLATIONS = {
         "msg.error_prefix": "Error: {error}\n",
         "msg.port_not_connected": "Port is not connected.\n",
         "msg.send_error": "Send error: {error}\n",
-        "msg.send_error_delayed": "Send error (delayed send): {error}\n",
+        "msg.tx_queue_full": "TX queue is full. Rejected {count} line(s).\n",
+        "msg.tx_queue_cleared": "Pending TX canceled: {count} line(s)\n",
+        "action.cancel_tx": "Cancel Pending TX",
+        "status.tx_queue": "TXQ: {count}",
+        "status.tx_progress": "TX {done}/{total}",
         "msg.log_start": "Logging started: {path}\n",
         "dialog.log_error.title": "Log Error",
         "dialog.log_error.body": "Cannot open log file:\n{error}",
@@ -238,13 +395,11 @@ TRANSLATIONS = {
             "<li>Terminal output search</li>"
             "</ul>"
         ),
-        "msg.env_updated": "Environment variables (.env) updated.\n",
+        "msg.env_updated": "Settings (.env, lnxterm_config.json) updated.\n",
         "dialog.done.title": "Done",
-        "dialog.done.body": "Environment variables (.env) were updated successfully.",
-        "dialog.update_unavailable.title": "Update Unavailable",
-        "dialog.update_unavailable.body": "Cannot update environment variables because AUTO_LOAD_MODE is '{mode}'.",
+        "dialog.done.body": "Settings (.env, lnxterm_config.json) were updated successfully.",
         "dialog.failed.title": "Failed",
-        "dialog.failed.body": "Failed to update environment variables. (Unknown error)",
+        "dialog.failed.body": "Failed to save the settings file.\n{path}\n(See the terminal message for the error.)",
         "search.placeholder": "Search...",
         "search.tooltip.prev": "Previous result (Shift+F3)",
         "search.tooltip.next": "Next result (F3)",
@@ -274,6 +429,7 @@ TRANSLATIONS = {
         "sidebar.tooltip.copy_log_path": "Copy log file path",
         "sidebar.tooltip.copy_stats_path": "Copy stats file path",
         "sidebar.tooltip.reset_counter": "Reset stats",
+        "sidebar.tooltip.sparkline": "Hits per second over the last 60 s",
         "sidebar.tooltip.reset_all": "Reset all string stats",
         "sidebar.conn.expanded": "Connection Settings ▼",
         "sidebar.conn.collapsed": "Connection Settings ▲",
@@ -318,12 +474,162 @@ TRANSLATIONS = {
         "macro.dialog.max.title": "Limit Reached",
         "macro.dialog.max.body": "You can register up to {max_count} commands.",
         "sidebar.csv.header.keyword": "Keyword",
-        "sidebar.csv.header.timestamp": "Timestamp",
-        "sidebar.csv.header.count": "Cumulative Count",
+        "sidebar.csv.header.minute": "Minute",
+        "sidebar.csv.header.hits": "Hits/min",
         "sidebar.csv.header.case": "Case Sensitive",
-        "sidebar.csv.header.log": "Log",
         "sidebar.csv.case_yes": "Yes",
         "sidebar.csv.case_no": "No",
+        "action.export_latency": "Export Auto Command Latency...",
+        "dialog.export_latency.title": "Save Latency CSV",
+        "msg.latency_exported": "Latency stats saved: {path}\n",
+        "msg.latency_export_failed": "Failed to save latency stats: {path}\n",
+        "sidebar.auto.latency_header": "Trigger→TX latency (p50 / p99 / max)",
+        "sidebar.latency_csv.header.task": "Auto Command",
+        "sidebar.latency_csv.header.stage": "Stage",
+        "sidebar.latency_csv.header.bucket_low": "Bucket Low (us)",
+        "sidebar.latency_csv.header.bucket_high": "Bucket High (us)",
+        "sidebar.latency_csv.header.count": "Count",
+        "sidebar.latency_csv.header.cumulative": "Cumulative (%)",
+        "action.send_file": "Send File...",
+        "status.file_send": "📤 {percent}% {rate}/s ETA {eta}s",
+        "msg.file_send_start": "File send started: {path}\n",
+        "msg.file_send_done": "File sent: {path} ({lines} lines, {size}, {elapsed}s, {rate}/s)\n",
+        "msg.file_send_failed": "File send failed: {path} ({error})\n",
+        "msg.file_send_canceled": "File send canceled: {path} ({size} sent)\n",
+        "msg.file_send_busy": "A file send is already in progress.\n",
+        "msg.file_not_found": "file not found",
+        "file_send.title": "Send File",
+        "file_send.placeholder.path": "Path of the file to send",
+        "file_send.button.browse": "Browse...",
+        "file_send.button.send": "Send",
+        "file_send.group.pacing": "Pacing",
+        "file_send.label.mode": "Mode:",
+        "file_send.mode.line_delay": "Line delay",
+        "file_send.mode.byte_rate": "Byte rate",
+        "file_send.mode.prompt": "Wait for prompt",
+        "file_send.label.line_delay": "Line delay:",
+        "file_send.label.byte_rate": "Byte rate:",
+        "file_send.label.prompt": "Prompt string:",
+        "file_send.label.prompt_timeout": "Prompt timeout:",
+        "file_send.checkbox.collapse_echo": "Collapse TX echo into one summary line",
+        "action.modem_send": "XMODEM/YMODEM Send...",
+        "action.modem_receive": "XMODEM/YMODEM Receive...",
+        "dialog.modem.title": "XMODEM/YMODEM Transfer",
+        "dialog.modem.protocol": "Protocol:",
+        "status.modem": "📦 {percent}% {size} ({rate}/s)",
+        "msg.modem_send_start": "XMODEM/YMODEM send waiting for receiver: {path}\n",
+        "msg.modem_receive_start": "XMODEM/YMODEM receive started: {path}\n",
+        "msg.modem_done": "XMODEM/YMODEM transfer complete: {path} ({size}, {elapsed}s, {rate}/s)\n",
+        "msg.modem_failed": "XMODEM/YMODEM transfer failed: {path} ({error})\n",
+        "action.new_session": "New Port Session",
+        "session.tab.main": "Main",
+        "session.tab.new": "New Session",
+        "session.tab.timeline": "Merged Timeline",
+        "session.button.connect": "Connect",
+        "session.button.disconnect": "Disconnect",
+        "session.placeholder.command": "Command for this port...",
+        "msg.stream_server_started": "RX stream server listening: {address}\n",
+        "msg.stream_server_failed": "RX stream server failed: {address} ({error})\n",
+        "action.raw_capture": "Raw Capture",
+        "action.replay_raw": "Replay Raw Capture...",
+        "dialog.replay.title": "Replay Raw Capture",
+        "dialog.replay.speed": "Replay speed:",
+        "status.replay": "⏵ Replay {chunks} chunks {size}",
+        "msg.raw_capture_started": "Raw capture started: {path}\n",
+        "msg.raw_capture_stopped": "Raw capture stopped: {path} ({chunks} chunks, {size})\n",
+        "msg.raw_capture_failed": "Failed to start raw capture: {error}\n",
+        "msg.replay_requires_disconnect": "Disconnect the port before replaying.\n",
+        "msg.replay_start": "Raw capture replay started ({speed}): {path}\n",
+        "msg.replay_done": "Raw capture replay finished: {chunks} chunks, {size}, {elapsed}s ({rate}/s)\n",
+        "msg.replay_canceled": "Raw capture replay stopped: {chunks} chunks, {size}, {elapsed}s\n",
+        "msg.replay_failed": "Raw capture replay failed: {error}\n",
+        "msg.pty_peer_path": "Virtual pty peer path: {path}\n",
+        "action.metrics": "Pipeline Metrics",
+        "metrics.title": "Pipeline Metrics",
+        "metrics.row.rx_rate": "RX rate",
+        "metrics.row.queue": "Signal queue (chunks)",
+        "metrics.row.tx_pending": "TX pending lines",
+        "metrics.row.automation_timers": "Pending automation timers",
+        "metrics.row.render": "Render (per chunk)",
+        "metrics.row.match": "Counter/trigger match (per line)",
+        "metrics.row.log": "Log write+flush (per line)",
+        "metrics.chunk_sizes": "RX chunk size distribution",
+        "metrics.value.rx_rate": "{bytes}/s, {lines} lines/s",
+        "metrics.value.queue": "now {depth}, max {max}",
+        "metrics.value.stage": "{rate}/s  p50 {p50}µs  p99 {p99}µs  max {max}µs",
+        "metrics.button.reset": "Reset",
+        "metrics.button.close": "Close",
+        "action.stall_report": "Save GUI Stall Report...",
+        "dialog.stall_report.title": "Save GUI Stall Report",
+        "msg.stall_report_saved": "[GUI stall report saved] {path} (folded stacks: {folded}, {stalls} stalls, {samples} samples)\n",
+        "msg.stall_report_failed": "[GUI stall report save failed] {path}: {error}\n",
+        "msg.stall_detector_disabled": "[GUI stall detector disabled] STALL_THRESHOLD_MS=0\n",
+        "action.profile_start": "Start Profiling",
+        "action.profile_stop": "Stop Profiling and Save",
+        "msg.profile_started": "[Profiling started] Stop to save .pstats and a summary to LOG_DIR\n",
+        "msg.profile_saved": "[Profile saved] {path} (summary: {summary}, {seconds}s, {calls} calls)\n",
+        "msg.profile_save_failed": "[Profile save failed] {path}: {error}\n",
+        "about.startup": (
+            "<p><b>Startup time</b> (from Python entry)<br>"
+            "window created {window_init} ms, first paint {first_paint} ms, ready {ready} ms<br>"
+            "process start → Python entry {pre_python} ms</p>"
+        ),
+        "msg.config_save_failed": "[Settings save failed] {path}: {error}\n",
+        "action.command_palette": "Command Palette...",
+        "palette.title": "Command Palette",
+        "palette.placeholder": "Search macros / history / automation tasks (Enter: send)",
+        "palette.status": "{shown} / {total} entries, search {elapsed_us} µs",
+        "palette.source.history": "History",
+        "palette.source.macro": "Macro",
+        "palette.source.task": "Auto",
+        "history.search.prompt": "(reverse-i-search) '{query}':",
+        "history.search.failed": "(failed reverse-i-search) '{query}':",
+        "action.highlight_rules": "Highlight Rules...",
+        "highlight.dialog.title": "Highlight Rules",
+        "highlight.dialog.hint": "Matching text is highlighted in color (applied only to visible lines, rules higher in the list win). Double-click a color cell to change it.",
+        "highlight.dialog.max": "You can register up to {max_count} rules.",
+        "highlight.dialog.invalid": "Rule {row} has an invalid regular expression: {error}",
+        "highlight.table.pattern": "Pattern",
+        "highlight.table.regex": "Regex",
+        "highlight.table.ignore_case": "Ignore case",
+        "highlight.table.color": "Color",
+        "highlight.table.line": "Whole line",
+        "highlight.tooltip.color": "Double-click to choose a color",
+        "highlight.button.add": "Add",
+        "highlight.button.remove": "Remove",
+        "highlight.button.defaults": "Defaults",
+        "highlight.button.ok": "OK",
+        "highlight.button.cancel": "Cancel",
+        "action.hex_view": "Hex View",
+        "session.tab.hex": "HEX (raw RX)",
+        "msg.log_raw_sidecar": "Raw byte log: {path}\n",
+        "menu.frame_decoder": "Frame Decoder",
+        "frame.decoder.off": "Off (text only)",
+        "frame.decoder.length": "Length-prefixed (FRAME_LENGTH_PREFIX)",
+        "frame.table.time": "Time",
+        "frame.table.source": "Port",
+        "frame.table.protocol": "Format",
+        "frame.table.length": "Length",
+        "frame.table.status": "Status",
+        "frame.table.payload": "Payload",
+        "session.tab.frames": "Frames",
+        "session.label.frame_decoder": "Frames:",
+        "msg.frame_decoder": "Frame decoder: {name}\n",
+        "action.plot": "Plot",
+        "plot.title": "Numeric Plot",
+        "plot.window": "Time range:",
+        "plot.window.seconds": "{count} s",
+        "plot.window.minutes": "{count} min",
+        "plot.window.hours": "{count} h",
+        "plot.window.all": "All",
+        "plot.pause": "Pause",
+        "plot.extractors": "Extractors (one per line, named group = series name, e.g. temp=(?P<temp>-?\\d+(?:\\.\\d+)?)):",
+        "plot.button.apply": "Apply",
+        "plot.button.clear": "Clear",
+        "plot.button.close": "Close",
+        "plot.empty": "No samples to display",
+        "plot.status": "{series} series · {samples} samples",
+        "plot.status.error": "Extractor error: {pattern} ({error})",
     },
 }
 
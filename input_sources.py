@@ -0,0 +1,357 @@
+"""
+입력 소스 모듈
+- 시리얼 포트 외의 입력을 pyserial Serial 호환 인터페이스로 제공
+  → 동일한 수신/송신 스레드와 라인 파이프라인을 그대로 사용
+- 포트 이름 대신 아래 형식의 주소로 연결
+    pty:                    가상 pty 쌍 생성 (상대편 경로에 부하 생성기/시뮬레이터 연결)
+    socket://호스트:포트     TCP raw 스트림 (ser2net raw 모드 등)
+    rfc2217://호스트:포트    RFC2217 원격 시리얼 (pyserial URL 핸들러)
+    exec:명령               하위 프로세스 stdout(+stderr) 수신, stdin으로 송신
+    tail:경로               파일 추가분 수신 (tail -f, 읽기 전용, 로테이션 추적)
+- 수신 스레드는 read_into()로 공용 수신 버퍼에 직접 읽음 (중간 bytes 생성 없음)
+"""
+
+import array
+import fcntl
+import os
+import select
+import shlex
+import socket
+import subprocess
+import termios
+import time
+import tty
+import serial
+
+ENV_INPUT_SOURCES = "INPUT_SOURCES"
+
+SCHEME_PTY = "pty:"
+SCHEME_SOCKET = "socket://"
+SCHEME_RFC2217 = "rfc2217://"
+SCHEME_EXEC = "exec:"
+SCHEME_TAIL = "tail:"
+SOURCE_SCHEMES = (SCHEME_PTY, SCHEME_SOCKET, SCHEME_RFC2217, SCHEME_EXEC, SCHEME_TAIL)
+
+SOURCE_DESCRIPTIONS = {
+    SCHEME_PTY: "Virtual pty pair",
+    SCHEME_SOCKET: "TCP (raw)",
+    SCHEME_RFC2217: "RFC2217",
+    SCHEME_EXEC: "Subprocess",
+    SCHEME_TAIL: "File tail",
+}
+
+TCP_CONNECT_TIMEOUT_S = 5.0
+
+
+def is_source_url(port: str) -> bool:
+    """시리얼 장치 경로가 아닌 입력 소스 주소인지 여부"""
+    return bool(port) and port.strip().lower().startswith(SOURCE_SCHEMES)
+
+
+def describe_source(spec: str) -> str:
+    lowered = spec.strip().lower()
+    for scheme, description in SOURCE_DESCRIPTIONS.items():
+        if lowered.startswith(scheme):
+            return description
+    return "Serial"
+
+
+def configured_sources() -> list[dict]:
+    """INPUT_SOURCES (';' 구분) 환경변수의 입력 소스를 포트 목록 형식으로 반환"""
+    raw = os.environ.get(ENV_INPUT_SOURCES, "").strip()
+    sources = []
+    for spec in (part.strip() for part in raw.split(";")):
+        if spec and is_source_url(spec):
+            sources.append({"path": spec, "description": describe_source(spec)})
+    return sources
+
+
+def open_source(spec: str, baudrate: int = 0, timeout: float = 0.1, **serial_kwargs):
+    """입력 소스 주소로 연결하여 Serial 호환 객체 반환 (실패 시 serial.SerialException)"""
+    spec = spec.strip()
+    lowered = spec.lower()
+    try:
+        if lowered.startswith(SCHEME_PTY):
+            return PtySource(timeout=timeout, baudrate=baudrate)
+        if lowered.startswith(SCHEME_SOCKET):
+            return TcpSource(spec, timeout=timeout, baudrate=baudrate)
+        if lowered.startswith(SCHEME_RFC2217):
+            return serial.serial_for_url(spec, baudrate=baudrate, timeout=timeout, **serial_kwargs)
+        if lowered.startswith(SCHEME_EXEC):
+            return SubprocessSource(spec[len(SCHEME_EXEC):], timeout=timeout, baudrate=baudrate)
+        if lowered.startswith(SCHEME_TAIL):
+            return FileTailSource(spec[len(SCHEME_TAIL):], timeout=timeout, baudrate=baudrate)
+    except (OSError, ValueError) as e:
+        raise serial.SerialException(f"입력 소스 연결 실패: {spec} ({e})") from e
+    raise serial.SerialException(f"지원하지 않는 입력 소스: {spec}")
+
+
+# === 수신 스레드 공용 헬퍼 ===
+
+def read_into(port, view: memoryview) -> int:
+    """수신 대기 중인 데이터를 view에 직접 읽고 읽은 바이트 수 반환 (in_waiting > 0일 때 호출)"""
+    if isinstance(port, _FdSource):
+        return port.readinto(view)
+    fd = getattr(port, "fd", None)
+    if isinstance(port, serial.Serial) and isinstance(fd, int):
+        # POSIX 시리얼: pyserial read()의 bytes 생성/복사 없이 커널에서 바로 수신 버퍼로
+        try:
+            return os.readv(fd, [view])
+        except BlockingIOError:
+            return 0
+        except OSError as e:
+            raise serial.SerialException(f"read failed: {e}") from e
+    return port.readinto(view)
+
+
+def wait_readable(port, timeout_s: float) -> None:
+    """수신 데이터가 생길 때까지 최대 timeout_s 대기 (fd 기반은 select, 그 외 sleep)"""
+    if isinstance(port, _FdSource):
+        port.wait_readable(timeout_s)
+        return
+    fd = getattr(port, "fd", None)
+    if not (isinstance(port, serial.Serial) and isinstance(fd, int)):
+        time.sleep(timeout_s)
+        return
+    readable, _, _ = select.select([fd], [], [], timeout_s)
+    if readable and port.in_waiting == 0:
+        # pyserial read()와 동일한 판단: 읽기 가능 신호인데 데이터가 없으면 장치 분리
+        raise serial.SerialException(
+            "device reports readiness to read but returned no data "
+            "(device disconnected or multiple access on port?)"
+        )
+
+
+# === fd 기반 입력 소스 ===
+
+class _FdSource:
+    """파일 디스크립터 기반 입력 소스 공통 구현 (SerialManager가 사용하는 Serial 인터페이스)"""
+
+    def __init__(self, port: str, fd: int, timeout: float, baudrate: int = 0):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self._fd: int | None = fd
+
+    @property
+    def is_open(self) -> bool:
+        return self._fd is not None
+
+    @property
+    def peer_path(self) -> str:
+        """외부 도구가 연결할 상대편 경로 (pty 전용)"""
+        return ""
+
+    def fileno(self) -> int:
+        if self._fd is None:
+            raise serial.PortNotOpenError()
+        return self._fd
+
+    @property
+    def in_waiting(self) -> int:
+        count = array.array("i", [0])
+        fcntl.ioctl(self.fileno(), termios.FIONREAD, count, True)
+        return count[0]
+
+    def wait_readable(self, timeout_s: float) -> bool:
+        readable, _, _ = select.select([self.fileno()], [], [], timeout_s)
+        if readable and self.in_waiting == 0:
+            self._on_eof()
+        return bool(readable)
+
+    def _on_eof(self) -> None:
+        raise serial.SerialException(f"입력 소스가 종료되었습니다: {self.port}")
+
+    def readinto(self, buffer) -> int:
+        try:
+            return os.readv(self.fileno(), [buffer])
+        except BlockingIOError:
+            return 0
+        except OSError as e:
+            raise serial.SerialException(f"수신 실패: {self.port} ({e})") from e
+
+    def read(self, size: int = 1) -> bytes:
+        """최대 size 바이트 읽기 (timeout 동안 대기, pyserial read와 동일한 의미)"""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        deadline = time.monotonic() + (self.timeout or 0)
+        while received < size:
+            if self.in_waiting <= 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.wait_readable(remaining):
+                    break
+                continue
+            received += self.readinto(view[received:])
+        return bytes(view[:received])
+
+    def write(self, data) -> int:
+        view = memoryview(data)
+        total = len(view)
+        try:
+            while view:
+                written = self._write_fd(view)
+                view = view[written:]
+        except OSError as e:
+            raise serial.SerialException(f"송신 실패: {self.port} ({e})") from e
+        return total
+
+    def _write_fd(self, view: memoryview) -> int:
+        return os.write(self.fileno(), view)
+
+    def reset_input_buffer(self) -> None:
+        scratch = memoryview(bytearray(4096))
+        while self.is_open and self.in_waiting > 0:
+            if not self.readinto(scratch):
+                break
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class PtySource(_FdSource):
+    """가상 pty 쌍의 master 측 (slave 경로에 부하 생성기/시뮬레이터가 연결)"""
+
+    def __init__(self, timeout: float = 0.1, baudrate: int = 0):
+        master_fd, slave_fd = os.openpty()
+        tty.setraw(master_fd)
+        tty.setraw(slave_fd)
+        # slave를 열어 두어 상대편이 닫았다 다시 열어도 master 읽기가 EIO로 끊기지 않게 함
+        self._slave_fd = slave_fd
+        self._slave_path = os.ttyname(slave_fd)
+        super().__init__(f"{SCHEME_PTY}{self._slave_path}", master_fd, timeout, baudrate)
+
+    @property
+    def peer_path(self) -> str:
+        return self._slave_path
+
+    def close(self) -> None:
+        super().close()
+        if self._slave_fd is not None:
+            os.close(self._slave_fd)
+            self._slave_fd = None
+
+
+class TcpSource(_FdSource):
+    """TCP raw 스트림 (socket://호스트:포트)"""
+
+    def __init__(self, spec: str, timeout: float = 0.1, baudrate: int = 0):
+        host, _sep, port = spec[len(SCHEME_SOCKET):].partition("/")[0].rpartition(":")
+        self._socket = socket.create_connection(
+            (host or "127.0.0.1", int(port)), timeout=TCP_CONNECT_TIMEOUT_S
+        )
+        self._socket.settimeout(None)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().__init__(spec, self._socket.fileno(), timeout, baudrate)
+
+    def readinto(self, buffer) -> int:
+        try:
+            return self._socket.recv_into(buffer)
+        except OSError as e:
+            raise serial.SerialException(f"수신 실패: {self.port} ({e})") from e
+
+    def _write_fd(self, view: memoryview) -> int:
+        return self._socket.send(view)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            self._socket.close()
+            self._fd = None
+
+
+class SubprocessSource(_FdSource):
+    """하위 프로세스 stdout(+stderr) 수신 / stdin 송신 (exec:명령)"""
+
+    TERMINATE_TIMEOUT_S = 2.0
+
+    def __init__(self, command: str, timeout: float = 0.1, baudrate: int = 0):
+        args = shlex.split(command)
+        if not args:
+            raise ValueError("실행할 명령이 없습니다.")
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        super().__init__(f"{SCHEME_EXEC}{command}", self._process.stdout.fileno(), timeout, baudrate)
+
+    def _on_eof(self) -> None:
+        code = self._process.poll()
+        raise serial.SerialException(f"프로세스가 종료되었습니다: {self.port} (exit={code})")
+
+    def _write_fd(self, view: memoryview) -> int:
+        return os.write(self._process.stdin.fileno(), view)
+
+    def close(self) -> None:
+        if self._fd is None:
+            return
+        self._fd = None
+        for pipe in (self._process.stdin, self._process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(self.TERMINATE_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+
+class FileTailSource(_FdSource):
+    """파일 추가분 수신 (tail:경로, 읽기 전용)
+
+    연결 시점의 파일 끝부터 읽으며, 파일이 잘리면 처음부터,
+    로테이션(같은 경로에 새 파일)되면 기존 파일을 끝까지 읽은 뒤 새 파일로 전환한다.
+    """
+
+    def __init__(self, path: str, timeout: float = 0.1, baudrate: int = 0):
+        self._path = os.path.abspath(os.path.expanduser(path.strip()))
+        fd = os.open(self._path, os.O_RDONLY)
+        os.lseek(fd, 0, os.SEEK_END)
+        super().__init__(f"{SCHEME_TAIL}{self._path}", fd, timeout, baudrate)
+
+    @property
+    def in_waiting(self) -> int:
+        fd = self.fileno()
+        position = os.lseek(fd, 0, os.SEEK_CUR)
+        stat = os.fstat(fd)
+        if stat.st_size < position:
+            os.lseek(fd, 0, os.SEEK_SET)  # 잘린 파일: 처음부터 다시
+            return stat.st_size
+        if stat.st_size > position:
+            return stat.st_size - position
+        self._follow_rotation(stat)
+        return 0
+
+    def _follow_rotation(self, stat: os.stat_result) -> None:
+        try:
+            current = os.stat(self._path)
+        except OSError:
+            return  # 로테이션 중 일시적으로 경로가 없음
+        if (current.st_dev, current.st_ino) != (stat.st_dev, stat.st_ino):
+            new_fd = os.open(self._path, os.O_RDONLY)
+            os.close(self._fd)
+            self._fd = new_fd
+
+    def wait_readable(self, timeout_s: float) -> bool:
+        # 일반 파일은 select가 항상 읽기 가능으로 보고하므로 주기적으로 크기 확인
+        deadline = time.monotonic() + timeout_s
+        while self.in_waiting <= 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, 0.01))
+        return True
+
+    def write(self, data) -> int:
+        raise serial.SerialException(f"읽기 전용 입력 소스입니다: {self.port}")
+
+    def reset_input_buffer(self) -> None:
+        os.lseek(self.fileno(), 0, os.SEEK_END)
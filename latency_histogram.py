@@ -0,0 +1,187 @@
+"""
+지연 시간 히스토그램 모듈
+- 고정 버킷 HDR 스타일 히스토그램 (나노초 단위 기록, O(1) 기록)
+- 자동 명령 트리거 → 송신 구간별 지연 통계
+"""
+
+
+class LatencyHistogram:
+    """고정 버킷 HDR 스타일 지연 히스토그램
+
+    2의 거듭제곱 구간마다 16개의 하위 버킷을 두어 약 6% 이내 정밀도로
+    1ns ~ 약 9.8시간(2^45 ns) 범위를 고정 크기 배열 하나로 표현한다 (초과 값은 마지막 버킷).
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    MAX_EXPONENT = 40
+    BUCKET_COUNT = (MAX_EXPONENT + 2) * SUB_BUCKET_COUNT
+
+    def __init__(self):
+        self._counts = [0] * self.BUCKET_COUNT
+        self._total = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    @classmethod
+    def _bucket_index(cls, value: int) -> int:
+        if value < cls.SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - (cls.SUB_BUCKET_BITS + 1)
+        mantissa = value >> shift
+        index = (shift + 1) * cls.SUB_BUCKET_COUNT + (mantissa - cls.SUB_BUCKET_COUNT)
+        return min(index, cls.BUCKET_COUNT - 1)
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> tuple[int, int]:
+        """버킷의 [하한, 상한) 값(ns) 반환"""
+        if index < cls.SUB_BUCKET_COUNT:
+            return index, index + 1
+        shift = index // cls.SUB_BUCKET_COUNT - 1
+        mantissa = index % cls.SUB_BUCKET_COUNT + cls.SUB_BUCKET_COUNT
+        return mantissa << shift, (mantissa + 1) << shift
+
+    def record(self, value_ns: int) -> None:
+        """지연 값(ns) 기록"""
+        value = max(0, int(value_ns))
+        self._counts[self._bucket_index(value)] += 1
+        if self._total == 0 or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._total += 1
+        self._sum += value
+
+    def reset(self) -> None:
+        self._counts = [0] * self.BUCKET_COUNT
+        self._total = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    def percentile(self, percent: float) -> int:
+        """백분위 값(ns) 반환 (버킷 상한 기준, 최대값으로 제한)"""
+        if self._total == 0:
+            return 0
+        target = max(1, int(self._total * percent / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if not count:
+                continue
+            seen += count
+            if seen >= target:
+                _low, high = self.bucket_bounds(index)
+                return min(high - 1, self._max)
+        return self._max
+
+    def nonzero_buckets(self):
+        """(하한ns, 상한ns, count) 목록 반환"""
+        buckets = []
+        for index, count in enumerate(self._counts):
+            if count:
+                low, high = self.bucket_bounds(index)
+                buckets.append((low, high, count))
+        return buckets
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    @property
+    def min(self) -> int:
+        return self._min
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._total if self._total else 0.0
+
+
+class TaskLatencyStats:
+    """자동 명령 1개에 대한 구간별 지연 히스토그램 묶음
+
+    트레이스 딕셔너리 키 (time.monotonic_ns 기준):
+        rx_ns: 트리거 라인 수신(리더 스레드 read 반환) 시각
+        match_ns: 트리거 매칭 시각
+        send_ns: 예약된 송신 실행 시각 (지연 타이머 만료, 헤드리스는 송신 스레드의 지연 종료 시각)
+        write_ns: SerialManager.write 반환 시각
+    """
+
+    STAGES = (
+        ("rx_to_match", "rx_ns", "match_ns"),
+        ("match_to_send", "match_ns", "send_ns"),
+        ("send_to_write", "send_ns", "write_ns"),
+        ("rx_to_write", "rx_ns", "write_ns"),
+    )
+
+    def __init__(self):
+        self._histograms = {name: LatencyHistogram() for name, _start, _end in self.STAGES}
+
+    def record_trace(self, trace: dict) -> None:
+        """단계별 타임스탬프가 채워진 트레이스를 히스토그램에 반영"""
+        for name, start_key, end_key in self.STAGES:
+            start = trace.get(start_key)
+            end = trace.get(end_key)
+            if start is None or end is None:
+                continue
+            self._histograms[name].record(end - start)
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        return self._histograms[stage]
+
+    @property
+    def count(self) -> int:
+        return self._histograms["rx_to_write"].count
+
+    def reset(self) -> None:
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    @staticmethod
+    def format_ns(value_ns: float) -> str:
+        """ns 값을 표시용 문자열로 변환"""
+        if value_ns < 1_000:
+            return f"{int(value_ns)} ns"
+        if value_ns < 1_000_000:
+            return f"{value_ns / 1_000:.1f} µs"
+        if value_ns < 1_000_000_000:
+            return f"{value_ns / 1_000_000:.2f} ms"
+        return f"{value_ns / 1_000_000_000:.2f} s"
+
+    def summary_lines(self) -> list[str]:
+        """구간별 p50/p99/max 요약 문자열 목록"""
+        lines = []
+        for name, _start, _end in self.STAGES:
+            histogram = self._histograms[name]
+            if not histogram.count:
+                continue
+            lines.append(
+                f"{name}: p50 {self.format_ns(histogram.percentile(50))} / "
+                f"p99 {self.format_ns(histogram.percentile(99))} / "
+                f"max {self.format_ns(histogram.max)} (n={histogram.count})"
+            )
+        return lines
+
+    def write_csv_rows(self, writer, task_name: str) -> None:
+        """히스토그램 버킷을 CSV 행으로 기록"""
+        for name, _start, _end in self.STAGES:
+            histogram = self._histograms[name]
+            if not histogram.count:
+                continue
+            cumulative = 0
+            for low, high, count in histogram.nonzero_buckets():
+                cumulative += count
+                writer.writerow(
+                    [
+                        task_name,
+                        name,
+                        f"{low / 1000:.3f}",
+                        f"{high / 1000:.3f}",
+                        count,
+                        f"{cumulative * 100.0 / histogram.count:.2f}",
+                    ]
+                )
@@ -0,0 +1,201 @@
+"""
+라인 처리 파이프라인 모듈
+- 수신 텍스트 → 완성 라인 분리 (미완성 라인 버퍼링, CR 제거, ANSI 시퀀스 해석/제거)
+- 문자열 통계 CSV 경로/분당 히트 수 기록
+- 자동 명령 sleep() 지시 해석 및 실행 순서 구성
+- GUI(TerminalWidget, SidebarWidget)와 헤드리스 모드 공용 (QtWidgets 미사용)
+"""
+
+import csv
+import os
+import re
+from datetime import datetime
+
+from ansi_parser import AnsiParser
+
+MAX_SLEEP_DELAY_MS = 99_999_999
+SLEEP_COMMAND_PATTERN = re.compile(r"^sleep\s*\(\s*(\d+)\s*\)$", re.IGNORECASE)
+
+
+class LineFramer:
+    """수신 텍스트를 라인 단위로 분리 (수신 데이터가 줄 단위로 오지 않을 수 있음)
+
+    ansi=True: ANSI 시퀀스를 해석해 라인별 (텍스트, 스타일 id) 구간도 만들고(feed_styled),
+    반환 라인 텍스트에서는 시퀀스를 제거 (keep_raw=True면 반환 라인은 수신 원본 그대로)
+    """
+
+    def __init__(self, ansi: bool = False, keep_raw: bool = False, parser: AnsiParser | None = None):
+        self._buffer = ""
+        self._parser = (parser or AnsiParser()) if ansi else None
+        self._keep_raw = keep_raw
+        self._line_runs: list[tuple[str, int]] = []   # 미완성 라인의 구간 (ansi 모드)
+
+    @property
+    def parser(self) -> AnsiParser | None:
+        return self._parser
+
+    def set_keep_raw(self, keep_raw: bool) -> None:
+        self._keep_raw = keep_raw
+
+    def feed(self, data: str) -> list[str]:
+        """텍스트 추가 후 완성된 라인 목록 반환 (모든 CR 문자 제거)"""
+        if self._parser is not None:
+            return [line for line, _runs in self.feed_styled(data)]
+        self._buffer += data.replace("\r", "")
+        if "\n" not in self._buffer:
+            return []
+        *lines, self._buffer = self._buffer.split("\n")
+        return lines
+
+    def feed_styled(self, data: str) -> list[tuple[str, list[tuple[str, int]]]]:
+        """텍스트 추가 후 완성된 라인 [(라인 텍스트, [(구간 텍스트, 스타일 id), ...]), ...] 반환"""
+        data = data.replace("\r", "")
+        if self._parser is None:
+            lines = self.feed(data)
+            return [(line, [(line, 0)] if line else []) for line in lines]
+
+        completed = []
+        line_runs = self._line_runs
+        for text, style_id in self._parser.feed(data):
+            if "\n" not in text:
+                line_runs.append((text, style_id))
+                continue
+            first, *middle, last = text.split("\n")
+            if first:
+                line_runs.append((first, style_id))
+            completed.append(line_runs)
+            completed.extend([(part, style_id)] if part else [] for part in middle)
+            line_runs = [(last, style_id)] if last else []
+        self._line_runs = line_runs
+
+        if self._keep_raw:
+            self._buffer += data
+            if not completed:
+                return []
+            *raw_lines, self._buffer = self._buffer.split("\n")
+            return list(zip(raw_lines, completed))
+        return [
+            (runs[0][0] if len(runs) == 1 else "".join(text for text, _style in runs), runs)
+            for runs in completed
+        ]
+
+    def flush(self) -> str:
+        """미완성 라인 강제 반환"""
+        return self.flush_styled()[0]
+
+    def flush_styled(self) -> tuple[str, list[tuple[str, int]]]:
+        """미완성 라인 강제 반환 (라인 텍스트, 구간 목록)"""
+        runs, self._line_runs = self._line_runs, []
+        line, self._buffer = self._buffer, ""
+        if self._parser is None:
+            return line, [(line, 0)] if line else []
+        if not self._keep_raw:
+            line = "".join(text for text, _style in runs)
+        return line, runs
+
+    def clear(self) -> None:
+        self._buffer = ""
+        self._line_runs = []
+        if self._parser is not None:
+            self._parser.reset()
+
+    @property
+    def pending(self) -> str:
+        if self._parser is not None and not self._keep_raw:
+            return "".join(text for text, _style in self._line_runs)
+        return self._buffer
+
+
+def parse_sleep_delay_ms(line: str) -> int | None:
+    """'sleep(ms)' 지시 해석. 지시가 아니면 None"""
+    match = SLEEP_COMMAND_PATTERN.match(line.strip())
+    if not match:
+        return None
+    try:
+        parsed = int(match.group(1))
+    except ValueError:
+        return None
+    if parsed < 0:
+        return 0
+    return min(parsed, MAX_SLEEP_DELAY_MS)
+
+
+def build_command_sequence(command_text: str, interval_ms: int) -> list[tuple[int, str]]:
+    """명령어와 sleep() 지시를 실행 순서 [(선행 지연 ms, 명령), ...]로 변환."""
+    interval = max(0, int(interval_ms))
+    sequence = []
+    pending_sleep = 0
+    command_count = 0
+
+    for raw_line in command_text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        sleep_ms = parse_sleep_delay_ms(line)
+        if sleep_ms is not None:
+            pending_sleep = min(MAX_SLEEP_DELAY_MS, pending_sleep + sleep_ms)
+            continue
+
+        if command_count == 0:
+            delay_before = pending_sleep
+        elif pending_sleep > 0:
+            delay_before = pending_sleep
+        else:
+            delay_before = interval
+
+        sequence.append((delay_before, line))
+        pending_sleep = 0
+        command_count += 1
+
+    return sequence
+
+
+def build_stats_csv_path(logfile_path: str) -> str:
+    """로그 파일명 타임스탬프를 활용해 통계 CSV 경로 생성"""
+    abs_dir = os.path.dirname(os.path.abspath(logfile_path))
+    log_filename = os.path.basename(logfile_path)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    if log_filename.startswith("lnxterm_"):
+        stem, _ = os.path.splitext(log_filename)
+        extracted = stem[len("lnxterm_"):]
+        if extracted:
+            timestamp = extracted
+
+    return os.path.join(abs_dir, f"lnxterm_stats_{timestamp}.csv")
+
+
+def counter_rate_rows(counters: list[tuple[str, object]], start: int, end: int, case_label: str) -> list[list]:
+    """카운터별 RateBuckets에서 [start, end) 초 구간의 분당 히트 수 행 생성
+
+    counters: [(문자열, RateBuckets), ...] / 행: [문자열, 분(YYYY-MM-DD HH:MM), 히트 수, 대소문자 구분]
+    분 순서 → 카운터 순서로 정렬
+    """
+    rows = []
+    for order, (keyword, rates) in enumerate(counters):
+        for minute, hits in rates.minute_totals(start, end):
+            rows.append((minute, order, keyword, hits))
+    rows.sort()
+    return [
+        [keyword, datetime.fromtimestamp(minute).strftime("%Y-%m-%d %H:%M"), hits, case_label]
+        for minute, _order, keyword, hits in rows
+    ]
+
+
+def append_counter_stats_rows(csv_path: str, header: list[str], rows: list[list]) -> bool:
+    """통계 CSV에 행 추가 (파일이 비어 있으면 헤더 먼저 기록)"""
+    if not rows:
+        return True
+    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    needs_header = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+    try:
+        with open(csv_path, "a", newline="", encoding="utf-8") as fp:
+            writer = csv.writer(fp)
+            if needs_header:
+                writer.writerow(header)
+            writer.writerows(rows)
+    except OSError:
+        # 통계 저장은 보조 기능이므로 기록 실패가 메인 동작을 멈추지 않게 함
+        return False
+    return True
@@ -2,11 +2,25 @@
 로그 파일 관리 모듈
 - 밀리초 타임스탬프 포함 라인 단위 로그 기록
 - 덮어쓰기(overwrite) / 추가(append) 모드 지원
+- 선택 시 수신 원본 바이트를 같은 이름의 .bin 파일에 함께 기록 (LOG_RAW_SIDECAR=1)
 """
 
 import os
 from datetime import datetime
 
+ENV_LOG_RAW_SIDECAR = "LOG_RAW_SIDECAR"
+RAW_SIDECAR_EXTENSION = ".bin"
+
+
+def raw_sidecar_from_env() -> bool:
+    """LOG_RAW_SIDECAR=1이면 텍스트 로그와 함께 수신 원본 바이트 파일 기록"""
+    return os.environ.get(ENV_LOG_RAW_SIDECAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def raw_sidecar_path(file_path: str) -> str:
+    """텍스트 로그 경로 → 원본 바이트 파일 경로 (확장자만 .bin으로 교체)"""
+    return os.path.splitext(file_path)[0] + RAW_SIDECAR_EXTENSION
+
 
 class LogManager:
     """로그 파일 관리 클래스"""
@@ -20,6 +34,8 @@ class LogManager:
         self._is_logging: bool = False
         self._mode: str = self.MODE_APPEND
         self._started_at: str = ""
+        self.raw_sidecar: bool = False
+        self._raw_file = None
 
     @staticmethod
     def get_timestamp() -> str:
@@ -47,6 +63,8 @@ class LogManager:
 
         self._file_path = file_path
         self._file = open(file_path, self._mode, encoding="utf-8")
+        if self.raw_sidecar:
+            self._raw_file = open(raw_sidecar_path(file_path), self._mode + "b")
         self._is_logging = True
         self._started_at = self.get_timestamp()
 
@@ -62,7 +80,10 @@ class LogManager:
             self._file.write(footer + "\n")
             self._file.flush()
             self._file.close()
+        if self._raw_file is not None:
+            self._raw_file.close()
         self._file = None
+        self._raw_file = None
         self._is_logging = False
         self._started_at = ""
 
@@ -82,6 +103,13 @@ class LogManager:
         self._file.write(f"{timestamp} {line}\n")
         self._file.flush()
 
+    def write_raw(self, data: bytes) -> None:
+        """수신 원본 바이트 기록 (원본 바이트 파일을 열지 않았으면 무시)"""
+        if self._raw_file is None:
+            return
+        self._raw_file.write(data)
+        self._raw_file.flush()
+
     @property
     def is_logging(self) -> bool:
         return self._is_logging
@@ -90,6 +118,11 @@ class LogManager:
     def file_path(self) -> str:
         return self._file_path
 
+    @property
+    def raw_file_path(self) -> str:
+        """기록 중인 원본 바이트 파일 경로 (없으면 빈 문자열)"""
+        return self._raw_file.name if self._raw_file is not None else ""
+
     @property
     def mode(self) -> str:
         return self._mode
@@ -1,20 +1,166 @@
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QShortcut, QKeySequence
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
 from i18n import normalize_language, tr
 from styles import COLORS
 
+MAX_DESCRIPTION_LENGTH = 200
+
+
+class MacroTableModel(QAbstractTableModel):
+    """매크로 목록 모델 (번호 / 명령어 / 설명).
+
+    번호 열은 저장하지 않고 행 위치로 계산하며, 셀 수정은 해당 셀만 dataChanged로 알린다.
+    """
+
+    COLUMN_NUMBER = 0
+    COLUMN_COMMAND = 1
+    COLUMN_DESCRIPTION = 2
+    COLUMN_COUNT = 3
+
+    contents_changed = pyqtSignal()
+
+    def __init__(self, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._rows: list[list[str]] = []   # [명령어, 설명]
+        self._headers = ["#", "", ""]
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self._headers = [
+            tr(self._language, "macro.table.no"),
+            tr(self._language, "macro.table.command"),
+            tr(self._language, "macro.table.description"),
+        ]
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    # === QAbstractTableModel ===
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if index.column() != self.COLUMN_NUMBER:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == self.COLUMN_NUMBER:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return str(row + 1)
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return tr(self._language, "macro.tooltip.send_on_number")
+            return None
+        text = self._rows[row][column - 1]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return text
+        if role == Qt.ItemDataRole.ToolTipRole and column == self.COLUMN_COMMAND:
+            return text.strip() or None
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        column = index.column()
+        if column == self.COLUMN_NUMBER:
+            return False
+        text = str(value)
+        if column == self.COLUMN_DESCRIPTION:
+            text = text[:MAX_DESCRIPTION_LENGTH]
+        row = self._rows[index.row()]
+        if row[column - 1] == text:
+            return False
+        row[column - 1] = text
+        self.dataChanged.emit(index, index)
+        self.contents_changed.emit()
+        return True
+
+    # === 목록 조작 ===
+
+    def set_commands(self, commands: list, max_count: int):
+        """전체 교체 (행 단위 삽입 대신 모델 리셋 1회)"""
+        self.beginResetModel()
+        self._rows = [
+            [
+                str(item.get("command", "")).strip(),
+                str(item.get("description", "")).strip()[:MAX_DESCRIPTION_LENGTH],
+            ]
+            for item in commands[:max_count]
+            if isinstance(item, dict)
+        ]
+        self.endResetModel()
+
+    def get_commands(self) -> list:
+        commands = []
+        for command, description in self._rows:
+            command = command.strip()
+            description = description.strip()[:MAX_DESCRIPTION_LENGTH]
+            if not command and not description:
+                continue
+            commands.append({"command": command, "description": description})
+        return commands
+
+    def command_at(self, row: int) -> str:
+        if row < 0 or row >= len(self._rows):
+            return ""
+        return self._rows[row][0].strip()
+
+    def append_row(self, command: str = "", description: str = "") -> int:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([command, description[:MAX_DESCRIPTION_LENGTH]])
+        self.endInsertRows()
+        self.contents_changed.emit()
+        return row
+
+    def remove_rows(self, rows) -> None:
+        """행 번호 목록 삭제 (연속 구간 단위로 묶어 뒤에서부터 제거)"""
+        ordered = sorted(set(rows), reverse=True)
+        if not ordered:
+            return
+        ranges = []
+        end = start = ordered[0]
+        for row in ordered[1:]:
+            if row == start - 1:
+                start = row
+                continue
+            ranges.append((start, end))
+            end = start = row
+        ranges.append((start, end))
+        for first, last in ranges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        self.contents_changed.emit()
+
 
 class MacroDialog(QDialog):
     """자주 쓰는 명령어(매크로) 등록/실행 창."""
@@ -22,13 +168,21 @@ class MacroDialog(QDialog):
     send_requested = pyqtSignal(str)
     commands_changed = pyqtSignal(list)
 
-    MAX_COMMANDS = 1000
+    MAX_COMMANDS = 10000
+    # 연속 편집/삭제를 모아 commands_changed를 한 번만 보내기 위한 지연
+    CHANGE_NOTIFY_DELAY_MS = 300
+    ROW_HEIGHT = 26
 
     def __init__(self, parent=None, language: str = "ko"):
         super().__init__(parent)
         self._language = normalize_language(language)
-        self._suppress_item_changed = False
         self._shortcut_list = []
+        self._model = MacroTableModel(self, language=self._language)
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.CHANGE_NOTIFY_DELAY_MS)
+        self._change_timer.timeout.connect(self._emit_commands_changed)
+        self._model.contents_changed.connect(self._change_timer.start)
         self._setup_ui()
         self._setup_shortcuts()
         self._apply_language()
@@ -44,7 +198,7 @@ class MacroDialog(QDialog):
             QLabel {{
                 color: {COLORS['text_primary']};
             }}
-            QTableWidget {{
+            QTableView {{
                 background-color: {COLORS['bg_input']};
                 border: 1px solid {COLORS['border']};
                 gridline-color: {COLORS['border']};
@@ -74,8 +228,8 @@ class MacroDialog(QDialog):
         action_row.addStretch()
         root_layout.addLayout(action_row)
 
-        self._table = QTableWidget(0, 3, self)
-        self._table.setHorizontalHeaderLabels(["#", "", ""])
+        self._table = QTableView(self)
+        self._table.setModel(self._model)
         self._table.setAlternatingRowColors(False)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -83,12 +237,15 @@ class MacroDialog(QDialog):
             QAbstractItemView.EditTrigger.DoubleClicked
             | QAbstractItemView.EditTrigger.EditKeyPressed
         )
-        self._table.verticalHeader().setVisible(False)
+        # 고정 행 높이: 행 수와 무관하게 스크롤/레이아웃 비용 일정
+        vertical_header = self._table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.ROW_HEIGHT)
         self._table.horizontalHeader().setStretchLastSection(True)
-        self._table.setColumnWidth(0, 56)
-        self._table.setColumnWidth(1, 280)
-        self._table.itemChanged.connect(self._on_item_changed)
-        self._table.cellClicked.connect(self._on_cell_clicked)
+        self._table.setColumnWidth(MacroTableModel.COLUMN_NUMBER, 56)
+        self._table.setColumnWidth(MacroTableModel.COLUMN_COMMAND, 280)
+        self._table.clicked.connect(self._on_cell_clicked)
         root_layout.addWidget(self._table, 1)
 
     def _setup_shortcuts(self):
@@ -111,120 +268,50 @@ class MacroDialog(QDialog):
         self._shortcut_label.setText(tr(self._language, "macro.label.shortcuts"))
         self._add_btn.setText(tr(self._language, "macro.button.add"))
         self._delete_btn.setText(tr(self._language, "macro.button.delete"))
-        self._table.setHorizontalHeaderLabels(
-            [
-                tr(self._language, "macro.table.no"),
-                tr(self._language, "macro.table.command"),
-                tr(self._language, "macro.table.description"),
-            ]
-        )
+        self._model.set_language(self._language)
 
     def set_commands(self, commands):
-        self._suppress_item_changed = True
-        self._table.setRowCount(0)
-        for item in commands[: self.MAX_COMMANDS]:
-            command = str(item.get("command", "")).strip()
-            description = str(item.get("description", "")).strip()[:200]
-            self._append_row(command, description, emit_change=False)
-        self._suppress_item_changed = False
+        self._change_timer.stop()
+        self._model.set_commands(commands, self.MAX_COMMANDS)
 
     def get_commands(self):
-        commands = []
-        for row in range(self._table.rowCount()):
-            command = self._get_cell_text(row, 1)
-            description = self._get_cell_text(row, 2)[:200]
-            if not command and not description:
-                continue
-            commands.append({"command": command, "description": description})
-        return commands
+        return self._model.get_commands()
 
-    def _append_row(self, command: str = "", description: str = "", emit_change: bool = True):
-        row = self._table.rowCount()
-        if row >= self.MAX_COMMANDS:
+    def flush_pending_changes(self):
+        """모아 둔 변경 알림이 있으면 즉시 commands_changed 발생"""
+        if self._change_timer.isActive():
+            self._change_timer.stop()
+            self._emit_commands_changed()
+
+    def hideEvent(self, event):
+        self.flush_pending_changes()
+        super().hideEvent(event)
+
+    def _add_row(self):
+        if self._model.rowCount() >= self.MAX_COMMANDS:
             QMessageBox.warning(
                 self,
                 tr(self._language, "macro.dialog.max.title"),
                 tr(self._language, "macro.dialog.max.body", max_count=self.MAX_COMMANDS),
             )
             return
-
-        self._table.insertRow(row)
-
-        number_item = QTableWidgetItem(str(row + 1))
-        number_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        number_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        number_item.setToolTip(tr(self._language, "macro.tooltip.send_on_number"))
-        self._table.setItem(row, 0, number_item)
-
-        command_item = QTableWidgetItem(command)
-        command_item.setToolTip(command)
-        self._table.setItem(row, 1, command_item)
-
-        desc_item = QTableWidgetItem(description[:200])
-        self._table.setItem(row, 2, desc_item)
-
-        if emit_change:
-            self._emit_commands_changed()
-
-    def _add_row(self):
-        self._append_row()
+        row = self._model.append_row()
+        self._table.scrollTo(self._model.index(row, MacroTableModel.COLUMN_COMMAND))
 
     def _delete_selected_rows(self):
-        selected_rows = sorted(
-            {item.row() for item in self._table.selectedItems()},
-            reverse=True,
-        )
-        if not selected_rows:
-            return
+        rows = [index.row() for index in self._table.selectionModel().selectedRows()]
+        self._model.remove_rows(rows)
 
-        for row in selected_rows:
-            self._table.removeRow(row)
-        self._renumber_rows()
-        self._emit_commands_changed()
-
-    def _renumber_rows(self):
-        self._suppress_item_changed = True
-        for row in range(self._table.rowCount()):
-            number_item = self._table.item(row, 0)
-            if number_item is None:
-                number_item = QTableWidgetItem()
-                number_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                self._table.setItem(row, 0, number_item)
-            number_item.setText(str(row + 1))
-            number_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            number_item.setToolTip(tr(self._language, "macro.tooltip.send_on_number"))
-        self._suppress_item_changed = False
-
-    def _on_item_changed(self, item: QTableWidgetItem):
-        if self._suppress_item_changed:
-            return
-        if item.column() == 1:
-            item.setToolTip(item.text().strip())
-        if item.column() == 2 and len(item.text()) > 200:
-            self._suppress_item_changed = True
-            item.setText(item.text()[:200])
-            self._suppress_item_changed = False
-        self._emit_commands_changed()
-
-    def _on_cell_clicked(self, row: int, column: int):
+    def _on_cell_clicked(self, index):
         # 번호 셀 클릭 시 즉시 전송
-        if column == 0:
-            self._send_row(row)
+        if index.column() == MacroTableModel.COLUMN_NUMBER:
+            self._send_row(index.row())
 
     def _send_row(self, row: int):
-        if row < 0 or row >= self._table.rowCount():
-            return
-        command = self._get_cell_text(row, 1)
+        command = self._model.command_at(row)
         if not command:
             return
         self.send_requested.emit(command)
 
     def _emit_commands_changed(self):
-        self._renumber_rows()
         self.commands_changed.emit(self.get_commands())
-
-    def _get_cell_text(self, row: int, col: int) -> str:
-        item = self._table.item(row, col)
-        if item is None:
-            return ""
-        return item.text().strip()
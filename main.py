@@ -4,20 +4,58 @@ LnxTerm - 시리얼 터미널 애플리케이션
 ST-Link V3 Mini를 이용한 임베디드 장치 디버그 및 로그 수집
 """
 
+import argparse
 import sys
 import os
 
 # 프로젝트 루트를 모듈 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QFont, QPalette, QColor
-from PyQt6.QtCore import Qt
+import startup_timing  # 파이썬 진입 시각 기록 (가장 먼저 import)
 
-from main_window import MainWindow
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="LnxTerm serial terminal")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="GUI 없이 로그 수집/문자열 통계/자동 명령만 실행",
+    )
+    parser.add_argument("--port", default="", help="헤드리스 모드 포트 (기본: HEADLESS_PORT)")
+    parser.add_argument("--baud", type=int, default=0, help="헤드리스 모드 baudrate")
+    parser.add_argument(
+        "--stats-interval", type=float, default=0.0,
+        help="헤드리스 모드 통계 출력 주기(초)",
+    )
+    parser.add_argument(
+        "--frame-decoder", default="",
+        help="헤드리스 모드 바이너리 프레임 디코더 (cobs / slip / length, 프레임은 로그에 [FRAME]으로 기록)",
+    )
+    # Qt 고유 인자(-style 등)는 QApplication에 그대로 전달
+    args, _unknown = parser.parse_known_args(argv)
+    return args
 
 
 def main():
+    args = parse_args()
+    if args.headless:
+        # QtWidgets를 불러오지 않는 경량 경로
+        from headless import run_headless
+        sys.exit(run_headless(args))
+
+    # PROFILE_STARTUP 설정 시 Qt 초기화/MainWindow 생성부터 프로파일
+    from profiler_capture import ProfilerSession, startup_mode
+    profile_until = startup_mode()
+    startup_profiler = None
+    if profile_until:
+        startup_profiler = ProfilerSession()
+        startup_profiler.start(f"startup_{profile_until}")
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QFont, QPalette, QColor
+    from PyQt6.QtCore import Qt
+
+    from main_window import MainWindow
+
     # High DPI 지원
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
 
@@ -55,7 +93,7 @@ def main():
     app.setPalette(dark_palette)
 
     # 메인 윈도우 생성 및 표시
-    window = MainWindow()
+    window = MainWindow(profiler=startup_profiler, profile_until=profile_until)
     window.show()
 
     sys.exit(app.exec())
@@ -2,21 +2,40 @@
 메인 윈도우: VS Code 스타일 레이아웃, 모든 위젯 통합
 """
 
-import sys
 import os
+import time
 from datetime import datetime
-from dotenv import load_dotenv, set_key
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QLineEdit, QLabel, QStatusBar, QPushButton,
-    QMenuBar, QMessageBox, QApplication, QFrame
+    QMenuBar, QMessageBox, QApplication, QFrame, QTabWidget, QTabBar, QDialog
 )
 from PyQt6.QtGui import QAction, QActionGroup, QShortcut, QKeySequence, QFont
-from PyQt6.QtCore import Qt, QTimer, QSettings, QEvent
-
-from serial_manager import SerialManager
-from log_manager import LogManager
+from PyQt6.QtCore import Qt, QTimer, QSettings, QEvent, pyqtSignal
+
+import ansi_parser
+import env_config
+from serial_manager import SerialManager, SerialWriterThread
+from file_sender import FileSenderThread
+from stream_server import StreamServer
+from raw_capture import RawReplayThread, FILE_EXTENSION as RAW_CAPTURE_EXTENSION
+from pipeline_metrics import PipelineMetrics, STAGE_LOG, STAGE_MATCH, STAGE_RENDER
+from stall_detector import StallDetector
+import config_store
+from config_store import ConfigStore
+from highlight_rules import HighlightRuleSet
+from plot_data import PlotStore
+from command_history import CommandHistory, history_path_for
+from profiler_capture import ProfilerSession, STARTUP_CONNECT, STARTUP_INIT
+import startup_timing
+from xmodem import ModemTransferThread, PROTOCOL_XMODEM_1K, PROTOCOL_YMODEM
+from log_manager import LogManager, raw_sidecar_from_env
+from byte_ring import ByteRing, capacity_from_env
+import frame_decoder
+from frame_table import FrameTableView, decoder_label
 from terminal_widget import TerminalWidget
+from session import SessionWidget
+from timeline import TimelineMerger, TimelineWidget
 from search_widget import SearchWidget
 from sidebar_widget import SidebarWidget
 from i18n import normalize_language, tr
@@ -28,7 +47,13 @@ from styles import (
 
 
 class CommandInput(QLineEdit):
-    """명령 입력 위젯 (히스토리 기능 포함)"""
+    """명령 입력 위젯 (히스토리 기능 포함)
+
+    위/아래: 최근 사용 순(중복 제거) 히스토리 탐색
+    Ctrl+R: 역방향 증분 검색 (다시 Ctrl+R: 다음 일치, Enter: 전송, Esc/Ctrl+G: 취소)
+    """
+
+    search_prompt_changed = pyqtSignal(str)   # 검색 중 프롬프트 (검색 종료 시 "")
 
     def __init__(self, parent=None, language: str = "ko"):
         super().__init__(parent)
@@ -36,60 +61,150 @@ class CommandInput(QLineEdit):
         self.setStyleSheet(get_command_input_stylesheet())
         self.setPlaceholderText(tr(self._language, "command.placeholder"))
 
-        self._history: list[str] = []
-        self._history_index: int = -1
-        self._max_history: int = 100
+        # 시작 직후에는 메모리 전용, .env 로드 후 파일 히스토리로 교체 (set_history)
+        self._history = CommandHistory()
+        self._history_index: int = -1     # -1: 편집 중인 줄, 0부터 최근 사용 순
+        self._draft_text = ""
+
+        # 역방향 검색 상태 (_search_query가 None이면 검색 중 아님)
+        self._search_query: str | None = None
+        self._search_matches: list[str] = []
+        self._search_pos = 0
+        self._search_saved_text = ""
 
     def set_language(self, language: str):
         self._language = normalize_language(language)
         self.setPlaceholderText(tr(self._language, "command.placeholder"))
+        if self._search_query is not None:
+            self._emit_search_prompt()
+
+    def set_history(self, history: CommandHistory):
+        self._history = history
+        self._history_index = -1
 
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key.Key_Up:
-            self._navigate_history(-1)
-        elif event.key() == Qt.Key.Key_Down:
+        if self._search_query is not None and self._handle_search_key(event):
+            return
+        if (
+            event.key() == Qt.Key.Key_R
+            and event.modifiers() == Qt.KeyboardModifier.ControlModifier
+        ):
+            self._start_search()
+        elif event.key() == Qt.Key.Key_Up:
             self._navigate_history(1)
+        elif event.key() == Qt.Key.Key_Down:
+            self._navigate_history(-1)
         else:
             super().keyPressEvent(event)
 
+    def focusOutEvent(self, event):
+        if self._search_query is not None:
+            self._end_search(accept=True)
+        super().focusOutEvent(event)
+
     def add_to_history(self, command: str):
-        """명령 히스토리에 추가"""
-        if command and (not self._history or self._history[-1] != command):
-            self._history.append(command)
-            if len(self._history) > self._max_history:
-                self._history.pop(0)
-        self._history_index = len(self._history)
+        """명령 히스토리에 추가 (파일에 즉시 기록)"""
+        self._history.add(command)
+        self._history_index = -1
 
-    def _navigate_history(self, direction: int):
-        """히스토리 탐색 (direction: -1=이전, 1=다음)"""
-        if not self._history:
-            return
+    def recent_history(self, limit: int) -> list[str]:
+        """최근 사용 순 히스토리 (최신이 앞, 최대 limit개)"""
+        return self._history.recent()[:limit]
 
-        new_index = self._history_index + direction
-        if new_index < 0:
-            new_index = 0
-        elif new_index >= len(self._history):
-            new_index = len(self._history)
-            self.clear()
-            self._history_index = new_index
+    def _navigate_history(self, direction: int):
+        """히스토리 탐색 (direction: 1=이전 명령, -1=다음 명령)"""
+        recent = self._history.recent()
+        if not recent:
             return
+        if self._history_index == -1:
+            self._draft_text = self.text()
 
+        new_index = max(-1, min(self._history_index + direction, len(recent) - 1))
         self._history_index = new_index
-        self.setText(self._history[new_index])
+        self.setText(self._draft_text if new_index == -1 else recent[new_index])
+
+    # === 역방향 검색 (Ctrl+R) ===
+
+    def _start_search(self):
+        self._search_query = ""
+        self._search_matches = []
+        self._search_pos = 0
+        self._search_saved_text = self.text()
+        self._emit_search_prompt()
+
+    def _handle_search_key(self, event) -> bool:
+        """검색 중 키 처리 (처리했으면 True, 검색을 끝내고 기본 처리로 넘기면 False)"""
+        key = event.key()
+        if key in (Qt.Key.Key_Shift, Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Meta):
+            return True
+        modifiers = event.modifiers()
+        ctrl = modifiers == Qt.KeyboardModifier.ControlModifier
+        if ctrl and key == Qt.Key.Key_R:
+            if self._search_pos + 1 < len(self._search_matches):
+                self._search_pos += 1
+                self.setText(self._search_matches[self._search_pos])
+            self._emit_search_prompt()
+            return True
+        if key == Qt.Key.Key_Escape or (ctrl and key == Qt.Key.Key_G):
+            self._end_search(accept=False)
+            return True
+        if key == Qt.Key.Key_Backspace:
+            self._update_search(self._search_query[:-1])
+            return True
+        text = event.text()
+        if text and text.isprintable() and not (
+            modifiers & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.AltModifier)
+        ):
+            self._update_search(self._search_query + text)
+            return True
+        # Enter(전송) / 방향키 등: 현재 일치 항목을 입력창에 둔 채 검색 종료 후 기본 처리
+        self._end_search(accept=True)
+        return False
+
+    def _update_search(self, query: str):
+        self._search_query = query
+        self._search_matches = self._history.search(query)
+        self._search_pos = 0
+        if self._search_matches:
+            self.setText(self._search_matches[0])
+        elif not query:
+            self.setText(self._search_saved_text)
+        self._emit_search_prompt()
+
+    def _end_search(self, accept: bool):
+        if not accept:
+            self.setText(self._search_saved_text)
+        self._search_query = None
+        self._search_matches = []
+        self._history_index = -1
+        self.search_prompt_changed.emit("")
+
+    def _emit_search_prompt(self):
+        key = (
+            "history.search.failed"
+            if self._search_query and not self._search_matches
+            else "history.search.prompt"
+        )
+        self.search_prompt_changed.emit(tr(self._language, key, query=self._search_query))
 
 
 class MainWindow(QMainWindow):
     """메인 윈도우"""
 
     APP_VERSION = "v1.10.0"
-    DEFAULT_RECONNECT_INTERVAL_MS = 1000
-    ENV_RECONNECT_INTERVAL_MS = "RECONNECT_INTERVAL_MS"
-    ENV_RECONNECT_INTERVAL_SEC = "RECONNECT_INTERVAL_SEC"
-    ENV_AUTO_LOAD_STRING_STATS = "AUTO_LOAD_STRING_STATS"
-    ENV_AUTO_LOAD_AUTO_COMMANDS = "AUTO_LOAD_AUTO_COMMANDS"
-    ENV_AUTO_LOAD_MACRO_COMMANDS = "AUTO_LOAD_MACRO_COMMANDS"
-
-    def __init__(self):
+    DEFAULT_RECONNECT_INTERVAL_MS = env_config.DEFAULT_RECONNECT_INTERVAL_MS
+    ENV_RECONNECT_INTERVAL_MS = env_config.ENV_RECONNECT_INTERVAL_MS
+    ENV_RECONNECT_INTERVAL_SEC = env_config.ENV_RECONNECT_INTERVAL_SEC
+    ENV_AUTO_LOAD_STRING_STATS = env_config.ENV_AUTO_LOAD_STRING_STATS
+    ENV_AUTO_LOAD_AUTO_COMMANDS = env_config.ENV_AUTO_LOAD_AUTO_COMMANDS
+    ENV_AUTO_LOAD_MACRO_COMMANDS = env_config.ENV_AUTO_LOAD_MACRO_COMMANDS
+    TIMELINE_FLUSH_INTERVAL_MS = 50
+    # 첫 화면이 그려지지 않는 경우(최소화 시작 등)에도 지연 초기화를 실행하기 위한 대기 시간
+    STARTUP_FALLBACK_MS = 1000
+    # 명령 팔레트에 올리는 최근 입력 히스토리 수
+    PALETTE_HISTORY_LIMIT = 1000
+
+    def __init__(self, profiler: ProfilerSession | None = None, profile_until: str = ""):
         super().__init__()
         self._settings = QSettings("LnxTerm", "LnxTerm")
         self._language = normalize_language(self._settings.value("language", "en", type=str))
@@ -98,21 +213,68 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 650)
         self.resize(1280, 768)
 
-        # .env 파일 로드 (실행 파일 디렉토리 우선)
+        # .env 경로 (실행 파일 디렉토리 우선). 파일 로드는 첫 화면 이후 _finish_startup()에서
         self._env_path = self._resolve_env_path()
-        self._ensure_env_file_defaults()
-        load_dotenv(self._env_path, override=True)
-        self._log_dir = os.path.abspath(
-            os.path.expanduser(os.environ.get("LOG_DIR", "").strip())
-        ) if os.environ.get("LOG_DIR", "").strip() else ""
+        self._log_dir = ""
         self._persistent_log_path: str = ""
-        self._reconnect_interval_ms = self._resolve_reconnect_interval_ms()
+        self._reconnect_interval_ms = env_config.DEFAULT_RECONNECT_INTERVAL_MS
+        self._first_paint_done = False
+        self._startup_finished = False
+        self._config_store: ConfigStore | None = None
 
         # 매니저 초기화
         self._serial = SerialManager()
         self._log = LogManager()
         self._rx_bytes = 0
         self._tx_bytes = 0
+        self._file_sender: FileSenderThread | None = None
+        self._file_send_options: dict = {}
+        self._file_send_reported_bytes = 0
+        self._modem_transfer: ModemTransferThread | None = None
+
+        # 추가 포트 세션 + 통합 타임라인 (모든 세션이 공유하는 단일 플러시 타이머)
+        self._sessions: list[SessionWidget] = []
+        self._timeline_merger = TimelineMerger()
+        self._timeline_timer = QTimer(self)
+        self._timeline_timer.setInterval(self.TIMELINE_FLUSH_INTERVAL_MS)
+        self._timeline_timer.timeout.connect(self._flush_timeline)
+
+        # 파이프라인 단계별 지표 (지표 패널에서 표시)
+        self._metrics = PipelineMetrics()
+        self._serial.set_metrics(self._metrics)
+        self._metrics_panel = None
+
+        # 수신 원본 바이트 링 버퍼 (Hex 보기용, .env 로드 후 HEX_VIEW_BUFFER_BYTES 크기로 재생성)
+        self._rx_ring = ByteRing()
+        self._hex_view = None
+
+        # 바이너리 프레임 디코더 (보기 > 프레임 디코더, 프레임 탭은 첫 프레임 수신 시 생성)
+        self._frame_decoder: frame_decoder.FrameDecoder | None = None
+        self._frame_table = None
+
+        # 로그 라인 수치 추출 → 플롯 (추출기는 설정 저장소 로드 후 적용, 창은 처음 열 때 생성)
+        self._plot_store = PlotStore()
+        self._plot_panel = None
+
+        # 명령 팔레트 (Ctrl+P, 처음 열 때 생성)
+        self._palette_index = None
+        self._command_palette = None
+
+        # 사용자 하이라이트 규칙 (설정 저장소 로드 후 생성, 모든 터미널 탭이 공유)
+        self._highlight_rules: HighlightRuleSet | None = None
+
+        # GUI 이벤트 루프 멈춤 감지 (.env 로드 후 생성, STALL_THRESHOLD_MS=0이면 비활성)
+        self._stall_detector: StallDetector | None = None
+
+        # cProfile 캡처 (도움말 메뉴 또는 PROFILE_STARTUP으로 시작된 세션)
+        self._profiler = profiler if profiler is not None else ProfilerSession()
+        self._profile_until = profile_until if self._profiler.is_running else ""
+
+        # raw 캡처 재생 (재생 중에는 포트 대신 재생 스레드가 수신 파이프라인에 공급)
+        self._replay_thread: RawReplayThread | None = None
+
+        # RX 스트림 팬아웃 서버 (STREAM_SERVER 설정 시)
+        self._stream_server: StreamServer | None = None
 
         # 자동 재연결 설정
         self._last_settings: dict = {}
@@ -134,13 +296,67 @@ class MainWindow(QMainWindow):
         # 시그널 연결
         self._connect_signals()
 
-        # 환경 변수 사전 설정 로드
-        self._sidebar.load_configs_from_env()
-
         self._apply_language()
 
         # 초기 상태
         self._update_statusbar_style(False)
+        self._timeline_timer.start()
+        QTimer.singleShot(0, self._focus_command_input)
+        QTimer.singleShot(self.STARTUP_FALLBACK_MS, self._finish_startup)
+        startup_timing.mark("window_init")
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            startup_timing.mark("first_paint")
+            QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self):
+        """첫 화면 이후 나머지 초기화 (.env 로드, 문자열 통계 행, 사전 설정 로드, 시작 메시지)
+
+        연결 등 .env 값이 필요한 동작이 먼저 호출되면 그 시점에 즉시 실행
+        """
+        if self._startup_finished:
+            return
+        self._startup_finished = True
+
+        from dotenv import load_dotenv
+        self._ensure_env_file_defaults()
+        load_dotenv(self._env_path, override=True)
+        self._log_dir = env_config.resolve_log_dir()
+        self._reconnect_interval_ms = self._resolve_reconnect_interval_ms()
+        self._reconnect_timer.setInterval(self._reconnect_interval_ms)
+        self._terminal.set_ansi_keep_raw(ansi_parser.keep_raw_from_env())
+        self._log.raw_sidecar = raw_sidecar_from_env()
+        if not self._rx_ring.end_offset:
+            self._rx_ring = ByteRing(capacity_from_env())
+
+        # 문자열 통계/자동 명령/매크로 설정 저장소 (lnxterm_config.json, 디바운스 저장)
+        self._config_store = ConfigStore(self._env_path, self)
+        self._config_store.save_failed.connect(self._on_config_save_failed)
+        self._sidebar.set_config_store(self._config_store)
+        self._config_store.set_snapshot_provider(self._collect_configs)
+        self._highlight_rules = HighlightRuleSet(
+            self._config_store.sections()[config_store.SECTION_HIGHLIGHT_RULES], self
+        )
+        self._terminal.set_highlight_rules(self._highlight_rules)
+        self._timeline.set_highlight_rules(self._highlight_rules)
+        for session in self._sessions:
+            session.set_highlight_rules(self._highlight_rules)
+        self._plot_store.set_extractors(
+            self._config_store.sections()[config_store.SECTION_PLOT_EXTRACTORS]
+        )
+
+        # 환경 변수 사전 설정 로드 (CONFIRM 모드 확인 창은 창이 보인 뒤 표시)
+        self._sidebar.build_deferred_ui()
+        self._sidebar.load_configs_from_env()
+
+        # 명령 히스토리 파일 (lnxterm_history.jsonl, 백그라운드에서 읽기)
+        history = CommandHistory(history_path_for(self._env_path))
+        history.preload()
+        self._command_input.set_history(history)
+
         self._terminal.append_system_message(tr(self._language, "msg.app_started"))
 
         # LOG_DIR 확인
@@ -158,7 +374,13 @@ class MainWindow(QMainWindow):
         )
 
         self._terminal.append_system_message(tr(self._language, "msg.select_port"))
-        QTimer.singleShot(0, self._focus_command_input)
+        self._start_stream_server()
+        self._stall_detector = StallDetector.from_env(self)
+        if self._stall_detector is not None:
+            self._stall_detector.start()
+        startup_timing.mark("startup_ready")
+        if self._profile_until == STARTUP_INIT:
+            self._stop_profiling()
 
     def _setup_menu_bar(self):
         """메뉴바 구성"""
@@ -179,11 +401,46 @@ class MainWindow(QMainWindow):
 
         self._file_menu.addSeparator()
 
+        self._raw_capture_action = QAction("", self, checkable=True)
+        self._raw_capture_action.toggled.connect(self._toggle_raw_capture)
+        self._file_menu.addAction(self._raw_capture_action)
+
+        self._replay_action = QAction("", self)
+        self._replay_action.triggered.connect(self._on_replay_raw)
+        self._file_menu.addAction(self._replay_action)
+
+        self._file_menu.addSeparator()
+
+        self._new_session_action = QAction("", self)
+        self._new_session_action.setShortcut("Ctrl+Shift+N")
+        self._new_session_action.triggered.connect(self.add_port_session)
+        self._file_menu.addAction(self._new_session_action)
+
+        self._file_menu.addSeparator()
+
+        self._send_file_action = QAction("", self)
+        self._send_file_action.triggered.connect(self._on_send_file)
+        self._file_menu.addAction(self._send_file_action)
+
+        self._modem_send_action = QAction("", self)
+        self._modem_send_action.triggered.connect(self._on_modem_send)
+        self._file_menu.addAction(self._modem_send_action)
+
+        self._modem_receive_action = QAction("", self)
+        self._modem_receive_action.triggered.connect(self._on_modem_receive)
+        self._file_menu.addAction(self._modem_receive_action)
+
+        self._file_menu.addSeparator()
+
         self._update_env_action = QAction("", self)
         self._update_env_action.setShortcut("Ctrl+S")
         self._update_env_action.triggered.connect(self._on_update_env_configs)
         self._file_menu.addAction(self._update_env_action)
 
+        self._export_latency_action = QAction("", self)
+        self._export_latency_action.triggered.connect(self._on_export_latency_csv)
+        self._file_menu.addAction(self._export_latency_action)
+
         self._file_menu.addSeparator()
 
         self._exit_action = QAction("", self)
@@ -199,8 +456,18 @@ class MainWindow(QMainWindow):
         self._find_action.triggered.connect(self._toggle_search)
         self._edit_menu.addAction(self._find_action)
 
+        self._palette_action = QAction("", self)
+        self._palette_action.setShortcut("Ctrl+P")
+        self._palette_action.triggered.connect(self._show_command_palette)
+        self._edit_menu.addAction(self._palette_action)
+
         self._edit_menu.addSeparator()
 
+        self._cancel_tx_action = QAction("", self)
+        self._cancel_tx_action.setShortcut("Ctrl+Shift+X")
+        self._cancel_tx_action.triggered.connect(self._cancel_pending_tx)
+        self._edit_menu.addAction(self._cancel_tx_action)
+
         self._clear_action = QAction("", self)
         self._clear_action.setShortcut("Ctrl+Shift+C")
         self._clear_action.triggered.connect(self._clear_terminal)
@@ -219,6 +486,37 @@ class MainWindow(QMainWindow):
         self._refresh_action.triggered.connect(lambda: self._sidebar.refresh_ports())
         self._view_menu.addAction(self._refresh_action)
 
+        self._metrics_action = QAction("", self)
+        self._metrics_action.setShortcut("Ctrl+Shift+M")
+        self._metrics_action.triggered.connect(self._show_metrics_panel)
+        self._view_menu.addAction(self._metrics_action)
+
+        self._hex_view_action = QAction("", self, checkable=True)
+        self._hex_view_action.setShortcut("Ctrl+Shift+H")
+        self._hex_view_action.toggled.connect(self._toggle_hex_view)
+        self._view_menu.addAction(self._hex_view_action)
+
+        self._plot_action = QAction("", self)
+        self._plot_action.setShortcut("Ctrl+Shift+G")
+        self._plot_action.triggered.connect(self._show_plot_panel)
+        self._view_menu.addAction(self._plot_action)
+
+        self._frame_decoder_menu = self._view_menu.addMenu("")
+        self._frame_decoder_group = QActionGroup(self)
+        self._frame_decoder_group.setExclusive(True)
+        self._frame_decoder_actions = {}
+        for name in [""] + frame_decoder.decoder_names():
+            action = QAction("", self, checkable=True)
+            action.setChecked(not name)
+            action.triggered.connect(lambda checked, n=name: checked and self._set_frame_decoder(n))
+            self._frame_decoder_group.addAction(action)
+            self._frame_decoder_menu.addAction(action)
+            self._frame_decoder_actions[name] = action
+
+        self._highlight_rules_action = QAction("", self)
+        self._highlight_rules_action.triggered.connect(self._show_highlight_rules_dialog)
+        self._view_menu.addAction(self._highlight_rules_action)
+
         self._language_menu = menubar.addMenu("")
         self._language_action_group = QActionGroup(self)
         self._language_action_group.setExclusive(True)
@@ -240,6 +538,14 @@ class MainWindow(QMainWindow):
         self._about_action.triggered.connect(self._show_about)
         self._help_menu.addAction(self._about_action)
 
+        self._stall_report_action = QAction("", self)
+        self._stall_report_action.triggered.connect(self._on_save_stall_report)
+        self._help_menu.addAction(self._stall_report_action)
+
+        self._profile_action = QAction("", self)
+        self._profile_action.triggered.connect(self._toggle_profiling)
+        self._help_menu.addAction(self._profile_action)
+
     def _setup_central_widget(self):
         """중앙 위젯 구성"""
         central = QWidget()
@@ -256,7 +562,6 @@ class MainWindow(QMainWindow):
 
         # 사이드바
         self._sidebar = SidebarWidget(language=self._language)
-        self._sidebar.set_env_path(self._env_path)
         self._splitter.addWidget(self._sidebar)
 
         # 오른쪽 영역 (터미널 + 검색 + 입력)
@@ -270,8 +575,18 @@ class MainWindow(QMainWindow):
         self._search = SearchWidget(self._terminal, language=self._language)
         right_layout.addWidget(self._search)
 
-        # 터미널
-        right_layout.addWidget(self._terminal, 1)
+        # 터미널 탭 (메인 포트 / 추가 포트 세션 / 통합 타임라인)
+        self._session_tabs = QTabWidget()
+        self._session_tabs.setDocumentMode(True)
+        self._session_tabs.setTabsClosable(True)
+        self._session_tabs.tabCloseRequested.connect(self._close_port_session)
+        self._session_tabs.addTab(self._terminal, "")
+        self._timeline = TimelineWidget()
+        self._session_tabs.addTab(self._timeline, "")
+        tab_bar = self._session_tabs.tabBar()
+        for index in range(self._session_tabs.count()):
+            tab_bar.setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+        right_layout.addWidget(self._session_tabs, 1)
 
         # 명령 입력 바
         input_frame = QFrame()
@@ -288,8 +603,17 @@ class MainWindow(QMainWindow):
         )
         input_layout.addWidget(prompt_label)
 
+        # Ctrl+R 역방향 검색 프롬프트 (검색 중에만 표시)
+        self._history_search_label = QLabel()
+        self._history_search_label.setStyleSheet(
+            f"color: {COLORS['text_secondary']}; background-color: transparent;"
+        )
+        self._history_search_label.hide()
+        input_layout.addWidget(self._history_search_label)
+
         self._command_input = CommandInput(language=self._language)
         self._command_input.returnPressed.connect(self._send_command)
+        self._command_input.search_prompt_changed.connect(self._on_history_search_prompt)
         input_layout.addWidget(self._command_input, 1)
 
         # 전송 버튼
@@ -315,12 +639,16 @@ class MainWindow(QMainWindow):
         self._status_baud = QLabel("")
         self._status_rx = QLabel("RX: 0")
         self._status_tx = QLabel("TX: 0")
+        self._status_txq = QLabel("")
+        self._status_file = QLabel("")
         self._status_log = QLabel("")
 
         self._statusbar.addWidget(self._status_connection)
         self._statusbar.addWidget(self._status_port)
         self._statusbar.addWidget(self._status_baud)
         self._statusbar.addPermanentWidget(self._status_log)
+        self._statusbar.addPermanentWidget(self._status_file)
+        self._statusbar.addPermanentWidget(self._status_txq)
         self._statusbar.addPermanentWidget(self._status_rx)
         self._statusbar.addPermanentWidget(self._status_tx)
 
@@ -347,6 +675,7 @@ class MainWindow(QMainWindow):
         self._sidebar.log_stop_requested.connect(self._on_log_stop)
         self._sidebar.clear_requested.connect(self._clear_terminal)
         self._sidebar.send_command_requested.connect(self.send_serial_command)
+        self._sidebar.send_traced_command_requested.connect(self._send_traced_command)
 
         # 터미널 엔터 시 커맨드 입력창으로 포커스
         self._terminal.return_pressed.connect(self._command_input.setFocus)
@@ -370,12 +699,35 @@ class MainWindow(QMainWindow):
         self._log_start_action.setText(tr(self._language, "action.log_start"))
         self._log_stop_action.setText(tr(self._language, "action.log_stop"))
         self._update_env_action.setText(tr(self._language, "action.update_env"))
+        self._send_file_action.setText(tr(self._language, "action.send_file"))
+        self._new_session_action.setText(tr(self._language, "action.new_session"))
+        self._raw_capture_action.setText(tr(self._language, "action.raw_capture"))
+        self._replay_action.setText(tr(self._language, "action.replay_raw"))
+        self._modem_send_action.setText(tr(self._language, "action.modem_send"))
+        self._modem_receive_action.setText(tr(self._language, "action.modem_receive"))
+        self._export_latency_action.setText(tr(self._language, "action.export_latency"))
         self._exit_action.setText(tr(self._language, "action.exit"))
         self._find_action.setText(tr(self._language, "action.find"))
+        self._palette_action.setText(tr(self._language, "action.command_palette"))
         self._clear_action.setText(tr(self._language, "action.clear_terminal"))
+        self._cancel_tx_action.setText(tr(self._language, "action.cancel_tx"))
         self._sidebar_action.setText(tr(self._language, "action.toggle_sidebar"))
         self._refresh_action.setText(tr(self._language, "action.refresh_ports"))
+        self._metrics_action.setText(tr(self._language, "action.metrics"))
+        self._highlight_rules_action.setText(tr(self._language, "action.highlight_rules"))
+        self._hex_view_action.setText(tr(self._language, "action.hex_view"))
+        self._plot_action.setText(tr(self._language, "action.plot"))
+        self._frame_decoder_menu.setTitle(tr(self._language, "menu.frame_decoder"))
+        for name, action in self._frame_decoder_actions.items():
+            action.setText(decoder_label(self._language, name))
+        if self._frame_table is not None:
+            self._frame_table.set_language(self._language)
+            self._session_tabs.setTabText(
+                self._session_tabs.indexOf(self._frame_table), tr(self._language, "session.tab.frames")
+            )
         self._about_action.setText(tr(self._language, "action.about"))
+        self._stall_report_action.setText(tr(self._language, "action.stall_report"))
+        self._update_profile_action_text()
         self._lang_ko_action.setText(tr(self._language, "action.lang_ko"))
         self._lang_en_action.setText(tr(self._language, "action.lang_en"))
 
@@ -386,6 +738,23 @@ class MainWindow(QMainWindow):
         self._send_btn.setText(tr(self._language, "button.send"))
         self._search.set_language(self._language)
         self._sidebar.set_language(self._language)
+        if self._metrics_panel is not None:
+            self._metrics_panel.set_language(self._language)
+        if self._plot_panel is not None:
+            self._plot_panel.set_language(self._language)
+        if self._command_palette is not None:
+            self._command_palette.set_language(self._language)
+        for session in self._sessions:
+            session.set_language(self._language)
+            self._update_session_tab_title(session)
+        self._update_main_tab_title()
+        self._session_tabs.setTabText(
+            self._session_tabs.indexOf(self._timeline), tr(self._language, "session.tab.timeline")
+        )
+        if self._hex_view is not None and self._session_tabs.indexOf(self._hex_view) >= 0:
+            self._session_tabs.setTabText(
+                self._session_tabs.indexOf(self._hex_view), tr(self._language, "session.tab.hex")
+            )
         self._update_connection_status_text()
 
         if self._serial.is_connected() and self._serial.port_name:
@@ -405,6 +774,7 @@ class MainWindow(QMainWindow):
 
     def _on_connect(self, settings: dict, silent: bool = False) -> bool:
         """시리얼 포트 연결. silent=True이면 다이얼로그 없이 경고만 출력."""
+        self._finish_startup()
         # LOG_DIR 확인 - 미설정시 다이얼로그
         if not self._ensure_log_dir():
             return False
@@ -448,12 +818,15 @@ class MainWindow(QMainWindow):
                         self._terminal.append_system_message(tr(self._language, "msg.connect_canceled"))
                         return False
 
+            rtscts, xonxoff = settings.get("flow_control") or (False, False)
             self._serial.connect(
                 port=port,
                 baudrate=settings["baudrate"],
                 databits=settings["databits"],
                 parity=settings["parity"],
                 stopbits=settings["stopbits"],
+                rtscts=rtscts,
+                xonxoff=xonxoff,
             )
 
             # 연결 설정 저장 (자동 재연결용)
@@ -465,6 +838,14 @@ class MainWindow(QMainWindow):
             reader.error_occurred.connect(self._on_serial_error)
             reader.start()
 
+            # 송신 스레드 시작
+            writer = self._serial.start_writing()
+            writer.line_written.connect(self._on_line_written)
+            writer.progress.connect(self._on_tx_progress)
+            writer.batch_finished.connect(self._on_tx_batch_finished)
+            writer.error_occurred.connect(self._on_tx_error)
+            writer.start()
+
             # UI 업데이트
             self._sidebar.set_connected_state(True)
             self._update_statusbar_style(True)
@@ -483,11 +864,18 @@ class MainWindow(QMainWindow):
                     baudrate=settings["baudrate"],
                 )
             )
+            if self._serial.peer_path:
+                self._terminal.append_system_message(
+                    tr(self._language, "msg.pty_peer_path", path=self._serial.peer_path)
+                )
 
             self.setWindowTitle(f"{self._app_title} - {settings['port']}")
+            self._update_main_tab_title()
 
             # 연결 시 자동 로그 시작
             self._auto_start_logging()
+            if self._profile_until == STARTUP_CONNECT:
+                self._stop_profiling()
             return True
 
         except Exception as e:
@@ -503,6 +891,7 @@ class MainWindow(QMainWindow):
 
     def _ensure_log_dir(self) -> bool:
         """LOG_DIR 확인 및 설정. 성공 시 True 반환."""
+        self._finish_startup()
         if self._log_dir:
             normalized = os.path.abspath(os.path.expanduser(self._log_dir))
             try:
@@ -527,6 +916,7 @@ class MainWindow(QMainWindow):
         # .env 파일에 저장
         self._log_dir = os.path.abspath(os.path.expanduser(dir_path))
         os.environ["LOG_DIR"] = self._log_dir
+        from dotenv import set_key
         set_key(self._env_path, "LOG_DIR", self._log_dir)
         self._terminal.append_system_message(
             tr(self._language, "msg.log_dir_set", path=self._log_dir)
@@ -535,89 +925,15 @@ class MainWindow(QMainWindow):
 
     def _resolve_env_path(self) -> str:
         """실행 환경에 맞는 .env 경로 결정."""
-        candidate_paths: list[str] = []
-        if getattr(sys, "frozen", False):
-            candidate_paths.append(
-                os.path.join(os.path.dirname(os.path.abspath(sys.executable)), ".env")
-            )
-        candidate_paths.append(os.path.join(os.getcwd(), ".env"))
-        candidate_paths.append(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
-        )
-
-        unique_candidates = []
-        for path in candidate_paths:
-            normalized = os.path.abspath(path)
-            if normalized not in unique_candidates:
-                unique_candidates.append(normalized)
-
-        for path in unique_candidates:
-            if os.path.isfile(path):
-                return path
-
-        # 기존 파일이 없으면 실행 파일 폴더(배포 환경) 또는 소스 폴더(개발 환경)에 생성
-        if getattr(sys, "frozen", False):
-            return os.path.join(
-                os.path.dirname(os.path.abspath(sys.executable)), ".env"
-            )
-        return os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+        return env_config.resolve_env_path()
 
     def _ensure_env_file_defaults(self):
         """최초 실행 시 .env를 자동 생성하고 기본값을 채운다."""
-        env_exists = os.path.isfile(self._env_path)
-        env_dir = os.path.dirname(self._env_path)
-        if env_dir:
-            os.makedirs(env_dir, exist_ok=True)
-        if not env_exists:
-            with open(self._env_path, "a", encoding="utf-8"):
-                pass
-            defaults = {
-                self.ENV_RECONNECT_INTERVAL_MS: "1000",
-                self.ENV_AUTO_LOAD_STRING_STATS: "",
-                self.ENV_AUTO_LOAD_AUTO_COMMANDS: "",
-                self.ENV_AUTO_LOAD_MACRO_COMMANDS: "",
-            }
-            for key, value in defaults.items():
-                set_key(self._env_path, key, value)
-                os.environ[key] = value
+        env_config.ensure_env_file_defaults(self._env_path)
 
     def _resolve_reconnect_interval_ms(self) -> int:
         """환경변수에서 자동 재연결 주기를 읽어 ms 단위로 반환."""
-        raw_ms = os.environ.get(self.ENV_RECONNECT_INTERVAL_MS, "").strip()
-        parsed_ms = self._parse_positive_milliseconds(raw_ms)
-        if parsed_ms is not None:
-            return parsed_ms
-
-        raw_sec = os.environ.get(self.ENV_RECONNECT_INTERVAL_SEC, "").strip()
-        parsed_sec_ms = self._parse_positive_seconds_to_ms(raw_sec)
-        if parsed_sec_ms is not None:
-            return parsed_sec_ms
-
-        return self.DEFAULT_RECONNECT_INTERVAL_MS
-
-    @staticmethod
-    def _parse_positive_milliseconds(raw_value: str) -> int | None:
-        """양의 밀리초 문자열을 int로 변환. 실패 시 None."""
-        if not raw_value:
-            return None
-        try:
-            value = int(float(raw_value))
-        except ValueError:
-            return None
-        return value if value > 0 else None
-
-    @staticmethod
-    def _parse_positive_seconds_to_ms(raw_value: str) -> int | None:
-        """양의 초 문자열을 ms(int)로 변환. 실패 시 None."""
-        if not raw_value:
-            return None
-        try:
-            value = float(raw_value)
-        except ValueError:
-            return None
-        if value <= 0:
-            return None
-        return int(value * 1000)
+        return env_config.resolve_reconnect_interval_ms()
 
     def _get_reconnect_delay_text(self) -> str:
         """자동 재연결 주기를 화면 표시용 텍스트로 변환."""
@@ -650,12 +966,17 @@ class MainWindow(QMainWindow):
     def _on_disconnect(self, manual: bool = True):
         """시리얼 포트 연결 해제"""
         port_name = self._serial.port_name
+        self._stop_replay()
+        self._stop_file_send()
+        self._stop_modem_transfer()
         self._serial.disconnect()
 
         self._sidebar.set_connected_state(False)
         self._update_statusbar_style(False)
         self._status_port.setText("")
         self._status_baud.setText("")
+        self._status_txq.setText("")
+        self._update_main_tab_title()
 
         self._terminal.append_system_message(
             tr(self._language, "msg.disconnected", port=port_name)
@@ -702,24 +1023,54 @@ class MainWindow(QMainWindow):
             self._reconnect_timer.start()
             self._update_connection_status_text()
 
-    def _on_data_received(self, data: bytes):
-        """시리얼 데이터 수신"""
+    def _on_data_received(self, data: bytes, rx_ns: int = None):
+        """시리얼 데이터 수신 (rx_ns: 리더 스레드 수신 시각, monotonic ns)"""
         self._rx_bytes += len(data)
         self._update_byte_counts()
+        if self._stream_server is not None:
+            self._stream_server.publish(data)
+        self._rx_ring.append(data)
+        self._log.write_raw(data)
+        if self._frame_decoder is not None:
+            # 프레임은 표/로그로, 나머지 텍스트만 아래 라인 파이프라인으로
+            data, frames = self._frame_decoder.split(data)
+            if frames:
+                self._on_frames_decoded(self._main_timeline_source(), frames)
 
         try:
             text = data.decode("utf-8", errors="replace")
         except Exception:
             text = data.decode("latin-1", errors="replace")
+        if self._file_sender is not None:
+            self._file_sender.notify_rx_text(text)
 
         # 터미널에 표시 및 완성된 라인 수집
+        metrics = self._metrics
+        render_started = time.perf_counter_ns()
         completed_lines = self._terminal.append_data(text, direction="rx")
+        metrics.record_stage(STAGE_RENDER, time.perf_counter_ns() - render_started)
+        metrics.record_chunk_processed(len(completed_lines))
+
+        if completed_lines:
+            source = self._main_timeline_source()
+            if rx_ns is None:
+                rx_ns = time.monotonic_ns()
+            for _timestamp, line in completed_lines:
+                self._timeline_merger.push(source, rx_ns, line)
+            if self._plot_store.has_extractors:
+                plot_time = rx_ns / 1e9
+                for _timestamp, line in completed_lines:
+                    self._plot_store.process_line(line, plot_time)
 
         # 로그 파일에 기록
         for timestamp, line in completed_lines:
+            match_started = time.perf_counter_ns()
             self._sidebar.process_log_line_for_counters(line, timestamp)
-            self._sidebar.process_log_line_for_automation(line)
+            self._sidebar.process_log_line_for_automation(line, rx_ns)
+            log_started = time.perf_counter_ns()
+            metrics.record_stage(STAGE_MATCH, log_started - match_started)
             self._log.write_line(line, timestamp)
+            metrics.record_stage(STAGE_LOG, time.perf_counter_ns() - log_started)
 
     def _on_serial_error(self, error_msg: str):
         """시리얼 오류 처리 - 비정상 끊김, 자동 재연결 시도"""
@@ -733,7 +1084,7 @@ class MainWindow(QMainWindow):
         command = self._command_input.text()
         
         # 빈 명령이라도 일단 전송 시도(엔터 역할)
-        self.send_serial_command(command)
+        self.send_serial_command(command, priority=SerialWriterThread.PRIORITY_HIGH)
 
         # 히스토리 추가 및 입력 클리어
         if command:
@@ -741,11 +1092,14 @@ class MainWindow(QMainWindow):
         self._command_input.clear()
         self._command_input.setFocus()
 
-    def send_serial_command(self, content: str, interval_ms: int = 0):
+    def send_serial_command(
+        self, content: str, interval_ms: int = 0,
+        priority: int = SerialWriterThread.PRIORITY_NORMAL,
+    ):
         """
         시리얼 명령 전송 (단일/멀티라인 지원, 간격 지원).
-        content에 포함된 각 라인을 순차적으로 전송.
-        interval_ms > 0 이면 각 라인 전송 사이 지연.
+        content에 포함된 각 라인을 송신 스레드 큐에 배치로 추가.
+        interval_ms > 0 이면 송신 스레드가 각 라인 전송 사이 지연.
         """
         if not content:
             lines = [""]
@@ -755,55 +1109,654 @@ class MainWindow(QMainWindow):
         if not lines:
             lines = [""]
 
+        self._enqueue_tx_lines(lines, interval_ms, priority)
+
+    def _send_traced_command(self, command: str, trace: dict):
+        """자동 명령 트리거 직후 명령 전송 (송신 스레드가 write 반환 시각을 트레이스에 기록)"""
+        self._enqueue_tx_lines(
+            [command], 0, SerialWriterThread.PRIORITY_HIGH, trace=trace
+        )
+
+    def _enqueue_tx_lines(
+        self, lines: list[str], interval_ms: int, priority: int, trace: dict = None
+    ) -> bool:
+        """송신 스레드 큐에 라인 추가. 큐가 가득 차면 전송 거부."""
+        writer = self._serial.writer
+        if self._replay_thread is not None and not self._serial.is_connected():
+            self._dry_run_tx_lines(lines, trace)
+            return True
+        if not self._serial.is_connected() or writer is None:
+            self._terminal.append_system_message(tr(self._language, "msg.port_not_connected"))
+            return False
+
+        batch_id = writer.enqueue_lines(lines, interval_ms, priority, trace=trace)
+        if batch_id is None:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.tx_queue_full", count=len(lines))
+            )
+            return False
+        self._update_tx_queue_status()
+        return True
+
+    def _on_line_written(self, item: dict):
+        """송신 스레드의 라인 송신 완료 처리 (터미널 에코/로그/카운트)"""
+        self._tx_bytes += item.get("sent") or 0
+
+        completed_lines = self._terminal.append_data(item["text"] + "\n", direction="tx")
+        for timestamp, log_line in completed_lines:
+            tx_line = f"[TX] {log_line}"
+            self._log.write_line(tx_line, timestamp)
+        self._timeline_merger.push(
+            self._main_timeline_source(), item["write_ns"], item["text"], "tx"
+        )
+
+        if item.get("trace") is not None:
+            self._sidebar.record_automation_latency(item["trace"])
+        self._update_byte_counts()
+        self._update_tx_queue_status()
+
+    def _on_tx_progress(self, _batch_id: int, done: int, total: int):
+        """멀티라인 송신 진행률 표시"""
+        if total > 1:
+            self._status_txq.setText(
+                tr(self._language, "status.tx_progress", done=done, total=total)
+            )
+
+    def _on_tx_batch_finished(self, _batch_id: int, cancelled: bool):
+        self._update_tx_queue_status()
+
+    def _on_tx_error(self, error_msg: str):
+        self._terminal.append_system_message(
+            tr(self._language, "msg.send_error", error=error_msg)
+        )
+        self._update_tx_queue_status()
+
+    def _cancel_pending_tx(self):
+        """대기 중인 송신 큐 비우기 (진행 중인 파일 송신 포함)"""
+        if self._file_sender is not None:
+            self._file_sender.cancel()
+        if self._modem_transfer is not None:
+            self._modem_transfer.cancel()
+        writer = self._serial.writer
+        removed = writer.cancel() if writer is not None else 0
+        self._terminal.append_system_message(
+            tr(self._language, "msg.tx_queue_cleared", count=removed)
+        )
+        self._update_tx_queue_status()
+
+    def _update_tx_queue_status(self):
+        writer = self._serial.writer
+        pending = writer.pending_count if writer is not None else 0
+        self._status_txq.setText(
+            tr(self._language, "status.tx_queue", count=pending) if pending else ""
+        )
+
+    # === 파일 송신 ===
+
+    def _on_send_file(self):
+        """파일 송신 설정 창을 열고 스트리밍 송신 시작"""
         if not self._serial.is_connected():
             self._terminal.append_system_message(tr(self._language, "msg.port_not_connected"))
             return
+        if self._file_sender is not None:
+            self._terminal.append_system_message(tr(self._language, "msg.file_send_busy"))
+            return
+
+        from file_send_dialog import FileSendDialog
+        dialog = FileSendDialog(self, self._file_send_options, language=self._language)
+        if dialog.exec() != FileSendDialog.DialogCode.Accepted:
+            return
+        options = dialog.get_data()
+        self._file_send_options = options
+        self.start_file_send(options)
+
+    def start_file_send(self, options: dict) -> bool:
+        """파일 스트리밍 송신 시작 (options: FileSendDialog.get_data 형식)"""
+        if not os.path.isfile(options["path"]):
+            self._terminal.append_system_message(
+                tr(
+                    self._language,
+                    "msg.file_send_failed",
+                    path=options["path"],
+                    error=tr(self._language, "msg.file_not_found"),
+                )
+            )
+            return False
+
+        self._file_send_options = options
+        self._file_send_reported_bytes = 0
+        self._file_sender = FileSenderThread(self._serial.write, options)
+        self._file_sender.progress.connect(self._on_file_send_progress)
+        self._file_sender.line_sent.connect(self._on_file_line_sent)
+        self._file_sender.finished_sending.connect(self._on_file_send_finished)
+        self._terminal.append_system_message(
+            tr(self._language, "msg.file_send_start", path=options["path"])
+        )
+        self._file_sender.start()
+        return True
+
+    def _on_file_send_progress(self, sent: int, total: int, rate: float, eta: float):
+        """파일 송신 진행률/처리량/남은 시간 표시"""
+        self._tx_bytes += sent - self._file_send_reported_bytes
+        self._file_send_reported_bytes = sent
+        self._update_byte_counts()
+        percent = sent * 100 // total if total else 100
+        self._status_file.setText(
+            tr(
+                self._language,
+                "status.file_send",
+                percent=percent,
+                rate=self._format_bytes(int(rate)),
+                eta=max(0, int(eta + 0.5)),
+            )
+        )
+
+    def _on_file_line_sent(self, line: str):
+        """파일 송신 라인 에코 (에코 요약 미사용 시)"""
+        completed_lines = self._terminal.append_data(line + "\n", direction="tx")
+        for timestamp, log_line in completed_lines:
+            self._log.write_line(f"[TX] {log_line}", timestamp)
+
+    def _on_file_send_finished(self, ok: bool, sent: int, lines: int, elapsed: float, error: str):
+        """파일 송신 종료 요약 (성공/실패/취소)"""
+        sender = self._file_sender
+        self._file_sender = None
+        self._status_file.setText("")
+        path = sender.path if sender is not None else ""
+        if ok:
+            summary = tr(
+                self._language,
+                "msg.file_send_done",
+                path=path,
+                lines=lines,
+                size=self._format_bytes(sent),
+                elapsed=f"{elapsed:.1f}",
+                rate=self._format_bytes(int(sent / elapsed) if elapsed > 0 else sent),
+            )
+        elif error:
+            summary = tr(self._language, "msg.file_send_failed", path=path, error=error)
+        else:
+            summary = tr(
+                self._language, "msg.file_send_canceled", path=path, size=self._format_bytes(sent)
+            )
+        self._terminal.append_system_message(summary)
+        if self._file_send_options.get("collapse_echo"):
+            self._log.write_line(f"[TX] {summary.strip()}")
+        if sender is not None:
+            sender.wait(1000)
+            sender.deleteLater()
+
+    def _stop_file_send(self):
+        """진행 중인 파일 송신 중단 (연결 해제 시)"""
+        if self._file_sender is not None:
+            self._file_sender.cancel()
+            self._file_sender.wait(2000)
+
+    # === 추가 포트 세션 / 통합 타임라인 ===
+
+    def add_port_session(self) -> SessionWidget:
+        """추가 포트 세션 탭 생성 (타임라인 탭 앞에 삽입)"""
+        session = SessionWidget(log_dir=self._log_dir, language=self._language)
+        session.lines_received.connect(self._on_session_lines)
+        session.title_changed.connect(lambda _title, s=session: self._update_session_tab_title(s))
+        if self._highlight_rules is not None:
+            session.set_highlight_rules(self._highlight_rules)
+        session.frames_received.connect(self._on_session_frames)
+        self._sessions.append(session)
+        index = self._session_tabs.insertTab(
+            self._session_tabs.indexOf(self._timeline), session, session.title()
+        )
+        self._session_tabs.setCurrentIndex(index)
+        return session
 
-        if interval_ms <= 0:
+    def _close_port_session(self, index: int):
+        """추가 포트 세션 탭 닫기 (메인/타임라인 탭은 닫지 않음)"""
+        session = self._session_tabs.widget(index)
+        if session not in self._sessions:
+            return
+        session.shutdown()
+        self._sessions.remove(session)
+        self._session_tabs.removeTab(index)
+        session.deleteLater()
+
+    def _update_session_tab_title(self, session: SessionWidget):
+        index = self._session_tabs.indexOf(session)
+        if index >= 0:
+            self._session_tabs.setTabText(index, session.title())
+
+    def _update_main_tab_title(self):
+        title = self._main_timeline_source() if self._serial.is_connected() \
+            else tr(self._language, "session.tab.main")
+        self._session_tabs.setTabText(self._session_tabs.indexOf(self._terminal), title)
+
+    def _main_timeline_source(self) -> str:
+        return os.path.basename(self._serial.port_name) or "main"
+
+    def _on_session_lines(self, source: str, rx_ns: int, lines: list, direction: str):
+        for line in lines:
+            self._timeline_merger.push(source, rx_ns, line, direction)
+
+    def _flush_timeline(self):
+        """재정렬 윈도우가 지난 라인을 수신 시각 순으로 타임라인에 출력"""
+        items = self._timeline_merger.pop_ready()
+        if items:
+            self._timeline.append_timeline_lines(items)
+
+    # === Raw 캡처 / 재생 ===
+
+    def _toggle_raw_capture(self, checked: bool):
+        """수신 원본 바이트 캡처 시작/중지 (LOG_DIR/lnxterm_raw_*.lnxraw)"""
+        if checked:
+            if self._serial.raw_capture is not None:
+                return
+            if not self._ensure_log_dir():
+                self._raw_capture_action.setChecked(False)
+                return
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(self._log_dir, f"lnxterm_raw_{timestamp}{RAW_CAPTURE_EXTENSION}")
             try:
-                for line in lines:
-                    self._send_line_logic(line)
-                self._update_byte_counts()
-            except Exception as e:
+                self._serial.start_raw_capture(path)
+            except OSError as e:
                 self._terminal.append_system_message(
-                    tr(self._language, "msg.send_error", error=str(e))
+                    tr(self._language, "msg.raw_capture_failed", error=str(e))
                 )
+                self._raw_capture_action.setChecked(False)
+                return
+            self._terminal.append_system_message(
+                tr(self._language, "msg.raw_capture_started", path=path)
+            )
         else:
-            self._send_lines_delayed(lines, interval_ms)
+            capture = self._serial.stop_raw_capture()
+            if capture is not None:
+                self._terminal.append_system_message(
+                    tr(
+                        self._language,
+                        "msg.raw_capture_stopped",
+                        path=capture.path,
+                        chunks=capture.chunk_count,
+                        size=self._format_bytes(capture.byte_count),
+                    )
+                )
 
-    def _send_line_logic(self, line: str):
-        """단일 라인 전송 로직 (로그/터미널 처리 포함)"""
-        data = (line + "\n").encode("utf-8")
-        sent = self._serial.write(data)
-        self._tx_bytes += sent
-        
-        completed_lines = self._terminal.append_data(line + "\n", direction="tx")
-        
-        for timestamp, log_line in completed_lines:
-            tx_line = f"[TX] {log_line}"
-            self._log.write_line(tx_line, timestamp)
+    def _on_replay_raw(self):
+        """raw 캡처 파일 선택 후 재생 속도를 골라 재생"""
+        if self._replay_thread is not None:
+            self._stop_replay()
+            return
+        if self._serial.is_connected():
+            self._terminal.append_system_message(
+                tr(self._language, "msg.replay_requires_disconnect")
+            )
+            return
+        from PyQt6.QtWidgets import QFileDialog, QInputDialog
+        path, _ = QFileDialog.getOpenFileName(
+            self, tr(self._language, "dialog.replay.title"), self._log_dir,
+            f"LnxTerm Raw (*{RAW_CAPTURE_EXTENSION});;All Files (*)"
+        )
+        if not path:
+            return
+        speeds = {"1x": 1.0, "2x": 2.0, "10x": 10.0, "100x": 100.0, "max": 0.0}
+        label, ok = QInputDialog.getItem(
+            self, tr(self._language, "dialog.replay.title"),
+            tr(self._language, "dialog.replay.speed"), list(speeds), 0, False
+        )
+        if ok:
+            self.start_replay(path, speeds[label])
 
-    def _send_lines_delayed(self, lines: list, interval_ms: int):
-        """지연 시간을 두고 순차 전송"""
-        if not lines:
-            self._update_byte_counts()
+    def start_replay(self, path: str, speed: float = 1.0) -> bool:
+        """raw 캡처 재생 시작 (speed: 1.0 실시간, N 배속, 0 최대 속도)"""
+        if self._replay_thread is not None or self._serial.is_connected():
+            return False
+        self._replay_thread = RawReplayThread(path, speed)
+        self._replay_thread.data_received.connect(self._on_replay_data)
+        self._replay_thread.progress.connect(self._on_replay_progress)
+        self._replay_thread.finished_replay.connect(self._on_replay_finished)
+        # 재생 세션 동안 문자열 통계/자동 명령을 연결 상태처럼 사용
+        self._sidebar.set_connected_state(True)
+        self._rx_bytes = 0
+        self._tx_bytes = 0
+        self._update_byte_counts()
+        speed_text = f"{speed:g}x" if speed > 0 else "max"
+        self._terminal.append_system_message(
+            tr(self._language, "msg.replay_start", path=path, speed=speed_text)
+        )
+        self._replay_thread.start()
+        return True
+
+    def _on_replay_data(self, data: bytes, rx_ns: int):
+        """재생 청크를 실제 수신과 동일한 파이프라인으로 처리"""
+        self._metrics.record_chunk(len(data))
+        self._on_data_received(data, rx_ns)
+        if self._replay_thread is not None:
+            self._replay_thread.chunk_processed()
+
+    def _on_replay_progress(self, chunks: int, size: int):
+        self._status_file.setText(
+            tr(self._language, "status.replay", chunks=chunks, size=self._format_bytes(size))
+        )
+
+    def _on_replay_finished(self, completed: bool, chunks: int, size: int, elapsed: float, error: str):
+        """재생 종료 요약 (완료/취소/오류)"""
+        replay = self._replay_thread
+        self._replay_thread = None
+        self._status_file.setText("")
+        if not self._serial.is_connected():
+            self._sidebar.set_connected_state(False)
+        if error:
+            summary = tr(self._language, "msg.replay_failed", error=error)
+        else:
+            summary = tr(
+                self._language,
+                "msg.replay_done" if completed else "msg.replay_canceled",
+                chunks=chunks,
+                size=self._format_bytes(size),
+                elapsed=f"{elapsed:.2f}",
+                rate=self._format_bytes(int(size / elapsed) if elapsed > 0 else size),
+            )
+        self._terminal.append_system_message(summary)
+        if replay is not None:
+            replay.wait(1000)
+            replay.deleteLater()
+
+    def _stop_replay(self):
+        """진행 중인 재생 중단"""
+        if self._replay_thread is not None:
+            self._replay_thread.cancel()
+            self._replay_thread.wait(2000)
+
+    def _dry_run_tx_lines(self, lines: list[str], trace: dict = None):
+        """재생 중 송신: 포트 대신 에코/로그/지연 통계만 처리"""
+        for index, line in enumerate(lines):
+            write_ns = time.monotonic_ns()
+            item_trace = trace if index == 0 else None
+            if item_trace is not None:
+                item_trace["write_ns"] = write_ns
+            self._on_line_written(
+                {"text": line, "sent": 0, "write_ns": write_ns, "trace": item_trace}
+            )
+
+    # === 파이프라인 지표 ===
+
+    def _show_metrics_panel(self):
+        """파이프라인 지표 창 표시 (모델리스)"""
+        if self._metrics_panel is None:
+            from metrics_panel import MetricsPanel
+            self._metrics_panel = MetricsPanel(
+                self._metrics_snapshot, self._metrics.reset, self, language=self._language
+            )
+        self._metrics_panel.show()
+        self._metrics_panel.raise_()
+        self._metrics_panel.activateWindow()
+
+    def _show_plot_panel(self):
+        """수치 플롯 창 표시 (모델리스)"""
+        self._finish_startup()
+        if self._plot_panel is None:
+            from plot_panel import PlotPanel
+            self._plot_panel = PlotPanel(self._plot_store, self, language=self._language)
+            self._plot_panel.extractors_changed.connect(self._config_store.mark_dirty)
+        self._plot_panel.show()
+        self._plot_panel.raise_()
+        self._plot_panel.activateWindow()
+
+    def _toggle_hex_view(self, checked: bool):
+        """수신 원본 바이트 Hex 덤프 탭 표시/숨김 (메인 포트 탭 바로 뒤)"""
+        self._finish_startup()
+        if not checked:
+            if self._hex_view is not None:
+                index = self._session_tabs.indexOf(self._hex_view)
+                if index >= 0:
+                    self._session_tabs.removeTab(index)
+            return
+        if self._hex_view is None:
+            from hex_view import HexView
+            self._hex_view = HexView(self._rx_ring)
+        else:
+            self._hex_view.set_ring(self._rx_ring)
+        index = self._session_tabs.insertTab(
+            self._session_tabs.indexOf(self._terminal) + 1,
+            self._hex_view, tr(self._language, "session.tab.hex"),
+        )
+        self._session_tabs.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+        self._session_tabs.setCurrentIndex(index)
+
+    def _set_frame_decoder(self, name: str):
+        """메인 포트 프레임 디코더 선택 (빈 문자열 = 끄기)"""
+        self._frame_decoder = frame_decoder.create_decoder(name)
+        self._terminal.append_system_message(
+            tr(self._language, "msg.frame_decoder", name=decoder_label(self._language, name))
+        )
+
+    def _on_frames_decoded(self, source: str, frames: list):
+        """디코딩된 프레임 → 프레임 탭 + 로그 ([FRAME] 요약 한 줄씩)"""
+        timestamp = self._log.get_timestamp()
+        for frame in frames:
+            self._log.write_line(f"[FRAME] {frame.summary()}", timestamp)
+        self._append_frame_rows(timestamp, source, frames)
+
+    def _on_session_frames(self, source: str, timestamp: str, frames: list):
+        self._append_frame_rows(timestamp, source, frames)
+
+    def _append_frame_rows(self, timestamp: str, source: str, frames: list):
+        if self._frame_table is None:
+            self._frame_table = FrameTableView(language=self._language)
+            index = self._session_tabs.addTab(
+                self._frame_table, tr(self._language, "session.tab.frames")
+            )
+            self._session_tabs.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
+        self._frame_table.append_frames(timestamp, source, frames)
+
+    def _collect_configs(self) -> dict:
+        """설정 저장소 스냅샷 (사이드바 섹션 + 하이라이트 규칙 + 플롯 추출기)"""
+        sections = self._sidebar.collect_configs()
+        sections[config_store.SECTION_HIGHLIGHT_RULES] = self._highlight_rules.rules()
+        sections[config_store.SECTION_PLOT_EXTRACTORS] = self._plot_store.patterns()
+        return sections
+
+    def _show_highlight_rules_dialog(self):
+        """하이라이트 규칙 편집 (확인 시 모든 터미널의 보이는 줄에 바로 반영)"""
+        self._finish_startup()
+        from highlight_dialog import HighlightRulesDialog
+        dialog = HighlightRulesDialog(self._highlight_rules.rules(), self, language=self._language)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self._highlight_rules.set_rules(dialog.rules())
+        self._config_store.mark_dirty()
+
+    def _show_command_palette(self):
+        """명령 팔레트 표시 (매크로 / 입력 히스토리 / 자동 명령)"""
+        self._finish_startup()
+        if self._command_palette is None:
+            from command_palette import CommandPalette, PaletteIndex
+            self._palette_index = PaletteIndex()
+            self._command_palette = CommandPalette(
+                self._palette_index, self, language=self._language
+            )
+            self._command_palette.entry_activated.connect(self._on_palette_entry_activated)
+        self._sync_palette_index()
+        self._command_palette.open_palette()
+
+    def _sync_palette_index(self):
+        """팔레트 색인을 현재 목록에 맞춤 (바뀐 항목만 색인 갱신)"""
+        from command_palette import SOURCE_HISTORY, SOURCE_MACRO, SOURCE_TASK
+        history = self._command_input.recent_history(self.PALETTE_HISTORY_LIMIT)
+        self._palette_index.replace_source(
+            SOURCE_HISTORY, [(command, command, "") for command in history]
+        )
+        self._palette_index.replace_source(
+            SOURCE_MACRO,
+            [
+                (f"{item['command']}\x00{item['description']}", item["command"], item["description"])
+                for item in self._sidebar.macro_commands()
+                if item["command"]
+            ],
+        )
+        self._palette_index.replace_source(
+            SOURCE_TASK,
+            [
+                (f"{index}\x00{name}", name, "")
+                for index, name in enumerate(self._sidebar.automation_task_names())
+            ],
+        )
+
+    def _on_history_search_prompt(self, prompt: str):
+        self._history_search_label.setText(prompt)
+        self._history_search_label.setVisible(bool(prompt))
+
+    def _on_palette_entry_activated(self, source: str, key: str, text: str):
+        from command_palette import SOURCE_TASK
+        if source == SOURCE_TASK:
+            self._sidebar.start_automation_task(int(key.split("\x00", 1)[0]))
+            return
+        self.send_serial_command(text, priority=SerialWriterThread.PRIORITY_HIGH)
+        self._command_input.add_to_history(text)
+
+    def _metrics_snapshot(self) -> dict:
+        snapshot = self._metrics.roll()
+        writer = self._serial.writer
+        snapshot["tx_pending"] = writer.pending_count if writer is not None else 0
+        snapshot["automation_timers"] = self._sidebar.pending_automation_timer_count()
+        return snapshot
+
+    # === RX 스트림 팬아웃 서버 ===
+
+    def _start_stream_server(self):
+        """STREAM_SERVER 설정 시 RX 팬아웃/TX 수집 서버 시작"""
+        server = StreamServer.from_env(tx_callback=self._serial.queue_write)
+        if server is None:
             return
-        
         try:
-            line = lines[0]
-            self._send_line_logic(line)
-            
-            remaining = lines[1:]
-            if remaining:
-                QTimer.singleShot(interval_ms, lambda: self._send_lines_delayed(remaining, interval_ms))
-            else:
-                self._update_byte_counts()
+            server.start()
+        except (OSError, ValueError) as e:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.stream_server_failed", address=server.address, error=str(e))
+            )
+            return
+        self._stream_server = server
+        self._terminal.append_system_message(
+            tr(self._language, "msg.stream_server_started", address=server.address)
+        )
+
+    # === XMODEM/YMODEM 전송 ===
+
+    def _select_modem_protocol(self) -> str | None:
+        """전송 프로토콜 선택 (취소 시 None)"""
+        from PyQt6.QtWidgets import QInputDialog
+        labels = ["XMODEM-1K", "YMODEM"]
+        label, ok = QInputDialog.getItem(
+            self, tr(self._language, "dialog.modem.title"),
+            tr(self._language, "dialog.modem.protocol"), labels, 0, False
+        )
+        if not ok:
+            return None
+        return PROTOCOL_YMODEM if label == "YMODEM" else PROTOCOL_XMODEM_1K
+
+    def _can_start_modem_transfer(self) -> bool:
+        if not self._serial.is_connected():
+            self._terminal.append_system_message(tr(self._language, "msg.port_not_connected"))
+            return False
+        if self._modem_transfer is not None or self._file_sender is not None:
+            self._terminal.append_system_message(tr(self._language, "msg.file_send_busy"))
+            return False
+        return True
+
+    def _on_modem_send(self):
+        """XMODEM-1K/YMODEM 파일 송신 (펌웨어 업로드)"""
+        if not self._can_start_modem_transfer():
+            return
+        protocol = self._select_modem_protocol()
+        if protocol is None:
+            return
+        from PyQt6.QtWidgets import QFileDialog
+        path, _ = QFileDialog.getOpenFileName(
+            self, tr(self._language, "dialog.modem.title"), "",
+            "Firmware (*.bin *.hex *.img);;All Files (*)"
+        )
+        if path:
+            self.start_modem_transfer(ModemTransferThread.DIRECTION_SEND, protocol, path)
+
+    def _on_modem_receive(self):
+        """XMODEM-1K/YMODEM 파일 수신 (XMODEM: 저장 파일, YMODEM: 저장 폴더 선택)"""
+        if not self._can_start_modem_transfer():
+            return
+        protocol = self._select_modem_protocol()
+        if protocol is None:
+            return
+        from PyQt6.QtWidgets import QFileDialog
+        if protocol == PROTOCOL_YMODEM:
+            path = QFileDialog.getExistingDirectory(self, tr(self._language, "dialog.modem.title"))
+        else:
+            path, _ = QFileDialog.getSaveFileName(self, tr(self._language, "dialog.modem.title"))
+        if path:
+            self.start_modem_transfer(ModemTransferThread.DIRECTION_RECEIVE, protocol, path)
+
+    def start_modem_transfer(self, direction: str, protocol: str, path: str) -> bool:
+        """수신 라인 파이프라인을 일시 정지하고 XMODEM/YMODEM 전송 시작"""
+        try:
+            port = self._serial.acquire_raw_port()
         except Exception as e:
             self._terminal.append_system_message(
-                tr(self._language, "msg.send_error_delayed", error=str(e))
+                tr(self._language, "msg.modem_failed", path=path, error=str(e))
             )
+            return False
+
+        self._modem_transfer = ModemTransferThread(port, direction, protocol, path)
+        self._modem_transfer.progress.connect(self._on_modem_progress)
+        self._modem_transfer.finished_transfer.connect(self._on_modem_finished)
+        key = "msg.modem_send_start" if direction == ModemTransferThread.DIRECTION_SEND \
+            else "msg.modem_receive_start"
+        self._terminal.append_system_message(tr(self._language, key, path=path))
+        self._modem_transfer.start()
+        return True
+
+    def _on_modem_progress(self, done: int, total: int, rate: float):
+        """전송 진행률/처리량 표시"""
+        percent = done * 100 // total if total else 0
+        self._status_file.setText(
+            tr(
+                self._language,
+                "status.modem",
+                percent=percent,
+                size=self._format_bytes(done),
+                rate=self._format_bytes(int(rate)),
+            )
+        )
+
+    def _on_modem_finished(self, ok: bool, result: str, size: int, elapsed: float):
+        """전송 종료: 수신 스레드 재개 및 결과 요약"""
+        transfer = self._modem_transfer
+        self._modem_transfer = None
+        self._status_file.setText("")
+        self._serial.release_raw_port()
+        if transfer is not None:
+            if transfer.direction == ModemTransferThread.DIRECTION_SEND:
+                self._tx_bytes += size
+            else:
+                self._rx_bytes += size
+            self._update_byte_counts()
+        if ok:
+            summary = tr(
+                self._language,
+                "msg.modem_done",
+                path=result,
+                size=self._format_bytes(size),
+                elapsed=f"{elapsed:.1f}",
+                rate=self._format_bytes(int(size / elapsed) if elapsed > 0 else size),
+            )
+        else:
+            path = transfer.path if transfer is not None else ""
+            summary = tr(self._language, "msg.modem_failed", path=path, error=result)
+        self._terminal.append_system_message(summary)
+        if transfer is not None:
+            transfer.wait(1000)
+            transfer.deleteLater()
+
+    def _stop_modem_transfer(self):
+        """진행 중인 XMODEM/YMODEM 전송 중단 (연결 해제 시)"""
+        if self._modem_transfer is not None:
+            self._modem_transfer.cancel()
+            self._modem_transfer.wait(3000)
 
-    # === 로그 관리 ===
     # === 로그 관리 ===
 
     def _on_log_start_menu(self):
@@ -829,6 +1782,10 @@ class MainWindow(QMainWindow):
             self._terminal.append_system_message(
                 tr(self._language, "msg.log_start", path=file_path)
             )
+            if self._log.raw_file_path:
+                self._terminal.append_system_message(
+                    tr(self._language, "msg.log_raw_sidecar", path=self._log.raw_file_path)
+                )
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -864,6 +1821,11 @@ class MainWindow(QMainWindow):
     def _clear_terminal(self):
         """터미널 클리어"""
         self._terminal.clear_terminal()
+        self._rx_ring.clear()
+        if self._frame_table is not None:
+            self._frame_table.clear()
+        if self._hex_view is not None:
+            self._hex_view.refresh()
         self._terminal.append_system_message(tr(self._language, "msg.terminal_cleared"))
 
     def _update_byte_counts(self):
@@ -893,12 +1855,119 @@ class MainWindow(QMainWindow):
         QMessageBox.about(
             self,
             tr(self._language, "about.title"),
-            tr(self._language, "about.body", version=self.APP_VERSION),
+            tr(self._language, "about.body", version=self.APP_VERSION)
+            + tr(self._language, "about.startup", **self._startup_times()),
         )
 
+    @staticmethod
+    def _startup_times() -> dict:
+        """시작 시간 측정값 (ms 문자열, 미측정 시 "-")"""
+        def fmt(value):
+            return "-" if value is None else f"{value:,.0f}"
+        return {
+            "pre_python": fmt(startup_timing.pre_python_ms()),
+            "window_init": fmt(startup_timing.elapsed_ms("window_init")),
+            "first_paint": fmt(startup_timing.elapsed_ms("first_paint")),
+            "ready": fmt(startup_timing.elapsed_ms("startup_ready")),
+        }
+
+    def _on_save_stall_report(self):
+        """GUI 멈춤 보고서(텍스트 + 접힌 스택) 저장"""
+        if self._stall_detector is None:
+            self._terminal.append_system_message(tr(self._language, "msg.stall_detector_disabled"))
+            return
+        from PyQt6.QtWidgets import QFileDialog
+        default_name = datetime.now().strftime("lnxterm_stalls_%Y%m%d_%H%M%S.txt")
+        default_path = os.path.join(self._log_dir, default_name) if self._log_dir else default_name
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            tr(self._language, "dialog.stall_report.title"),
+            default_path,
+            "Text (*.txt)",
+        )
+        if not path:
+            return
+        try:
+            folded_path = self._stall_detector.save_report(path)
+        except OSError as e:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.stall_report_failed", path=path, error=e)
+            )
+            return
+        self._terminal.append_system_message(
+            tr(
+                self._language,
+                "msg.stall_report_saved",
+                path=path,
+                folded=folded_path,
+                stalls=self._stall_detector.stall_count,
+                samples=self._stall_detector.sample_count,
+            )
+        )
+
+    def _update_profile_action_text(self):
+        key = "action.profile_stop" if self._profiler.is_running else "action.profile_start"
+        self._profile_action.setText(tr(self._language, key))
+
+    def _toggle_profiling(self):
+        """프로파일 캡처 시작/중지 (중지 시 LOG_DIR에 .pstats + 요약 저장)"""
+        if self._profiler.is_running:
+            self._stop_profiling()
+            return
+        self._profiler.start("manual")
+        self._update_profile_action_text()
+        self._terminal.append_system_message(tr(self._language, "msg.profile_started"))
+
+    def _stop_profiling(self):
+        self._profile_until = ""
+        import tempfile
+        output_dir = self._log_dir or tempfile.gettempdir()
+        try:
+            result = self._profiler.stop(output_dir)
+        except OSError as e:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.profile_save_failed", path=output_dir, error=e)
+            )
+            return
+        finally:
+            self._update_profile_action_text()
+        self._terminal.append_system_message(
+            tr(
+                self._language,
+                "msg.profile_saved",
+                path=result["pstats_path"],
+                summary=result["summary_path"],
+                seconds=f"{result['duration_s']:.1f}",
+                calls=result["calls"],
+            )
+        )
+
+    def _on_export_latency_csv(self):
+        """자동 명령 트리거→송신 지연 히스토그램 CSV 내보내기"""
+        from PyQt6.QtWidgets import QFileDialog
+        default_name = datetime.now().strftime("lnxterm_latency_%Y%m%d_%H%M%S.csv")
+        default_path = os.path.join(self._log_dir, default_name) if self._log_dir else default_name
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            tr(self._language, "dialog.export_latency.title"),
+            default_path,
+            "CSV (*.csv)",
+        )
+        if not path:
+            return
+        if self._sidebar.export_automation_latency_csv(path):
+            self._terminal.append_system_message(
+                tr(self._language, "msg.latency_exported", path=path)
+            )
+        else:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.latency_export_failed", path=path)
+            )
+
     def _on_update_env_configs(self):
         """환경 변수 업데이트 실행"""
-        success = self._sidebar.save_configs_to_env(self._env_path)
+        self._finish_startup()
+        success = self._sidebar.save_configs()
         if success:
             self._terminal.append_system_message(tr(self._language, "msg.env_updated"))
             QMessageBox.information(
@@ -907,37 +1976,51 @@ class MainWindow(QMainWindow):
                 tr(self._language, "dialog.done.body"),
             )
         else:
-            mode = os.environ.get("AUTO_LOAD_MODE", "CONFIRM")
-            if mode == "IGNORE":
-                QMessageBox.warning(
-                    self,
-                    tr(self._language, "dialog.update_unavailable.title"),
-                    tr(self._language, "dialog.update_unavailable.body", mode=mode),
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    tr(self._language, "dialog.failed.title"),
-                    tr(self._language, "dialog.failed.body"),
-                )
+            # 설정은 AUTO_LOAD_MODE와 관계없이 lnxterm_config.json에 저장됨 (기록 실패 시에만 여기로 옴)
+            QMessageBox.warning(
+                self,
+                tr(self._language, "dialog.failed.title"),
+                tr(self._language, "dialog.failed.body", path=self._config_store.path),
+            )
+
+    def _on_config_save_failed(self, path: str, error: str):
+        self._terminal.append_system_message(
+            tr(self._language, "msg.config_save_failed", path=path, error=error)
+        )
 
     def closeEvent(self, event):
         """창 닫기 이벤트"""
         # 연결 해제
+        self._timeline_timer.stop()
+        if self._stall_detector is not None:
+            self._stall_detector.stop()
+        if self._profiler.is_running:
+            self._stop_profiling()
+        self._stop_replay()
+        self._serial.stop_raw_capture()
+        if self._stream_server is not None:
+            self._stream_server.stop()
+        for session in self._sessions:
+            session.shutdown()
+        # 포트를 닫기 전에 송신 스레드 종료 (실행 중인 QThread가 파괴되지 않도록)
+        self._stop_file_send()
+        self._stop_modem_transfer()
         if self._serial.is_connected():
             self._serial.disconnect()
         # 로그 종료
         if self._log.is_logging:
             self._log.stop_logging()
         
-        # 현재 설정 저장
-        self._save_runtime_env()
-        self._sidebar.save_configs_to_env(self._env_path)
+        # 현재 설정 저장 (.env 로드 전에 닫히면 저장할 변경 사항 없음)
+        if self._startup_finished:
+            self._save_runtime_env()
+            self._sidebar.save_configs()
             
         event.accept()
 
     def _save_runtime_env(self):
         """런타임 환경값 저장."""
+        from dotenv import set_key
         set_key(self._env_path, self.ENV_RECONNECT_INTERVAL_MS, str(self._reconnect_interval_ms))
         os.environ[self.ENV_RECONNECT_INTERVAL_MS] = str(self._reconnect_interval_ms)
         if self._log_dir:
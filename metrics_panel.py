@@ -0,0 +1,176 @@
+"""
+파이프라인 지표 패널
+- 1초마다 PipelineMetrics.roll() 결과를 표시 (창이 보일 때만 갱신)
+- 수신 속도, 청크 크기 분포, 시그널 큐 길이, 단계별 처리 시간, 송신 큐/자동 명령 대기 타이머
+"""
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QDialog, QGridLayout, QHBoxLayout, QLabel, QPushButton, QVBoxLayout,
+)
+
+from i18n import normalize_language, tr
+from pipeline_metrics import CHUNK_SIZE_BUCKETS, PipelineMetrics, STAGES
+from styles import COLORS
+
+
+class MetricsPanel(QDialog):
+    """모델리스 파이프라인 지표 창
+
+    snapshot_provider: PipelineMetrics.roll() 결과에 "tx_pending", "automation_timers"를
+    더한 dict를 반환하는 함수
+    """
+
+    REFRESH_INTERVAL_MS = 1000
+    HISTOGRAM_BAR_WIDTH = 24
+
+    def __init__(self, snapshot_provider, reset_callback=None, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._snapshot_provider = snapshot_provider
+        self._reset_callback = reset_callback
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._setup_ui()
+        self._apply_language()
+
+    def _setup_ui(self):
+        self.resize(520, 520)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+            }}
+            QLabel {{
+                color: {COLORS['text_primary']};
+            }}
+        """)
+        mono = QFont("JetBrains Mono", 10)
+        mono.setStyleHint(QFont.StyleHint.Monospace)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(12)
+        self._name_labels = {}
+        self._value_labels = {}
+        rows = ("rx_rate", "queue", "tx_pending", "automation_timers") + STAGES
+        for row, key in enumerate(rows):
+            name_label = QLabel()
+            name_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            value_label = QLabel("-")
+            value_label.setFont(mono)
+            grid.addWidget(name_label, row, 0)
+            grid.addWidget(value_label, row, 1)
+            self._name_labels[key] = name_label
+            self._value_labels[key] = value_label
+        grid.setColumnStretch(1, 1)
+        layout.addLayout(grid)
+
+        self._chunk_title = QLabel()
+        self._chunk_title.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        layout.addWidget(self._chunk_title)
+        self._chunk_histogram = QLabel("-")
+        self._chunk_histogram.setFont(mono)
+        layout.addWidget(self._chunk_histogram, 1)
+
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        self._reset_btn = QPushButton()
+        self._reset_btn.clicked.connect(self._on_reset)
+        button_row.addWidget(self._reset_btn)
+        self._close_btn = QPushButton()
+        self._close_btn.clicked.connect(self.close)
+        button_row.addWidget(self._close_btn)
+        layout.addLayout(button_row)
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self._apply_language()
+
+    def _apply_language(self):
+        self.setWindowTitle(tr(self._language, "metrics.title"))
+        for key, label in self._name_labels.items():
+            label.setText(tr(self._language, f"metrics.row.{key}"))
+        self._chunk_title.setText(tr(self._language, "metrics.chunk_sizes"))
+        self._reset_btn.setText(tr(self._language, "metrics.button.reset"))
+        self._close_btn.setText(tr(self._language, "metrics.button.close"))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def _on_reset(self):
+        if self._reset_callback is not None:
+            self._reset_callback()
+        self.refresh()
+
+    def refresh(self):
+        snapshot = self._snapshot_provider()
+
+        self._value_labels["rx_rate"].setText(
+            tr(
+                self._language,
+                "metrics.value.rx_rate",
+                bytes=self._format_bytes(int(snapshot["rx_bytes_per_s"])),
+                lines=f"{snapshot['rx_lines_per_s']:,.0f}",
+            )
+        )
+        self._value_labels["queue"].setText(
+            tr(
+                self._language,
+                "metrics.value.queue",
+                depth=snapshot["queue_depth"],
+                max=snapshot["max_queue_depth"],
+            )
+        )
+        self._value_labels["tx_pending"].setText(str(snapshot.get("tx_pending", 0)))
+        self._value_labels["automation_timers"].setText(str(snapshot.get("automation_timers", 0)))
+        for stage in STAGES:
+            stats = snapshot["stages"][stage]
+            if not stats["count"]:
+                self._value_labels[stage].setText("-")
+                continue
+            self._value_labels[stage].setText(
+                tr(
+                    self._language,
+                    "metrics.value.stage",
+                    rate=f"{stats['count'] / snapshot['interval_s']:,.0f}",
+                    p50=f"{stats['p50_us']:,.0f}",
+                    p99=f"{stats['p99_us']:,.0f}",
+                    max=f"{stats['max_us']:,.0f}",
+                )
+            )
+        self._chunk_histogram.setText(self._format_chunk_histogram(snapshot["chunk_sizes"]))
+
+    @staticmethod
+    def _format_bytes(count: int) -> str:
+        if count < 1024:
+            return f"{count} B"
+        if count < 1024 * 1024:
+            return f"{count / 1024:.1f} KB"
+        return f"{count / (1024 * 1024):.1f} MB"
+
+    def _format_chunk_histogram(self, buckets: list[int]) -> str:
+        total = sum(buckets)
+        if not total:
+            return "-"
+        peak = max(buckets)
+        rows = []
+        for index in range(CHUNK_SIZE_BUCKETS):
+            count = buckets[index]
+            if not count:
+                continue
+            bar = "█" * max(1, round(count / peak * self.HISTOGRAM_BAR_WIDTH))
+            label = PipelineMetrics.chunk_bucket_label(index)
+            rows.append(f"{label:>5}B {bar:<{self.HISTOGRAM_BAR_WIDTH}} {count / total * 100:5.1f}%")
+        return "\n".join(rows)
@@ -0,0 +1,99 @@
+"""
+파이프라인 지표 모듈
+- 단계별 경량 카운터: 수신 청크 → 시그널 큐 → 표시(렌더) → 통계/자동 명령 매칭 → 로그 기록
+- 각 단계는 누적 카운터/히스토그램만 갱신하고, 초당 값과 구간 분포는 roll() 호출 시 계산
+- 리더 스레드는 record_chunk()만 호출 (GIL 하의 정수 증가만 수행, 잠금 없음)
+"""
+
+import time
+
+from latency_histogram import LatencyHistogram
+
+STAGE_RENDER = "render"     # TerminalWidget.append_data (수신 청크 1개 = 1프레임)
+STAGE_MATCH = "match"       # 문자열 통계 + 자동 명령 트리거 검사
+STAGE_LOG = "log"           # LogManager.write_line (기록 + flush, 동기)
+STAGES = (STAGE_RENDER, STAGE_MATCH, STAGE_LOG)
+
+# 청크 크기 분포: 2의 거듭제곱 구간 (1B, 2~3B, 4~7B, ... 64KB 이상)
+CHUNK_SIZE_BUCKETS = 17
+
+
+class PipelineMetrics:
+    """수신 파이프라인 단계별 카운터"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        # 리더 스레드 측
+        self.rx_chunks = 0
+        self.rx_bytes = 0
+        self.chunk_sizes = [0] * CHUNK_SIZE_BUCKETS
+        # GUI 스레드 측
+        self.processed_chunks = 0
+        self.rx_lines = 0
+        self.max_queue_depth = 0
+        self._stages = {stage: LatencyHistogram() for stage in STAGES}
+        self._last_roll = {"at": time.monotonic(), "rx_bytes": 0, "rx_lines": 0}
+
+    # === 기록 ===
+
+    def record_chunk(self, size: int) -> None:
+        """리더 스레드가 청크 1개를 시그널로 보낼 때 호출"""
+        self.rx_chunks += 1
+        self.rx_bytes += size
+        self.chunk_sizes[min(CHUNK_SIZE_BUCKETS - 1, max(0, size.bit_length() - 1))] += 1
+
+    def record_chunk_processed(self, lines: int) -> None:
+        """GUI 스레드가 청크 1개 처리를 시작할 때 호출 (이 시점의 큐 길이 기록)"""
+        depth = self.rx_chunks - self.processed_chunks
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        self.processed_chunks += 1
+        self.rx_lines += lines
+
+    def record_stage(self, stage: str, elapsed_ns: int) -> None:
+        self._stages[stage].record(elapsed_ns)
+
+    @property
+    def queue_depth(self) -> int:
+        """리더가 보냈지만 GUI가 아직 처리하지 않은 청크 수"""
+        return max(0, self.rx_chunks - self.processed_chunks)
+
+    # === 집계 ===
+
+    @staticmethod
+    def chunk_bucket_label(index: int) -> str:
+        low = 1 << index
+        if index == CHUNK_SIZE_BUCKETS - 1:
+            return f"≥{low // 1024}K"
+        return f"{low // 1024}K" if low >= 1024 else f"{low}"
+
+    def roll(self) -> dict:
+        """직전 roll() 이후 구간 통계 반환 후 구간 카운터 초기화"""
+        now = time.monotonic()
+        elapsed = max(1e-6, now - self._last_roll["at"])
+        stages = {}
+        for stage, histogram in self._stages.items():
+            stages[stage] = {
+                "count": histogram.count,
+                "p50_us": histogram.percentile(50) / 1000,
+                "p99_us": histogram.percentile(99) / 1000,
+                "max_us": histogram.max / 1000,
+            }
+        snapshot = {
+            "interval_s": elapsed,
+            "rx_bytes_per_s": (self.rx_bytes - self._last_roll["rx_bytes"]) / elapsed,
+            "rx_lines_per_s": (self.rx_lines - self._last_roll["rx_lines"]) / elapsed,
+            "rx_bytes": self.rx_bytes,
+            "rx_lines": self.rx_lines,
+            "rx_chunks": self.rx_chunks,
+            "chunk_sizes": list(self.chunk_sizes),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "stages": stages,
+        }
+        self._last_roll = {"at": now, "rx_bytes": self.rx_bytes, "rx_lines": self.rx_lines}
+        self.max_queue_depth = self.queue_depth
+        self._stages = {stage: LatencyHistogram() for stage in STAGES}
+        return snapshot
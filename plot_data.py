@@ -0,0 +1,292 @@
+"""
+로그 라인 수치 추출 / 시계열 저장 (QtWidgets 미사용)
+- 추출기: 이름 있는 그룹을 가진 정규식 (예: temp=(?P<temp>-?\\d+(?:\\.\\d+)?)) → 그룹 이름별 시계열
+- 시계열은 미리 할당한 array('d') 링 버퍼에 (시각, 값)으로 저장 (샘플 추가 시 메모리 할당 없음)
+- 64개 샘플 블록마다 최소/최대를 함께 갱신 → 화면 폭(픽셀 열)에 맞춘 최소/최대 축약을
+  블록 단위로 계산해 100만 점도 그리기 비용이 픽셀 수에 비례
+"""
+
+import bisect
+import re
+from array import array
+
+BLOCK_SIZE = 64
+DIRECT_SAMPLES_PER_COLUMN = 8   # 열당 평균 샘플이 이 값 이하이면 블록 요약 없이 샘플을 직접 순회
+APPROX_BLOCKS = 8                # 한 열의 샘플이 이 블록 수 이상이면 블록 요약만으로 최소/최대 계산
+DEFAULT_CAPACITY = 1 << 20       # 시계열당 최대 샘플 수 (초과 시 오래된 샘플부터 덮어씀)
+MAX_SERIES = 16                  # 새 그룹 이름이 계속 생겨도 메모리가 무한히 늘지 않도록 제한
+
+DEFAULT_PLOT_EXTRACTORS = [
+    r"temp=(?P<temp>-?\d+(?:\.\d+)?)",
+    r"vbat=(?P<vbat>-?\d+(?:\.\d+)?)",
+]
+
+
+def _zeros(count: int) -> array:
+    return array("d", bytes(8 * count))
+
+
+class SeriesRing:
+    """(시각, 값) 링 버퍼 + 블록별 최소/최대 (위치는 누적 절대 인덱스)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        capacity = max(BLOCK_SIZE, capacity // BLOCK_SIZE * BLOCK_SIZE)
+        self._capacity = capacity
+        self._times = _zeros(capacity)
+        self._values = _zeros(capacity)
+        self._block_count = capacity // BLOCK_SIZE
+        self._block_min = _zeros(self._block_count)
+        self._block_max = _zeros(self._block_count)
+        self._count = 0
+
+    @property
+    def start(self) -> int:
+        return max(0, self._count - self._capacity)
+
+    @property
+    def end(self) -> int:
+        return self._count
+
+    def __len__(self) -> int:
+        return self._count - self.start
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        index = self._count
+        slot = index % self._capacity
+        self._times[slot] = timestamp
+        self._values[slot] = value
+        block = (index // BLOCK_SIZE) % self._block_count
+        if index % BLOCK_SIZE == 0:
+            self._block_min[block] = value
+            self._block_max[block] = value
+        elif value < self._block_min[block]:
+            self._block_min[block] = value
+        elif value > self._block_max[block]:
+            self._block_max[block] = value
+        self._count = index + 1
+
+    def last(self) -> tuple[float, float] | None:
+        if not self._count:
+            return None
+        slot = (self._count - 1) % self._capacity
+        return self._times[slot], self._values[slot]
+
+    def time_at(self, index: int) -> float:
+        return self._times[index % self._capacity]
+
+    def index_at_time(self, timestamp: float, low: int = None, high: int = None) -> int:
+        """[low, high) 중 시각이 timestamp 이상인 첫 절대 인덱스 (시각은 추가 순서대로 증가)
+
+        링 버퍼 배열을 복사하지 않고 경계 전/후 두 구간에서 C 수준 bisect
+        """
+        low = self.start if low is None else low
+        high = self._count if high is None else high
+        capacity = self._capacity
+        times = self._times
+        slot = low % capacity
+        if slot + (high - low) <= capacity or times[capacity - 1] >= timestamp:
+            return low + bisect.bisect_left(times, timestamp, slot, min(capacity, slot + high - low)) - slot
+        wrapped = low + capacity - slot
+        return wrapped + bisect.bisect_left(times, timestamp, 0, high - wrapped)
+
+    def min_max(self, first: int, last: int) -> tuple[float, float]:
+        """절대 인덱스 [first, last) 최소/최대 (last > first)
+
+        가운데 온전한 블록은 블록 요약 사용, 구간이 APPROX_BLOCKS 블록 이상이면 양 끝 일부 블록도
+        블록 요약으로 대신함 (최대 1블록씩 넓어지지만 픽셀 열 폭에 비해 무시할 수준)
+        """
+        if last - first >= APPROX_BLOCKS * BLOCK_SIZE:
+            first_block = max(first // BLOCK_SIZE, -(-self.start // BLOCK_SIZE))
+            last_block = -(-last // BLOCK_SIZE)
+            if last_block > self._count // BLOCK_SIZE:
+                last_block = self._count // BLOCK_SIZE   # 채우는 중인 마지막 블록은 원본으로
+                values = (
+                    self._ring_slice(self._block_min, self._block_count, first_block, last_block)
+                    + self._ring_slice(self._block_max, self._block_count, first_block, last_block)
+                    + self._ring_slice(self._values, self._capacity, last_block * BLOCK_SIZE, last)
+                )
+            else:
+                values = (
+                    self._ring_slice(self._block_min, self._block_count, first_block, last_block)
+                    + self._ring_slice(self._block_max, self._block_count, first_block, last_block)
+                )
+            return min(values), max(values)
+        head_end = min(last, -(-first // BLOCK_SIZE) * BLOCK_SIZE)
+        tail_start = max(head_end, last // BLOCK_SIZE * BLOCK_SIZE)
+        values = self._ring_slice(self._values, self._capacity, first, head_end)
+        if tail_start > head_end:
+            first_block = head_end // BLOCK_SIZE
+            last_block = tail_start // BLOCK_SIZE
+            values += self._ring_slice(self._block_min, self._block_count, first_block, last_block)
+            values += self._ring_slice(self._block_max, self._block_count, first_block, last_block)
+        if last > tail_start:
+            values += self._ring_slice(self._values, self._capacity, tail_start, last)
+        return min(values), max(values)
+
+    @staticmethod
+    def _ring_slice(data: array, size: int, first: int, last: int) -> array:
+        start = first % size
+        length = last - first
+        if start + length <= size:
+            return data[start:start + length]
+        return data[start:] + data[:start + length - size]
+
+    def _block_times(self, first_block: int, last_block: int) -> array:
+        """블록 [first_block, last_block)의 첫 샘플 시각 (용량이 블록 크기의 배수라 슬롯 = 블록 * BLOCK_SIZE)"""
+        start = first_block % self._block_count
+        length = last_block - first_block
+        if start + length <= self._block_count:
+            return self._times[start * BLOCK_SIZE:(start + length) * BLOCK_SIZE:BLOCK_SIZE]
+        return (
+            self._times[start * BLOCK_SIZE::BLOCK_SIZE]
+            + self._times[:(start + length - self._block_count) * BLOCK_SIZE:BLOCK_SIZE]
+        )
+
+    @staticmethod
+    def _accumulate(result: list, t0: float, span: float, columns: int,
+                    times, lows, highs) -> list:
+        """시각 순서 (시각, 최소, 최대)를 열별로 합쳐 result에 추가 (마지막 열이 같으면 병합)"""
+        if result:
+            current, low, high = result.pop()
+        else:
+            current, low, high = -1, 0.0, 0.0
+        for timestamp, item_low, item_high in zip(times, lows, highs):
+            column = min(columns - 1, int((timestamp - t0) / span))
+            if column != current:
+                if current >= 0:
+                    result.append((current, low, high))
+                current = column
+                low = item_low
+                high = item_high
+            else:
+                if item_low < low:
+                    low = item_low
+                if item_high > high:
+                    high = item_high
+        if current >= 0:
+            result.append((current, low, high))
+        return result
+
+    def decimate(self, t0: float, t1: float, columns: int) -> list[tuple[int, float, float]]:
+        """[t0, t1) 구간을 columns개 열로 나눈 열별 (열 번호, 최소, 최대) — 샘플 없는 열은 생략"""
+        if columns <= 0 or t1 <= t0 or not self._count:
+            return []
+        first = self.index_at_time(t0)
+        last = self.index_at_time(t1)
+        if last <= first:
+            return []
+        result = []
+        span = (t1 - t0) / columns
+        if last - first <= columns * DIRECT_SAMPLES_PER_COLUMN:
+            # 열당 샘플이 적으면 구간을 한 번 복사해 샘플 순서대로 열별 최소/최대 누적
+            times = self._ring_slice(self._times, self._capacity, first, last)
+            values = self._ring_slice(self._values, self._capacity, first, last)
+            return self._accumulate(result, t0, span, columns, times, values, values)
+        if last - first >= columns * BLOCK_SIZE:
+            # 열당 샘플이 한 블록 이상이면 블록 요약을 블록 첫 샘플 시각의 열에 누적
+            # (블록 폭이 열 폭 이하라 오차는 1열 미만), 앞뒤 일부 블록만 원본 샘플 사용
+            first_block = -(-first // BLOCK_SIZE)
+            last_block = last // BLOCK_SIZE
+            head = first_block * BLOCK_SIZE
+            tail = last_block * BLOCK_SIZE
+            if head > first:
+                times = self._ring_slice(self._times, self._capacity, first, head)
+                values = self._ring_slice(self._values, self._capacity, first, head)
+                self._accumulate(result, t0, span, columns, times, values, values)
+            self._accumulate(
+                result, t0, span, columns,
+                self._block_times(first_block, last_block),
+                self._ring_slice(self._block_min, self._block_count, first_block, last_block),
+                self._ring_slice(self._block_max, self._block_count, first_block, last_block),
+            )
+            if last > tail:
+                times = self._ring_slice(self._times, self._capacity, tail, last)
+                values = self._ring_slice(self._values, self._capacity, tail, last)
+                self._accumulate(result, t0, span, columns, times, values, values)
+            return result
+        index = first
+        for column in range(columns):
+            if column < columns - 1:
+                column_end = self.index_at_time(t0 + span * (column + 1), index, last)
+            else:
+                column_end = last
+            if column_end > index:
+                low, high = self.min_max(index, column_end)
+                result.append((column, low, high))
+                index = column_end
+        return result
+
+
+class PlotStore:
+    """추출기 목록 + 그룹 이름별 시계열"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._extractors: list[tuple[re.Pattern, list[str]]] = []
+        self._patterns: list[str] = []
+        self._series: dict[str, SeriesRing] = {}
+        self.sample_count = 0     # 변경 감지용 누적 샘플 수
+
+    @property
+    def has_extractors(self) -> bool:
+        return bool(self._extractors)
+
+    def patterns(self) -> list[str]:
+        return list(self._patterns)
+
+    def set_extractors(self, patterns: list[str]) -> list[tuple[str, str]]:
+        """추출기 교체 → [(패턴, 오류), ...] (오류/이름 있는 그룹 없는 패턴은 제외)"""
+        extractors = []
+        accepted = []
+        errors = []
+        for pattern in patterns:
+            pattern = str(pattern).strip()
+            if not pattern:
+                continue
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                errors.append((pattern, str(e)))
+                continue
+            names = list(compiled.groupindex)
+            if not names:
+                errors.append((pattern, "no named group"))
+                continue
+            extractors.append((compiled, names))
+            accepted.append(pattern)
+        self._extractors = extractors
+        self._patterns = accepted
+        return errors
+
+    def series(self) -> dict[str, SeriesRing]:
+        return self._series
+
+    def clear(self) -> None:
+        for ring in self._series.values():
+            ring.clear()
+        self.sample_count += 1
+
+    def process_line(self, line: str, timestamp: float) -> None:
+        for pattern, names in self._extractors:
+            match = pattern.search(line)
+            if match is None:
+                continue
+            for name in names:
+                text = match.group(name)
+                if text is None:
+                    continue
+                try:
+                    value = float(text)
+                except ValueError:
+                    continue
+                ring = self._series.get(name)
+                if ring is None:
+                    if len(self._series) >= MAX_SERIES:
+                        continue
+                    ring = SeriesRing(self._capacity)
+                    self._series[name] = ring
+                ring.append(timestamp, value)
+                self.sample_count += 1
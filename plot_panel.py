@@ -0,0 +1,336 @@
+"""
+수치 플롯 패널 (로그 라인에서 추출한 값의 실시간 그래프)
+- 추출기 정규식을 한 줄에 하나씩 편집 (이름 있는 그룹 = 시계열 이름)
+- 그래프는 시계열별 링 버퍼를 위젯 픽셀 폭에 맞춰 최소/최대 축약한 뒤 열마다 세로선으로 연결
+  → 샘플 수와 관계없이 그리기 비용이 폭에 비례
+- 창이 보일 때만 주기적으로 갱신: 샘플 수가 바뀌었거나 시간 창이 흐르는 중일 때만 다시 그리고,
+  긴 시간 창은 한 픽셀 열에 해당하는 시간이 지나야 다시 그림
+  (수신 경로에서는 신호를 보내지 않음)
+"""
+
+import time
+
+from PyQt6.QtCore import QPointF, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import (
+    QCheckBox, QComboBox, QDialog, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton,
+    QSplitter, QVBoxLayout, QWidget,
+)
+
+from i18n import normalize_language, tr
+from plot_data import PlotStore
+from styles import COLORS
+
+# 시간 창 (초, 0 = 전체)
+TIME_WINDOWS = (10, 60, 600, 3600, 0)
+SERIES_COLORS = (
+    COLORS["terminal_blue"], COLORS["terminal_green"], COLORS["terminal_yellow"],
+    COLORS["terminal_red"], COLORS["info"], "#C678DD", "#D19A66", COLORS["terminal_white"],
+)
+
+
+def _format_value(value: float) -> str:
+    return f"{value:.6g}"
+
+
+class PlotWidget(QWidget):
+    """PlotStore 시계열 그래프 (X: 수신 시각, Y: 보이는 구간 기준 자동 범위)"""
+
+    MARGIN_LEFT = 64
+    MARGIN_RIGHT = 12
+    MARGIN_TOP = 8
+    MARGIN_BOTTOM = 22
+    GRID_LINES = 4
+
+    def __init__(self, store: PlotStore, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._store = store
+        self._language = normalize_language(language)
+        self._window = TIME_WINDOWS[1]
+        self._frozen_end = None      # 일시정지 시 고정한 오른쪽 끝 시각
+        font = QFont("JetBrains Mono", 9)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        metrics = QFontMetrics(font)
+        self._line_height = metrics.lineSpacing()
+        self._ascent = metrics.ascent()
+        self._background = QColor(COLORS["bg_dark"])
+        self._grid_color = QColor(COLORS["bg_active"])
+        self._axis_color = QColor(COLORS["text_secondary"])
+        self.setMinimumSize(320, 180)
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self.update()
+
+    def set_window(self, seconds: int):
+        self._window = seconds
+        self.update()
+
+    def set_paused(self, paused: bool):
+        self._frozen_end = time.monotonic() if paused else None
+        self.update()
+
+    def _time_range(self) -> tuple[float, float]:
+        end = self._frozen_end if self._frozen_end is not None else time.monotonic()
+        if self._window:
+            return end - self._window, end
+        starts = [ring.time_at(ring.start) for ring in self._store.series().values() if len(ring)]
+        start = min(starts) if starts else end - TIME_WINDOWS[0]
+        return start, max(end, start + 1e-3)
+
+    def seconds_per_column(self) -> float:
+        t0, t1 = self._time_range()
+        return (t1 - t0) / max(1, self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._background)
+        left = self.MARGIN_LEFT
+        top = self.MARGIN_TOP
+        width = self.width() - left - self.MARGIN_RIGHT
+        height = self.height() - top - self.MARGIN_BOTTOM
+        if width <= 0 or height <= 0:
+            painter.end()
+            return
+
+        t0, t1 = self._time_range()
+        columns = []
+        low = high = None
+        for name, ring in self._store.series().items():
+            points = ring.decimate(t0, t1, width)
+            columns.append((name, ring, points))
+            if points:
+                series_low = min(point[1] for point in points)
+                series_high = max(point[2] for point in points)
+                low = series_low if low is None else min(low, series_low)
+                high = series_high if high is None else max(high, series_high)
+
+        if low is None:
+            painter.setPen(self._axis_color)
+            painter.drawText(
+                self.rect(), Qt.AlignmentFlag.AlignCenter, tr(self._language, "plot.empty")
+            )
+            painter.end()
+            return
+        if high - low < 1e-12:
+            low, high = low - 1.0, high + 1.0
+        pad = (high - low) * 0.05
+        low -= pad
+        high += pad
+        scale = height / (high - low)
+
+        # 격자 + 축 눈금
+        for step in range(self.GRID_LINES + 1):
+            y = top + height * step / self.GRID_LINES
+            painter.setPen(self._grid_color)
+            painter.drawLine(QPointF(left, y), QPointF(left + width, y))
+            painter.setPen(self._axis_color)
+            label = _format_value(high - (high - low) * step / self.GRID_LINES)
+            painter.drawText(4, int(y + self._ascent / 2), label)
+        baseline = top + height + self._ascent + 4
+        painter.drawText(left, baseline, f"-{t1 - t0:.0f}s")
+        painter.drawText(left + width - painter.fontMetrics().horizontalAdvance("0s"), baseline, "0s")
+
+        # 열마다 (최대 → 최소) 두 점을 이어 한 폴리라인으로 그림
+        legend_y = top + self._ascent
+        for index, (name, ring, points) in enumerate(columns):
+            color = QColor(SERIES_COLORS[index % len(SERIES_COLORS)])
+            if points:
+                polygon = QPolygonF()
+                bottom = top + height
+                for column, column_low, column_high in points:
+                    x = left + column + 0.5
+                    polygon.append(QPointF(x, bottom - (column_high - low) * scale))
+                    polygon.append(QPointF(x, bottom - (column_low - low) * scale))
+                painter.setPen(QPen(color, 1))
+                painter.drawPolyline(polygon)
+            latest = ring.last()
+            if latest is not None:
+                painter.setPen(color)
+                painter.drawText(left + 8, legend_y, f"{name} = {_format_value(latest[1])}")
+                legend_y += self._line_height
+        painter.end()
+
+
+class PlotPanel(QDialog):
+    """모델리스 플롯 창 (추출기 편집 + 그래프)
+
+    extractors_changed: 적용 후 추출기 목록이 바뀌면 발생 (설정 저장용)
+    """
+
+    extractors_changed = pyqtSignal()
+
+    REFRESH_INTERVAL_MS = 200
+
+    def __init__(self, store: PlotStore, parent=None, language: str = "ko"):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._store = store
+        self._seen_samples = -1
+        self._painted_at = 0.0
+        self._errors: list[tuple[str, str]] = []
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._setup_ui()
+        self._apply_language()
+
+    def _setup_ui(self):
+        self.resize(760, 520)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_dark']};
+                color: {COLORS['text_primary']};
+            }}
+            QLabel, QCheckBox {{
+                color: {COLORS['text_primary']};
+            }}
+            QPlainTextEdit {{
+                background-color: {COLORS['bg_input']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border']};
+            }}
+        """)
+        mono = QFont("JetBrains Mono", 10)
+        mono.setStyleHint(QFont.StyleHint.Monospace)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+
+        control_row = QHBoxLayout()
+        self._window_label = QLabel()
+        control_row.addWidget(self._window_label)
+        self._window_combo = QComboBox()
+        for seconds in TIME_WINDOWS:
+            self._window_combo.addItem("", seconds)
+        self._window_combo.setCurrentIndex(1)
+        self._window_combo.currentIndexChanged.connect(self._on_window_changed)
+        control_row.addWidget(self._window_combo)
+        self._pause_check = QCheckBox()
+        self._pause_check.toggled.connect(self._on_pause_toggled)
+        control_row.addWidget(self._pause_check)
+        control_row.addStretch()
+        self._clear_btn = QPushButton()
+        self._clear_btn.clicked.connect(self._on_clear)
+        control_row.addWidget(self._clear_btn)
+        layout.addLayout(control_row)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self._plot = PlotWidget(self._store, language=self._language)
+        splitter.addWidget(self._plot)
+
+        editor = QWidget()
+        editor_layout = QVBoxLayout(editor)
+        editor_layout.setContentsMargins(0, 0, 0, 0)
+        self._extractors_label = QLabel()
+        editor_layout.addWidget(self._extractors_label)
+        self._extractors_edit = QPlainTextEdit()
+        self._extractors_edit.setFont(mono)
+        self._extractors_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._extractors_edit.setPlainText("\n".join(self._store.patterns()))
+        editor_layout.addWidget(self._extractors_edit)
+        splitter.addWidget(editor)
+        splitter.setSizes([380, 120])
+        layout.addWidget(splitter, 1)
+
+        button_row = QHBoxLayout()
+        self._status_label = QLabel()
+        self._status_label.setWordWrap(True)
+        button_row.addWidget(self._status_label, 1)
+        self._apply_btn = QPushButton()
+        self._apply_btn.clicked.connect(self._on_apply)
+        button_row.addWidget(self._apply_btn)
+        self._close_btn = QPushButton()
+        self._close_btn.clicked.connect(self.close)
+        button_row.addWidget(self._close_btn)
+        layout.addLayout(button_row)
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self._plot.set_language(self._language)
+        self._apply_language()
+
+    def _apply_language(self):
+        self.setWindowTitle(tr(self._language, "plot.title"))
+        self._window_label.setText(tr(self._language, "plot.window"))
+        for index, seconds in enumerate(TIME_WINDOWS):
+            if not seconds:
+                text = tr(self._language, "plot.window.all")
+            elif seconds < 60:
+                text = tr(self._language, "plot.window.seconds", count=seconds)
+            elif seconds < 3600:
+                text = tr(self._language, "plot.window.minutes", count=seconds // 60)
+            else:
+                text = tr(self._language, "plot.window.hours", count=seconds // 3600)
+            self._window_combo.setItemText(index, text)
+        self._pause_check.setText(tr(self._language, "plot.pause"))
+        self._clear_btn.setText(tr(self._language, "plot.button.clear"))
+        self._extractors_label.setText(tr(self._language, "plot.extractors"))
+        self._apply_btn.setText(tr(self._language, "plot.button.apply"))
+        self._close_btn.setText(tr(self._language, "plot.button.close"))
+        self._update_status()
+
+    def _update_status(self):
+        if self._errors:
+            pattern, error = self._errors[0]
+            self._status_label.setStyleSheet(f"color: {COLORS['error']};")
+            self._status_label.setText(
+                tr(self._language, "plot.status.error", pattern=pattern, error=error)
+            )
+            return
+        series = self._store.series()
+        self._status_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        self._status_label.setText(
+            tr(
+                self._language,
+                "plot.status",
+                series=len(series),
+                samples=f"{sum(len(ring) for ring in series.values()):,}",
+            )
+        )
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._seen_samples = -1
+        self._painted_at = 0.0
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """샘플이 늘었거나 시간 창이 흘러가는 중이면 다시 그림"""
+        samples = self._store.sample_count
+        scrolling = bool(self._window_combo.currentData()) and not self._pause_check.isChecked()
+        if samples == self._seen_samples and not scrolling:
+            return
+        if samples != self._seen_samples:
+            self._seen_samples = samples
+            self._update_status()
+        now = time.monotonic()
+        if now - self._painted_at < self._plot.seconds_per_column():
+            return
+        self._painted_at = now
+        self._plot.update()
+
+    def _on_window_changed(self, index: int):
+        self._plot.set_window(self._window_combo.itemData(index))
+
+    def _on_pause_toggled(self, checked: bool):
+        self._plot.set_paused(checked)
+
+    def _on_clear(self):
+        self._store.clear()
+        self._painted_at = 0.0
+        self.refresh()
+
+    def _on_apply(self):
+        previous = self._store.patterns()
+        self._errors = self._store.set_extractors(self._extractors_edit.toPlainText().splitlines())
+        self._update_status()
+        if self._store.patterns() != previous:
+            self.extractors_changed.emit()
@@ -0,0 +1,131 @@
+"""
+프로파일 캡처 모듈
+- cProfile로 GUI 스레드(프로파일을 시작한 스레드)의 호출을 사용자가 지정한 구간 동안 기록
+- 중지 시 .pstats 파일과 상위 N개 함수 요약(.txt)을 저장 (snakeviz / python -m pstats로 분석)
+- PROFILE_STARTUP 환경변수로 시작 시점부터 프로파일 (MainWindow 생성, 첫 연결까지)
+- 리더/송신 스레드는 기록 대상이 아님 (수신 측 비용은 파이프라인 지표 창 참고)
+- 시작 시 항상 불러오므로 cProfile/pstats/dotenv는 실제 사용 시점에 import
+"""
+
+import os
+import time
+from datetime import datetime
+
+import env_config
+
+ENV_PROFILE_STARTUP = "PROFILE_STARTUP"
+ENV_PROFILE_TOP_N = "PROFILE_TOP_N"
+DEFAULT_PROFILE_TOP_N = 40
+
+# PROFILE_STARTUP 값
+STARTUP_INIT = "init"          # 창 생성 + 첫 화면 이후 지연 초기화 완료 시 중지
+STARTUP_CONNECT = "connect"    # 첫 연결 완료 시 중지 (1/true도 동일)
+
+
+def startup_mode() -> str:
+    """PROFILE_STARTUP 설정값 반환 ("", "init", "connect")
+
+    MainWindow가 .env를 불러오기 전에 호출되므로 프로세스 환경변수 → .env 순으로 확인
+    """
+    raw = os.environ.get(ENV_PROFILE_STARTUP)
+    if raw is None:
+        raw = _read_env_file_value(env_config.resolve_env_path(), ENV_PROFILE_STARTUP)
+    value = raw.strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return ""
+    if value == STARTUP_INIT:
+        return STARTUP_INIT
+    return STARTUP_CONNECT
+
+
+def _read_env_file_value(env_path: str, key: str) -> str:
+    try:
+        with open(env_path, encoding="utf-8") as fp:
+            if key not in fp.read():
+                return ""
+    except OSError:
+        return ""
+    from dotenv import dotenv_values
+    return dotenv_values(env_path).get(key) or ""
+
+
+def resolve_top_n() -> int:
+    raw = os.environ.get(ENV_PROFILE_TOP_N, "").strip()
+    try:
+        value = int(raw) if raw else DEFAULT_PROFILE_TOP_N
+    except ValueError:
+        return DEFAULT_PROFILE_TOP_N
+    return value if value > 0 else DEFAULT_PROFILE_TOP_N
+
+
+class ProfilerSession:
+    """시작/중지 가능한 cProfile 세션"""
+
+    def __init__(self, label: str = "manual"):
+        self.label = label
+        self._profile = None
+        self._started_at: datetime | None = None
+        self._started_monotonic = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._profile is not None
+
+    def start(self, label: str = "") -> None:
+        if self._profile is not None:
+            return
+        if label:
+            self.label = label
+        self._started_at = datetime.now()
+        self._started_monotonic = time.monotonic()
+        import cProfile
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self, output_dir: str) -> dict:
+        """기록 중지 후 결과 저장
+
+        반환: {"pstats_path", "summary_path", "duration_s", "calls"}
+        """
+        profile = self._profile
+        if profile is None:
+            raise RuntimeError("profiler is not running")
+        profile.disable()
+        self._profile = None
+        duration = time.monotonic() - self._started_monotonic
+
+        os.makedirs(output_dir, exist_ok=True)
+        base = os.path.join(
+            output_dir,
+            f"lnxterm_profile_{self.label}_{self._started_at:%Y%m%d_%H%M%S}",
+        )
+        pstats_path = base + ".pstats"
+        summary_path = base + ".txt"
+        profile.dump_stats(pstats_path)
+
+        import pstats
+        stats = pstats.Stats(profile)
+        with open(summary_path, "w", encoding="utf-8") as fp:
+            fp.write(self._build_summary(stats, duration, pstats_path))
+        return {
+            "pstats_path": pstats_path,
+            "summary_path": summary_path,
+            "duration_s": duration,
+            "calls": stats.total_calls,
+        }
+
+    def _build_summary(self, stats, duration: float, pstats_path: str) -> str:
+        import io
+        top_n = resolve_top_n()
+        buffer = io.StringIO()
+        buffer.write("LnxTerm profile summary\n")
+        buffer.write(f"label: {self.label}\n")
+        buffer.write(f"started: {self._started_at:%Y-%m-%d %H:%M:%S}\n")
+        buffer.write(f"duration: {duration:.3f} s, calls: {stats.total_calls}\n")
+        buffer.write(f"pstats: {pstats_path}\n")
+        stats.stream = buffer
+        stats.strip_dirs()
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            buffer.write(f"\n== top {top_n} by {title} ==\n")
+            stats.sort_stats(sort_key).print_stats(top_n)
+        return buffer.getvalue()
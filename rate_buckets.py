@@ -0,0 +1,109 @@
+"""
+문자열 통계 초당 히트 버킷 (QtWidgets 미사용)
+- 카운터마다 고정 크기 array('I') 링 버퍼에 초(epoch 초) 단위 히트 수 누적 → 히트당 비용은 배열 한 칸 증가
+- 시간이 흐른 만큼 지나간 칸만 0으로 비움 (히트가 없으면 다음 기록/조회 때 한 번에 처리)
+- 스파크라인용 최근 N초 값, 분당 히트 수(CSV) 모두 같은 버킷에서 계산
+"""
+
+from array import array
+
+DEFAULT_WINDOW_SECONDS = 24 * 3600   # 보관 기간 (초당 4바이트, 카운터당 약 340KB)
+SPARKLINE_SECONDS = 60
+
+
+def minute_start(second: float) -> int:
+    return int(second) // 60 * 60
+
+
+class RateBuckets:
+    """초 단위 히트 수 링 버퍼 (first: 집계 시작 초, last: 마지막으로 정리한 초)"""
+
+    def __init__(self, seconds: int = DEFAULT_WINDOW_SECONDS):
+        self._size = max(SPARKLINE_SECONDS, int(seconds))
+        self._counts = array("I", bytes(4 * self._size))
+        self._first: int | None = None
+        self._last = 0
+
+    @property
+    def started(self) -> bool:
+        return self._first is not None
+
+    def clear(self) -> None:
+        if self._first is not None:
+            self._counts = array("I", bytes(4 * self._size))
+        self._first = None
+        self._last = 0
+
+    def start(self, now: float) -> None:
+        """집계 시작 시각 기록 (이미 시작했으면 유지)"""
+        if self._first is None:
+            self._first = self._last = int(now)
+
+    def _advance(self, second: int) -> None:
+        """last+1 ~ second 칸을 0으로 비우고 last 이동"""
+        gap = second - self._last
+        if gap <= 0:
+            return
+        size = self._size
+        if gap >= size:
+            self._counts = array("I", bytes(4 * size))
+        else:
+            start = (self._last + 1) % size
+            end = start + gap
+            if end <= size:
+                self._counts[start:end] = array("I", bytes(4 * gap))
+            else:
+                self._counts[start:] = array("I", bytes(4 * (size - start)))
+                self._counts[:end - size] = array("I", bytes(4 * (end - size)))
+        self._last = second
+
+    def record(self, now: float) -> None:
+        second = int(now)
+        if self._first is None:
+            self._first = self._last = second
+        elif second > self._last:
+            self._advance(second)
+        elif second <= self._last - self._size:
+            return
+        self._counts[second % self._size] += 1
+
+    def count_between(self, start: int, end: int) -> int:
+        """[start, end) 초 구간 히트 합계 (보관 기간 밖/집계 시작 전은 0)"""
+        if self._first is None:
+            return 0
+        start = max(start, self._first, self._last - self._size + 1)
+        end = min(end, self._last + 1)
+        if end <= start:
+            return 0
+        size = self._size
+        first = start % size
+        length = end - start
+        if first + length <= size:
+            return sum(self._counts[first:first + length])
+        return sum(self._counts[first:]) + sum(self._counts[:first + length - size])
+
+    def recent(self, now: float, seconds: int = SPARKLINE_SECONDS) -> list[int]:
+        """now까지 최근 seconds초 값 (오래된 순)"""
+        second = int(now)
+        if self._first is None:
+            return [0] * seconds
+        self._advance(second)
+        seconds = min(seconds, self._size)
+        values = []
+        for offset in range(second - seconds + 1, second + 1):
+            if offset < self._first or offset > self._last:
+                values.append(0)
+            else:
+                values.append(self._counts[offset % self._size])
+        return values
+
+    def minute_totals(self, start: int, end: int) -> list[tuple[int, int]]:
+        """[start, end) 초 구간을 분 단위로 나눈 (분 시작 epoch 초, 히트 수) 목록 (집계 시작 전 분은 생략)"""
+        if self._first is None:
+            return []
+        rows = []
+        minute = minute_start(max(start, self._first))
+        while minute < end:
+            rows.append((minute, self.count_between(max(minute, start), min(minute + 60, end))))
+            minute += 60
+        return rows
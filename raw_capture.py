@@ -0,0 +1,149 @@
+"""
+Raw 바이트 캡처 / 재생 모듈
+- 캡처 파일: 헤더(MAGIC) + [수신 시각 monotonic ns(u64), 길이(u32), 데이터] 레코드 반복 (little-endian)
+- 수신 스레드가 read() 직후 청크 단위로 기록 (디코딩/라인 분리 이전의 원본)
+- 재생 스레드: 기록된 시간 간격을 1x / Nx / 최대 속도로 재현하여 수신 파이프라인에 공급
+"""
+
+import struct
+import threading
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+
+MAGIC = b"LNXRAW1\n"
+RECORD_HEADER = struct.Struct("<QI")
+FILE_EXTENSION = ".lnxraw"
+
+
+class RawCaptureWriter:
+    """raw 캡처 파일 기록기 (수신 스레드에서 호출, close와 경합 방지용 잠금)"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._chunks = 0
+        self._bytes = 0
+
+    def write_chunk(self, timestamp_ns: int, data: bytes) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(RECORD_HEADER.pack(timestamp_ns, len(data)))
+            self._file.write(data)
+            self._chunks += 1
+            self._bytes += len(data)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def chunk_count(self) -> int:
+        return self._chunks
+
+    @property
+    def byte_count(self) -> int:
+        return self._bytes
+
+
+def iter_raw_capture(path: str):
+    """캡처 파일의 (수신 시각 ns, 데이터) 레코드를 순서대로 반환"""
+    with open(path, "rb") as fp:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"raw 캡처 파일 형식이 아닙니다: {path}")
+        while True:
+            header = fp.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return  # 정상 종료 또는 기록 중 중단된 파일의 마지막 불완전 레코드
+            timestamp_ns, length = RECORD_HEADER.unpack(header)
+            data = fp.read(length)
+            if len(data) < length:
+                return
+            yield timestamp_ns, data
+
+
+class RawReplayThread(QThread):
+    """raw 캡처 파일 재생 스레드 (SerialReaderThread와 동일한 data_received 시그널)
+
+    speed: 1.0 = 실시간, N = N배속, 0 = 최대 속도
+    GUI 처리 속도를 넘지 않도록 처리 대기 중인 청크 수를 MAX_IN_FLIGHT로 제한하며,
+    수신 측은 청크 처리 후 chunk_processed()를 호출해야 한다.
+    """
+
+    data_received = pyqtSignal(bytes, object)  # (데이터, 재생 시각 monotonic ns)
+    progress = pyqtSignal(int, int)             # (재생 청크 수, 재생 바이트)
+    finished_replay = pyqtSignal(bool, int, int, float, str)  # (완료, 청크, 바이트, 경과초, 오류)
+
+    MAX_IN_FLIGHT = 64
+    PROGRESS_INTERVAL_S = 0.2
+
+    def __init__(self, path: str, speed: float = 1.0, parent=None):
+        super().__init__(parent)
+        self._path = path
+        self._speed = max(0.0, float(speed))
+        self._cancel_event = threading.Event()
+        self._credits = threading.Semaphore(self.MAX_IN_FLIGHT)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    def cancel(self):
+        self._cancel_event.set()
+        # 처리 대기 중인 청크 제한에 막혀 있으면 해제
+        for _ in range(self.MAX_IN_FLIGHT):
+            self._credits.release()
+
+    def chunk_processed(self):
+        """수신 측에서 청크 1개 처리 완료 통지"""
+        self._credits.release()
+
+    def run(self):
+        started_at = time.monotonic_ns()
+        first_ts = None
+        chunks = 0
+        total_bytes = 0
+        error = ""
+        last_progress = 0.0
+        try:
+            for timestamp_ns, data in iter_raw_capture(self._path):
+                if self._cancel_event.is_set():
+                    break
+                if first_ts is None:
+                    first_ts = timestamp_ns
+                if self._speed > 0:
+                    target = started_at + int((timestamp_ns - first_ts) / self._speed)
+                    wait_ns = target - time.monotonic_ns()
+                    if wait_ns > 0 and self._cancel_event.wait(wait_ns / 1_000_000_000):
+                        break
+                while not self._credits.acquire(timeout=0.1):
+                    if self._cancel_event.is_set():
+                        break
+                if self._cancel_event.is_set():
+                    break
+                self.data_received.emit(data, time.monotonic_ns())
+                chunks += 1
+                total_bytes += len(data)
+                now = time.monotonic()
+                if now - last_progress >= self.PROGRESS_INTERVAL_S:
+                    last_progress = now
+                    self.progress.emit(chunks, total_bytes)
+        except (OSError, ValueError) as e:
+            error = str(e)
+
+        elapsed = (time.monotonic_ns() - started_at) / 1_000_000_000
+        completed = not error and not self._cancel_event.is_set()
+        self.progress.emit(chunks, total_bytes)
+        self.finished_replay.emit(completed, chunks, total_bytes, elapsed, error)
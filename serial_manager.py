@@ -2,38 +2,72 @@
 시리얼 포트 관리 모듈
 - 포트 스캔, 연결/해제, 데이터 송수신
 - QThread 기반 비동기 수신
+- 시리얼 장치 외 입력 소스(pty/TCP/RFC2217/하위 프로세스/파일 tail)도 동일하게 처리 (input_sources)
 """
 
 import glob
+import itertools
+from collections import deque
 import subprocess
 import os
+import threading
+import time
 import serial
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
 
+import input_sources
+from raw_capture import RawCaptureWriter
+
 
 class SerialReaderThread(QThread):
     """시리얼 데이터 수신 스레드"""
-    data_received = pyqtSignal(bytes)
+    data_received = pyqtSignal(bytes, object)  # (데이터, 수신 시각 monotonic ns)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, serial_port: serial.Serial, parent=None):
+    READ_BUFFER_SIZE = 64 * 1024
+    POLL_INTERVAL_S = 0.01
+
+    def __init__(self, serial_port: serial.Serial, raw_sink=None, metrics=None, parent=None):
         super().__init__(parent)
         self._serial = serial_port
+        self._raw_sink = raw_sink  # (수신 시각 ns, 데이터) 원본 기록 콜백 (raw 캡처)
+        self._metrics = metrics    # PipelineMetrics (청크 수/크기 집계)
         self._running = False
         self._mutex = QMutex()
+        self._pause_requested = threading.Event()
+        self._paused = threading.Event()
 
     def run(self):
         self._running = True
+        # 공용 수신 버퍼: 포트/소스에서 직접 읽고 시그널 전달용으로 1회만 복사
+        buffer = bytearray(self.READ_BUFFER_SIZE)
+        view = memoryview(buffer)
         while self._running:
             try:
+                if self._pause_requested.is_set():
+                    # 일시 정지 중: 포트 읽기를 다른 소유자(파일 전송 등)에 양보
+                    self._paused.set()
+                    self.msleep(10)
+                    continue
+                self._paused.clear()
                 if self._serial and self._serial.is_open:
-                    if self._serial.in_waiting > 0:
-                        data = self._serial.read(self._serial.in_waiting)
-                        if data:
-                            self.data_received.emit(data)
+                    waiting = self._serial.in_waiting
+                    if waiting > 0:
+                        count = input_sources.read_into(
+                            self._serial, view[:min(waiting, len(view))]
+                        )
+                        if count:
+                            rx_ns = time.monotonic_ns()
+                            data = bytes(view[:count])
+                            raw_sink = self._raw_sink
+                            if raw_sink is not None:
+                                raw_sink(rx_ns, data)
+                            if self._metrics is not None:
+                                self._metrics.record_chunk(count)
+                            self.data_received.emit(data, rx_ns)
                     else:
-                        # 짧은 대기 (CPU 부하 방지)
-                        self.msleep(10)
+                        # 수신 대기 (fd 기반은 select로 즉시 깨어남, 일시 정지 확인 위해 짧게)
+                        input_sources.wait_readable(self._serial, self.POLL_INTERVAL_S)
                 else:
                     break
             except serial.SerialException as e:
@@ -43,11 +77,241 @@ class SerialReaderThread(QThread):
                 self.error_occurred.emit(f"예기치 않은 오류: {str(e)}")
                 break
 
+    def pause(self, timeout_s: float = 1.0) -> bool:
+        """수신 일시 정지 요청 후 실제로 읽기를 멈출 때까지 대기"""
+        self._pause_requested.set()
+        if not self.isRunning():
+            return True
+        return self._paused.wait(timeout_s)
+
+    def resume(self):
+        self._pause_requested.clear()
+
+    def set_raw_sink(self, raw_sink) -> None:
+        """raw 캡처 콜백 설정/해제 (None)"""
+        self._raw_sink = raw_sink
+
     def stop(self):
         self._running = False
         self.wait(2000)  # 최대 2초 대기
 
 
+class SerialWriterThread(QThread):
+    """시리얼 송신 스레드
+
+    - 배치(여러 줄 전송)별 라인 큐(용량 제한)로 송신 라인을 받아 배치 안에서는 순차 전송
+    - 라인 간 지연(페이싱)을 스레드 내부에서 처리하여 GUI 스레드 블로킹 방지
+    - 배치마다 다음 라인의 송신 가능 시각을 따로 두고, 송신 가능한 배치 중 우선순위가 가장 높은
+      (같으면 먼저 들어온) 배치의 라인을 보냄 → 지연/페이싱 중인 배치가 다른 배치를 막지 않음
+    - 배치(여러 줄 전송) 단위 진행률/완료 시그널, 큐 비우기(취소) 지원
+    """
+    line_written = pyqtSignal(object)        # 송신 완료 항목 dict
+    progress = pyqtSignal(int, int, int)     # (batch_id, 완료 라인 수, 전체 라인 수)
+    batch_finished = pyqtSignal(int, bool)   # (batch_id, 취소 여부)
+    error_occurred = pyqtSignal(str)
+
+    PRIORITY_HIGH = 0      # 대화형 입력, 자동 명령 트리거 응답
+    PRIORITY_NORMAL = 1    # 매크로, 자동 명령 세트
+    PRIORITY_BULK = 2      # 대량 전송
+    DEFAULT_MAX_QUEUE = 10_000
+
+    def __init__(self, write_func, max_queue: int = DEFAULT_MAX_QUEUE,
+                 cancel_write_func=None, parent=None):
+        super().__init__(parent)
+        self._write = write_func
+        self._cancel_write = cancel_write_func
+        self._max_queue = max(1, int(max_queue))
+        self._cond = threading.Condition()
+        # batch_id → {"priority", "seq", "items": deque, "ready_at": 직전 라인 송신(또는 추가) 시각}
+        self._batches: dict[int, dict] = {}
+        self._pending = 0
+        self._seq = itertools.count()
+        self._batch_ids = itertools.count(1)
+        self._held = False      # True면 큐는 유지하고 송신만 보류 (바이트 단위 전송 중)
+        self._in_write = False  # 큐에서 꺼낸 항목을 포트에 기록 중
+        self._running = False
+
+    def enqueue_lines(self, lines: list[str], interval_ms: int = 0,
+                      priority: int = PRIORITY_NORMAL, trace: dict = None,
+                      delay_before_ms: int = 0, delays_ms: list[int] = None) -> int | None:
+        """라인 목록을 하나의 배치로 큐에 추가
+
+        delays_ms: 라인별 선행 지연 (첫 줄은 추가 시각, 이후는 직전 라인 송신 기준).
+            지정하면 interval_ms / delay_before_ms 대신 사용
+
+        Returns:
+            batch_id, 큐 용량 초과(백프레셔) 시 None
+        """
+        if not lines:
+            return None
+        interval_s = max(0, int(interval_ms)) / 1000.0
+        entries = [
+            (
+                line,
+                (line + "\n").encode("utf-8"),
+                max(0, int(delays_ms[index])) / 1000.0 if delays_ms is not None
+                else interval_s if index > 0
+                else max(0, int(delay_before_ms)) / 1000.0,
+            )
+            for index, line in enumerate(lines)
+        ]
+        return self._add_batch(entries, priority, trace)
+
+    def enqueue_data(self, data: bytes, priority: int = PRIORITY_HIGH) -> int | None:
+        """바이트를 그대로(줄바꿈 추가 없이) 한 항목 배치로 큐에 추가 (스트림 서버 TX 등)
+
+        에코/로그용 text는 UTF-8 디코딩(잘못된 바이트 대체) 후 끝의 줄바꿈 제거
+        """
+        if not data:
+            return None
+        text = data.decode("utf-8", errors="replace").rstrip("\r\n")
+        return self._add_batch([(text, bytes(data), 0.0)], priority, None)
+
+    def _add_batch(self, entries: list[tuple[str, bytes, float]], priority: int, trace: dict | None) -> int | None:
+        """(text, data, 선행 지연 초) 목록을 하나의 배치로 추가. 큐 용량 초과 시 None"""
+        with self._cond:
+            if self._pending + len(entries) > self._max_queue:
+                return None
+            batch_id = next(self._batch_ids)
+            total = len(entries)
+            items = deque()
+            for index, (text, data, delay_s) in enumerate(entries):
+                items.append({
+                    "batch_id": batch_id,
+                    "index": index,
+                    "total": total,
+                    "text": text,
+                    "data": data,
+                    "delay_s": delay_s,
+                    "trace": trace if index == 0 else None,
+                })
+            self._batches[batch_id] = {
+                "priority": int(priority),
+                "seq": next(self._seq),
+                "items": items,
+                "ready_at": time.monotonic(),
+            }
+            self._pending += total
+            self._cond.notify()
+        return batch_id
+
+    def cancel(self, batch_id: int = None) -> int:
+        """대기 중인 송신 항목 제거 (batch_id 미지정 시 전체). 제거된 라인 수 반환"""
+        with self._cond:
+            if batch_id is None:
+                cancelled_batches = sorted(self._batches)
+            else:
+                cancelled_batches = [batch_id] if batch_id in self._batches else []
+            removed = 0
+            for cancelled in cancelled_batches:
+                removed += len(self._batches.pop(cancelled)["items"])
+            self._pending -= removed
+            self._cond.notify()
+        for cancelled in cancelled_batches:
+            self.batch_finished.emit(cancelled, True)
+        return removed
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return self._pending
+
+    def set_held(self, held: bool, timeout: float = 2.0) -> None:
+        """송신 보류/재개 (보류 중 추가된 라인은 재개 후 순서대로 송신)
+
+        보류 시에는 이미 꺼내 기록 중인 항목이 끝날 때까지 최대 timeout초 대기
+        """
+        with self._cond:
+            self._held = held
+            self._cond.notify_all()
+            if held:
+                self._cond.wait_for(lambda: not self._in_write, timeout)
+
+    def _next_item(self):
+        """송신 시점이 된 다음 항목 대기 후 반환 (중지 시 None)
+
+        배치 맨 앞 라인만 후보: 송신 가능한 배치 중 (우선순위, 추가 순서)가 가장 앞선 배치를 고르고,
+        없으면 가장 이른 송신 가능 시각까지 대기 (대기 중 새 항목/취소가 들어오면 다시 평가)
+        """
+        with self._cond:
+            while self._running:
+                if not self._batches or self._held:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                best = None
+                earliest = None
+                for batch in self._batches.values():
+                    due = batch["ready_at"] + batch["items"][0]["delay_s"]
+                    if due <= now:
+                        if best is None or (batch["priority"], batch["seq"]) < (best["priority"], best["seq"]):
+                            best = batch
+                    elif earliest is None or due < earliest:
+                        earliest = due
+                if best is None:
+                    self._cond.wait(earliest - now)
+                    continue
+                item = best["items"].popleft()
+                if not best["items"]:
+                    del self._batches[item["batch_id"]]
+                self._pending -= 1
+                self._in_write = True
+                return item
+        return None
+
+    def run(self):
+        self._running = True
+        while self._running:
+            item = self._next_item()
+            if item is None:
+                break
+            batch_id = item["batch_id"]
+            if item["trace"] is not None:
+                # 지연 타이머를 송신 스레드가 처리한 경우: 선행 지연이 끝나 송신을 시작한 시각
+                item["trace"].setdefault("send_ns", time.monotonic_ns())
+            try:
+                item["sent"] = self._write(item["data"])
+            except Exception as e:
+                self.error_occurred.emit(f"송신 오류: {str(e)}")
+                # 실패한 라인의 배치(마지막 라인이었어도)를 먼저 취소 완료 처리 후 나머지 배치 취소
+                with self._cond:
+                    self._in_write = False
+                    self._cond.notify_all()
+                    batch = self._batches.pop(batch_id, None)
+                    if batch is not None:
+                        self._pending -= len(batch["items"])
+                self.batch_finished.emit(batch_id, True)
+                self.cancel()
+                continue
+            item["write_ns"] = time.monotonic_ns()
+            if item["trace"] is not None:
+                item["trace"]["write_ns"] = item["write_ns"]
+
+            with self._cond:
+                self._in_write = False
+                self._cond.notify_all()
+                batch = self._batches.get(batch_id)
+                if batch is not None:
+                    batch["ready_at"] = time.monotonic()
+            self.line_written.emit(item)
+            done = item["index"] + 1
+            self.progress.emit(batch_id, done, item["total"])
+            if done >= item["total"]:
+                self.batch_finished.emit(batch_id, False)
+
+    def stop(self):
+        self.cancel()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._cancel_write is not None:
+            try:
+                self._cancel_write()
+            except Exception:
+                pass
+        self.wait(2000)  # 최대 2초 대기
+
+
 class SerialManager:
     """시리얼 포트 관리 클래스"""
 
@@ -75,14 +339,25 @@ class SerialManager:
         "1.5": serial.STOPBITS_ONE_POINT_FIVE,
         "2": serial.STOPBITS_TWO,
     }
+    # 흐름 제어: (rtscts, xonxoff)
+    FLOW_CONTROLS = {
+        "None": (False, False),
+        "RTS/CTS": (True, False),
+        "XON/XOFF": (False, True),
+    }
 
     def __init__(self):
         self._serial: serial.Serial | None = None
         self._reader_thread: SerialReaderThread | None = None
+        self._writer_thread: SerialWriterThread | None = None
+        self._write_lock = threading.Lock()
+        self._raw_capture: RawCaptureWriter | None = None
+        self._metrics = None
+        self._raw_session_active = False   # acquire_raw_port() ~ release_raw_port() 구간
 
     @staticmethod
     def scan_ports() -> list[dict]:
-        """사용 가능한 시리얼 포트 목록 반환"""
+        """사용 가능한 시리얼 포트 목록 반환 (INPUT_SOURCES 입력 소스 포함)"""
         ports = []
         # /dev/ttyACM* (ST-Link 등 USB CDC)
         for path in sorted(glob.glob("/dev/ttyACM*")):
@@ -98,6 +373,7 @@ class SerialManager:
                 ports.append({"path": path, "description": "Virtual (pts)"})
             except ValueError:
                 continue
+        ports.extend(input_sources.configured_sources())
         return ports
 
     @staticmethod
@@ -108,6 +384,8 @@ class SerialManager:
             list[dict]: [{"pid": 12345, "name": "minicom"}, ...]
         """
         processes = []
+        if input_sources.is_source_url(port):
+            return processes
         port_name = os.path.basename(port)
         
         # 1. Lockfile 확인 (/var/lock/LCK..ttyXXX)
@@ -170,11 +448,30 @@ class SerialManager:
         parity: str = serial.PARITY_NONE,
         stopbits: float = serial.STOPBITS_ONE,
         timeout: float = 0.1,
+        rtscts: bool = False,
+        xonxoff: bool = False,
     ) -> None:
-        """시리얼 포트 연결"""
+        """시리얼 포트 연결 (rtscts/xonxoff: 하드웨어/소프트웨어 흐름 제어)
+
+        port가 입력 소스 주소(pty:, socket://, rfc2217://, exec:, tail:)이면
+        해당 소스를 열고, 시리얼 설정은 RFC2217에만 적용된다.
+        """
         if self._serial and self._serial.is_open:
             self.disconnect()
 
+        if input_sources.is_source_url(port):
+            self._serial = input_sources.open_source(
+                port,
+                baudrate=baudrate,
+                timeout=timeout,
+                bytesize=databits,
+                parity=parity,
+                stopbits=stopbits,
+                rtscts=rtscts,
+                xonxoff=xonxoff,
+            )
+            return
+
         self._serial = serial.Serial(
             port=port,
             baudrate=baudrate,
@@ -182,11 +479,15 @@ class SerialManager:
             parity=parity,
             stopbits=stopbits,
             timeout=timeout,
+            rtscts=rtscts,
+            xonxoff=xonxoff,
             exclusive=True  # pyserial 3.0+ 지원: TIOCEXCL (배타적 접근)
         )
 
     def disconnect(self) -> None:
         """시리얼 포트 연결 해제"""
+        self._raw_session_active = False
+        self.stop_writing()
         self.stop_reading()
         if self._serial and self._serial.is_open:
             self._serial.close()
@@ -197,10 +498,64 @@ class SerialManager:
         return self._serial is not None and self._serial.is_open
 
     def write(self, data: bytes) -> int:
-        """데이터 송신"""
+        """데이터 송신 (GUI 스레드/파일 송신/스트림 서버 공용, 직렬화됨)
+
+        바이트 단위 전송(acquire_raw_port) 중에는 전송 데이터에 끼어들지 않도록 거부
+        """
+        if self._raw_session_active:
+            raise serial.SerialException("파일 전송(XMODEM/YMODEM) 중에는 송신할 수 없습니다.")
+        return self._write_port(data)
+
+    def queue_write(self, data: bytes) -> None:
+        """송신 스레드 큐에 바이트 추가 (아무 스레드에서 호출 가능, 블로킹 없음)
+
+        스트림 서버 클라이언트 입력용: 흐름 제어/느린 포트에 I/O 스레드가 묶이지 않고,
+        다른 송신과 같은 우선순위 큐를 거쳐 터미널 에코/로그에도 기록됨
+        """
+        if self._raw_session_active:
+            raise serial.SerialException("파일 전송(XMODEM/YMODEM) 중에는 송신할 수 없습니다.")
+        writer = self._writer_thread
+        if writer is None or not self.is_connected():
+            raise serial.SerialException("포트가 연결되지 않았습니다.")
+        if writer.enqueue_data(data) is None:
+            raise serial.SerialException("송신 큐가 가득 찼습니다.")
+
+    def _write_port(self, data: bytes) -> int:
+        """포트에 직접 기록 (송신 스레드/바이트 단위 전송 세션용, 직렬화됨)"""
+        serial_port = self._serial
+        if serial_port is None or not serial_port.is_open:
+            raise serial.SerialException("포트가 연결되지 않았습니다.")
+        with self._write_lock:
+            return serial_port.write(data)
+
+    def _cancel_pending_write(self) -> None:
+        """흐름 제어 등으로 블로킹된 write 해제 (지원 플랫폼 한정)"""
+        serial_port = self._serial
+        if serial_port is not None and hasattr(serial_port, "cancel_write"):
+            serial_port.cancel_write()
+
+    def start_writing(self) -> SerialWriterThread:
+        """비동기 송신 스레드 생성 (호출 측에서 시그널 연결 후 start)"""
         if not self.is_connected():
             raise serial.SerialException("포트가 연결되지 않았습니다.")
-        return self._serial.write(data)
+        if self._writer_thread and self._writer_thread.isRunning():
+            self.stop_writing()
+        self._writer_thread = SerialWriterThread(
+            self._write_port, cancel_write_func=self._cancel_pending_write
+        )
+        self._writer_thread.set_held(self._raw_session_active)
+        return self._writer_thread
+
+    def stop_writing(self) -> None:
+        """송신 스레드 중지 (대기 중인 송신 항목은 취소)"""
+        if self._writer_thread:
+            self._writer_thread.stop()
+            self._writer_thread = None
+
+    @property
+    def writer(self) -> SerialWriterThread | None:
+        """현재 송신 스레드"""
+        return self._writer_thread
 
     def start_reading(self) -> SerialReaderThread:
         """비동기 수신 스레드 시작"""
@@ -208,15 +563,71 @@ class SerialManager:
             raise serial.SerialException("포트가 연결되지 않았습니다.")
         if self._reader_thread and self._reader_thread.isRunning():
             self.stop_reading()
-        self._reader_thread = SerialReaderThread(self._serial)
+        raw_sink = self._raw_capture.write_chunk if self._raw_capture else None
+        self._reader_thread = SerialReaderThread(
+            self._serial, raw_sink=raw_sink, metrics=self._metrics
+        )
         return self._reader_thread
 
+    def set_metrics(self, metrics) -> None:
+        """수신 스레드 지표 집계 대상 설정 (다음 start_reading부터 적용)"""
+        self._metrics = metrics
+
     def stop_reading(self) -> None:
         """수신 스레드 중지"""
         if self._reader_thread:
             self._reader_thread.stop()
             self._reader_thread = None
 
+    def start_raw_capture(self, path: str) -> RawCaptureWriter:
+        """수신 원본 바이트 캡처 시작 (연결 전/후 모두 가능, 재연결 시 유지)"""
+        self.stop_raw_capture()
+        self._raw_capture = RawCaptureWriter(path)
+        if self._reader_thread:
+            self._reader_thread.set_raw_sink(self._raw_capture.write_chunk)
+        return self._raw_capture
+
+    def stop_raw_capture(self) -> RawCaptureWriter | None:
+        """raw 캡처 종료. 종료한 기록기 반환 (통계 표시용)"""
+        capture = self._raw_capture
+        self._raw_capture = None
+        if self._reader_thread:
+            self._reader_thread.set_raw_sink(None)
+        if capture is not None:
+            capture.close()
+        return capture
+
+    @property
+    def raw_capture(self) -> RawCaptureWriter | None:
+        return self._raw_capture
+
+    def acquire_raw_port(self) -> "RawPortSession":
+        """수신 스레드를 일시 정지하고 포트를 직접 읽고 쓰는 세션 반환
+
+        XMODEM/YMODEM 등 바이트 단위 프로토콜이 라인 파이프라인을 거치지 않고
+        포트를 점유할 때 사용한다. 사용 후 release_raw_port() 호출 필요.
+        """
+        if not self.is_connected():
+            raise serial.SerialException("포트가 연결되지 않았습니다.")
+        # 세션 동안 직접 송신(스트림 서버 TX 등)은 거부, 송신 큐(자동 명령/매크로)는 비우지 않고
+        # 보류만 함 → release_raw_port()에서 재개되어 보류된 라인을 순서대로 송신
+        self._raw_session_active = True
+        if self._writer_thread:
+            self._writer_thread.set_held(True)
+        if self._reader_thread and not self._reader_thread.pause():
+            self.release_raw_port()
+            raise serial.SerialException("수신 스레드를 일시 정지하지 못했습니다.")
+        self._serial.reset_input_buffer()
+        return RawPortSession(self._serial, self._write_port)
+
+    def release_raw_port(self) -> None:
+        """acquire_raw_port()로 점유한 포트를 수신 스레드/송신 큐에 반환"""
+        self._raw_session_active = False
+        if self._reader_thread:
+            self._reader_thread.resume()
+        if self._writer_thread:
+            self._writer_thread.set_held(False)
+
     @property
     def port_name(self) -> str:
         """현재 연결된 포트 이름"""
@@ -224,9 +635,29 @@ class SerialManager:
             return self._serial.port
         return ""
 
+    @property
+    def peer_path(self) -> str:
+        """pty 입력 소스의 상대편 경로 (그 외 빈 문자열)"""
+        return getattr(self._serial, "peer_path", "") if self._serial else ""
+
     @property
     def baudrate(self) -> int:
         """현재 baudrate"""
         if self._serial:
             return self._serial.baudrate
         return 0
+
+
+class RawPortSession:
+    """수신 스레드가 일시 정지된 동안 포트를 직접 사용하는 read/write 래퍼"""
+
+    def __init__(self, serial_port: serial.Serial, write_func):
+        self._serial = serial_port
+        self._write = write_func
+
+    def read(self, size: int = 1) -> bytes:
+        """최대 size 바이트 읽기 (포트 timeout 만큼 대기)"""
+        return self._serial.read(size)
+
+    def write(self, data) -> int:
+        return self._write(data)
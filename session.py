@@ -0,0 +1,305 @@
+"""
+추가 포트 세션 모듈
+- 메인 창과 별도로 포트 1개를 담당 (자체 SerialManager, 수신/송신 스레드, 로그, 카운터)
+- 완성된 수신/송신 라인을 수신 시각과 함께 통합 타임라인으로 전달
+- 세션별 바이너리 프레임 디코더 선택 (프레임은 세션 로그 + 프레임 탭으로 전달)
+"""
+
+import os
+import time
+from datetime import datetime
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton, QLabel, QLineEdit, QFrame
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from serial_manager import SerialManager, SerialWriterThread
+from log_manager import LogManager, raw_sidecar_from_env
+import frame_decoder
+from frame_table import decoder_label
+from terminal_widget import TerminalWidget
+from i18n import normalize_language, tr
+from styles import COLORS, get_command_input_stylesheet
+
+
+class SessionWidget(QWidget):
+    """추가 포트 세션 탭 (연결 바 + 터미널 + 명령 입력)"""
+
+    lines_received = pyqtSignal(str, object, list, str)  # (포트, 수신 시각 ns, [라인], 방향)
+    title_changed = pyqtSignal(str)
+    frames_received = pyqtSignal(str, str, list)  # (포트, 타임스탬프, [Frame])
+
+    def __init__(self, log_dir: str = "", language: str = "ko", parent=None):
+        super().__init__(parent)
+        self._language = normalize_language(language)
+        self._log_dir = log_dir
+        self._serial = SerialManager()
+        self._log = LogManager()
+        self._log.raw_sidecar = raw_sidecar_from_env()
+        self._frame_decoder: frame_decoder.FrameDecoder | None = None
+        self._counters = {"rx_bytes": 0, "tx_bytes": 0, "rx_lines": 0, "tx_lines": 0}
+        self._setup_ui()
+        self.refresh_ports()
+        self._apply_language()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        # 1. 연결 바
+        bar = QFrame()
+        bar.setStyleSheet(
+            f"background-color: {COLORS['bg_sidebar']}; border-bottom: 1px solid {COLORS['border']};"
+        )
+        bar_layout = QHBoxLayout(bar)
+        bar_layout.setContentsMargins(8, 4, 8, 4)
+        bar_layout.setSpacing(6)
+
+        self._port_combo = QComboBox()
+        self._port_combo.setEditable(True)
+        self._port_combo.setMinimumWidth(220)
+        bar_layout.addWidget(self._port_combo, 1)
+
+        self._refresh_btn = QPushButton("⟳")
+        self._refresh_btn.setFixedWidth(32)
+        self._refresh_btn.clicked.connect(self.refresh_ports)
+        bar_layout.addWidget(self._refresh_btn)
+
+        self._baud_combo = QComboBox()
+        for rate in SerialManager.BAUDRATES:
+            self._baud_combo.addItem(str(rate), rate)
+        idx = self._baud_combo.findData(SerialManager.DEFAULT_BAUDRATE)
+        if idx >= 0:
+            self._baud_combo.setCurrentIndex(idx)
+        bar_layout.addWidget(self._baud_combo)
+
+        self._connect_btn = QPushButton()
+        self._connect_btn.clicked.connect(self._on_connect_clicked)
+        bar_layout.addWidget(self._connect_btn)
+
+        self._frame_label = QLabel()
+        self._frame_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        bar_layout.addWidget(self._frame_label)
+        self._frame_combo = QComboBox()
+        for name in [""] + frame_decoder.decoder_names():
+            self._frame_combo.addItem("", name)
+        self._frame_combo.currentIndexChanged.connect(self._on_frame_decoder_changed)
+        bar_layout.addWidget(self._frame_combo)
+
+        self._counter_label = QLabel("")
+        self._counter_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        bar_layout.addWidget(self._counter_label)
+        layout.addWidget(bar)
+
+        # 2. 터미널
+        self._terminal = TerminalWidget()
+        layout.addWidget(self._terminal, 1)
+
+        # 3. 명령 입력
+        input_frame = QFrame()
+        input_frame.setStyleSheet(
+            f"background-color: {COLORS['bg_sidebar']}; border-top: 1px solid {COLORS['border']};"
+        )
+        input_layout = QHBoxLayout(input_frame)
+        input_layout.setContentsMargins(8, 4, 8, 4)
+        self._command_input = QLineEdit()
+        self._command_input.setStyleSheet(get_command_input_stylesheet())
+        self._command_input.returnPressed.connect(self._send_command)
+        input_layout.addWidget(self._command_input, 1)
+        self._send_btn = QPushButton()
+        self._send_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._send_btn.clicked.connect(self._send_command)
+        input_layout.addWidget(self._send_btn)
+        layout.addWidget(input_frame)
+
+        self._update_counter_label()
+
+    def set_language(self, language: str):
+        self._language = normalize_language(language)
+        self._apply_language()
+
+    def _apply_language(self):
+        key = "session.button.disconnect" if self.is_connected() else "session.button.connect"
+        self._connect_btn.setText(tr(self._language, key))
+        self._send_btn.setText(tr(self._language, "button.send"))
+        self._frame_label.setText(tr(self._language, "session.label.frame_decoder"))
+        for index in range(self._frame_combo.count()):
+            self._frame_combo.setItemText(
+                index, decoder_label(self._language, self._frame_combo.itemData(index))
+            )
+        self._command_input.setPlaceholderText(tr(self._language, "session.placeholder.command"))
+
+    def set_highlight_rules(self, rule_set):
+        self._terminal.set_highlight_rules(rule_set)
+
+    def set_log_dir(self, log_dir: str):
+        self._log_dir = log_dir
+
+    # === 상태 ===
+
+    def is_connected(self) -> bool:
+        return self._serial.is_connected()
+
+    @property
+    def port_name(self) -> str:
+        return self._serial.port_name
+
+    @property
+    def counters(self) -> dict:
+        return dict(self._counters)
+
+    @property
+    def log_path(self) -> str:
+        return self._log.file_path if self._log.is_logging else ""
+
+    def title(self) -> str:
+        """탭 제목 (연결 포트 이름 또는 기본 문구)"""
+        if self.is_connected():
+            return os.path.basename(self.port_name)
+        return tr(self._language, "session.tab.new")
+
+    def refresh_ports(self):
+        current = self._port_combo.currentText()
+        self._port_combo.clear()
+        for port_info in SerialManager.scan_ports():
+            self._port_combo.addItem(port_info["path"], port_info["path"])
+        if current:
+            self._port_combo.setEditText(current)
+
+    # === 연결 ===
+
+    def _on_connect_clicked(self):
+        if self.is_connected():
+            self.disconnect_port()
+        else:
+            port = self._port_combo.currentText().strip()
+            if port:
+                self.connect_port(port, self._baud_combo.currentData())
+
+    def connect_port(self, port: str, baudrate: int = SerialManager.DEFAULT_BAUDRATE) -> bool:
+        """포트 연결 및 수신/송신 스레드, 로그 시작"""
+        try:
+            self._serial.connect(port=port, baudrate=baudrate)
+            reader = self._serial.start_reading()
+            reader.data_received.connect(self._on_data_received)
+            reader.error_occurred.connect(self._on_serial_error)
+            reader.start()
+            writer = self._serial.start_writing()
+            writer.line_written.connect(self._on_line_written)
+            writer.error_occurred.connect(self._on_serial_error)
+            writer.start()
+        except Exception as e:
+            self._serial.disconnect()
+            self._terminal.append_system_message(
+                tr(self._language, "msg.connect_failed", error=str(e))
+            )
+            return False
+
+        for key in self._counters:
+            self._counters[key] = 0
+        self._update_counter_label()
+        self._start_logging()
+        self._terminal.append_system_message(
+            tr(self._language, "msg.connected", port=port, baudrate=baudrate)
+        )
+        self._port_combo.setEnabled(False)
+        self._baud_combo.setEnabled(False)
+        self._apply_language()
+        self.title_changed.emit(self.title())
+        return True
+
+    def disconnect_port(self):
+        """포트 연결 해제 및 로그 종료"""
+        port = self.port_name
+        was_connected = self.is_connected()
+        self._serial.disconnect()
+        if self._log.is_logging:
+            self._log.stop_logging()
+        if was_connected:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.disconnected", port=port)
+            )
+        self._port_combo.setEnabled(True)
+        self._baud_combo.setEnabled(True)
+        self._apply_language()
+        self.title_changed.emit(self.title())
+
+    def _start_logging(self):
+        """세션 전용 로그 파일 생성: lnxterm_<포트>_YYYYMMDD_HHMMSS.log"""
+        if not self._log_dir:
+            return
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        port = os.path.basename(self.port_name) or "port"
+        path = os.path.join(self._log_dir, f"lnxterm_{port}_{timestamp}.log")
+        try:
+            self._log.start_logging(path)
+        except OSError as e:
+            self._terminal.append_system_message(
+                tr(self._language, "msg.error_prefix", error=str(e))
+            )
+            return
+        self._terminal.append_system_message(tr(self._language, "msg.log_start", path=path))
+
+    def _on_serial_error(self, error_msg: str):
+        self._terminal.append_system_message(
+            tr(self._language, "msg.error_prefix", error=error_msg)
+        )
+        self.disconnect_port()
+
+    # === 송수신 ===
+
+    def _on_data_received(self, data: bytes, rx_ns: int = None):
+        if rx_ns is None:
+            rx_ns = time.monotonic_ns()
+        self._counters["rx_bytes"] += len(data)
+        self._log.write_raw(data)
+        if self._frame_decoder is not None:
+            data, frames = self._frame_decoder.split(data)
+            if frames:
+                timestamp = self._log.get_timestamp()
+                for frame in frames:
+                    self._log.write_line(f"[FRAME] {frame.summary()}", timestamp)
+                self.frames_received.emit(self.port_name, timestamp, frames)
+        text = data.decode("utf-8", errors="replace")
+        completed_lines = self._terminal.append_data(text, direction="rx")
+        if completed_lines:
+            self._counters["rx_lines"] += len(completed_lines)
+            for timestamp, line in completed_lines:
+                self._log.write_line(line, timestamp)
+            self.lines_received.emit(
+                self.title(), rx_ns, [line for _ts, line in completed_lines], "rx"
+            )
+        self._update_counter_label()
+
+    def _on_frame_decoder_changed(self, index: int):
+        self._frame_decoder = frame_decoder.create_decoder(self._frame_combo.itemData(index))
+
+    def _send_command(self):
+        if not self.is_connected():
+            self._terminal.append_system_message(
+                tr(self._language, "msg.port_not_connected")
+            )
+            return
+        command = self._command_input.text()
+        self._serial.writer.enqueue_lines([command], priority=SerialWriterThread.PRIORITY_HIGH)
+        self._command_input.clear()
+
+    def _on_line_written(self, item: dict):
+        self._counters["tx_bytes"] += item.get("sent") or len(item["data"])
+        self._counters["tx_lines"] += 1
+        for timestamp, line in self._terminal.append_data(item["text"] + "\n", direction="tx"):
+            self._log.write_line(f"[TX] {line}", timestamp)
+        self.lines_received.emit(self.title(), item["write_ns"], [item["text"]], "tx")
+        self._update_counter_label()
+
+    def _update_counter_label(self):
+        self._counter_label.setText(
+            f"RX {self._counters['rx_bytes']} B / {self._counters['rx_lines']} L   "
+            f"TX {self._counters['tx_bytes']} B / {self._counters['tx_lines']} L"
+        )
+
+    def shutdown(self):
+        """탭 닫기/앱 종료 시 정리"""
+        if self.is_connected() or self._log.is_logging:
+            self.disconnect_port()
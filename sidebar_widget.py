@@ -3,10 +3,9 @@
 """
 
 import csv
-import json
 import serial.tools.list_ports
 import os
-import re
+import time
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
@@ -20,8 +19,11 @@ from PyQt6.QtGui import QIntValidator, QPainter, QPixmap, QIcon, QColor, QFont,
 
 from serial_manager import SerialManager
 from styles import COLORS
-from automation_dialog import AutomationDialog
-from macro_dialog import MacroDialog
+from latency_histogram import TaskLatencyStats
+from rate_buckets import RateBuckets, minute_start
+from sparkline import SparklineWidget
+import line_pipeline
+import config_store
 from i18n import normalize_language, tr
 
 
@@ -30,11 +32,11 @@ class SidebarWidget(QFrame):
 
     MAX_LOG_COUNTERS = 10
     MAX_AUTO_TASKS = 10
-    MAX_MACRO_COMMANDS = 1000
+    MAX_MACRO_COMMANDS = 10000
     MAX_TASK_NAME_LENGTH = 40
     TASK_NAME_LINE_LENGTH = 20
-    MAX_SLEEP_DELAY_MS = 99_999_999
-    SLEEP_COMMAND_PATTERN = re.compile(r"^sleep\s*\(\s*(\d+)\s*\)$", re.IGNORECASE)
+    MAX_SLEEP_DELAY_MS = line_pipeline.MAX_SLEEP_DELAY_MS
+    SLEEP_COMMAND_PATTERN = line_pipeline.SLEEP_COMMAND_PATTERN
 
     # 시그널
     connect_requested = pyqtSignal(dict)    # 연결 요청 (설정 딕셔너리)
@@ -42,6 +44,7 @@ class SidebarWidget(QFrame):
     log_stop_requested = pyqtSignal()       # 로그 중지
     clear_requested = pyqtSignal()          # 터미널 클리어
     send_command_requested = pyqtSignal(str, int) # 명령 전송 요청 (명령어, 간격ms)
+    send_traced_command_requested = pyqtSignal(str, object) # 지연 측정 명령 전송 (명령어, 트레이스)
 
     def __init__(self, parent=None, language: str = "ko"):
 # ... (rest of init same)
@@ -55,6 +58,7 @@ class SidebarWidget(QFrame):
         self._is_logging = False
         self._log_counters = []
         self._stats_csv_path = ""
+        self._stats_csv_written_until = 0   # 통계 CSV에 기록한 마지막 분 경계 (epoch 초)
         self._last_log_started_at = ""
         
         # 자동화 관련 상태
@@ -62,11 +66,17 @@ class SidebarWidget(QFrame):
         # { "name": str, "pre_cmd": str, "trigger": str, "post_cmd": str, 
         #   "delay": int, "cmd_interval": int, "enabled": bool, "running": bool }
         self._automation_tasks = [] 
+        self._auto_name_buttons = []
         self._macro_commands = []
         self._macro_dialog = None
-        self._env_path = ""
+        self._config_store = None
         self._loading_env = False
 
+        # 카운터 스파크라인 갱신 + 분 경계마다 통계 CSV 기록 (카운터 행 생성 후 시작)
+        self._rate_timer = QTimer(self)
+        self._rate_timer.setInterval(1000)
+        self._rate_timer.timeout.connect(self._on_rate_timer)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -236,13 +246,20 @@ class SidebarWidget(QFrame):
         self._stop_combo.setFixedHeight(32)
         self._stop_label = add_conn_row(4, "Stop:", self._stop_combo)
 
+        # Flow Control
+        self._flow_combo = QComboBox()
+        for label, value in SerialManager.FLOW_CONTROLS.items():
+            self._flow_combo.addItem(label, value)
+        self._flow_combo.setFixedHeight(32)
+        self._flow_label = add_conn_row(5, "Flow:", self._flow_combo)
+
         # 터미널 최대 라인 수
         self._max_lines_input = QLineEdit()
         self._max_lines_input.setPlaceholderText("1000000")
         self._max_lines_input.setText("1000000")
         self._max_lines_input.setFixedHeight(32)
         self._max_lines_input.setValidator(QIntValidator(1, 5_000_000, self))
-        self._buffer_label = add_conn_row(5, "Buffer:", self._max_lines_input)
+        self._buffer_label = add_conn_row(6, "Buffer:", self._max_lines_input)
 
         layout.addWidget(self._conn_content_widget)
 
@@ -367,6 +384,59 @@ class SidebarWidget(QFrame):
         counter_layout.setContentsMargins(0, 0, 0, 0)
         counter_layout.setSpacing(4)
 
+        # 입력 행은 첫 화면 이후 build_deferred_ui()에서 구성
+        self._counter_layout = counter_layout
+        counter_layout.addStretch()
+        counter_scroll.setWidget(counter_container)
+        counter_scroll.setMinimumHeight(190)
+        find_layout.addWidget(counter_scroll)
+        layout.addWidget(self._find_group)
+
+        # === 자동 명령 정보 및 목록 섹션 (New) ===
+        self._auto_info_group = QGroupBox(tr(self._language, "sidebar.group.auto"))
+        auto_info_layout = QVBoxLayout(self._auto_info_group)
+        auto_info_layout.setContentsMargins(10, 8, 10, 10)
+        auto_info_layout.setSpacing(4)
+
+        # 대소문자 구분 (New)
+        self._auto_case_checkbox = QCheckBox(tr(self._language, "sidebar.checkbox.case_sensitive"))
+        self._auto_case_checkbox.setChecked(False)
+        auto_info_layout.addWidget(self._auto_case_checkbox)
+
+        # 스크롤 영역
+        self._auto_list_scroll = QScrollArea()
+        self._auto_list_scroll.setFrameShape(QFrame.Shape.NoFrame)
+        self._auto_list_scroll.setWidgetResizable(True)
+        self._auto_list_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # self._auto_list_scroll.setMaximumHeight(200)
+
+        self._auto_list_container = QWidget()
+        self._auto_list_layout = QVBoxLayout(self._auto_list_container)
+        self._auto_list_layout.setContentsMargins(0, 0, 0, 0)
+        self._auto_list_layout.setSpacing(4)
+        self._auto_list_layout.addStretch()
+
+        self._auto_list_scroll.setWidget(self._auto_list_container)
+        auto_info_layout.addWidget(self._auto_list_scroll)
+        
+        layout.addWidget(self._auto_info_group)
+        
+        # Ratio & Size Policy
+        self._find_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._auto_info_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        layout.setStretchFactor(self._find_group, 6)
+        layout.setStretchFactor(self._auto_info_group, 4)
+
+        # 하단 여백
+        layout.addStretch()
+
+        # 초기 포트 스캔
+        self.refresh_ports()
+
+    def build_deferred_ui(self):
+        """문자열 통계 입력 행 구성 (첫 화면 이후 MainWindow 유휴 타이머에서 호출)"""
+        if self._log_counters:
+            return
         for index in range(self.MAX_LOG_COUNTERS):
             item_frame = QFrame()
             item_frame.setStyleSheet(
@@ -387,6 +457,11 @@ class SidebarWidget(QFrame):
             )
             item_layout.addWidget(text_input)
 
+            # 최근 60초 초당 히트 수
+            sparkline = SparklineWidget()
+            sparkline.setToolTip(tr(self._language, "sidebar.tooltip.sparkline"))
+            item_layout.addWidget(sparkline)
+
             # 2. Bottom Row (Left: Info, Right: Actions)
             bottom_row = QHBoxLayout()
             bottom_row.setContentsMargins(0, 0, 0, 0)
@@ -493,7 +568,7 @@ class SidebarWidget(QFrame):
             
             item_layout.addLayout(bottom_row)
 
-            counter_layout.addWidget(item_frame)
+            self._counter_layout.insertWidget(index, item_frame)
             self._log_counters.append({
                 "input": text_input,
                 "count_label": count_label,
@@ -502,6 +577,8 @@ class SidebarWidget(QFrame):
                 "status_label": status_label,
                 "toggle_btn": toggle_btn,
                 "reset_btn": reset_btn,
+                "sparkline": sparkline,
+                "rates": RateBuckets(),
                 "count": 0,
                 "started_at": None,
                 "last_detected_at": None,
@@ -509,53 +586,7 @@ class SidebarWidget(QFrame):
                 "is_stopped": False,
             })
             self._update_log_counter_ui(index)
-
-        counter_layout.addStretch()
-        counter_scroll.setWidget(counter_container)
-        counter_scroll.setMinimumHeight(190)
-        find_layout.addWidget(counter_scroll)
-        layout.addWidget(self._find_group)
-
-        # === 자동 명령 정보 및 목록 섹션 (New) ===
-        self._auto_info_group = QGroupBox(tr(self._language, "sidebar.group.auto"))
-        auto_info_layout = QVBoxLayout(self._auto_info_group)
-        auto_info_layout.setContentsMargins(10, 8, 10, 10)
-        auto_info_layout.setSpacing(4)
-
-        # 대소문자 구분 (New)
-        self._auto_case_checkbox = QCheckBox(tr(self._language, "sidebar.checkbox.case_sensitive"))
-        self._auto_case_checkbox.setChecked(False)
-        auto_info_layout.addWidget(self._auto_case_checkbox)
-
-        # 스크롤 영역
-        self._auto_list_scroll = QScrollArea()
-        self._auto_list_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self._auto_list_scroll.setWidgetResizable(True)
-        self._auto_list_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        # self._auto_list_scroll.setMaximumHeight(200)
-
-        self._auto_list_container = QWidget()
-        self._auto_list_layout = QVBoxLayout(self._auto_list_container)
-        self._auto_list_layout.setContentsMargins(0, 0, 0, 0)
-        self._auto_list_layout.setSpacing(4)
-        self._auto_list_layout.addStretch()
-
-        self._auto_list_scroll.setWidget(self._auto_list_container)
-        auto_info_layout.addWidget(self._auto_list_scroll)
-        
-        layout.addWidget(self._auto_info_group)
-        
-        # Ratio & Size Policy
-        self._find_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self._auto_info_group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        layout.setStretchFactor(self._find_group, 6)
-        layout.setStretchFactor(self._auto_info_group, 4)
-
-        # 하단 여백
-        layout.addStretch()
-
-        # 초기 포트 스캔
-        self.refresh_ports()
+        self._rate_timer.start()
 
     def set_language(self, language: str):
         self._language = normalize_language(language)
@@ -588,6 +619,7 @@ class SidebarWidget(QFrame):
                 tr(self._language, "sidebar.counter.placeholder", index=index + 1)
             )
             counter["reset_btn"].setToolTip(tr(self._language, "sidebar.tooltip.reset_counter"))
+            counter["sparkline"].setToolTip(tr(self._language, "sidebar.tooltip.sparkline"))
             self._update_log_counter_ui(index)
         if self._port_combo.count() == 1 and self._port_combo.itemData(0) is None:
             self._port_combo.setItemText(0, tr(self._language, "sidebar.port_not_found"))
@@ -595,41 +627,29 @@ class SidebarWidget(QFrame):
         if self._macro_dialog is not None:
             self._macro_dialog.set_language(self._language)
 
-    def set_env_path(self, env_path: str):
-        """즉시 저장에 사용할 .env 경로 설정."""
-        self._env_path = env_path
+    def set_config_store(self, store):
+        """설정 저장소 연결 (변경 시 디바운스 저장, 저장 시점에 collect_configs()로 스냅샷)"""
+        self._config_store = store
+        store.set_snapshot_provider(self.collect_configs)
 
     def load_configs_from_env(self):
-        """환경 변수(.env)에서 문자열 통계 및 자동 명령 설정을 읽어와 적용"""
+        """설정 저장소(lnxterm_config.json / 이전 .env 값)에서 문자열 통계, 자동 명령, 매크로를 읽어와 적용"""
         mode = os.environ.get("AUTO_LOAD_MODE", "CONFIRM").upper()
-        if mode == "IGNORE":
+        if mode == "IGNORE" or self._config_store is None:
             return
 
         self._loading_env = True
 
-        # 1. 환경 변수 읽기
-        raw_stats = os.environ.get("AUTO_LOAD_STRING_STATS", "").strip()
-        raw_autos = os.environ.get("AUTO_LOAD_AUTO_COMMANDS", "").strip()
-        raw_macros = os.environ.get("AUTO_LOAD_MACRO_COMMANDS", "").strip()
-
-        stats_list = [s.strip() for s in raw_stats.split(";") if s.strip()] if raw_stats else []
-        autos_list = []
-        if raw_autos:
-            try:
-                autos_list = json.loads(raw_autos)
-                if not isinstance(autos_list, list):
-                    autos_list = []
-            except json.JSONDecodeError:
-                print(f"Error parsing AUTO_LOAD_AUTO_COMMANDS: {raw_autos}")
-
-        macros_list = []
-        if raw_macros:
-            try:
-                macros_list = json.loads(raw_macros)
-                if not isinstance(macros_list, list):
-                    macros_list = []
-            except json.JSONDecodeError:
-                print(f"Error parsing AUTO_LOAD_MACRO_COMMANDS: {raw_macros}")
+        # 1. 저장된 설정 읽기
+        sections = self._config_store.sections()
+        stats_list = [
+            str(keyword).strip() for keyword in sections[config_store.SECTION_STRING_STATS]
+            if str(keyword).strip()
+        ]
+        autos_list = [
+            task for task in sections[config_store.SECTION_AUTO_COMMANDS] if isinstance(task, dict)
+        ]
+        macros_list = sections[config_store.SECTION_MACRO_COMMANDS]
 
         if not stats_list and not autos_list and not macros_list:
             self._loading_env = False
@@ -705,6 +725,7 @@ class SidebarWidget(QFrame):
     def _open_macro_dialog(self):
         """매크로 등록/실행 창 열기 (모델리스)."""
         if self._macro_dialog is None:
+            from macro_dialog import MacroDialog
             self._macro_dialog = MacroDialog(self, language=self._language)
             self._macro_dialog.send_requested.connect(self._send_macro_command)
             self._macro_dialog.commands_changed.connect(self._on_macro_commands_changed)
@@ -715,6 +736,10 @@ class SidebarWidget(QFrame):
         self._macro_dialog.raise_()
         self._macro_dialog.activateWindow()
 
+    def macro_commands(self) -> list:
+        """등록된 매크로 목록 (복사본)"""
+        return [dict(item) for item in self._macro_commands]
+
     def _send_macro_command(self, command: str):
         """매크로 명령 즉시 전송."""
         if not command.strip():
@@ -744,12 +769,12 @@ class SidebarWidget(QFrame):
         return sanitized
 
     def _save_env_if_ready(self):
-        """입력 변경 즉시 .env 저장."""
+        """입력 변경 알림 (설정 저장소가 디바운스 후 백그라운드 저장)"""
         if self._loading_env:
             return
-        if not self._env_path:
+        if self._config_store is None:
             return
-        self.save_configs_to_env(self._env_path)
+        self._config_store.mark_dirty()
 
     def _build_automation_task(self, task_data: dict):
         """자동 명령 데이터 정규화 및 런타임 필드 보강."""
@@ -767,6 +792,7 @@ class SidebarWidget(QFrame):
             "last_run_at": task_data.get("last_run_at"),
             "_timers": [],
             "_run_generation": 0,
+            "_latency": TaskLatencyStats(),
         }
 
     def _normalize_task_name(self, name: str) -> str:
@@ -801,8 +827,8 @@ class SidebarWidget(QFrame):
 
     # === 환경 변수 저장 (앱 종료 시 호출) ===
     
-    def save_configs_to_env(self, env_path: str):
-        """현재 문자열 통계 및 자동 명령 설정을 .env 파일에 저장"""
+    def collect_configs(self) -> dict:
+        """현재 문자열 통계, 자동 명령, 매크로 설정 스냅샷 (설정 저장소 섹션 형식)"""
         # 1. 문자열 통계 수집
         stats_list = []
         for i, item in enumerate(self._log_counters):
@@ -825,37 +851,20 @@ class SidebarWidget(QFrame):
             }
             autos_list.append(saved_task)
 
-        macro_list = self._sanitize_macro_commands(self._macro_commands)
-
-        from dotenv import set_key
-
-        try:
-            # 문자열 통계 저장
-            stats_str = ";".join(stats_list)
-            set_key(env_path, "AUTO_LOAD_STRING_STATS", stats_str)
-            os.environ["AUTO_LOAD_STRING_STATS"] = stats_str
-            
-            # 자동 명령 저장
-            if autos_list:
-                import json
-                autos_str = json.dumps(autos_list, ensure_ascii=False)
-                set_key(env_path, "AUTO_LOAD_AUTO_COMMANDS", autos_str)
-                os.environ["AUTO_LOAD_AUTO_COMMANDS"] = autos_str
-            else:
-                set_key(env_path, "AUTO_LOAD_AUTO_COMMANDS", "")
-                os.environ["AUTO_LOAD_AUTO_COMMANDS"] = ""
+        return {
+            config_store.SECTION_STRING_STATS: stats_list,
+            config_store.SECTION_AUTO_COMMANDS: autos_list,
+            config_store.SECTION_MACRO_COMMANDS: self._sanitize_macro_commands(self._macro_commands),
+        }
 
-            if macro_list:
-                macro_str = json.dumps(macro_list, ensure_ascii=False)
-                set_key(env_path, "AUTO_LOAD_MACRO_COMMANDS", macro_str)
-                os.environ["AUTO_LOAD_MACRO_COMMANDS"] = macro_str
-            else:
-                set_key(env_path, "AUTO_LOAD_MACRO_COMMANDS", "")
-                os.environ["AUTO_LOAD_MACRO_COMMANDS"] = ""
-        except OSError:
+    def save_configs(self) -> bool:
+        """대기 중인 설정 변경을 즉시 저장 (종료/수동 저장용, 기록 완료까지 대기)"""
+        if self._config_store is None:
             return False
-
-        return True
+        if self._macro_dialog is not None:
+            # 매크로 창에서 모아 둔 편집 알림 먼저 반영
+            self._macro_dialog.flush_pending_changes()
+        return self._config_store.flush()
 
     # === 자동 명령 수행 관리 ===
 
@@ -870,6 +879,7 @@ class SidebarWidget(QFrame):
             return
         
         # 빈 태스크로 다이얼로그 열기
+        from automation_dialog import AutomationDialog
         dialog = AutomationDialog(self, language=self._language)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             task = self._build_automation_task(dialog.get_data())
@@ -893,11 +903,13 @@ class SidebarWidget(QFrame):
             return
             
         prev_task = self._automation_tasks[index]
+        from automation_dialog import AutomationDialog
         dialog = AutomationDialog(self, prev_task, language=self._language)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self._cancel_task_commands(prev_task)
             new_task = self._build_automation_task(dialog.get_data())
             new_task["trigger_count"] = prev_task.get("trigger_count", 0)
+            new_task["_latency"] = prev_task.get("_latency") or TaskLatencyStats()
             self._automation_tasks[index] = new_task
             self._refresh_automation_list()
             self._save_env_if_ready()
@@ -914,6 +926,7 @@ class SidebarWidget(QFrame):
     def _refresh_automation_list(self):
         """자동 명령 목록 UI 갱신"""
         # 기존 아이템 제거
+        self._auto_name_buttons = []
         while self._auto_list_layout.count():
             item = self._auto_list_layout.takeAt(0)
             if item.widget():
@@ -949,7 +962,8 @@ class SidebarWidget(QFrame):
             name_row.setSpacing(4)
             
             name_btn = QPushButton(self._format_task_display_name(name_text))
-            name_btn.setToolTip(name_text)
+            name_btn.setToolTip(self._build_task_tooltip(task))
+            self._auto_name_buttons.append(name_btn)
             name_btn.setStyleSheet(f"""
                 QPushButton {{
                     background-color: transparent;
@@ -1066,6 +1080,13 @@ class SidebarWidget(QFrame):
             self._refresh_automation_list()
             self._save_env_if_ready()
 
+    def automation_task_names(self) -> list[str]:
+        return [task["name"] for task in self._automation_tasks]
+
+    def start_automation_task(self, index: int):
+        """자동 명령 시작 (명령 팔레트용)"""
+        self._start_task(index)
+
     def _start_task(self, index: int):
         """자동 명령 시작"""
         if 0 <= index < len(self._automation_tasks):
@@ -1090,8 +1111,13 @@ class SidebarWidget(QFrame):
                 self._refresh_automation_list()
                 self._save_env_if_ready()
 
-    def process_log_line_for_automation(self, line: str):
-        """로그 라인 트리거 검사 및 사후 명령 예약"""
+    def process_log_line_for_automation(self, line: str, rx_ns: int = None):
+        """로그 라인 트리거 검사 및 사후 명령 예약
+
+        Args:
+            line: 수신 완료 라인
+            rx_ns: 라인 수신 시각 (time.monotonic_ns), 지연 통계용
+        """
         triggered_any = False
         
         # 대소문자 구분 설정
@@ -1113,58 +1139,29 @@ class SidebarWidget(QFrame):
                 task['trigger_count'] = task.get('trigger_count', 0) + 1
                 task['last_run_at'] = datetime.now()
                 triggered_any = True
-                
+
+                match_ns = time.monotonic_ns()
+                trace = {
+                    "rx_ns": rx_ns if rx_ns is not None else match_ns,
+                    "match_ns": match_ns,
+                }
                 delay_ms = max(0, int(task.get("delay", 0)))
                 self._run_task_command_set(
                     task,
                     task.get("post_cmd", ""),
                     delay_before_first_command=delay_ms,
+                    trace=trace,
                 )
                         
         if triggered_any:
             self._refresh_automation_list()
 
     def _parse_sleep_delay_ms(self, line: str):
-        match = self.SLEEP_COMMAND_PATTERN.match(line.strip())
-        if not match:
-            return None
-        try:
-            parsed = int(match.group(1))
-        except ValueError:
-            return None
-        if parsed < 0:
-            return 0
-        return min(parsed, self.MAX_SLEEP_DELAY_MS)
+        return line_pipeline.parse_sleep_delay_ms(line)
 
     def _build_command_sequence(self, command_text: str, interval_ms: int):
         """명령어와 sleep() 지시를 실행 순서로 변환."""
-        interval = max(0, int(interval_ms))
-        sequence = []
-        pending_sleep = 0
-        command_count = 0
-
-        for raw_line in command_text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            sleep_ms = self._parse_sleep_delay_ms(line)
-            if sleep_ms is not None:
-                pending_sleep = min(self.MAX_SLEEP_DELAY_MS, pending_sleep + sleep_ms)
-                continue
-
-            if command_count == 0:
-                delay_before = pending_sleep
-            elif pending_sleep > 0:
-                delay_before = pending_sleep
-            else:
-                delay_before = interval
-
-            sequence.append((delay_before, line))
-            pending_sleep = 0
-            command_count += 1
-
-        return sequence
+        return line_pipeline.build_command_sequence(command_text, interval_ms)
 
     def _can_run_task(self, task: dict, generation: int) -> bool:
         return (
@@ -1189,7 +1186,9 @@ class SidebarWidget(QFrame):
         task.setdefault("_timers", []).append(timer)
         timer.start(max(0, int(delay_ms)))
 
-    def _run_task_sequence(self, task: dict, sequence, position: int, generation: int):
+    def _run_task_sequence(
+        self, task: dict, sequence, position: int, generation: int, trace: dict = None
+    ):
         if position >= len(sequence):
             return
         if not self._can_run_task(task, generation):
@@ -1200,7 +1199,13 @@ class SidebarWidget(QFrame):
         def _emit_and_continue():
             if not self._can_run_task(task, generation):
                 return
-            self.send_command_requested.emit(command, 0)
+            if trace is not None:
+                # 트리거 직후 첫 명령만 트리거→송신 지연 측정 대상
+                trace["send_ns"] = time.monotonic_ns()
+                trace["task"] = task
+                self.send_traced_command_requested.emit(command, trace)
+            else:
+                self.send_command_requested.emit(command, 0)
             if task in self._automation_tasks:
                 task["last_run_at"] = datetime.now()
                 self._refresh_automation_list()
@@ -1216,8 +1221,9 @@ class SidebarWidget(QFrame):
         task: dict,
         command_text: str,
         delay_before_first_command: int = 0,
+        trace: dict = None,
     ):
-        """사전/사후 명령 세트를 실행."""
+        """사전/사후 명령 세트를 실행. trace가 있으면 첫 명령의 지연을 측정."""
         sequence = self._build_command_sequence(command_text, task.get("cmd_interval", 0))
         if not sequence:
             return
@@ -1228,7 +1234,55 @@ class SidebarWidget(QFrame):
             first_command,
         )
         generation = task.get("_run_generation", 0)
-        self._run_task_sequence(task, sequence, 0, generation)
+        self._run_task_sequence(task, sequence, 0, generation, trace)
+
+    def pending_automation_timer_count(self) -> int:
+        """예약되어 대기 중인 자동 명령 타이머 수"""
+        return sum(len(task.get("_timers", [])) for task in self._automation_tasks)
+
+    def record_automation_latency(self, trace: dict):
+        """송신 완료된 트레이스를 해당 자동 명령의 지연 히스토그램에 기록"""
+        task = trace.get("task")
+        if task is None or task not in self._automation_tasks:
+            return
+        latency = task.setdefault("_latency", TaskLatencyStats())
+        latency.record_trace(trace)
+        index = self._automation_tasks.index(task)
+        if index < len(self._auto_name_buttons):
+            self._auto_name_buttons[index].setToolTip(self._build_task_tooltip(task))
+
+    def _build_task_tooltip(self, task: dict) -> str:
+        """자동 명령 이름 + 트리거→송신 지연 요약(p50/p99/max) 툴팁"""
+        name_text = self._normalize_task_name(task["name"])
+        latency = task.get("_latency")
+        if latency is None or not latency.count:
+            return name_text
+        lines = [name_text, tr(self._language, "sidebar.auto.latency_header")]
+        lines.extend(latency.summary_lines())
+        return "\n".join(lines)
+
+    def export_automation_latency_csv(self, path: str) -> bool:
+        """자동 명령별 지연 히스토그램을 CSV로 내보내기"""
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as fp:
+                writer = csv.writer(fp)
+                writer.writerow(
+                    [
+                        tr(self._language, "sidebar.latency_csv.header.task"),
+                        tr(self._language, "sidebar.latency_csv.header.stage"),
+                        tr(self._language, "sidebar.latency_csv.header.bucket_low"),
+                        tr(self._language, "sidebar.latency_csv.header.bucket_high"),
+                        tr(self._language, "sidebar.latency_csv.header.count"),
+                        tr(self._language, "sidebar.latency_csv.header.cumulative"),
+                    ]
+                )
+                for task in self._automation_tasks:
+                    latency = task.get("_latency")
+                    if latency is not None:
+                        latency.write_csv_rows(writer, self._normalize_task_name(task["name"]))
+        except OSError:
+            return False
+        return True
 
     def _cancel_task_commands(self, task: dict):
         """실행 대기 중인 자동 명령 타이머를 즉시 중지."""
@@ -1269,6 +1323,7 @@ class SidebarWidget(QFrame):
                 "databits": self._data_combo.currentData(),
                 "parity": self._parity_combo.currentData(),
                 "stopbits": self._stop_combo.currentData(),
+                "flow_control": self._flow_combo.currentData(),
                 "max_lines": max_lines,
             }
             self.connect_requested.emit(settings)
@@ -1305,6 +1360,7 @@ class SidebarWidget(QFrame):
             return
 
         self._stats_csv_path = self._build_stats_csv_path(logfile_path)
+        self._stats_csv_written_until = int(time.time())
         self._stats_file_label.setText(self._stats_csv_path)
         self._stats_file_label.setToolTip(self._stats_csv_path)
         self._stats_file_label.setStyleSheet(
@@ -1315,17 +1371,7 @@ class SidebarWidget(QFrame):
     @staticmethod
     def _build_stats_csv_path(logfile_path: str) -> str:
         """로그 파일명 타임스탬프를 활용해 통계 CSV 경로 생성"""
-        abs_dir = os.path.dirname(os.path.abspath(logfile_path))
-        log_filename = os.path.basename(logfile_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        if log_filename.startswith("lnxterm_"):
-            stem, _ = os.path.splitext(log_filename)
-            extracted = stem[len("lnxterm_"):]
-            if extracted:
-                timestamp = extracted
-
-        return os.path.join(abs_dir, f"lnxterm_stats_{timestamp}.csv")
+        return line_pipeline.build_stats_csv_path(logfile_path)
 
     def set_log_started_time(self, timestamp: str):
         """로깅 시작 시간 표시"""
@@ -1361,6 +1407,7 @@ class SidebarWidget(QFrame):
             self._data_combo.setEnabled(False)
             self._parity_combo.setEnabled(False)
             self._stop_combo.setEnabled(False)
+            self._flow_combo.setEnabled(False)
             self._max_lines_input.setEnabled(False)
             self._refresh_btn.setEnabled(False)
         else:
@@ -1374,6 +1421,7 @@ class SidebarWidget(QFrame):
             self._data_combo.setEnabled(True)
             self._parity_combo.setEnabled(True)
             self._stop_combo.setEnabled(True)
+            self._flow_combo.setEnabled(True)
             self._max_lines_input.setEnabled(True)
             self._refresh_btn.setEnabled(True)
 
@@ -1459,7 +1507,9 @@ class SidebarWidget(QFrame):
         return QIcon(pixmap)
 
     def set_logging_state(self, logging: bool, clear_display: bool = True):
-        """로깅 상태 UI 업데이트"""
+        """로깅 상태 UI 업데이트 (중지 시 진행 중인 분까지 통계 CSV에 기록)"""
+        if self._is_logging and not logging:
+            self._write_counter_rates(int(time.time()) + 1)
         self._is_logging = logging
         if not logging and clear_display:
             self.set_log_started_time("")
@@ -1611,6 +1661,7 @@ class SidebarWidget(QFrame):
 
         if counter["started_at"] is None or counter["started_at"] == 0:
             counter["started_at"] = datetime.now()
+        counter["rates"].start(time.time())
         counter["is_running"] = True
         counter["is_stopped"] = False
         self._set_counter_readonly(index, True)
@@ -1625,6 +1676,7 @@ class SidebarWidget(QFrame):
         counter["last_detected_at"] = None
         counter["is_running"] = False
         counter["is_stopped"] = False
+        self._clear_counter_rates(counter)
         self._update_log_counter_ui(index)
         self._save_env_if_ready()
 
@@ -1636,6 +1688,7 @@ class SidebarWidget(QFrame):
         counter["last_detected_at"] = None
         counter["is_running"] = False
         counter["is_stopped"] = False
+        self._clear_counter_rates(counter)
         counter["input"].setText("")
         self._set_counter_readonly(index, False)
         self._update_log_counter_ui(index)
@@ -1654,57 +1707,52 @@ class SidebarWidget(QFrame):
         self._update_log_counter_ui(index)
         self._save_env_if_ready()
 
-    def _append_counter_stats(self, keyword: str, count: int, timestamp: str | None, log_line: str):
-        """통계 변경 내역을 CSV 파일에 저장"""
-        if not self._stats_csv_path:
+    @staticmethod
+    def _clear_counter_rates(counter: dict):
+        counter["rates"].clear()
+        counter["sparkline"].set_values([])
+
+    def _on_rate_timer(self):
+        """1초마다: 보이는 경우 스파크라인 갱신, 분 경계를 지났으면 완료된 분을 통계 CSV에 기록"""
+        now = time.time()
+        if self.isVisible():
+            for counter in self._log_counters:
+                if counter["rates"].started:
+                    counter["sparkline"].set_values(counter["rates"].recent(now))
+        minute = minute_start(now)
+        if minute > self._stats_csv_written_until:
+            self._write_counter_rates(minute)
+
+    def _write_counter_rates(self, end: int):
+        """통계 CSV에 [마지막 기록 시점, end) 구간 분당 히트 수 추가 (로깅 중일 때만)"""
+        if not self._is_logging or not self._stats_csv_path:
             return
-
-        os.makedirs(os.path.dirname(self._stats_csv_path), exist_ok=True)
-        normalized_time = self._normalize_stats_timestamp(timestamp)
-        needs_header = (
-            not os.path.exists(self._stats_csv_path)
-            or os.path.getsize(self._stats_csv_path) == 0
-        )
-
-        try:
-            with open(self._stats_csv_path, "a", newline="", encoding="utf-8") as fp:
-                writer = csv.writer(fp)
-                if needs_header:
-                    writer.writerow(
-                        [
-                            tr(self._language, "sidebar.csv.header.keyword"),
-                            tr(self._language, "sidebar.csv.header.timestamp"),
-                            tr(self._language, "sidebar.csv.header.count"),
-                            tr(self._language, "sidebar.csv.header.case"),
-                            tr(self._language, "sidebar.csv.header.log"),
-                        ]
-                    )
-                writer.writerow(
-                    [
-                        keyword,
-                        normalized_time,
-                        count,
-                        tr(self._language, "sidebar.csv.case_yes")
-                        if self._case_sensitive_checkbox.isChecked()
-                        else tr(self._language, "sidebar.csv.case_no"),
-                        log_line,
-                    ]
-                )
-        except OSError:
-            # 통계 저장은 보조 기능이므로 기록 실패가 메인 동작을 멈추지 않게 함
+        start = self._stats_csv_written_until
+        if end <= start:
             return
-
-    @staticmethod
-    def _normalize_stats_timestamp(timestamp: str | None) -> str:
-        """타임스탬프 문자열 정규화"""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        if not timestamp:
-            return now
-
-        timestamp = timestamp.strip()
-        if timestamp.startswith("[") and "]" in timestamp:
-            return timestamp[1:timestamp.rfind("]")]
-        return timestamp
+        self._stats_csv_written_until = end
+        counters = [
+            (counter["input"].text().strip(), counter["rates"])
+            for counter in self._log_counters
+            if counter["rates"].started and counter["input"].text().strip()
+        ]
+        line_pipeline.append_counter_stats_rows(
+            self._stats_csv_path,
+            [
+                tr(self._language, "sidebar.csv.header.keyword"),
+                tr(self._language, "sidebar.csv.header.minute"),
+                tr(self._language, "sidebar.csv.header.hits"),
+                tr(self._language, "sidebar.csv.header.case"),
+            ],
+            line_pipeline.counter_rate_rows(
+                counters,
+                start,
+                end,
+                tr(self._language, "sidebar.csv.case_yes")
+                if self._case_sensitive_checkbox.isChecked()
+                else tr(self._language, "sidebar.csv.case_no"),
+            ),
+        )
 
     def process_log_line_for_counters(self, line: str, line_timestamp: str = None):
         """로그 라인 출력 시 문자열 카운터 누적"""
@@ -1721,6 +1769,7 @@ class SidebarWidget(QFrame):
             compare_keyword = keyword if self._case_sensitive_checkbox.isChecked() else keyword.lower()
             if compare_keyword in compare_line:
                 counter["count"] += 1
+                counter["rates"].record(time.time())
                 
                 # Update Last Detected
                 if line_timestamp:
@@ -1731,13 +1780,7 @@ class SidebarWidget(QFrame):
                     counter["last_detected_at"] = ts_clean
                 else:
                     counter["last_detected_at"] = datetime.now()
-                
-                self._append_counter_stats(
-                    keyword,
-                    counter["count"],
-                    line_timestamp,
-                    line.rstrip("\r\n")
-                )
+
                 self._update_log_counter_ui(index)
 
     # === 자동 명령 수행 ===
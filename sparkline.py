@@ -0,0 +1,52 @@
+"""
+작은 막대 스파크라인 (문자열 통계 카운터 행의 최근 60초 초당 히트 수)
+- 값 목록이 바뀐 경우에만 다시 그림, 세로 범위는 보이는 값의 최대값 기준
+"""
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+from styles import COLORS
+
+
+class SparklineWidget(QWidget):
+    """초당 값 막대 그래프 (가장 오른쪽 = 현재 초)"""
+
+    HEIGHT = 18
+
+    def __init__(self, parent=None, color: str = COLORS["accent"]):
+        super().__init__(parent)
+        self._values: list[int] = []
+        self._color = QColor(color)
+        self._baseline = QColor(COLORS["border"])
+        self.setFixedHeight(self.HEIGHT)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+    def set_color(self, color: str) -> None:
+        color = QColor(color)
+        if color != self._color:
+            self._color = color
+            self.update()
+
+    def set_values(self, values: list[int]) -> None:
+        if values != self._values:
+            self._values = values
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        width = self.width()
+        height = self.height()
+        painter.fillRect(0, height - 1, width, 1, self._baseline)
+        peak = max(self._values, default=0)
+        if peak:
+            bar_width = width / len(self._values)
+            for index, value in enumerate(self._values):
+                if value:
+                    bar_height = max(1.0, (height - 1) * value / peak)
+                    painter.fillRect(
+                        QRectF(index * bar_width, height - 1 - bar_height, max(1.0, bar_width - 1), bar_height),
+                        self._color,
+                    )
+        painter.end()
@@ -0,0 +1,209 @@
+"""
+GUI 이벤트 루프 멈춤 감지 모듈
+- GUI 스레드의 하트비트 타이머가 주기적으로 시각을 갱신하고, 감시 스레드가 갱신 지연을 검사
+- 임계값 이상 멈춘 동안 sys._current_frames()로 메인 스레드 파이썬 스택을 주기 샘플링
+- 샘플은 접힌 스택(folded stack, "a;b;c 횟수")으로 집계 → 플레임 그래프 형태 텍스트 보고서
+  (.folded 파일은 flamegraph.pl / speedscope에서 바로 열 수 있음)
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from PyQt6.QtCore import QObject, QTimer
+
+ENV_STALL_THRESHOLD_MS = "STALL_THRESHOLD_MS"
+DEFAULT_STALL_THRESHOLD_MS = 200
+
+
+class StallDetector(QObject):
+    """GUI 스레드 멈춤 감지 + 스택 샘플링"""
+
+    HEARTBEAT_INTERVAL_MS = 50
+    SAMPLE_INTERVAL_S = 0.01
+    MAX_EVENTS = 200
+    MAX_STACK_DEPTH = 64
+
+    def __init__(self, threshold_ms: int = DEFAULT_STALL_THRESHOLD_MS, parent=None):
+        super().__init__(parent)
+        self._threshold_s = max(1, int(threshold_ms)) / 1000.0
+        self._main_thread_id = threading.main_thread().ident
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._folded: dict[str, int] = {}
+        self._events: deque[dict] = deque(maxlen=self.MAX_EVENTS)
+        self._total_stalls = 0
+        self._total_stall_s = 0.0
+        self._started_at = datetime.now()
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(self.HEARTBEAT_INTERVAL_MS)
+        self._heartbeat.timeout.connect(self._beat)
+
+    @classmethod
+    def from_env(cls, parent=None) -> "StallDetector | None":
+        """STALL_THRESHOLD_MS 환경변수로 생성 (0이면 비활성 → None)"""
+        raw = os.environ.get(ENV_STALL_THRESHOLD_MS, "").strip()
+        try:
+            threshold_ms = int(raw) if raw else DEFAULT_STALL_THRESHOLD_MS
+        except ValueError:
+            threshold_ms = DEFAULT_STALL_THRESHOLD_MS
+        if threshold_ms <= 0:
+            return None
+        return cls(threshold_ms, parent)
+
+    @property
+    def threshold_ms(self) -> int:
+        return int(self._threshold_s * 1000)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._last_beat = time.monotonic()
+        self._heartbeat.start()
+        self._thread = threading.Thread(target=self._watch, name="StallDetector", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        self._heartbeat.stop()
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+
+    def _beat(self) -> None:
+        self._last_beat = time.monotonic()
+
+    # === 감시 스레드 ===
+
+    def _watch(self) -> None:
+        # 평상시에는 임계값의 1/4 주기로만 깨어나고, 멈춤 중에는 샘플 주기로 깨어남
+        idle_interval = max(self.SAMPLE_INTERVAL_S, self._threshold_s / 4)
+        while self._running:
+            time.sleep(idle_interval)
+            beat = self._last_beat
+            if time.monotonic() - beat < self._threshold_s:
+                continue
+            self._sample_stall(beat)
+
+    def _sample_stall(self, beat: float) -> None:
+        """하트비트가 다시 갱신될 때까지 메인 스레드 스택 샘플링"""
+        stacks: dict[str, int] = {}
+        samples = 0
+        while self._running and self._last_beat == beat:
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is not None:
+                folded = self._fold_stack(frame)
+                stacks[folded] = stacks.get(folded, 0) + 1
+                samples += 1
+            del frame
+            time.sleep(self.SAMPLE_INTERVAL_S)
+        duration = (self._last_beat if self._last_beat != beat else time.monotonic()) - beat
+        duration -= self.HEARTBEAT_INTERVAL_MS / 1000.0  # 정상 하트비트 간격 제외
+
+        top_stack = max(stacks, key=stacks.get) if stacks else ""
+        with self._lock:
+            for folded, count in stacks.items():
+                self._folded[folded] = self._folded.get(folded, 0) + count
+            self._total_stalls += 1
+            self._total_stall_s += max(0.0, duration)
+            self._events.append({
+                "at": datetime.now() - timedelta(seconds=max(0.0, duration)),
+                "duration_ms": max(0.0, duration) * 1000,
+                "samples": samples,
+                "top_frame": top_stack.rsplit(";", 1)[-1],
+            })
+
+    def _fold_stack(self, frame) -> str:
+        """바깥쪽 → 안쪽 순서의 'file:함수' 목록을 ';'로 연결"""
+        names = []
+        while frame is not None and len(names) < self.MAX_STACK_DEPTH:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)
+            names.append(f"{os.path.basename(code.co_filename)}:{name}")
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+    # === 보고서 ===
+
+    @property
+    def stall_count(self) -> int:
+        with self._lock:
+            return self._total_stalls
+
+    @property
+    def sample_count(self) -> int:
+        with self._lock:
+            return sum(self._folded.values())
+
+    def folded_lines(self) -> list[str]:
+        """flamegraph.pl / speedscope용 접힌 스택 행"""
+        with self._lock:
+            items = sorted(self._folded.items(), key=lambda item: -item[1])
+        return [f"{stack} {count}" for stack, count in items]
+
+    def build_report(self) -> str:
+        """멈춤 요약 + 최근 멈춤 목록 + 플레임 그래프 형태 호출 트리"""
+        with self._lock:
+            folded = dict(self._folded)
+            events = list(self._events)
+            total_stalls = self._total_stalls
+            total_stall_s = self._total_stall_s
+        total_samples = sum(folded.values())
+
+        lines = [
+            "LnxTerm GUI stall report",
+            f"generated: {datetime.now():%Y-%m-%d %H:%M:%S}",
+            f"monitoring since: {self._started_at:%Y-%m-%d %H:%M:%S}",
+            f"threshold: {self.threshold_ms} ms, sample interval: {self.SAMPLE_INTERVAL_S * 1000:.0f} ms",
+            f"stalls: {total_stalls}, total stalled: {total_stall_s * 1000:.0f} ms, samples: {total_samples}",
+            "",
+            f"== recent stalls (last {len(events)}) ==",
+        ]
+        for event in events:
+            lines.append(
+                f"{event['at']:%H:%M:%S.%f}"[:-3]
+                + f"  {event['duration_ms']:8.0f} ms  {event['samples']:5d} samples  {event['top_frame']}"
+            )
+
+        lines += ["", "== call tree (inclusive samples, flame graph order) =="]
+        tree: dict = {}
+        for stack, count in folded.items():
+            node = tree
+            for name in stack.split(";"):
+                child = node.setdefault(name, {"count": 0, "children": {}})
+                child["count"] += count
+                node = child["children"]
+
+        def walk(node: dict, depth: int):
+            for name, child in sorted(node.items(), key=lambda item: -item[1]["count"]):
+                share = child["count"] / total_samples * 100 if total_samples else 0.0
+                lines.append(f"{share:6.1f}% {child['count']:6d}  {'  ' * depth}{name}")
+                walk(child["children"], depth + 1)
+
+        walk(tree, 0)
+        return "\n".join(lines) + "\n"
+
+    def save_report(self, path: str) -> str:
+        """텍스트 보고서와 접힌 스택 파일(<경로>.folded) 저장. .folded 경로 반환"""
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(self.build_report())
+        folded_path = os.path.splitext(path)[0] + ".folded"
+        with open(folded_path, "w", encoding="utf-8") as fp:
+            for line in self.folded_lines():
+                fp.write(line + "\n")
+        return folded_path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._folded.clear()
+            self._events.clear()
+            self._total_stalls = 0
+            self._total_stall_s = 0.0
+            self._started_at = datetime.now()
@@ -0,0 +1,60 @@
+"""
+시작 시간 측정 모듈
+- main.py가 가장 먼저 불러와 파이썬 진입 시각을 기준으로 단계별 경과 시간을 기록 (mark)
+- 리눅스에서는 /proc에서 프로세스 생성 시각을 읽어 파이썬 진입 전 구간도 계산
+  (PyInstaller onefile은 부트로더 부모 프로세스가 압축 해제 후 자식을 실행하므로 부모 기준)
+"""
+
+import os
+import sys
+import time
+
+_ENTERED_AT = time.perf_counter()
+_marks: dict[str, float] = {}
+
+
+def mark(name: str) -> None:
+    """단계 시각 기록 (같은 이름은 처음 한 번만)"""
+    if name not in _marks:
+        _marks[name] = time.perf_counter()
+
+
+def elapsed_ms(name: str) -> float | None:
+    """파이썬 진입 → 단계까지 경과 ms (미기록 시 None)"""
+    at = _marks.get(name)
+    if at is None:
+        return None
+    return (at - _ENTERED_AT) * 1000
+
+
+def _process_age_s(pid: int | str) -> float | None:
+    """프로세스 생성 후 경과 초 (리눅스 /proc, 10ms 단위)"""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as fp:
+            # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 분리
+            fields = fp.read().rsplit(b")", 1)[1].split()
+        with open("/proc/uptime", "rb") as fp:
+            uptime_s = float(fp.read().split()[0])
+        start_ticks = int(fields[19])   # stat 22번째 필드 starttime
+        return uptime_s - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _measure_pre_python_ms() -> float | None:
+    pid: int | str = "self"
+    if getattr(sys, "frozen", False) and "_MEI" in getattr(sys, "_MEIPASS", ""):
+        pid = os.getppid()
+    age_s = _process_age_s(pid)
+    if age_s is None:
+        return None
+    return max(0.0, age_s * 1000 - (time.perf_counter() - _ENTERED_AT) * 1000)
+
+
+# 모듈 import 시점에 계산 (이후 /proc/uptime 조회 시각과의 차이가 섞이지 않도록)
+_PRE_PYTHON_MS = _measure_pre_python_ms()
+
+
+def pre_python_ms() -> float | None:
+    """프로세스 생성 → 파이썬 진입(main.py)까지 ms (리눅스 외 None)"""
+    return _PRE_PYTHON_MS
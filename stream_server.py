@@ -0,0 +1,331 @@
+"""
+스트림 팬아웃 서버 모듈
+- 수신(RX) 스트림을 Unix 도메인 소켓 / localhost TCP 클라이언트에 그대로 전달
+- 클라이언트가 보낸 바이트는 tx_callback으로 넘겨 송신 스레드 큐에 추가 (I/O 스레드는 포트 쓰기로 블로킹되지 않음)
+- TCP는 루프백 주소에만 바인딩 (접속한 상대가 시리얼 포트에 쓸 수 있으므로)
+- 클라이언트별 용량 제한 버퍼 + 느린 클라이언트 정책 (오래된 데이터 폐기 / 연결 종료)
+  → 느린 소비자가 캡처나 GUI를 멈추지 않음 (publish는 잠금 후 버퍼 추가만 수행)
+"""
+
+import collections
+import ipaddress
+import os
+import selectors
+import socket
+import threading
+
+ENV_STREAM_SERVER = "STREAM_SERVER"
+ENV_STREAM_CLIENT_BUFFER_BYTES = "STREAM_CLIENT_BUFFER_BYTES"
+ENV_STREAM_SLOW_CLIENT_POLICY = "STREAM_SLOW_CLIENT_POLICY"
+
+
+class _StreamClient:
+    """클라이언트 1개의 송신 대기 버퍼 (바이트 용량 제한)"""
+
+    def __init__(self, sock: socket.socket, address: str):
+        self.sock = sock
+        self.address = address
+        self.chunks: collections.deque[bytes] = collections.deque()
+        self.buffered = 0
+        self.offset = 0  # 첫 청크에서 이미 보낸 바이트 수
+        self.in_flight = False  # I/O 스레드가 첫 청크를 송신 중
+        self.dropped_bytes = 0
+        self.sent_bytes = 0
+        self.closing = False
+
+
+class StreamServer:
+    """RX 팬아웃 / TX 수집 서버 (단일 I/O 스레드, selectors 기반)
+
+    address 형식:
+        unix:/path/to.sock
+        tcp:127.0.0.1:5555  (호스트 생략 시 127.0.0.1, 루프백 주소만 허용)
+
+    tx_callback(data)는 I/O 스레드에서 호출되므로 블로킹 없이 반환해야 함 (예외 시 입력 폐기)
+    """
+
+    POLICY_DROP_OLDEST = "drop_oldest"
+    POLICY_DISCONNECT = "disconnect"
+    DEFAULT_CLIENT_BUFFER_BYTES = 1024 * 1024
+    MAX_CLIENTS = 16
+    RECV_SIZE = 4096
+
+    def __init__(self, address: str, tx_callback=None,
+                 client_buffer_bytes: int = DEFAULT_CLIENT_BUFFER_BYTES,
+                 slow_client_policy: str = POLICY_DROP_OLDEST):
+        self._address = address.strip()
+        self._tx_callback = tx_callback
+        self._client_buffer_bytes = max(4096, int(client_buffer_bytes))
+        self._policy = (
+            slow_client_policy
+            if slow_client_policy in (self.POLICY_DROP_OLDEST, self.POLICY_DISCONNECT)
+            else self.POLICY_DROP_OLDEST
+        )
+        self._lock = threading.Lock()
+        self._clients: dict[socket.socket, _StreamClient] = {}
+        self._selector: selectors.BaseSelector | None = None
+        self._listener: socket.socket | None = None
+        self._wake_r: socket.socket | None = None
+        self._wake_w: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._unix_path = ""
+        self._stats = {"tx_bytes": 0, "dropped_bytes": 0, "disconnected_slow": 0}
+
+    @classmethod
+    def from_env(cls, tx_callback=None) -> "StreamServer | None":
+        """STREAM_SERVER 환경변수가 설정된 경우 서버 생성 (미설정 시 None)"""
+        address = os.environ.get(ENV_STREAM_SERVER, "").strip()
+        if not address:
+            return None
+        try:
+            buffer_bytes = int(os.environ.get(ENV_STREAM_CLIENT_BUFFER_BYTES, "") or 0)
+        except ValueError:
+            buffer_bytes = 0
+        policy = os.environ.get(ENV_STREAM_SLOW_CLIENT_POLICY, "").strip().lower()
+        return cls(
+            address,
+            tx_callback=tx_callback,
+            client_buffer_bytes=buffer_bytes or cls.DEFAULT_CLIENT_BUFFER_BYTES,
+            slow_client_policy=policy or cls.POLICY_DROP_OLDEST,
+        )
+
+    # === 시작 / 종료 ===
+
+    def _create_listener(self) -> socket.socket:
+        if self._address.startswith("unix:"):
+            path = os.path.abspath(os.path.expanduser(self._address[len("unix:"):]))
+            if os.path.exists(path):
+                os.unlink(path)  # 이전 실행이 남긴 소켓 파일
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            listener.bind(path)
+            os.chmod(path, 0o600)
+            self._unix_path = path
+        elif self._address.startswith("tcp:"):
+            host, _sep, port = self._address[len("tcp:"):].rpartition(":")
+            host = host or "127.0.0.1"
+            if not self._is_loopback(host):
+                raise ValueError(
+                    f"TCP 스트림 서버는 루프백 주소에만 바인딩할 수 있습니다: {host} "
+                    "(다른 호스트에서 접속하면 시리얼 포트에 쓸 수 있음)"
+                )
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind((host, int(port)))
+        else:
+            raise ValueError(f"지원하지 않는 주소 형식: {self._address}")
+        listener.listen(self.MAX_CLIENTS)
+        listener.setblocking(False)
+        return listener
+
+    @staticmethod
+    def _is_loopback(host: str) -> bool:
+        try:
+            return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+        except (OSError, ValueError):
+            return False
+
+    def start(self) -> None:
+        """리스닝 시작 (실패 시 OSError/ValueError)"""
+        if self._running:
+            return
+        self._listener = self._create_listener()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_r, selectors.EVENT_READ, "wake")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="StreamServer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(2.0)
+            self._thread = None
+        with self._lock:
+            for client in list(self._clients.values()):
+                client.sock.close()
+            self._clients.clear()
+        for sock in (self._listener, self._wake_r, self._wake_w):
+            if sock is not None:
+                sock.close()
+        self._listener = self._wake_r = self._wake_w = None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._unix_path and os.path.exists(self._unix_path):
+            os.unlink(self._unix_path)
+        self._unix_path = ""
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    @property
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    # === RX 팬아웃 (호출 스레드: GUI/캡처) ===
+
+    def publish(self, data: bytes) -> None:
+        """수신 데이터를 모든 클라이언트 버퍼에 추가 (블로킹 없음)"""
+        if not self._running or not data:
+            return
+        with self._lock:
+            if not self._clients:
+                return
+            for client in self._clients.values():
+                if client.closing:
+                    continue
+                client.chunks.append(data)
+                client.buffered += len(data)
+                if client.buffered > self._client_buffer_bytes:
+                    self._apply_slow_client_policy(client)
+        self._wake()
+
+    def _apply_slow_client_policy(self, client: _StreamClient) -> None:
+        """버퍼 초과 클라이언트 처리 (잠금 보유 상태에서 호출)"""
+        if self._policy == self.POLICY_DISCONNECT:
+            client.closing = True
+            client.chunks.clear()
+            client.buffered = 0
+            self._stats["disconnected_slow"] += 1
+            return
+        # 오래된 청크부터 폐기 (송신 중인 첫 청크는 유지하여 바이트 경계 보존)
+        head_busy = client.offset or client.in_flight
+        keep = 2 if head_busy else 1
+        index = 1 if head_busy else 0
+        while client.buffered > self._client_buffer_bytes and len(client.chunks) > keep:
+            dropped = client.chunks[index]
+            del client.chunks[index]
+            client.buffered -= len(dropped)
+            client.dropped_bytes += len(dropped)
+            self._stats["dropped_bytes"] += len(dropped)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError, AttributeError):
+            pass  # 이미 깨우기 요청이 대기 중
+
+    # === I/O 스레드 ===
+
+    def _run(self) -> None:
+        while self._running:
+            for key, events in self._selector.select(timeout=0.5):
+                if key.data == "accept":
+                    self._accept()
+                elif key.data == "wake":
+                    try:
+                        while self._wake_r.recv(4096):
+                            pass
+                    except (BlockingIOError, OSError):
+                        pass
+                else:
+                    client = key.data
+                    if events & selectors.EVENT_READ:
+                        self._read_client(client)
+                    if events & selectors.EVENT_WRITE:
+                        self._flush_client(client)
+            self._update_interest()
+
+    def _accept(self) -> None:
+        try:
+            sock, address = self._listener.accept()
+        except (BlockingIOError, OSError):
+            return
+        with self._lock:
+            if len(self._clients) >= self.MAX_CLIENTS:
+                sock.close()
+                return
+            sock.setblocking(False)
+            client = _StreamClient(sock, str(address or "unix"))
+            self._clients[sock] = client
+        self._selector.register(sock, selectors.EVENT_READ, client)
+
+    def _read_client(self, client: _StreamClient) -> None:
+        try:
+            data = client.sock.recv(self.RECV_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close_client(client)
+            return
+        if self._tx_callback is not None:
+            try:
+                self._tx_callback(data)
+                with self._lock:
+                    self._stats["tx_bytes"] += len(data)
+            except Exception:
+                pass  # 포트 미연결 등: 클라이언트 입력은 폐기
+
+    def _flush_client(self, client: _StreamClient) -> None:
+        while True:
+            with self._lock:
+                if not client.chunks:
+                    return
+                chunk = client.chunks[0]
+                view = memoryview(chunk)[client.offset:]
+                client.in_flight = True
+            try:
+                sent = client.sock.send(view)
+            except BlockingIOError:
+                sent = 0
+            except OSError:
+                self._close_client(client)
+                return
+            with self._lock:
+                client.in_flight = False
+                if not sent:
+                    return
+                client.sent_bytes += sent
+                client.buffered -= sent
+                if client.offset + sent >= len(chunk):
+                    client.chunks.popleft()
+                    client.offset = 0
+                else:
+                    client.offset += sent
+                    return
+
+    def _update_interest(self) -> None:
+        """송신 대기 데이터 유무에 따라 쓰기 감시 등록/해제, 종료 표시 클라이언트 정리"""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            if client.closing:
+                self._close_client(client)
+                continue
+            events = selectors.EVENT_READ
+            if client.chunks:
+                events |= selectors.EVENT_WRITE
+            try:
+                self._selector.modify(client.sock, events, client)
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _close_client(self, client: _StreamClient) -> None:
+        with self._lock:
+            self._clients.pop(client.sock, None)
+        try:
+            self._selector.unregister(client.sock)
+        except (KeyError, ValueError, OSError):
+            pass
+        client.sock.close()
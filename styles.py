@@ -55,6 +55,22 @@ COLORS = {
     "menu_item_pressed": "#005A9E",
 }
 
+# 기본 하이라이트 규칙 (설정 파일에 규칙 섹션이 없을 때, Qt 없이 불러올 수 있도록 여기 정의)
+DEFAULT_HIGHLIGHT_RULES = [
+    {"pattern": "ERROR", "regex": False, "ignore_case": False, "color": COLORS["error"], "line": True},
+    {"pattern": "FAIL", "regex": False, "ignore_case": False, "color": COLORS["error"], "line": True},
+    {"pattern": r"\bassert", "regex": True, "ignore_case": True, "color": COLORS["error"], "line": True},
+    {"pattern": r"\bWARN(?:ING)?\b", "regex": True, "ignore_case": False, "color": COLORS["warning"], "line": True},
+]
+
+# ANSI SGR 기본 16색 (30~37 / 90~97, One Dark 계열)
+ANSI_COLORS = [
+    "#3F4451", COLORS["terminal_red"], COLORS["terminal_green"], COLORS["terminal_yellow"],
+    COLORS["terminal_blue"], "#C678DD", "#56B6C2", COLORS["terminal_white"],
+    "#5C6370", "#FF7A85", "#B5E890", "#FFD68A",
+    "#7CC5FF", "#DE8EFF", "#6CD9E8", "#FFFFFF",
+]
+
 
 def get_main_stylesheet():
     """메인 애플리케이션 QSS 스타일시트 반환"""
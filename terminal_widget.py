@@ -7,13 +7,21 @@ from PyQt6.QtWidgets import QPlainTextEdit
 from PyQt6.QtGui import QTextCharFormat, QColor, QTextCursor, QFont
 from PyQt6.QtCore import Qt, pyqtSignal
 
-from styles import COLORS, get_terminal_stylesheet
+import ansi_parser
+from styles import ANSI_COLORS, COLORS, get_terminal_stylesheet
+from line_pipeline import LineFramer
 
 
 class TerminalWidget(QPlainTextEdit):
     """터미널 출력 위젯"""
 
     DEFAULT_MAX_LINES = 1_000_000
+    # 방향별 기본 본문 색상 (ANSI 전경색이 없을 때)
+    DIRECTION_COLORS = {
+        "rx": COLORS["terminal_green"],
+        "tx": COLORS["terminal_blue"],
+        "sys": COLORS["terminal_yellow"],
+    }
 
     def __init__(self, parent=None, max_lines: int = None):
         super().__init__(parent)
@@ -32,8 +40,19 @@ class TerminalWidget(QPlainTextEdit):
         # 자동 스크롤 상태
         self._auto_scroll = True
 
-        # 미완성 라인 버퍼 (수신 데이터가 줄 단위로 오지 않을 수 있음)
-        self._line_buffer = ""
+        # 미완성 라인 버퍼 (수신 데이터가 줄 단위로 오지 않을 수 있음) + ANSI SGR 해석
+        self._framer = LineFramer(ansi=True, keep_raw=ansi_parser.keep_raw_from_env())
+
+        # 서식 캐시 (라인마다 QTextCharFormat을 새로 만들지 않음)
+        self._timestamp_format = QTextCharFormat()
+        self._timestamp_format.setForeground(QColor(COLORS["terminal_yellow"]))
+        self._direction_formats: dict[str, tuple[str, QTextCharFormat]] = {}
+        for direction, prefix in (("rx", " "), ("tx", " "), ("sys", " SYS ")):
+            dir_format = QTextCharFormat()
+            dir_format.setForeground(QColor(self.DIRECTION_COLORS[direction]))
+            self._direction_formats[direction] = (prefix, dir_format)
+        self._text_formats: dict[tuple[str, int], QTextCharFormat] = {}
+        self._highlighter = None    # 사용자 하이라이트 규칙 (set_highlight_rules)
 
     # 스크롤바 위치 변경 감지
         self.verticalScrollBar().valueChanged.connect(self._on_scroll_changed)
@@ -79,11 +98,17 @@ class TerminalWidget(QPlainTextEdit):
         now = datetime.now()
         return now.strftime("[%Y-%m-%d %H:%M:%S.") + f"{now.microsecond // 1000:03d}]"
 
+    @staticmethod
+    def get_full_timestamp() -> str:
+        """로그 기록용 전체 타임스탬프 반환 (LogManager.get_timestamp와 같은 형식)"""
+        now = datetime.now()
+        return now.strftime("[%Y-%m-%d %H:%M:%S.") + f"{now.microsecond // 1000:03d}]"
+
     def append_data(self, data: str, direction: str = "rx") -> list[tuple[str, str]]:
         """수신/송신 데이터를 터미널에 추가
 
         Args:
-            data: 표시할 텍스트
+            data: 표시할 텍스트 (ANSI SGR 색상은 서식으로 표시, 그 밖의 시퀀스는 제거)
             direction: "rx" (수신), "tx" (송신), "sys" (시스템 메시지)
 
         Returns:
@@ -91,74 +116,101 @@ class TerminalWidget(QPlainTextEdit):
         """
         completed_lines = []
 
-        # 방향별 색상
-        if direction == "tx":
-            text_color = QColor(COLORS["terminal_blue"])
-        elif direction == "sys":
-            text_color = QColor(COLORS["terminal_yellow"])
-        else:
-            text_color = QColor(COLORS["terminal_green"])
-
-        timestamp_color = QColor(COLORS["terminal_yellow"])
-
-        # 모든 CR 문자 제거 (타임스탬프 덮어쓰기 방지)
-        data = data.replace("\r", "")
-
-        # 버퍼에 추가
-        self._line_buffer += data
-
-        # 라인 단위로 처리
-        while "\n" in self._line_buffer:
-            line, self._line_buffer = self._line_buffer.split("\n", 1)
-
+        # 라인 단위로 처리 (CR 문자는 프레이머에서 제거: 타임스탬프 덮어쓰기 방지)
+        for line, runs in self._framer.feed_styled(data):
             timestamp = self.get_timestamp()
 
             # 터미널에 라인 추가 (빈 라인도 타임스탬프와 함께 표시)
-            self._append_formatted_line(timestamp, line, timestamp_color, text_color, direction)
+            self._append_formatted_line(timestamp, runs, direction)
 
             completed_lines.append((timestamp, line))
 
         return completed_lines
 
-    def _append_formatted_line(
-        self, timestamp: str, text: str,
-        ts_color: QColor, text_color: QColor,
-        direction: str
+    def _append_formatted_line(self, timestamp: str, runs: list[tuple[str, int]], direction: str):
+        """포맷된 라인을 터미널에 추가 (서식은 캐시된 QTextCharFormat 재사용)"""
+        self._insert_line(
+            timestamp, direction,
+            [(text, self._text_format(direction, style_id)) for text, style_id in runs],
+        )
+
+    def _insert_line(
+        self, timestamp: str, direction: str, parts: list[tuple[str, QTextCharFormat]]
     ):
-        """포맷된 라인을 터미널에 추가"""
+        """타임스탬프 + 방향 표시 + 본문 구간(텍스트, 서식)을 한 줄로 추가"""
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        # 타임스탬프 포맷
-        ts_format = QTextCharFormat()
-        ts_format.setForeground(ts_color)
-
-        # 방향 표시 (TX는 접두사 없이 색상만 구분)
-        dir_format = QTextCharFormat()
-        if direction == "tx":
-            dir_format.setForeground(QColor(COLORS["terminal_blue"]))
-            dir_prefix = " "
-        elif direction == "sys":
-            dir_format.setForeground(QColor(COLORS["terminal_yellow"]))
-            dir_prefix = " SYS "
-        else:
-            dir_format.setForeground(QColor(COLORS["terminal_green"]))
-            dir_prefix = " "
-
-        # 텍스트 포맷
-        txt_format = QTextCharFormat()
-        txt_format.setForeground(text_color)
-
         # 줄 추가
         if self.document().blockCount() > 1 or self.toPlainText():
             cursor.insertText("\n")
 
-        cursor.insertText(timestamp, ts_format)
+        # 방향 표시 (TX는 접두사 없이 색상만 구분)
+        dir_prefix, dir_format = self._direction_formats.get(direction, self._direction_formats["rx"])
+        cursor.insertText(timestamp, self._timestamp_format)
         cursor.insertText(dir_prefix, dir_format)
-        cursor.insertText(text, txt_format)
+        for text, text_format in parts:
+            cursor.insertText(text, text_format)
 
         self.setTextCursor(cursor)
 
+    def _text_format(self, direction: str, style_id: int) -> QTextCharFormat:
+        """(방향, 스타일 id)별 본문 서식 (처음 쓰일 때 한 번만 생성)"""
+        text_format = self._text_formats.get((direction, style_id))
+        if text_format is None:
+            text_format = self._build_text_format(direction, style_id)
+            self._text_formats[(direction, style_id)] = text_format
+        return text_format
+
+    def _build_text_format(self, direction: str, style_id: int) -> QTextCharFormat:
+        style = self._framer.parser.table.style(style_id)
+        fg = self._ansi_color(style[ansi_parser.FG])
+        bg = self._ansi_color(style[ansi_parser.BG])
+        if fg is None:
+            fg = QColor(self.DIRECTION_COLORS.get(direction, self.DIRECTION_COLORS["rx"]))
+        if style[ansi_parser.INVERSE]:
+            fg, bg = (bg or QColor(COLORS["bg_dark"])), fg
+        if style[ansi_parser.DIM]:
+            fg = QColor(fg)
+            fg.setAlpha(150)
+
+        text_format = QTextCharFormat()
+        text_format.setForeground(fg)
+        if bg is not None:
+            text_format.setBackground(bg)
+        if style[ansi_parser.BOLD]:
+            text_format.setFontWeight(QFont.Weight.Bold)
+        if style[ansi_parser.ITALIC]:
+            text_format.setFontItalic(True)
+        if style[ansi_parser.UNDERLINE]:
+            text_format.setFontUnderline(True)
+        if style[ansi_parser.STRIKE]:
+            text_format.setFontStrikeOut(True)
+        return text_format
+
+    @staticmethod
+    def _ansi_color(value) -> QColor | None:
+        if value is None:
+            return None
+        if isinstance(value, tuple):
+            return QColor(*value)
+        if value < len(ANSI_COLORS):
+            return QColor(ANSI_COLORS[value])
+        return QColor(*ansi_parser.palette_rgb(value))
+
+    def set_highlight_rules(self, rule_set) -> None:
+        """하이라이트 규칙 세트 연결 (보이는 줄에만 지연 적용, None이면 해제)"""
+        if self._highlighter is not None:
+            self._highlighter.deleteLater()
+            self._highlighter = None
+        if rule_set is not None:
+            from highlight_rules import ViewportHighlighter
+            self._highlighter = ViewportHighlighter(self, rule_set)
+
+    def set_ansi_keep_raw(self, keep_raw: bool) -> None:
+        """반환 라인(로그/통계/자동 명령용)에 ANSI 시퀀스 원본 유지 여부"""
+        self._framer.set_keep_raw(keep_raw)
+
     def append_system_message(self, message: str) -> list[tuple[str, str]]:
         """시스템 메시지 추가"""
         return self.append_data(message + "\n", direction="sys")
@@ -166,20 +218,15 @@ class TerminalWidget(QPlainTextEdit):
     def flush_buffer(self) -> list[tuple[str, str]]:
         """미완성 라인 버퍼 강제 플러시"""
         completed_lines = []
-        if self._line_buffer:
+        if self._framer.pending:
             timestamp = self.get_timestamp()
             full_timestamp = self.get_full_timestamp()
-            line = self._line_buffer
-            self._line_buffer = ""
-
-            ts_color = QColor(COLORS["terminal_yellow"])
-            text_color = QColor(COLORS["terminal_green"])
-            self._append_formatted_line(timestamp, line, ts_color, text_color, "rx")
-
+            line, runs = self._framer.flush_styled()
+            self._append_formatted_line(timestamp, runs, "rx")
             completed_lines.append((full_timestamp, line))
         return completed_lines
 
     def clear_terminal(self):
         """터미널 내용 초기화"""
         self.clear()
-        self._line_buffer = ""
+        self._framer.clear()
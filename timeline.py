@@ -0,0 +1,82 @@
+"""
+통합 타임라인 모듈
+- 여러 포트 세션의 수신 라인을 수신 시각(monotonic ns) 순으로 병합
+- 짧은 재정렬 윈도우 동안 보류 후 정렬된 순서로 출력 (스레드 간 시그널 도착 순서 보정)
+"""
+
+import heapq
+import itertools
+import time
+from datetime import datetime
+from PyQt6.QtGui import QColor, QTextCharFormat
+
+from styles import COLORS
+from terminal_widget import TerminalWidget
+
+
+class TimelineMerger:
+    """수신 시각 기준 라인 병합기 (힙 + 재정렬 윈도우)"""
+
+    DEFAULT_REORDER_WINDOW_MS = 100
+
+    def __init__(self, reorder_window_ms: int = DEFAULT_REORDER_WINDOW_MS):
+        self._window_ns = max(0, int(reorder_window_ms)) * 1_000_000
+        self._heap: list[tuple[int, int, str, str, str]] = []
+        self._sequence = itertools.count()
+
+    def push(self, source: str, rx_ns: int, line: str, direction: str = "rx") -> None:
+        """라인 추가 (rx_ns: 리더 스레드 수신 시각)"""
+        heapq.heappush(self._heap, (rx_ns, next(self._sequence), source, direction, line))
+
+    def pop_ready(self, now_ns: int = None) -> list[tuple[int, str, str, str]]:
+        """재정렬 윈도우가 지난 라인을 시각 순으로 반환 [(rx_ns, source, direction, line), ...]"""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        deadline = now_ns - self._window_ns
+        ready = []
+        while self._heap and self._heap[0][0] <= deadline:
+            rx_ns, _seq, source, direction, line = heapq.heappop(self._heap)
+            ready.append((rx_ns, source, direction, line))
+        return ready
+
+    def pending_count(self) -> int:
+        return len(self._heap)
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+
+class TimelineWidget(TerminalWidget):
+    """모든 포트 세션의 라인을 병합 표시하는 읽기 전용 터미널"""
+
+    SOURCE_COLORS = ("terminal_green", "terminal_blue", "accent", "terminal_yellow")
+
+    def __init__(self, parent=None, max_lines: int = None):
+        super().__init__(parent, max_lines)
+        # monotonic ns → 벽시계 변환 오프셋 (표시용)
+        self._wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        self._source_formats: dict[str, QTextCharFormat] = {}
+        self._tx_format = QTextCharFormat()
+        self._tx_format.setForeground(QColor(COLORS["terminal_blue"]))
+
+    def _format_for(self, source: str) -> QTextCharFormat:
+        source_format = self._source_formats.get(source)
+        if source_format is None:
+            key = self.SOURCE_COLORS[len(self._source_formats) % len(self.SOURCE_COLORS)]
+            source_format = QTextCharFormat()
+            source_format.setForeground(QColor(COLORS[key]))
+            self._source_formats[source] = source_format
+        return source_format
+
+    def format_rx_timestamp(self, rx_ns: int) -> str:
+        """수신 시각(monotonic ns)을 터미널 타임스탬프 형식으로 변환"""
+        wall = datetime.fromtimestamp((rx_ns + self._wall_offset_ns) / 1_000_000_000)
+        return wall.strftime("[%Y-%m-%d %H:%M:%S.") + f"{wall.microsecond // 1000:03d}]"
+
+    def append_timeline_lines(self, items: list[tuple[int, str, str, str]]) -> None:
+        """TimelineMerger.pop_ready() 결과를 표시"""
+        for rx_ns, source, direction, line in items:
+            text_format = self._tx_format if direction == "tx" else self._format_for(source)
+            self._insert_line(
+                self.format_rx_timestamp(rx_ns), direction, [(f"[{source}] {line}", text_format)]
+            )
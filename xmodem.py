@@ -0,0 +1,427 @@
+"""
+XMODEM-1K / YMODEM 파일 전송 모듈
+- 송신/수신 (CRC-16 모드, 수신 측 NAK 시 체크섬 모드 폴백)
+- 블록 데이터는 사전 할당 버퍼 + memoryview로 처리
+- CRC는 파일/포트에서 청크가 들어올 때마다 누적 계산 (프로토콜상 블록마다 0에서 다시 시작)
+- YMODEM 헤더(파일 이름 + 크기)가 128바이트를 넘으면 1024바이트(STX) 블록 0으로 송신
+- 포트 객체는 read(n) / write(data)만 필요 (pyserial, pty 래퍼 등)
+"""
+
+import binascii
+import os
+import threading
+import time
+from PyQt6.QtCore import QThread, pyqtSignal
+
+SOH = 0x01
+STX = 0x02
+EOT = 0x04
+ACK = 0x06
+NAK = 0x15
+CAN = 0x18
+CRC_REQUEST = 0x43  # 'C'
+PAD = 0x1A
+
+PROTOCOL_XMODEM_1K = "xmodem1k"
+PROTOCOL_YMODEM = "ymodem"
+
+
+YMODEM_MAX_HEADER = 1024
+
+
+class ModemTransferError(Exception):
+    """XMODEM/YMODEM 전송 실패"""
+
+
+def crc16_update(crc: int, data) -> int:
+    """CRC-16/XMODEM(CCITT, poly 0x1021) 누적 계산"""
+    return binascii.crc_hqx(data, crc)
+
+
+def checksum8_update(value: int, data) -> int:
+    """8비트 합 체크섬 누적 계산"""
+    return (value + sum(data)) & 0xFF
+
+
+class _ModemBase:
+    """송신/수신 공용 포트 입출력 헬퍼"""
+
+    def __init__(self, port, progress_cb=None, cancel_event: threading.Event = None,
+                 timeout: float = 10.0, retries: int = 10):
+        self._port = port
+        self._progress_cb = progress_cb
+        self._cancel_event = cancel_event or threading.Event()
+        self._timeout = timeout
+        self._retries = retries
+
+    def _check_cancel(self):
+        if self._cancel_event.is_set():
+            self._write(bytes([CAN] * 5))
+            raise ModemTransferError("사용자에 의해 전송이 취소되었습니다.")
+
+    def _write(self, data) -> None:
+        self._port.write(data)
+
+    def _read_exact(self, size: int, timeout: float = None) -> bytes | None:
+        """size 바이트를 모두 읽을 때까지 대기. 시간 초과 시 None"""
+        deadline = time.monotonic() + (self._timeout if timeout is None else timeout)
+        chunks = bytearray()
+        while len(chunks) < size:
+            if self._cancel_event.is_set():
+                return None
+            chunk = self._port.read(size - len(chunks))
+            if chunk:
+                chunks += chunk
+            elif time.monotonic() >= deadline:
+                return None
+        return bytes(chunks)
+
+    def _read_into(self, view: memoryview, on_chunk=None, timeout: float = None) -> bool:
+        """view를 모두 채울 때까지 읽기. 청크마다 on_chunk(청크 view) 호출. 시간 초과/취소 시 False"""
+        deadline = time.monotonic() + (self._timeout if timeout is None else timeout)
+        filled = 0
+        while filled < len(view):
+            if self._cancel_event.is_set():
+                return False
+            chunk = self._port.read(len(view) - filled)
+            if chunk:
+                end = filled + len(chunk)
+                view[filled:end] = chunk
+                if on_chunk is not None:
+                    on_chunk(view[filled:end])
+                filled = end
+            elif time.monotonic() >= deadline:
+                return False
+        return True
+
+    def _read_byte(self, timeout: float = None) -> int | None:
+        data = self._read_exact(1, timeout)
+        return data[0] if data else None
+
+    def _report(self, done: int, total: int):
+        if self._progress_cb is not None:
+            self._progress_cb(done, total)
+
+
+class ModemSender(_ModemBase):
+    """XMODEM-1K / YMODEM 송신기"""
+
+    def __init__(self, port, protocol: str = PROTOCOL_XMODEM_1K, **kwargs):
+        super().__init__(port, **kwargs)
+        self._protocol = protocol
+        self._use_crc = True
+        self._block = bytearray(3 + 1024 + 2)
+        self._view = memoryview(self._block)
+
+    def send_file(self, path: str) -> int:
+        """파일 송신. 송신한 데이터 바이트 수 반환"""
+        size = os.path.getsize(path)
+        with open(path, "rb", buffering=0) as fp:
+            return self.send_stream(fp, os.path.basename(path), size)
+
+    def send_stream(self, stream, filename: str, size: int) -> int:
+        if self._protocol == PROTOCOL_YMODEM:
+            header = filename.encode("utf-8") + b"\0" + f"{size} {0:o}".encode("ascii") + b"\0"
+            if len(header) > YMODEM_MAX_HEADER:
+                raise ModemTransferError("파일 이름이 너무 깁니다 (YMODEM 헤더 1024바이트 초과)")
+        self._wait_for_start()
+        if self._protocol == PROTOCOL_YMODEM:
+            self._send_block(0, header, 128 if len(header) <= 128 else 1024)
+            # 헤더 ACK 후 수신 측이 데이터 수신용 'C'를 다시 보냄
+            self._wait_for_start()
+
+        sent = 0
+        sequence = 1
+        self._report(0, size)
+        while True:
+            self._check_cancel()
+            remaining = size - sent
+            block_size = 1024 if remaining > 128 else 128
+            payload = self._view[3:3 + block_size]
+            # 블록을 채우면서 읽어 들인 청크마다 CRC(또는 체크섬) 누적
+            count = 0
+            check = 0
+            while count < block_size:
+                chunk_size = stream.readinto(payload[count:])
+                if not chunk_size:
+                    break
+                check = self._update_check(check, payload[count:count + chunk_size])
+                count += chunk_size
+            if not count:
+                break
+            if count < block_size:
+                payload[count:] = bytes([PAD]) * (block_size - count)
+                check = self._update_check(check, payload[count:])
+            self._send_prepared_block(sequence, block_size, check)
+            sent += count
+            sequence = (sequence + 1) & 0xFF
+            self._report(sent, size)
+
+        self._send_eot()
+        if self._protocol == PROTOCOL_YMODEM:
+            # 배치 종료: 빈 블록 0 전송
+            self._wait_for_start()
+            self._send_block(0, b"", 128)
+        return sent
+
+    def _wait_for_start(self):
+        """수신 측 시작 요청('C' 또는 NAK) 대기"""
+        deadline = time.monotonic() + self._timeout * 6
+        while time.monotonic() < deadline:
+            self._check_cancel()
+            value = self._read_byte(1.0)
+            if value == CRC_REQUEST:
+                self._use_crc = True
+                return
+            if value == NAK:
+                self._use_crc = False
+                return
+            if value == CAN:
+                raise ModemTransferError("수신 측에서 전송을 취소했습니다.")
+        raise ModemTransferError("수신 측 시작 요청 대기 시간 초과")
+
+    def _update_check(self, value: int, data) -> int:
+        if self._use_crc:
+            return crc16_update(value, data)
+        return checksum8_update(value, data)
+
+    def _send_block(self, sequence: int, data: bytes, block_size: int):
+        payload = self._view[3:3 + block_size]
+        payload[:len(data)] = data
+        payload[len(data):] = bytes(block_size - len(data))
+        self._send_prepared_block(sequence, block_size, self._update_check(0, payload))
+
+    def _send_prepared_block(self, sequence: int, block_size: int, check: int):
+        """버퍼에 채워진 블록에 헤더/CRC(check)를 붙여 송신, ACK까지 재시도"""
+        self._block[0] = STX if block_size == 1024 else SOH
+        self._block[1] = sequence
+        self._block[2] = 0xFF - sequence
+        if self._use_crc:
+            self._block[3 + block_size] = check >> 8
+            self._block[4 + block_size] = check & 0xFF
+            frame = self._view[:5 + block_size]
+        else:
+            self._block[3 + block_size] = check
+            frame = self._view[:4 + block_size]
+
+        for _attempt in range(self._retries):
+            self._check_cancel()
+            self._write(frame)
+            response = self._read_byte()
+            if response == ACK:
+                return
+            if response == CAN:
+                raise ModemTransferError("수신 측에서 전송을 취소했습니다.")
+        raise ModemTransferError(f"블록 {sequence} 전송 재시도 초과")
+
+    def _send_eot(self):
+        for _attempt in range(self._retries):
+            self._check_cancel()
+            self._write(bytes([EOT]))
+            response = self._read_byte()
+            if response == ACK:
+                return
+        raise ModemTransferError("EOT 응답 대기 시간 초과")
+
+
+class ModemReceiver(_ModemBase):
+    """XMODEM-1K / YMODEM 수신기 (CRC-16 모드)"""
+
+    def __init__(self, port, protocol: str = PROTOCOL_XMODEM_1K, **kwargs):
+        super().__init__(port, **kwargs)
+        self._protocol = protocol
+        self._buffer = bytearray(1024 + 2)
+        self._view = memoryview(self._buffer)
+
+    def receive_file(self, target: str) -> str:
+        """파일 수신. XMODEM은 target 파일 경로, YMODEM은 target 디렉토리. 저장 경로 반환"""
+        if self._protocol == PROTOCOL_YMODEM:
+            filename, size = self._receive_ymodem_header()
+            path = os.path.join(target, os.path.basename(filename) or "ymodem.bin")
+        else:
+            filename, size = "", None
+            path = target
+
+        with open(path, "wb") as fp:
+            written = self._receive_data(fp, size)
+            if size is not None and written > size:
+                fp.truncate(size)
+            elif size is None:
+                self._strip_padding(fp)
+
+        if self._protocol == PROTOCOL_YMODEM:
+            # 배치 종료 블록(빈 블록 0) 수신
+            self._write(bytes([CRC_REQUEST]))
+            header = self._read_block_header()
+            if header is not None:
+                block_size, _sequence = header
+                self._read_block_body(block_size)
+                self._write(bytes([ACK]))
+        return path
+
+    def _receive_ymodem_header(self) -> tuple[str, int | None]:
+        for _attempt in range(self._retries * 3):
+            self._check_cancel()
+            self._write(bytes([CRC_REQUEST]))
+            header = self._read_block_header(timeout=3.0)
+            if header is None:
+                continue
+            block_size, sequence = header
+            payload = self._read_block_body(block_size)
+            if payload is None or sequence != 0:
+                self._write(bytes([NAK]))
+                continue
+            self._write(bytes([ACK]))
+            fields = bytes(payload).split(b"\0")
+            filename = fields[0].decode("utf-8", errors="replace")
+            size = None
+            if len(fields) > 1 and fields[1]:
+                try:
+                    size = int(fields[1].split(b" ")[0])
+                except ValueError:
+                    size = None
+            return filename, size
+        raise ModemTransferError("YMODEM 헤더 수신 실패")
+
+    def _read_block_header(self, timeout: float = None):
+        """블록 시작 바이트/시퀀스 읽기. EOT면 ("eot", None), 시간 초과 시 None"""
+        start = self._read_byte(timeout)
+        if start is None:
+            return None
+        if start == EOT:
+            return "eot", None
+        if start == CAN:
+            raise ModemTransferError("송신 측에서 전송을 취소했습니다.")
+        if start not in (SOH, STX):
+            return "junk", None
+        sequence_pair = self._read_exact(2)
+        if sequence_pair is None or sequence_pair[0] != 0xFF - sequence_pair[1]:
+            return "junk", None
+        return (1024 if start == STX else 128), sequence_pair[0]
+
+    def _read_block_body(self, block_size: int):
+        """블록 데이터 + CRC 읽기 (CRC는 청크 수신마다 누적). CRC 불일치 시 None"""
+        crc = 0
+
+        def update(chunk):
+            nonlocal crc
+            crc = crc16_update(crc, chunk)
+
+        payload = self._view[:block_size]
+        if not self._read_into(payload, update) or not self._read_into(self._view[block_size:block_size + 2]):
+            return None
+        expected = (self._buffer[block_size] << 8) | self._buffer[block_size + 1]
+        if crc != expected:
+            return None
+        return payload
+
+    def _receive_data(self, fp, size: int | None) -> int:
+        expected_sequence = 1
+        written = 0
+        self._write(bytes([CRC_REQUEST]))
+        eot_count = 0
+        errors = 0
+        while True:
+            self._check_cancel()
+            header = self._read_block_header()
+            if header is None or header[0] == "junk":
+                errors += 1
+                if errors > self._retries:
+                    raise ModemTransferError("블록 수신 재시도 초과")
+                self._write(bytes([NAK if written or expected_sequence > 1 else CRC_REQUEST]))
+                continue
+            if header[0] == "eot":
+                eot_count += 1
+                if self._protocol == PROTOCOL_YMODEM and eot_count == 1:
+                    self._write(bytes([NAK]))
+                    continue
+                self._write(bytes([ACK]))
+                return written
+
+            block_size, sequence = header
+            payload = self._read_block_body(block_size)
+            if payload is None:
+                errors += 1
+                self._write(bytes([NAK]))
+                continue
+            if sequence == ((expected_sequence - 1) & 0xFF):
+                # 중복 블록 (ACK 유실): 기록하지 않고 ACK
+                self._write(bytes([ACK]))
+                continue
+            if sequence != expected_sequence:
+                self._write(bytes([CAN] * 5))
+                raise ModemTransferError("블록 순서 오류")
+            fp.write(payload)
+            written += block_size
+            errors = 0
+            expected_sequence = (expected_sequence + 1) & 0xFF
+            self._write(bytes([ACK]))
+            self._report(min(written, size) if size is not None else written, size or 0)
+
+    @staticmethod
+    def _strip_padding(fp):
+        """XMODEM 마지막 블록의 SUB(0x1A) 패딩 제거"""
+        end = fp.tell()
+        if end == 0:
+            return
+        fp.flush()
+        with open(fp.name, "rb") as reader:
+            reader.seek(max(0, end - 1024))
+            tail = reader.read()
+        stripped = len(tail) - len(tail.rstrip(bytes([PAD])))
+        if stripped:
+            fp.truncate(end - stripped)
+
+
+class ModemTransferThread(QThread):
+    """시리얼 세션 위에서 XMODEM/YMODEM 송수신 수행 스레드"""
+
+    progress = pyqtSignal(int, int, float)     # (처리 바이트, 전체 바이트, bytes/s)
+    finished_transfer = pyqtSignal(bool, str, int, float)  # (성공, 경로 또는 오류, 바이트, 경과초)
+
+    DIRECTION_SEND = "send"
+    DIRECTION_RECEIVE = "receive"
+
+    def __init__(self, port, direction: str, protocol: str, path: str, parent=None):
+        super().__init__(parent)
+        self._port = port
+        self._direction = direction
+        self._protocol = protocol
+        self._path = path
+        self._cancel_event = threading.Event()
+        self._started_at = 0.0
+        self._done = 0
+
+    @property
+    def direction(self) -> str:
+        return self._direction
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _on_progress(self, done: int, total: int):
+        self._done = done
+        elapsed = max(1e-6, time.monotonic() - self._started_at)
+        self.progress.emit(done, total, done / elapsed)
+
+    def run(self):
+        self._started_at = time.monotonic()
+        kwargs = {"progress_cb": self._on_progress, "cancel_event": self._cancel_event}
+        try:
+            if self._direction == self.DIRECTION_SEND:
+                sender = ModemSender(self._port, self._protocol, **kwargs)
+                self._done = sender.send_file(self._path)
+                result = self._path
+            else:
+                receiver = ModemReceiver(self._port, self._protocol, **kwargs)
+                result = receiver.receive_file(self._path)
+                self._done = os.path.getsize(result)
+            ok = True
+        except (ModemTransferError, OSError) as e:
+            ok = False
+            result = str(e)
+        self.finished_transfer.emit(ok, result, self._done, time.monotonic() - self._started_at)
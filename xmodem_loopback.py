@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+XMODEM-1K / YMODEM pty 루프백 검증
+- os.openpty() 쌍의 한쪽에 ModemSender, 다른 쪽에 ModemReceiver(로컬 대역 수신기)를 붙여 왕복 전송
+- 크기별 무작위 데이터를 보내고 받은 파일과 바이트 단위로 비교, 크기/소요 시간/처리량 출력
+- YMODEM은 128바이트를 넘는 헤더(긴 파일 이름 → STX 블록 0)도 함께 확인
+
+사용 예:
+    python3 xmodem_loopback.py
+    python3 xmodem_loopback.py --protocol ymodem --size 0 --size 300000
+
+XMODEM은 파일 크기를 전달하지 않아 수신 측이 끝의 SUB(0x1A) 패딩을 잘라내므로,
+시험 데이터의 마지막 바이트는 0x1A가 아니도록 만든다.
+"""
+
+import argparse
+import os
+import random
+import select
+import sys
+import tempfile
+import threading
+import time
+import tty
+
+from xmodem import (
+    PAD, PROTOCOL_XMODEM_1K, PROTOCOL_YMODEM, ModemReceiver, ModemSender, ModemTransferError,
+)
+
+DEFAULT_SIZES = [0, 1, 127, 128, 129, 1023, 1024, 1025, 4097, 65536, 300000]
+LONG_NAME = "bootloader_image_" + "x" * 150 + ".bin"
+
+
+class PtyPort:
+    """pty fd를 read(n) / write(data) 포트로 감싼 래퍼 (read는 짧은 타임아웃)"""
+
+    def __init__(self, fd: int, read_timeout: float = 0.1):
+        self._fd = fd
+        self._read_timeout = read_timeout
+
+    def read(self, size: int) -> bytes:
+        ready, _, _ = select.select([self._fd], [], [], self._read_timeout)
+        if not ready:
+            return b""
+        return os.read(self._fd, size)
+
+    def write(self, data) -> int:
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        return len(data)
+
+
+def make_payload(size: int, rng: random.Random) -> bytes:
+    data = bytearray(rng.randbytes(size))
+    if data and data[-1] == PAD:
+        data[-1] = 0
+    return bytes(data)
+
+
+def round_trip(protocol: str, size: int, filename: str, workdir: str, rng: random.Random) -> tuple[bool, str, float]:
+    """한 번 왕복 전송. (일치 여부, 설명, 소요 초) 반환"""
+    source = os.path.join(workdir, "src_" + filename)
+    with open(source, "wb") as fp:
+        fp.write(make_payload(size, rng))
+    if protocol == PROTOCOL_YMODEM:
+        target = os.path.join(workdir, "recv")
+        os.makedirs(target, exist_ok=True)
+        expected_path = os.path.join(target, "src_" + filename)
+    else:
+        target = expected_path = os.path.join(workdir, "recv_" + filename)
+
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(master_fd)
+    tty.setraw(slave_fd)
+    result = {}
+
+    def receive():
+        try:
+            result["path"] = ModemReceiver(PtyPort(slave_fd), protocol, timeout=5.0).receive_file(target)
+        except ModemTransferError as e:
+            result["error"] = f"수신 실패: {e}"
+
+    receiver = threading.Thread(target=receive, daemon=True)
+    started = time.perf_counter()
+    receiver.start()
+    try:
+        ModemSender(PtyPort(master_fd), protocol, timeout=5.0).send_file(source)
+    except ModemTransferError as e:
+        result.setdefault("error", f"송신 실패: {e}")
+    receiver.join(30.0)
+    elapsed = time.perf_counter() - started
+    os.close(master_fd)
+    os.close(slave_fd)
+
+    if "error" in result:
+        return False, result["error"], elapsed
+    if result.get("path") != expected_path:
+        return False, f"저장 경로 불일치: {result.get('path')}", elapsed
+    with open(source, "rb") as a, open(expected_path, "rb") as b:
+        sent, received = a.read(), b.read()
+    if sent != received:
+        return False, f"내용 불일치 (송신 {len(sent)}B / 수신 {len(received)}B)", elapsed
+    return True, "일치", elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="XMODEM-1K / YMODEM pty 루프백 검증")
+    parser.add_argument("--protocol", action="append", choices=[PROTOCOL_XMODEM_1K, PROTOCOL_YMODEM],
+                        help="검증할 프로토콜 (기본: 둘 다)")
+    parser.add_argument("--size", action="append", type=int, help="파일 크기(바이트, 반복 지정 가능)")
+    parser.add_argument("--seed", type=int, default=1, help="무작위 데이터 시드")
+    args = parser.parse_args(argv)
+
+    protocols = args.protocol or [PROTOCOL_XMODEM_1K, PROTOCOL_YMODEM]
+    sizes = args.size or DEFAULT_SIZES
+    rng = random.Random(args.seed)
+    cases = [(protocol, size, f"{protocol}_{size}.bin") for protocol in protocols for size in sizes]
+    if PROTOCOL_YMODEM in protocols:
+        cases.append((PROTOCOL_YMODEM, 5000, LONG_NAME))
+
+    failures = 0
+    with tempfile.TemporaryDirectory(prefix="xmodem_loopback_") as workdir:
+        for protocol, size, filename in cases:
+            ok, detail, elapsed = round_trip(protocol, size, filename, workdir, rng)
+            rate = size / elapsed / 1024 if elapsed > 0 else 0.0
+            label = "긴 이름" if filename == LONG_NAME else ""
+            print(f"{'OK  ' if ok else 'FAIL'} {protocol:9s} {size:>8d}B {elapsed:7.3f}s {rate:9.1f} KiB/s  {detail} {label}")
+            failures += not ok
+    print(f"{len(cases) - failures}/{len(cases)} 통과")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())